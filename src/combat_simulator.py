@@ -1,61 +1,30 @@
+import sys
+import os
 import math
 import random
-import statistics
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+# --- 경로 설정 (스크립트 직접 실행 지원) ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.utils.result_store import ResultStore
+from src.utils.stats import RunningStats, QuantileSketch
+from src.sim.adaptive import AdaptiveSimulator
+from src.sim.paired import compare_paired
+from src.formulas.engine import FormulaEngine, Roll, global_roll
+
 # =================================================================
 # 1. Mathematical Core (Based on Uploaded Documents)
 # =================================================================
 
-class MathEngine:
-    """
-    업로드된 문서(WoW Defense, PoE Pipelines)의 핵심 공식을 구현한 엔진.
-    """
-    @staticmethod
-    def calculate_defense_dr(armor: int, attacker_level: int) -> float:
-        """
-        WoW Hyperbolic Defense Formula: DR = Armor / (Armor + K)
-        K = 400 + 85 * Level (문서 기준 상수)
-        """
-        k_constant = 400 + (85 * attacker_level)
-        if armor <= 0: return 0.0
-        return armor / (armor + k_constant)
-
-    @staticmethod
-    def calculate_hit_chance(accuracy: int, evasion: int, min_chance: float = 0.05, max_chance: float = 1.0) -> float:
-        """
-        Standard Hit Formula: Acc / (Acc + Eva)^Entropy
-        여기서는 PoE 스타일의 엔트로피 대신 표준 명중 공식 사용.
-        """
-        if accuracy <= 0: return min_chance
-        chance = accuracy / (accuracy + (evasion * 0.5)) # 회피 효율 0.5 계수 적용
-        return max(min_chance, min(max_chance, chance))
-
-class StatBucket:
-    """
-    PoE Style Damage Pipeline:
-    Base -> Flat -> Increased(Sum) -> More(Product)
-    """
-    def __init__(self, base_value: float):
-        self.base = base_value
-        self.flat = 0.0
-        self.increased = 0.0 # 합연산 (예: 0.5 = 50% 증가)
-        self.more = []       # 곱연산 (예: 1.5 = 50% 증폭)
-
-    def add_flat(self, val: float): self.flat += val
-    def add_increased(self, val: float): self.increased += val
-    def add_more(self, val: float): self.more.append(val)
-
-    def calculate(self) -> float:
-        # Step 1 & 2: Base + Flat
-        val = self.base + self.flat
-        # Step 3: Increased (Additive)
-        val *= (1.0 + self.increased)
-        # Step 4: More (Multiplicative)
-        for m in self.more:
-            val *= m
-        return val
+# 수식 본체와 v9 공식 세트는 src/formulas/v9.py (기존 임포트 경로 유지용 재노출)
+from src.formulas.v9 import MathEngine, StatBucket, V9Formula, FORMULA as V9_FORMULA
+from src.formulas.profile import BalanceProfile, DEFAULT_PROFILE
+from src.utils.rng import CounterRNG
 
 # =================================================================
 # 2. Actor Model & Keystones
@@ -95,136 +64,61 @@ class Actor:
         raw_dex = getattr(self, 'dex')
         raw_con = getattr(self, 'con')
         
-        self.keystones["RESOLUTE_TECHNIQUE"] = raw_str >= 20
-        self.keystones["DEADLY_ARTS"] = raw_dex >= 20
-        self.keystones["IRON_FORTRESS"] = raw_con >= 20
+        threshold = V9Formula.KEYSTONE_THRESHOLD
+        self.keystones["RESOLUTE_TECHNIQUE"] = raw_str >= threshold
+        self.keystones["DEADLY_ARTS"] = raw_dex >= threshold
+        self.keystones["IRON_FORTRESS"] = raw_con >= threshold
 
 # =================================================================
 # 3. Combat System (v9.0 - The Theoretical Foundation)
 # =================================================================
 
 class CombatSystem:
-    # 글로벌 밸런스 상수
-    BASE_CRIT_MULT = 1.5
-    CRIT_CHANCE_PER_DEX = 0.012
-    GLOBAL_DMG_SCALE = 0.50
+    # 기본 프로필의 밸런스 상수 (V9Formula가 원본, 변형은 BalanceProfile.v9로 전달)
+    BASE_CRIT_MULT = V9Formula.BASE_CRIT_MULT
+    CRIT_CHANCE_PER_DEX = V9Formula.CRIT_CHANCE_PER_DEX
+    GLOBAL_DMG_SCALE = V9Formula.GLOBAL_DMG_SCALE
 
     @staticmethod
-    def resolve_round(attacker: Actor, defender: Actor, turn: int) -> dict:
-        # 1. 스탯 준비
-        str_a = attacker.get_stat("strength")
-        dex_a = attacker.get_stat("dex")
-        
-        str_d = defender.get_stat("strength")
-        dex_d = defender.get_stat("dex")
-        con_d = defender.get_stat("con")
-
-        # ---------------------------------------------------
-        # [Step 1] 명중 판정 (Hit Chance)
-        # ---------------------------------------------------
-        is_hit = False
-        
-        # [Keystone: RESOLUTE_TECHNIQUE] (STR)
-        # "공격이 빗나가지 않지만, 치명타가 발생하지 않는다."
-        if attacker.keystones["RESOLUTE_TECHNIQUE"]:
-            is_hit = True
-        # [Keystone: IRON_FORTRESS] (CON Defender)
-        # "회피할 수 없다."
-        elif defender.keystones["IRON_FORTRESS"]:
-            is_hit = True
-        else:
-            acc = dex_a * 4 + str_a * 1 # STR도 명중 기여
-            eva = dex_d * 4
-            hit_prob = MathEngine.calculate_hit_chance(acc, eva, min_chance=0.60)
-            is_hit = random.random() < hit_prob
-
-        if not is_hit:
-            return {"hit": False, "crit": False, "dmg": 0, "reflect": 0}
-
-        # ---------------------------------------------------
-        # [Step 2] 공격력 산출 (StatBucket Pipeline)
-        # ---------------------------------------------------
-        # Base: 무기 공격력 (레벨 기반 추정) + 스탯 기여
-        weapon_base = attacker.level * 5
-        stat_base = (str_a * 2.5) + (dex_a * 1.0)
-        
-        bucket = StatBucket(weapon_base + stat_base)
-
-        # [Keystone: RESOLUTE_TECHNIQUE] More Damage 30% (안정적 딜링)
-        if attacker.keystones["RESOLUTE_TECHNIQUE"]:
-            bucket.add_more(1.30)
-
-        # [Keystone: DEADLY_ARTS] (DEX)
-        # 관통력 구현: DEX 비례 More 데미지 (방어 계산 전 딜 증폭)
-        if attacker.keystones["DEADLY_ARTS"]:
-            # DEX 100 기준 약 50% 증폭
-            pen_mult = 1.0 + (dex_a / (dex_a + 100)) 
-            bucket.add_more(pen_mult)
-
-        raw_dmg = bucket.calculate() * CombatSystem.GLOBAL_DMG_SCALE
-
-        # ---------------------------------------------------
-        # [Step 3] 방어 및 피해 감소 (WoW Formula)
-        # ---------------------------------------------------
-        # Armor 산출: CON이 메인, STR/DEX 보조
-        armor = (con_d * 2.0) + (str_d * 0.5) + (dex_d * 0.2)
-        
-        # [Keystone: IRON_FORTRESS] 방어력 50% 증폭 (More Armor)
-        if defender.keystones["IRON_FORTRESS"]:
-            armor *= 1.5
-
-        # DR 계산 (Hyperbolic)
-        dr = MathEngine.calculate_defense_dr(armor, attacker.level)
-        
-        # [Keystone: IRON_FORTRESS] 추가 피해 감폭 10% (Flat Reduction이 아닌 %감소)
-        mitigation_mult = (1.0 - dr)
-        if defender.keystones["IRON_FORTRESS"]:
-            mitigation_mult *= 0.90
+    def _roll(rolls, actor: Actor, purpose: str) -> float:
+        """
+        [0, 1) 난수 한 개. rolls가 주어지면 (행위자, 용도)별 스트림에서 뽑습니다.
+        (공통 난수 비교 모드에서 빌드가 달라도 같은 판정에 같은 난수가 쓰이도록 함)
+        """
+        if rolls is None:
+            return random.random()
+        return rolls.draw(actor.id, purpose)
 
-        actual_dmg = raw_dmg * mitigation_mult
+    @staticmethod
+    def _roller(rolls, actor_id: str) -> Roll:
+        if rolls is None:
+            return global_roll
+        return lambda purpose: rolls.draw(actor_id, purpose)
 
-        # ---------------------------------------------------
-        # [Step 4] 치명타 (Critical)
-        # ---------------------------------------------------
-        is_crit = False
-        
-        # [Keystone: RESOLUTE_TECHNIQUE] 치명타 불가
-        can_crit = not attacker.keystones["RESOLUTE_TECHNIQUE"]
-        
-        if can_crit:
-            crit_chance = dex_a * CombatSystem.CRIT_CHANCE_PER_DEX
-            # 캡 적용: DEADLY_ARTS는 80%, 아니면 35%
-            crit_cap = 0.80 if attacker.keystones["DEADLY_ARTS"] else 0.35
-            crit_chance = min(crit_cap, crit_chance)
-
-            if random.random() < crit_chance:
-                is_crit = True
-                crit_dmg_mult = CombatSystem.BASE_CRIT_MULT
-                # DEX 보너스: DEX가 높으면 치명타 피해량 증가
-                crit_dmg_mult += (dex_a * 0.01)
-                actual_dmg *= crit_dmg_mult
-
-        # ---------------------------------------------------
-        # [Step 5] 반사 (Reflect) & 피해 적용
-        # ---------------------------------------------------
-        final_dmg = int(max(1, actual_dmg))
-        reflect_dmg = 0
-
-        # [Keystone: IRON_FORTRESS] 받은 피해의 25% 반사
-        if defender.keystones["IRON_FORTRESS"]:
-            reflect_dmg = int(final_dmg * 0.25)
-        
-        # [Keystone: DEADLY_ARTS] 받는 피해 15% 증가 패널티 (Glass Cannon)
-        if defender.keystones["DEADLY_ARTS"]:
-            final_dmg = int(final_dmg * 1.15)
+    @staticmethod
+    def resolve_round(attacker: Actor, defender: Actor, turn: int, rolls=None,
+                      profile: Optional[BalanceProfile] = None) -> dict:
+        """
+        공격 1회 처리. 명중 -> StatBucket 공격력 -> 쌍곡선 방어 -> 치명타 -> 반사/받피증 순서의
+        결정적 부분은 V9Formula.matchup이, 난수 판정은 FormulaEngine이 처리합니다.
+        profile: 밸런스 프로필 (None이면 기본 프로필).
+        """
+        formula = (profile or DEFAULT_PROFILE).v9
+        m = formula.matchup(formula.prepare(attacker), formula.prepare(defender))
+        if rolls is not None:
+            rolls.begin_round(turn)
+        roll = CombatSystem._roller(rolls, attacker.id)
+        if not FormulaEngine.roll_hit(m, roll):
+            return {"hit": False, "crit": False, "dmg": 0, "reflect": 0}
+        final_dmg, is_crit, reflect_dmg = FormulaEngine.roll_damage(m, roll)
 
         # 상태 적용
         defender.current_hp -= final_dmg
         attacker.current_hp -= reflect_dmg
 
         # IRON_FORTRESS 재생 (턴당 MaxHP 3%)
-        if defender.keystones["IRON_FORTRESS"] and defender.current_hp > 0:
-            defender.current_hp += int(defender.get_max_hp() * 0.03)
+        if m.regen and defender.current_hp > 0:
+            defender.current_hp += m.regen
 
         return {
             "hit": True,
@@ -233,29 +127,139 @@ class CombatSystem:
             "reflect": reflect_dmg
         }
 
+    @staticmethod
+    def expected_round(attacker: Actor, defender: Actor, profile: Optional[BalanceProfile] = None) -> dict:
+        """
+        resolve_round의 기댓값 버전 (난수 없이 해석적으로 계산).
+        반환: 명중 확률, 명중 시 기대 피해/반사/재생량. 빌드 탐색의 사전 선별(screening)용.
+        """
+        formula = (profile or DEFAULT_PROFILE).v9
+        return FormulaEngine.expected(formula.matchup(formula.prepare(attacker), formula.prepare(defender)))
+
 # =================================================================
 # 4. Simulation Runner
 # =================================================================
 
-def run_simulation():
-    # 설정: 레벨 20 기준 (중반부 밸런스)
-    LEVEL = 20
-    BATTLES = 500
-    
-    # 적 스탯 (밸런스형 엘리트)
-    enemy_stats = {"strength": 18, "dex": 15, "con": 18}
+# 설정: 레벨 20 기준 (중반부 밸런스)
+SIM_LEVEL = 20
+
+# 적 스탯 (밸런스형 엘리트)
+ENEMY_STATS = {"strength": 18, "dex": 15, "con": 18}
+
+# 테스트할 플레이어 빌드
+BUILDS = [
+    ("Berserker (STR 25)", {"strength": 25, "dex": 8, "con": 10}),
+    ("Assassin  (DEX 25)", {"strength": 10, "dex": 25, "con": 8}),
+    ("Tanker    (CON 25)", {"strength": 10, "dex": 8, "con": 25}),
+    ("Balanced  (15/15/15)", {"strength": 15, "dex": 15, "con": 15})
+]
+
+def simulate_duel(p_stats: dict, e_stats: dict, level: int = 20, max_turns: int = 100, rolls=None,
+                  profile: Optional[BalanceProfile] = None) -> dict:
+    """
+    플레이어(p_stats) vs 적(e_stats) 1:1 전투를 한 번 수행하고 결과를 반환합니다.
+    run_simulation 및 벤치마크/배치 도구가 공통으로 사용하는 단일 전투 루프.
+    rolls: draw(actor_id, purpose)/begin_round(round)를 제공하는 난수원 (None이면 전역 random 사용).
+           CounterRNG.battle(i)를 넘기면 결과가 (시드, 전투 i)만으로 정해집니다.
+    profile: 밸런스 프로필 (None이면 기본 프로필).
+    """
+    p = Actor("P", "Hero", level, **p_stats)
+    e = Actor("E", "Enemy", level, **e_stats)
+    p.update_keystones() # 키스톤 활성화
+    e.update_keystones()
+
+    # 스탯/키스톤은 전투 중 변하지 않으므로 양방향 Matchup을 한 번만 만들고 HP만 갱신
+    formula = (profile or DEFAULT_PROFILE).v9
+    fp, fe = formula.prepare(p), formula.prepare(e)
+    pe, ep = formula.matchup(fp, fe), formula.matchup(fe, fp)
+    roll_p, roll_e = CombatSystem._roller(rolls, p.id), CombatSystem._roller(rolls, e.id)
+    strike = FormulaEngine.strike
+    p_hp, e_hp = fp.max_hp, fe.max_hp
+
+    result = {
+        "win": False, "turns": 0, "attempts": 0, "hits": 0, "crits": 0,
+        "damages": [], "reflects": []
+    }
+
+    turn = 0
+    while p_hp > 0 and e_hp > 0 and turn < max_turns:
+        turn += 1
+        if rolls is not None:
+            rolls.begin_round(turn)
+
+        # Player Turn
+        dmg, crit, reflect = strike(pe, roll_p)
+        result["attempts"] += 1
+        if dmg:
+            e_hp -= dmg
+            p_hp -= reflect
+            if pe.regen and e_hp > 0:
+                e_hp += pe.regen
+            result["hits"] += 1
+            result["damages"].append(dmg)
+            result["reflects"].append(reflect)
+            if crit: result["crits"] += 1
+
+        if e_hp <= 0:
+            result["win"] = True
+            break
+
+        if p_hp <= 0: break
+
+        # Enemy Turn
+        dmg, _, reflect = strike(ep, roll_e)
+        if dmg:
+            p_hp -= dmg
+            e_hp -= reflect
+            if ep.regen and p_hp > 0:
+                p_hp += ep.regen
+
+    result["turns"] = turn
+    return result
+
+def estimate_duel(p_stats: dict, e_stats: dict, level: int = 20, max_turns: int = 100,
+                  profile: Optional[BalanceProfile] = None) -> dict:
+    """
+    simulate_duel의 해석적 근사. 라운드당 기대 순피해로 양측의 처치 턴 수를 추정합니다.
+    win은 처치 턴 차이에 로지스틱을 씌운 추정 승률(0~1), turns는 추정 전투 길이입니다.
+    """
+    p = Actor("P", "Hero", level, **p_stats)
+    e = Actor("E", "Enemy", level, **e_stats)
+    p.update_keystones()
+    e.update_keystones()
+
+    pe = CombatSystem.expected_round(p, e, profile)
+    ep = CombatSystem.expected_round(e, p, profile)
+
+    # 라운드당 기대 순피해 (명중 시 재생 상쇄, 반사는 공격자에게 되돌아옴)
+    to_enemy = pe["hit_prob"] * (pe["dmg"] - pe["regen"]) + ep["hit_prob"] * ep["reflect"]
+    to_player = ep["hit_prob"] * (ep["dmg"] - ep["regen"]) + pe["hit_prob"] * pe["reflect"]
 
-    # 테스트할 플레이어 빌드
-    builds = [
-        ("Berserker (STR 25)", {"strength": 25, "dex": 8, "con": 10}),
-        ("Assassin  (DEX 25)", {"strength": 10, "dex": 25, "con": 8}),
-        ("Tanker    (CON 25)", {"strength": 10, "dex": 8, "con": 25}),
-        ("Balanced  (15/15/15)", {"strength": 15, "dex": 15, "con": 15})
-    ]
+    t_enemy = math.ceil(e.get_max_hp() / to_enemy) if to_enemy > 0 else max_turns
+    t_player = math.ceil(p.get_max_hp() / to_player) if to_player > 0 else max_turns
+    t_enemy, t_player = min(t_enemy, max_turns), min(t_player, max_turns)
+
+    # 플레이어가 선공이므로 같은 턴 수면 플레이어 우세 (+0.5)
+    margin = (t_player - t_enemy + 0.5) / max(1.0, 0.15 * min(t_enemy, t_player))
+    win = 1.0 / (1.0 + math.exp(-margin))
+    return {"win": win, "turns": min(t_enemy, t_player)}
+
+def run_simulation(sink: Optional[ResultStore] = None, seed: Optional[int] = None,
+                   profile: Optional[BalanceProfile] = None, rng: Optional[CounterRNG] = None):
+    """
+    sink: 전투별 결과(build, level, win, turns, damage, crit, seed)를 스트리밍 기록할 ResultStore.
+    seed: 지정 시 전투 i는 seed + i로 시드를 고정하여 개별 재현이 가능합니다.
+    profile: 밸런스 프로필 (None이면 기본 프로필).
+    rng: 지정 시 전역 random 대신 빌드별 전투 i에 rng.battle("빌드:i")를 사용 (seed 열에는 i를 기록).
+    """
+    LEVEL = SIM_LEVEL
+    BATTLES = 500
+    enemy_stats = ENEMY_STATS
+    builds = BUILDS
 
     print(f"=== [v9.0 Theoretical Foundation Simulation (Lv.{LEVEL})] ===")
-    print(f"{'Class':<15} | {'Win%':<6} | {'TTK':<5} | {'Hit%':<6} | {'Crit%':<6} | {'AvgDmg':<8} | {'Reflect':<6}")
-    print("-" * 80)
+    print(f"{'Class':<15} | {'Win%':<6} | {'TTK':<5} | {'p95':<4} | {'Hit%':<6} | {'Crit%':<6} | {'AvgDmg':<8} | {'Reflect':<6}")
+    print("-" * 88)
 
     for name, stats in builds:
         wins = 0
@@ -263,50 +267,94 @@ def run_simulation():
         p_hits = 0
         p_attempts = 0
         p_crits = 0
-        p_damages = []
-        p_reflects = []
-
-        for _ in range(BATTLES):
-            p = Actor("P", "Hero", LEVEL, **stats)
-            e = Actor("E", "Enemy", LEVEL, **enemy_stats)
-            p.update_keystones() # 키스톤 활성화
-            e.update_keystones() # 적은 스탯 낮아서 활성화 안됨 (밸런스형)
-            
-            p.current_hp = p.get_max_hp()
-            e.current_hp = e.get_max_hp()
-
-            turn = 0
-            while p.current_hp > 0 and e.current_hp > 0 and turn < 100:
-                turn += 1
-                
-                # Player Turn
-                res_p = CombatSystem.resolve_round(p, e, turn)
-                p_attempts += 1
-                if res_p["hit"]: 
-                    p_hits += 1
-                    p_damages.append(res_p["dmg"])
-                    p_reflects.append(res_p["reflect"])
-                    if res_p["crit"]: p_crits += 1
-                
-                if e.current_hp <= 0:
-                    wins += 1
-                    break
-                
-                if p.current_hp <= 0: break
-
-                # Enemy Turn
-                res_e = CombatSystem.resolve_round(e, p, turn)
-                
-            total_turns += turn
+        # 리스트 대신 O(1) 메모리 누적기 사용
+        p_damages = RunningStats()
+        p_reflects = RunningStats()
+        ttk_sketch = QuantileSketch()
+
+        for i in range(BATTLES):
+            battle_seed = -1
+            rolls = None
+            if rng is not None:
+                battle_seed = i
+                rolls = rng.battle(f"{name.strip()}:{i}")
+            elif seed is not None:
+                battle_seed = seed + i
+                random.seed(battle_seed)
+            duel = simulate_duel(stats, enemy_stats, LEVEL, rolls=rolls, profile=profile)
+            if sink is not None:
+                sink.append(build=name.strip(), level=LEVEL, win=duel["win"], turns=duel["turns"],
+                            damage=sum(duel["damages"]), crit=duel["crits"], seed=battle_seed)
+            if duel["win"]: wins += 1
+            total_turns += duel["turns"]
+            ttk_sketch.push(duel["turns"])
+            p_attempts += duel["attempts"]
+            p_hits += duel["hits"]
+            p_crits += duel["crits"]
+            for dmg in duel["damages"]: p_damages.push(dmg)
+            for ref in duel["reflects"]: p_reflects.push(ref)
 
         win_rate = (wins / BATTLES) * 100
         avg_ttk = total_turns / BATTLES
         hit_rate = (p_hits / p_attempts * 100) if p_attempts > 0 else 0
         crit_rate = (p_crits / p_hits * 100) if p_hits > 0 else 0
-        avg_dmg = statistics.mean(p_damages) if p_damages else 0
-        avg_ref = statistics.mean(p_reflects) if p_reflects else 0
+        avg_dmg = p_damages.mean
+        avg_ref = p_reflects.mean
+        p95_ttk = ttk_sketch.quantile(0.95)
         
-        print(f"{name:<15} | {win_rate:>5.1f}% | {avg_ttk:>5.1f} | {hit_rate:>5.1f}% | {crit_rate:>5.1f}% | {avg_dmg:>8.1f} | {avg_ref:>6.1f}")
+        print(f"{name:<15} | {win_rate:>5.1f}% | {avg_ttk:>5.1f} | {p95_ttk:>4.0f} | {hit_rate:>5.1f}% | {crit_rate:>5.1f}% | {avg_dmg:>8.1f} | {avg_ref:>6.1f}")
+
+def run_adaptive_simulation(simulator: Optional[AdaptiveSimulator] = None):
+    """
+    고정 500판 대신 신뢰구간 목표를 만족할 때까지만 전투를 수행하는 버전.
+    빌드별로 사용한 전투 수와 달성한 정밀도(95% CI)를 함께 출력합니다.
+    """
+    simulator = simulator or AdaptiveSimulator()
+
+    print(f"=== [v9.0 Adaptive Simulation (Lv.{SIM_LEVEL})] target: Win% CI <= {simulator.win_ci_width * 100:.1f}p, TTK CI <= {simulator.ttk_ci_width:.2f} ===")
+    print(f"{'Class':<15} | {'Win%':<6} | {'Win CI':<13} | {'TTK':<5} | {'TTK CI':<6} | {'Battles':<7} | Converged")
+    print("-" * 88)
+
+    total_battles = 0
+    for name, stats in BUILDS:
+        res = simulator.run(lambda: simulate_duel(stats, ENEMY_STATS, SIM_LEVEL))
+        total_battles += res.battles
+        lo, hi = res.win_ci
+        print(f"{name:<15} | {res.win_rate * 100:>5.1f}% | {lo * 100:>5.1f}~{hi * 100:>5.1f}% | {res.ttk.mean:>5.1f} | "
+              f"±{res.ttk_ci_width / 2:>5.2f} | {res.battles:>7} | {'yes' if res.converged else 'no (cap)'}")
+    print("-" * 88)
+    print(f"Total battles: {total_battles} (fixed mode: {500 * len(BUILDS)})")
+
+def run_paired_comparison(baseline_index: int = 3, battles: int = 200, seed: int = 0, antithetic: bool = False):
+    """
+    공통 난수(CRN) 모드의 빌드 A/B 비교.
+    각 빌드를 기준 빌드(기본: Balanced)와 같은 전투/판정 난수로 짝지어 차이와 그 신뢰구간을 보고합니다.
+    VR: 독립 표본 대비 분산 감소 배율 (= 같은 정밀도를 얻는 데 필요한 전투 수 절감 배율).
+    """
+    base_name, base_stats = BUILDS[baseline_index]
+    mode = "CRN + antithetic" if antithetic else "CRN"
+
+    print(f"=== [v9.0 Paired Build Comparison ({mode}, Lv.{SIM_LEVEL})] baseline: {base_name.strip()} | {battles} pairs ===")
+    print(f"{'Build':<20} | {'ΔWin%':>7} | {'95% CI':<15} | {'ΔTTK':>6} | {'95% CI':<13} | {'VR win':>6} | {'VR ttk':>6}")
+    print("-" * 96)
+
+    duel_base = lambda rolls: simulate_duel(base_stats, ENEMY_STATS, SIM_LEVEL, rolls=rolls)
+    for name, stats in BUILDS:
+        if name == base_name:
+            continue
+        duel = lambda rolls, stats=stats: simulate_duel(stats, ENEMY_STATS, SIM_LEVEL, rolls=rolls)
+        res = compare_paired(duel_base, duel, battles=battles, seed=seed, antithetic=antithetic)
+        w_lo, w_hi = res.win_diff_ci
+        t_lo, t_hi = res.ttk_diff_ci
+        print(f"{name:<20} | {res.diff_win.mean * 100:>+6.1f}p | {w_lo * 100:>+6.1f}~{w_hi * 100:>+6.1f}p | "
+              f"{res.diff_ttk.mean:>+6.2f} | {t_lo:>+5.2f}~{t_hi:>+5.2f} | {res.win_variance_reduction:>5.1f}x | {res.ttk_variance_reduction:>5.1f}x")
 
 if __name__ == "__main__":
-    run_simulation()
\ No newline at end of file
+    if "--paired" in sys.argv:
+        run_paired_comparison(antithetic="--antithetic" in sys.argv)
+    elif "--adaptive" in sys.argv:
+        run_adaptive_simulation()
+    elif "--counter-rng" in sys.argv:
+        run_simulation(rng=CounterRNG(int(sys.argv[sys.argv.index("--counter-rng") + 1])))
+    else:
+        run_simulation()
\ No newline at end of file
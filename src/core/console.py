@@ -0,0 +1,24 @@
+import time
+
+class Console:
+    """
+    터미널 입출력 경계. 상태 클래스는 input()/time.sleep() 대신 GameContext.console을 거칩니다.
+    기록(ReplayRecorder)과 재생(Replayer)은 이 클래스를 바꿔 끼워 입력을 남기거나 다시 주입합니다.
+    """
+
+    def read(self, prompt: str = "") -> str:
+        """사용자 입력 한 줄 (EOF면 EOFError - 엔진이 루프를 끝냄)."""
+        return input(prompt)
+
+    def pause(self, seconds: float):
+        """연출용 대기. 재생 모드에서는 건너뜁니다."""
+        time.sleep(seconds)
+
+class NullRenderer:
+    """print 출력을 버리는 stdout 대용 (contextlib.redirect_stdout과 함께 사용)."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self):
+        pass
@@ -1,5 +1,7 @@
 from typing import Optional
+from src.core.console import Console
 from src.models.actor import Actor
+from src.utils.rng import BattleRolls, CounterRNG
 
 class GameContext:
     """
@@ -8,16 +10,39 @@ class GameContext:
     """
     _instance = None
     player: Optional[Actor] = None
+    auto_battle: bool = False  # 일방적인 전투 자동 처리 (마을에서 전환)
+    rng: Optional[CounterRNG] = None  # 설정 시 전투/탐험 판정이 (시드, 전투 번호, 라운드...)로 재현됨 (--seed)
+    battle_count: int = 0
+    dungeon_actions: int = 0         # 세션 전체 탐험/휴식 횟수 (재현 모드 탐험 판정 카운터)
+    console: Console = Console()     # 입력/대기 경계 (기록/재생 시 교체)
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(GameContext, cls).__new__(cls)
         return cls._instance
 
+    @classmethod
+    def reset(cls, rng: Optional[CounterRNG] = None, console: Optional[Console] = None):
+        """새 세션 시작 (리플레이 기록/재생이 같은 출발점에서 시작하도록 전역 상태 초기화)."""
+        cls.player = None
+        cls.auto_battle = False
+        cls.rng = rng
+        cls.battle_count = 0
+        cls.dungeon_actions = 0
+        cls.console = console or Console()
+
     @classmethod
     def set_player(cls, player: Actor):
         cls.player = player
 
     @classmethod
     def get_player(cls) -> Optional[Actor]:
-        return cls.player
\ No newline at end of file
+        return cls.player
+
+    @classmethod
+    def next_battle_rolls(cls) -> Optional[BattleRolls]:
+        """다음 전투의 난수원 (전투 번호 1, 2, ...). rng가 없으면 None = 전역 random."""
+        if cls.rng is None:
+            return None
+        cls.battle_count += 1
+        return cls.rng.battle(cls.battle_count)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import sys
 from .state_machine import StateMachine, State
+from .context import GameContext
 
 class EmptyState(State):
     def on_enter(self, machine): pass
@@ -19,13 +20,16 @@ class GameEngine:
                 self.state_machine.update()
                 
                 # Basic input handling loop
-                user_input = input(">> ")
+                user_input = GameContext.console.read(">> ")
                 if user_input.lower() == 'quit':
                     self.running = False
                     break
                     
                 self.state_machine.handle_input(user_input)
                 
+            except EOFError:
+                # 입력 종료 (파이프 입력 소진, Ctrl-D, 리플레이 끝)
+                self.running = False
             except KeyboardInterrupt:
                 self.running = False
                 sys.exit()
@@ -1,23 +1,27 @@
+import random
 import uuid
-from typing import Optional
+from typing import Dict, List, Optional
 from src.models.actor import Actor
-from src.models.item import Item
+from src.models.item import Item, ItemTemplate
 from src.utils.data_loader import DataLoader
 from src.systems.growth_system import GrowthSystem
 
 class EntityFactory:
     """
     Actor 및 Item 생성을 전담하는 공장 클래스.
+    아이템 템플릿은 ID별로 한 번만 만들어 모든 인스턴스가 공유합니다 (Flyweight).
     """
+    _item_templates: Dict[str, ItemTemplate] = {}
     
     @staticmethod
-    def create_player(name: str, race_id: str, class_id: str) -> Actor:
-        # 기존 코드 유지...
+    def create_player(name: str, race_id: str, class_id: str, profile=None) -> Actor:
+        """profile: BalanceProfile (None이면 기본 프로필). 성장/전투 공식이 이 프로필을 따릅니다."""
         new_actor = Actor(
             id=str(uuid.uuid4()),
             name=name, 
             race_id=race_id, 
-            class_id=class_id
+            class_id=class_id,
+            profile=profile
         )
 
         race_data = DataLoader.load_race(race_id)
@@ -40,7 +44,7 @@ class EntityFactory:
 
     # [NEW] 몬스터 생성 메서드 추가
     @staticmethod
-    def create_monster(monster_id: str) -> Optional[Actor]:
+    def create_monster(monster_id: str, profile=None) -> Optional[Actor]:
         data = DataLoader.load_monster(monster_id)
         if not data:
             print(f"[Factory] Error: Monster ID '{monster_id}' not found.")
@@ -51,12 +55,17 @@ class EntityFactory:
             id=str(uuid.uuid4()),
             name=data["name"],
             race_id="monster",
-            class_id="monster"
+            class_id="monster",
+            template_id=monster_id,
+            profile=profile
         )
         
         # 1. 기본 스탯 적용
         new_monster.base_stats = data["base_stats"]
         
+        # 스킬 목록 (데이터에 없으면 평타만) - 사용 스킬은 AISystem이 상황별로 선택
+        new_monster.skills = list(data.get("skills", ["basic_attack"]))
+
         # 2. 레벨 설정 (Challenge Rating 기반)
         new_monster.level = data.get("level", 1)
         
@@ -66,16 +75,26 @@ class EntityFactory:
         return new_monster
 
     @staticmethod
-    def create_item(item_id: str) -> Optional[Item]:
-        # 기존 코드 유지...
-        data = DataLoader.load_item(item_id)
-        if not data: return None
-        return Item(
-            id=data.get("id", item_id),
-            name=data["name"],
-            type=data["type"],
-            slot=data["slot"],
-            bonus_stats=data.get("bonus_stats", {}),
-            description=data.get("description", ""),
-            price=data.get("price", 0)
-        )
\ No newline at end of file
+    def get_item_template(item_id: str) -> Optional[ItemTemplate]:
+        """items.json 항목의 공유 템플릿을 반환합니다 (최초 1회만 생성)."""
+        template = EntityFactory._item_templates.get(item_id)
+        if template is None:
+            data = DataLoader.load_item(item_id)
+            if not data: return None
+            template = ItemTemplate.from_data(item_id, data)
+            EntityFactory._item_templates[item_id] = template
+        return template
+
+    @staticmethod
+    def create_item(item_id: str, rng=random) -> Optional[Item]:
+        """아이템 1개 생성. rng: 옵션 굴림 난수원 (전리품은 전투 스트림을 넘겨 시드로 재현)."""
+        template = EntityFactory.get_item_template(item_id)
+        if not template: return None
+        return Item(template, template.roll_affixes(rng))
+
+    @staticmethod
+    def create_items(item_id: str, count: int, seed: Optional[int] = None) -> List[Item]:
+        """같은 아이템 count개를 한 번에 생성합니다 (옵션은 일괄 굴림)."""
+        template = EntityFactory.get_item_template(item_id)
+        if not template: return []
+        return [Item(template, affixes) for affixes in template.roll_affixes_batch(count, seed)]
@@ -0,0 +1,235 @@
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.console import Console, NullRenderer
+from src.core.context import GameContext
+from src.core.engine import GameEngine
+from src.models.actor import Actor
+from src.states.title_state import TitleState
+from src.utils.rng import CounterRNG
+
+REPLAY_VERSION = 1
+Snapshot = Dict[str, Any]
+
+# ------------------------------------------------------------------------------
+# 상태 스냅샷 / 해시
+# ------------------------------------------------------------------------------
+
+def _actor_fields(prefix: str, actor: Actor, snap: Snapshot):
+    # id(uuid4)는 실행마다 달라지므로 제외
+    snap[f"{prefix}.name"] = actor.name
+    snap[f"{prefix}.lv"] = actor.level
+    snap[f"{prefix}.hp"] = f"{actor.current_hp}/{actor.max_hp}"
+    snap[f"{prefix}.mp"] = f"{actor.current_mp}/{actor.max_mp}"
+
+def capture(machine) -> Snapshot:
+    """
+    입력 직전 게임 상태의 평탄한 스냅샷 (키 -> 스칼라).
+    상태 스택, 플레이어 자원/장비/가방, 각 상태의 스칼라 필드(층, 걸음 수...), 전투 진행도를 담습니다.
+    """
+    snap: Snapshot = {
+        "stack": ">".join(type(state).__name__ for state in machine.stack),
+        "auto": GameContext.auto_battle,
+        "battles": GameContext.battle_count,
+        "explores": GameContext.dungeon_actions,
+    }
+    player = GameContext.get_player()
+    if player is not None:
+        _actor_fields("player", player, snap)
+        snap["player.exp"] = player.exp
+        snap["player.gear"] = ",".join(item.name if item else "-" for item in player.equipment.values())
+        snap["player.bag"] = len(player.inventory)
+    for depth, state in enumerate(machine.stack):
+        for name, value in vars(state).items():
+            if isinstance(value, (bool, int, float, str)):
+                snap[f"{depth}.{name}"] = value
+            elif isinstance(value, dict) and all(isinstance(v, (bool, int, float, str)) for v in value.values()):
+                snap[f"{depth}.{name}"] = ",".join(f"{k}={v}" for k, v in value.items())
+        ctx = getattr(state, "ctx", None)
+        if ctx is not None:
+            snap[f"{depth}.round"] = ctx.round_count
+            snap[f"{depth}.turn"] = ctx.current_turn_index
+            snap[f"{depth}.finished"] = ctx.is_finished
+            for i, enemy in enumerate(ctx.enemies):
+                _actor_fields(f"{depth}.enemy{i}", enemy, snap)
+    return snap
+
+def state_hash(snap: Snapshot) -> str:
+    """스냅샷의 32비트 해시 (16진수 8자리)."""
+    blob = json.dumps(snap, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=4).hexdigest()
+
+def delta(prev: Snapshot, cur: Snapshot) -> Snapshot:
+    """prev -> cur 변경분 (사라진 키는 None)."""
+    changed = {k: v for k, v in cur.items() if k not in prev or prev[k] != v}
+    changed.update({k: None for k in prev if k not in cur})
+    return changed
+
+def apply_delta(prev: Snapshot, change: Snapshot) -> Snapshot:
+    snap = dict(prev)
+    for k, v in change.items():
+        if v is None:
+            snap.pop(k, None)
+        else:
+            snap[k] = v
+    return snap
+
+# ------------------------------------------------------------------------------
+# 기록
+# ------------------------------------------------------------------------------
+
+class ReplayRecorder(Console):
+    """
+    입력을 받을 때마다 (입력 문자열, 직전 상태 해시, 이전 스텝 대비 변경분)을 남기는 콘솔.
+    상태 전이는 스냅샷의 "stack" 키 변경분으로 기록됩니다.
+
+    파일 형식 (gzip JSON):
+        {"version": 1, "seed": N, "steps": [[입력, 해시] 또는 [입력, 해시, {변경분}], ...],
+         "final": [해시, {변경분}]}
+    """
+
+    def __init__(self, machine, seed: int, source: Callable[[str], str] = input, realtime: bool = True):
+        self.machine = machine
+        self.seed = seed
+        self.source = source
+        self.realtime = realtime   # False면 연출 대기 생략 (봇 세션 기록용)
+        self.steps: List[list] = []
+        self._last: Snapshot = {}
+
+    def _checkpoint(self) -> tuple:
+        snap = capture(self.machine)
+        change = delta(self._last, snap)
+        return snap, ([state_hash(snap), change] if change else [state_hash(snap)])
+
+    def read(self, prompt: str = "") -> str:
+        snap, checkpoint = self._checkpoint()
+        user_input = self.source(prompt)   # EOF면 기록 없이 종료 (변경분 기준점도 그대로)
+        self.steps.append([user_input] + checkpoint)
+        self._last = snap
+        return user_input
+
+    def pause(self, seconds: float):
+        if self.realtime:
+            super().pause(seconds)
+
+    def save(self, path: str) -> int:
+        """기록 저장 (종료 시점 상태 포함). 파일 크기(바이트)를 반환합니다."""
+        data = {"version": REPLAY_VERSION, "seed": self.seed, "steps": self.steps, "final": self._checkpoint()[1]}
+        with gzip.open(path, "wb") as f:
+            f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        return os.path.getsize(path)
+
+def start_session(seed: int, console: Optional[Console] = None):
+    """기록/재생 공통 출발점: 전역 상태 초기화 + 카운터 난수(전투/탐험) + 전역 random 시드."""
+    GameContext.reset(rng=CounterRNG(seed), console=console)
+    random.seed(seed)
+
+def record_session(path: str, seed: int, source: Callable[[str], str] = input, renderer=None,
+                   realtime: bool = True) -> ReplayRecorder:
+    """
+    타이틀부터 게임을 돌리며 기록하고 종료 시(예외/sys.exit 포함) path에 저장합니다.
+    source: 입력 공급 함수 (기본 터미널, 봇 세션이면 프롬프트 -> 입력 함수). renderer: 출력 대상 (None = 화면).
+    """
+    app = GameEngine()
+    recorder = ReplayRecorder(app.state_machine, seed, source, realtime)
+    start_session(seed, console=recorder)
+    with contextlib.redirect_stdout(renderer) if renderer is not None else contextlib.nullcontext():
+        try:
+            app.state_machine.change(TitleState())
+            app.run()
+        finally:
+            recorder.save(path)
+    return recorder
+
+# ------------------------------------------------------------------------------
+# 재생
+# ------------------------------------------------------------------------------
+
+@dataclass
+class ReplayReport:
+    steps: int                      # 재생한 입력 수
+    total: int                      # 기록된 입력 수
+    elapsed: float
+    diverged_at: Optional[int] = None   # 해시가 처음 어긋난 스텝 (len(steps) = 종료 상태)
+    expected: Snapshot = field(default_factory=dict)
+    actual: Snapshot = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.diverged_at is None and self.steps == self.total
+
+    def mismatches(self) -> Dict[str, tuple]:
+        """어긋난 필드: 키 -> (기록값, 재생값). 상태 스택 등 최상위 키가 먼저 옵니다."""
+        keys = sorted(set(self.expected) | set(self.actual), key=lambda k: ("." in k, k))
+        return {k: (self.expected.get(k), self.actual.get(k)) for k in keys if self.expected.get(k) != self.actual.get(k)}
+
+class Replayer(Console):
+    """
+    기록된 입력을 그대로 다시 주입하는 콘솔. 대기는 건너뛰고, 출력은 NullRenderer로 버립니다.
+    입력을 줄 때마다 현재 상태 해시를 기록과 비교하고, 처음 어긋난 스텝에서 멈춥니다.
+    """
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.steps = data["steps"]
+        self.machine = None
+        self.index = 0
+        self.expected: Snapshot = {}
+        self.report: Optional[ReplayReport] = None
+
+    @staticmethod
+    def load(path: str) -> "Replayer":
+        with gzip.open(path, "rb") as f:
+            data = json.loads(f.read().decode("utf-8"))
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        return Replayer(data)
+
+    def _verify(self, checkpoint: list) -> bool:
+        if len(checkpoint) > 1:
+            self.expected = apply_delta(self.expected, checkpoint[1])
+        actual = capture(self.machine)
+        if state_hash(actual) == checkpoint[0]:
+            return True
+        self.report.diverged_at = self.index
+        self.report.expected, self.report.actual = self.expected, actual
+        return False
+
+    def read(self, prompt: str = "") -> str:
+        if self.index >= len(self.steps) or not self._verify(self.steps[self.index][1:]):
+            raise EOFError
+        user_input = self.steps[self.index][0]
+        self.index += 1
+        return user_input
+
+    def pause(self, seconds: float):
+        pass
+
+    def run(self, seed: Optional[int] = None) -> ReplayReport:
+        """
+        새 엔진으로 타이틀부터 재생. seed를 주면 기록의 시드 대신 사용합니다 (분기 확인용).
+        """
+        start_session(self.data["seed"] if seed is None else seed, console=self)
+        self.index, self.expected = 0, {}
+        self.report = ReplayReport(steps=0, total=len(self.steps), elapsed=0.0)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(NullRenderer()):
+            app = GameEngine()
+            self.machine = app.state_machine
+            app.state_machine.change(TitleState())
+            try:
+                app.run()
+            except SystemExit:
+                pass
+            if self.report.diverged_at is None and self.index == len(self.steps):
+                self._verify(self.data["final"])
+        self.report.steps = self.index
+        self.report.elapsed = time.perf_counter() - start
+        return self.report
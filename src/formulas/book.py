@@ -0,0 +1,150 @@
+# File: src/formulas/book.py
+import json
+import hashlib
+from typing import Dict, Optional, Tuple
+
+from src.formulas.dsl import CompiledFormula, FormulaError, compile_formula
+from src.utils.data_loader import DataLoader
+
+# 엔진 코드가 호출하는 수식과 인자 순서 (formulas.json으로 식은 바꿀 수 있지만 인자는 고정)
+FORMULA_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "stat_at_level": ("base", "level"),
+    "max_hp": ("con", "level"),
+    "max_mp": ("wisdom", "level"),
+    "attack_power": ("strength", "level"),
+    "magic_power": ("intelligence", "level"),
+    "evasion": ("dex",),
+    "defense": ("con",),
+    "crit_chance": ("dex",),
+    "skill_base": ("ap", "sp", "ap_coef", "sp_coef"),
+}
+
+# 사전 전체에 한 번에 적용하는 파생 함수: 속성 이름 -> (공식, 사전 값으로 바꿀 인자)
+FORMULA_MAPS: Dict[str, Tuple[str, str]] = {
+    "stats_at_level": ("stat_at_level", "base"),   # (base_stats, 스탯 키들, 기본값, level) -> {스탯: 값}
+}
+
+# formulas.json이 없거나 해당 항목이 없을 때 쓰는 기본값 (v2.2 GrowthSystem/MathEngine 하드코딩 공식과 동일)
+DEFAULT_CONSTANTS: Dict[str, float] = {
+    "STAT_GROWTH": 1.5,         # 레벨당 기본 스탯 성장
+    "STAT_BASELINE": 10,        # 회피/방어/치명타 보너스가 시작되는 스탯
+    "HP_PER_CON": 15,
+    "HP_PER_LEVEL": 30,
+    "MP_BASE": 20,
+    "MP_PER_LEVEL": 5,
+    "POWER_PER_LEVEL": 3,
+    "POWER_MULT": 1.2,
+    "EVASION_PER_DEX": 0.01,
+    "EVASION_CAP": 0.5,
+    "DEFENSE_PER_CON": 0.01,
+    "DEFENSE_CAP": 0.6,
+    "CRIT_BASE": 0.05,
+    "CRIT_PER_DEX": 0.005,
+}
+
+DEFAULT_FORMULAS: Dict[str, str] = {
+    "stat_at_level": "int(base + (level - 1) * STAT_GROWTH)",
+    "max_hp": "int(con * HP_PER_CON + level * HP_PER_LEVEL)",
+    "max_mp": "MP_BASE + wisdom // 2 + level * MP_PER_LEVEL",
+    "attack_power": "int((strength + level * POWER_PER_LEVEL) * POWER_MULT)",
+    "magic_power": "int((intelligence + level * POWER_PER_LEVEL) * POWER_MULT)",
+    "evasion": "min(EVASION_CAP, max(0, (dex - STAT_BASELINE) * EVASION_PER_DEX))",
+    "defense": "min(DEFENSE_CAP, max(0, (con - STAT_BASELINE) * DEFENSE_PER_CON))",
+    "crit_chance": "CRIT_BASE + max(0, (dex - STAT_BASELINE) * CRIT_PER_DEX)",
+    "skill_base": "ap * ap_coef + sp * sp_coef",
+}
+
+class FormulaBook:
+    """
+    데이터 기반 밸런스 공식 모음.
+
+    formulas.json 형식:
+        {"constants": {"HP_PER_CON": 18},
+         "formulas": {"max_hp": "int(con * HP_PER_CON + level * HP_PER_LEVEL + 50)",
+                      "ehp": {"params": ["hp", "defense"], "expr": "hp / (1 - defense)"}}}
+    엔진 공식(FORMULA_PARAMS)은 식 문자열만, 새 공식은 params와 함께 적습니다.
+    수식은 읽을 때 한 번 파싱/상수 접기/컴파일되며, 컴파일된 함수는 공식 이름 속성으로 바로 호출합니다
+    (book.max_hp(con, level)). reload()는 같은 인스턴스의 속성을 바꾸므로 참조를 다시 얻을 필요가 없습니다.
+    """
+
+    DATA_FILE = "formulas.json"
+
+    def __init__(self, formulas: Optional[Dict[str, object]] = None, constants: Optional[Dict[str, float]] = None):
+        self.compiled: Dict[str, CompiledFormula] = {}
+        self.constants: Dict[str, float] = {}
+        self._overrides = (formulas, constants)
+        self.load()
+
+    @staticmethod
+    def _data() -> dict:
+        data = DataLoader.load_json(FormulaBook.DATA_FILE)
+        return data if isinstance(data, dict) else {}
+
+    def load(self):
+        """기본값 <- formulas.json <- 생성자 인자 순서로 덮어쓴 뒤 모두 다시 컴파일합니다."""
+        formulas, constants = self._overrides
+        data = FormulaBook._data()
+        merged_constants = {**DEFAULT_CONSTANTS, **data.get("constants", {}), **(constants or {})}
+        definitions = {**DEFAULT_FORMULAS, **data.get("formulas", {}), **(formulas or {})}
+
+        compiled = {}
+        for name, definition in definitions.items():
+            if isinstance(definition, dict):
+                params = tuple(definition.get("params", FORMULA_PARAMS.get(name, ())))
+                text = definition.get("expr", "")
+            else:
+                params, text = FORMULA_PARAMS.get(name), definition
+                if params is None:
+                    raise FormulaError(f"{name}: custom formulas need {{\"params\": [...], \"expr\": ...}}")
+            if hasattr(FormulaBook, name) or name in FORMULA_MAPS or name in ("compiled", "constants"):
+                raise FormulaError(f"{name}: formula name clashes with a FormulaBook attribute")
+            if name in FORMULA_PARAMS and params != FORMULA_PARAMS[name]:
+                raise FormulaError(f"{name}: parameters must be {FORMULA_PARAMS[name]}, got {params}")
+            compiled[name] = compile_formula(name, text, params, merged_constants)
+
+        # 전부 컴파일에 성공한 뒤에만 교체 (잘못된 수정이 절반만 반영되는 일 방지)
+        for name in self.compiled:
+            if name not in compiled:
+                delattr(self, name)
+        self.compiled, self.constants = compiled, merged_constants
+        for name, formula in compiled.items():
+            setattr(self, name, formula.fn)
+        for attr, (name, param) in FORMULA_MAPS.items():
+            setattr(self, attr, compiled[name].over(param))
+
+    def reload(self):
+        """
+        formulas.json을 디스크에서 다시 읽어 재컴파일하고, 공식에서 파생된 캐시를 비웁니다.
+        살아 있는 액터는 GrowthSystem.refresh_stats로 최대 HP/MP를 다시 계산해야 합니다.
+        """
+        DataLoader._cache.pop(FormulaBook.DATA_FILE, None)
+        self.load()
+        # 순환 참조 방지를 위한 지역 임포트
+        from src.formulas.v22 import FORMULA as V22_FORMULA
+        from src.systems.ai_system import AISystem
+        from src.systems.auto_resolve_system import AutoResolveSystem
+        from src.systems.difficulty_system import DifficultySystem
+        V22_FORMULA.clear_cache()
+        AISystem.clear_cache()
+        AutoResolveSystem.clear_cache()
+        DifficultySystem.clear_cache()
+
+    def fingerprint(self) -> str:
+        """
+        현재 공식 전체의 지문 (결과 캐시 키용). 상수를 접은 컴파일 결과로 계산하므로
+        어떤 공식에도 쓰이지 않는 상수를 바꾸거나 식의 공백/괄호만 고쳐도 지문은 그대로입니다.
+        """
+        payload = json.dumps({name: [f.params, f.source] for name, f in self.compiled.items()}, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get(self, name: str) -> CompiledFormula:
+        formula = self.compiled.get(name)
+        if formula is None:
+            raise KeyError(f"Unknown formula: {name}")
+        return formula
+
+    def vectorized(self, name: str):
+        """공식의 NumPy 배열용 버전 (인자에 배열을 넣으면 원소별 결과 배열)."""
+        return self.get(name).vectorized()
+
+FORMULAS = FormulaBook()
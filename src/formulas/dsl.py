@@ -0,0 +1,343 @@
+# File: src/formulas/dsl.py
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # 배열 입력용 벡터화 컴파일 (선택 의존성)
+except ImportError:
+    np = None
+
+class FormulaError(ValueError):
+    """수식 문법/이름 오류. 어느 수식의 몇 번째 글자인지 메시지에 담습니다."""
+
+# ------------------------------------------------------------------------------
+# 함수 표 (수식 이름 -> (인자 수 범위, 스칼라 구현, NumPy 구현))
+# ------------------------------------------------------------------------------
+
+def _clamp(x, lo, hi):
+    return min(hi, max(lo, x))
+
+def _if(cond, a, b):
+    return a if cond else b
+
+def _vec_min(*args):
+    out = args[0]
+    for a in args[1:]:
+        out = np.minimum(out, a)
+    return out
+
+def _vec_max(*args):
+    out = args[0]
+    for a in args[1:]:
+        out = np.maximum(out, a)
+    return out
+
+def _vec_int(x):
+    # int()와 같은 0 방향 버림
+    return np.trunc(x).astype(np.int64)
+
+def _vec_floordiv(a, b):
+    return np.floor_divide(a, b)
+
+FUNCTIONS: Dict[str, Tuple[int, int, Callable, str]] = {
+    # 이름: (최소 인자, 최대 인자, 스칼라 함수, NumPy 함수 이름)
+    "min": (2, 8, min, "_vec_min"),
+    "max": (2, 8, max, "_vec_max"),
+    "clamp": (3, 3, _clamp, "_vec_clip"),
+    "int": (1, 1, int, "_vec_int"),
+    "floor": (1, 1, math.floor, "_vec_floor"),
+    "ceil": (1, 1, math.ceil, "_vec_ceil"),
+    "round": (1, 1, round, "_vec_round"),
+    "abs": (1, 1, abs, "_vec_abs"),
+    "sqrt": (1, 1, math.sqrt, "_vec_sqrt"),
+    "log": (1, 1, math.log, "_vec_log"),
+    "exp": (1, 1, math.exp, "_vec_exp"),
+    "if": (3, 3, _if, "_vec_where"),
+}
+
+# 비교 연산자 / 토큰 (숫자 | 이름 | 연산자)
+_COMPARE = ("<=", ">=", "==", "!=", "<", ">")
+_TOKEN = re.compile(r"(\d+\.\d*|\.\d+|\d+)|([A-Za-z_][A-Za-z0-9_]*)|(\*\*|//|<=|>=|==|!=|[-+*/%^(),<>])")
+
+# ------------------------------------------------------------------------------
+# 구문 트리: ("num", 값) / ("var", 이름) / ("neg", x) / ("bin", 연산자, a, b) / ("call", 함수, 인자들)
+# ------------------------------------------------------------------------------
+
+Node = tuple
+
+class _Parser:
+    """재귀 하강 파서. 우선순위: 비교 < 덧셈 < 곱셈 < 단항 부호 < 거듭제곱(우결합) < 호출/괄호."""
+
+    def __init__(self, name: str, text: str):
+        self.name = name
+        self.text = text
+        self.tokens: List[Tuple[str, str, int]] = []   # (종류, 글자, 위치)
+        pos = 0
+        while pos < len(text):
+            if text[pos].isspace():
+                pos += 1
+                continue
+            match = _TOKEN.match(text, pos)
+            if match is None:
+                raise self.error("unexpected character", pos)
+            number, ident, op = match.groups()
+            self.tokens.append(("num" if number else "name" if ident else "op", number or ident or op, pos))
+            pos = match.end()
+        self.i = 0
+
+    def error(self, message: str, pos: Optional[int] = None) -> FormulaError:
+        if pos is None:
+            pos = self.tokens[self.i][2] if self.i < len(self.tokens) else len(self.text)
+        return FormulaError(f"{self.name}: {message} at column {pos + 1}: {self.text!r}")
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.i][1] if self.i < len(self.tokens) else None
+
+    def take(self, expected: Optional[str] = None) -> Tuple[str, str, int]:
+        if self.i >= len(self.tokens):
+            raise self.error(f"expected {expected!r}" if expected else "unexpected end of formula")
+        token = self.tokens[self.i]
+        if expected is not None and token[1] != expected:
+            raise self.error(f"expected {expected!r}")
+        self.i += 1
+        return token
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise self.error("empty formula", 0)
+        node = self.compare()
+        if self.i < len(self.tokens):
+            raise self.error("unexpected token")
+        return node
+
+    def compare(self) -> Node:
+        node = self.additive()
+        while self.peek() in _COMPARE:
+            op = self.take()[1]
+            node = ("bin", op, node, self.additive())
+        return node
+
+    def additive(self) -> Node:
+        node = self.term()
+        while self.peek() in ("+", "-"):
+            op = self.take()[1]
+            node = ("bin", op, node, self.term())
+        return node
+
+    def term(self) -> Node:
+        node = self.unary()
+        while self.peek() in ("*", "/", "//", "%"):
+            op = self.take()[1]
+            node = ("bin", op, node, self.unary())
+        return node
+
+    def unary(self) -> Node:
+        if self.peek() == "-":
+            self.take()
+            return ("neg", self.unary())
+        if self.peek() == "+":
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self) -> Node:
+        node = self.atom()
+        if self.peek() in ("^", "**"):
+            self.take()
+            node = ("bin", "**", node, self.unary())   # -2^2 = -(2^2), 2^-1 허용
+        return node
+
+    def atom(self) -> Node:
+        kind, value, pos = self.take()
+        if kind == "num":
+            return ("num", float(value) if "." in value else int(value))
+        if kind == "name":
+            if self.peek() != "(":
+                return ("var", value)
+            if value not in FUNCTIONS:
+                raise self.error(f"unknown function {value!r}", pos)
+            self.take("(")
+            args = [self.compare()]
+            while self.peek() == ",":
+                self.take()
+                args.append(self.compare())
+            self.take(")")
+            lo, hi = FUNCTIONS[value][:2]
+            if not lo <= len(args) <= hi:
+                raise self.error(f"{value}() takes {lo}~{hi} arguments, got {len(args)}", pos)
+            return ("call", value, tuple(args))
+        if value == "(":
+            node = self.compare()
+            self.take(")")
+            return node
+        raise self.error(f"unexpected {value!r}", pos)
+
+def parse(name: str, text: str) -> Node:
+    return _Parser(name, str(text)).parse()
+
+# ------------------------------------------------------------------------------
+# 상수 접기
+# ------------------------------------------------------------------------------
+
+_BINARY: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": lambda a, b: a + b, "-": lambda a, b: a - b, "*": lambda a, b: a * b, "/": lambda a, b: a / b,
+    "//": lambda a, b: a // b, "%": lambda a, b: a % b, "**": lambda a, b: a ** b,
+    "<": lambda a, b: a < b, "<=": lambda a, b: a <= b, ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b, "==": lambda a, b: a == b, "!=": lambda a, b: a != b,
+}
+
+def fold(node: Node, constants: Dict[str, float], params: Sequence[str], name: str = "formula") -> Node:
+    """
+    이름 있는 상수를 값으로 바꾸고, 인자가 모두 숫자인 부분식을 미리 계산합니다.
+    부분식 단위로만 접으므로 계산 순서(부동소수점 결과)는 손으로 쓴 식과 같습니다.
+    """
+    kind = node[0]
+    if kind == "num":
+        return node
+    if kind == "var":
+        if node[1] in params:
+            return node
+        if node[1] in constants:
+            return ("num", constants[node[1]])
+        raise FormulaError(f"{name}: unknown name {node[1]!r} (parameters: {', '.join(params)})")
+    if kind == "neg":
+        inner = fold(node[1], constants, params, name)
+        return ("num", -inner[1]) if inner[0] == "num" else ("neg", inner)
+    if kind == "bin":
+        a, b = fold(node[2], constants, params, name), fold(node[3], constants, params, name)
+        if a[0] == "num" and b[0] == "num":
+            try:
+                return ("num", _BINARY[node[1]](a[1], b[1]))
+            except ZeroDivisionError:
+                raise FormulaError(f"{name}: division by zero in constant expression")
+        return ("bin", node[1], a, b)
+    args = tuple(fold(arg, constants, params, name) for arg in node[2])
+    if node[1] == "if" and args[0][0] == "num":
+        return args[1] if args[0][1] else args[2]   # 조건이 상수면 분기 하나만 남김
+    if all(arg[0] == "num" for arg in args):
+        return ("num", FUNCTIONS[node[1]][2](*(arg[1] for arg in args)))
+    return ("call", node[1], args)
+
+# ------------------------------------------------------------------------------
+# 코드 생성 / 컴파일
+# ------------------------------------------------------------------------------
+
+def to_source(node: Node, vectorized: bool = False) -> str:
+    """구문 트리 -> 괄호를 모두 붙인 Python 식 (계산 순서를 트리 그대로 고정)."""
+    kind = node[0]
+    if kind == "num":
+        return repr(node[1])
+    if kind == "var":
+        return node[1]
+    if kind == "neg":
+        return f"(-{to_source(node[1], vectorized)})"
+    if kind == "bin":
+        a, b = to_source(node[2], vectorized), to_source(node[3], vectorized)
+        if vectorized and node[1] == "//":
+            return f"_vec_floordiv({a}, {b})"
+        return f"({a} {node[1]} {b})"
+    args = [to_source(arg, vectorized) for arg in node[2]]
+    if vectorized:
+        return f"{FUNCTIONS[node[1]][3]}({', '.join(args)})"
+    if node[1] == "if":
+        return f"({args[1]} if {args[0]} else {args[2]})"   # 선택되지 않은 쪽은 계산하지 않음
+    if node[1] == "clamp":
+        return f"min({args[2]}, max({args[1]}, {args[0]}))"
+    return f"{node[1]}({', '.join(args)})"
+
+def _uses(node: Node, name: str) -> bool:
+    if node[0] == "var":
+        return node[1] == name
+    if node[0] == "num":
+        return False
+    children = node[1:2] if node[0] == "neg" else node[2:4] if node[0] == "bin" else node[2]
+    return any(_uses(child, name) for child in children)
+
+def _hoist(node: Node, param: str, hoisted: List[str]) -> Node:
+    """param을 쓰지 않는 가장 큰 부분식을 임시 변수(_h0, _h1...)로 빼냅니다."""
+    kind = node[0]
+    if kind in ("num", "var"):
+        return node
+    if not _uses(node, param):
+        hoisted.append(to_source(node))
+        return ("var", f"_h{len(hoisted) - 1}")
+    if kind == "neg":
+        return ("neg", _hoist(node[1], param, hoisted))
+    if kind == "bin":
+        return ("bin", node[1], _hoist(node[2], param, hoisted), _hoist(node[3], param, hoisted))
+    if node[1] == "if":
+        return node   # 분기 식은 조건에 따라 계산 여부가 갈리므로 그대로 둠
+    return ("call", node[1], tuple(_hoist(arg, param, hoisted) for arg in node[2]))
+
+def _scalar_namespace() -> dict:
+    names = {"__builtins__": {}}
+    for fname, (_, _, func, _) in FUNCTIONS.items():
+        if fname not in ("if", "clamp"):   # if/clamp는 식으로 펼쳐짐
+            names[fname] = func
+    return names
+
+def _vector_namespace() -> dict:
+    return {
+        "__builtins__": {},
+        "_vec_min": _vec_min, "_vec_max": _vec_max, "_vec_int": _vec_int, "_vec_floordiv": _vec_floordiv,
+        "_vec_clip": np.clip, "_vec_floor": np.floor, "_vec_ceil": np.ceil, "_vec_round": np.round,
+        "_vec_abs": np.abs, "_vec_sqrt": np.sqrt, "_vec_log": np.log, "_vec_exp": np.exp, "_vec_where": np.where,
+    }
+
+@dataclass
+class CompiledFormula:
+    """
+    파싱 -> 상수 접기 -> Python 바이트코드로 컴파일된 수식 하나.
+    fn은 손으로 쓴 lambda와 같은 바이트코드이므로 호출 비용도 같습니다.
+    vectorized()는 같은 트리를 NumPy 연산으로 컴파일한 배열용 함수 (처음 요청 시 생성).
+    """
+    name: str
+    params: Tuple[str, ...]
+    text: str
+    tree: Node
+    source: str
+    fn: Callable
+    _vector: Optional[Callable] = field(default=None, repr=False)
+
+    def __call__(self, *args):
+        return self.fn(*args)
+
+    def over(self, param: str) -> Callable:
+        """
+        param 하나를 사전의 여러 키에 대해 한 번에 계산하는 함수 (호출 1회로 사전 전체 변환):
+            f(values, keys, default, *나머지 인자) -> {key: 수식(param=values.get(key, default), ...)}
+        param과 무관한 부분식은 키 반복 밖에서 한 번만 계산합니다 (루프 불변식 끌어올리기).
+        """
+        if param not in self.params:
+            raise FormulaError(f"{self.name}: no parameter {param!r}")
+        hoisted: List[str] = []
+        body = to_source(_hoist(self.tree, param, hoisted))
+        rest = [p for p in self.params if p != param]
+        lines = [f"def _over({', '.join(['_values', '_keys', '_default'] + rest)}):"]
+        lines += [f"    _h{i} = {source}" for i, source in enumerate(hoisted)]
+        lines.append(f"    return {{_k: {body} for _k in _keys for {param} in [_values.get(_k, _default)]}}")
+        names = _scalar_namespace()
+        exec(compile("\n".join(lines), f"<formula:{self.name}:over:{param}>", "exec"), names)
+        return names["_over"]
+
+    def vectorized(self) -> Callable:
+        if self._vector is None:
+            if np is None:
+                raise RuntimeError("NumPy is required for vectorized formulas")
+            body = to_source(self.tree, vectorized=True)
+            code = compile(f"lambda {', '.join(self.params)}: {body}", f"<formula:{self.name}:vec>", "eval")
+            self._vector = eval(code, _vector_namespace())
+        return self._vector
+
+def compile_formula(name: str, text: str, params: Sequence[str],
+                    constants: Optional[Dict[str, float]] = None) -> CompiledFormula:
+    params = tuple(params)
+    for p in params:
+        if p in FUNCTIONS:
+            raise FormulaError(f"{name}: parameter {p!r} shadows a function")
+    tree = fold(parse(name, text), constants or {}, params, name)
+    source = to_source(tree)
+    code = compile(f"lambda {', '.join(params)}: {source}", f"<formula:{name}>", "eval")
+    return CompiledFormula(name, params, str(text), tree, source, eval(code, _scalar_namespace()))
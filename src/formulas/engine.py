@@ -0,0 +1,253 @@
+# File: src/formulas/engine.py
+import importlib
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 버전 이름 -> 공식 세트 모듈 (각 모듈은 FORMULA 인스턴스를 노출)
+FORMULA_MODULES = {
+    "v2.2": "src.formulas.v22",   # 실제 게임 (CombatSystem + MathEngine)
+    "v6.1": "src.formulas.v61",   # src/simulation.py 스트레스 테스트
+    "v9": "src.formulas.v9",      # src/combat_simulator.py 이론 모델 (키스톤)
+}
+
+Roll = Callable[[str], float]     # 용도("hit"/"variance"/"crit") -> [0, 1) 난수
+
+def global_roll(purpose: str) -> float:
+    """전역 random 모듈을 쓰는 기본 난수원 (용도 무시)."""
+    return random.random()
+
+def rng_roll(rng) -> Roll:
+    """random.Random 인스턴스를 Roll로 감쌉니다."""
+    return lambda purpose: rng.random()
+
+@dataclass(frozen=True)
+class Matchup:
+    """
+    (공격자, 방어자, 스킬) 조합마다 한 번 계산해 두는 결정적 값들. 타격 1회는 여기에 난수만 더해 처리됩니다.
+
+    피해 파이프라인: base x 분산 x pre... x (치명타 배율) x post... + flat -> 정수화(최소 1)
+                     -> 반사 = int(피해 x reflect_rate) -> 피해 x post_mult.
+    곱셈은 기존 구현과 같은 순서로 한 번에 하나씩 적용되므로 같은 난수에서 같은 결과가 나옵니다.
+    """
+    hit_window: Optional[Tuple[float, float]]  # lo <= 난수 < hi 이면 명중. None = 필중 (난수 소모 없음)
+    base: float
+    variance: Optional[Tuple[float, float]] = None   # U(lo, hi) 배율. None = 분산 없음
+    pre: Tuple[float, ...] = ()                      # 분산 뒤, 치명타 앞 배율
+    crit_chance: Optional[float] = None              # None = 치명타 불가 (난수 소모 없음)
+    crit_mult: float = 1.0
+    post: Tuple[float, ...] = ()                     # 치명타 뒤 배율
+    flat: float = 0.0                                # 정수화 직전 고정 추가 피해
+    reflect_rate: float = 0.0
+    post_mult: float = 1.0                           # 반사 계산 뒤 적용 (받는 피해 증가 등)
+    regen: int = 0                                   # 피격 후 살아 있으면 방어자 회복량
+
+    @property
+    def hit_chance(self) -> float:
+        if self.hit_window is None:
+            return 1.0
+        lo, hi = self.hit_window
+        return max(0.0, min(1.0, hi) - max(0.0, lo))
+
+class FormulaSet:
+    """
+    공식 세트 플러그인의 기반 클래스.
+    prepare()로 전투 시작 시 액터를 스냅샷하고, matchup()으로 (공격자, 방어자, 스킬)별 Matchup을 만듭니다.
+    명중/피해/경감/치명타/반사/재생 단계는 모두 Matchup 필드로 표현되고, 실제 난수 처리는 FormulaEngine이 맡습니다.
+
+    밸런스 상수는 클래스 속성이 기본값이고, 인스턴스를 만들 때 CONSTANTS에 있는 이름만 덮어쓸 수 있습니다
+    (V9Formula(CRIT_CAP=0.4)). 공식은 self의 상수를 읽으므로 인스턴스 여러 개가 한 프로세스에서 공존합니다.
+    만든 뒤에는 상수를 바꾸지 않습니다 (BalanceProfile이 불변 묶음으로 보관).
+    """
+    name = ""
+    CONSTANTS: Tuple[str, ...] = ()
+
+    def __init__(self, **overrides):
+        for key, value in overrides.items():
+            if key not in self.CONSTANTS:
+                raise KeyError(f"Unknown {self.name} constant: {key}")
+            setattr(self, key, value)
+        self.overrides: Dict[str, object] = dict(overrides)
+
+    def values(self) -> Dict[str, object]:
+        """이 인스턴스의 실제 상수 값 (기본값 + 덮어쓴 값)."""
+        return {key: getattr(self, key) for key in self.CONSTANTS}
+
+    def prepare(self, actor):
+        """버전별 액터 -> 전투용 스냅샷."""
+        raise NotImplementedError
+
+    def create(self, actor_id: str, stats: Dict[str, int], level: int):
+        """
+        버전 공통 스탯(strength/dexterity/constitution/intelligence)으로 스냅샷을 만듭니다.
+        같은 빌드를 여러 공식 세트로 비교할 때 사용합니다.
+        """
+        raise NotImplementedError
+
+    def max_hp(self, combatant) -> int:
+        return combatant.max_hp
+
+    def matchup(self, attacker, defender, skill=None) -> Matchup:
+        raise NotImplementedError
+
+@dataclass
+class DuelResult:
+    """FormulaEngine.duel 결과. damages/reflects는 플레이어(A)의 명중 피해/받은 반사."""
+    win: bool = False
+    rounds: int = 0
+    actions: int = 0
+    attempts: int = 0
+    hits: int = 0
+    crits: int = 0
+    damages: List[int] = field(default_factory=list)
+    reflects: List[int] = field(default_factory=list)
+
+class FormulaEngine:
+    """
+    모든 전투 코어(v2.2 실게임, v6.1/v9 시뮬레이션)가 공유하는 단일 타격 처리 경로.
+    공식 세트는 Matchup만 만들고, 명중 판정 -> 분산 -> 치명타 -> 정수화 -> 반사 순서의 난수 처리는 여기서 한 번만 구현합니다.
+    """
+
+    _formulas: Dict[str, FormulaSet] = {}
+
+    @staticmethod
+    def get(version: str) -> FormulaSet:
+        formula = FormulaEngine._formulas.get(version)
+        if formula is None:
+            if version not in FORMULA_MODULES:
+                raise KeyError(f"Unknown formula set: {version} (available: {', '.join(FORMULA_MODULES)})")
+            formula = FormulaEngine._formulas[version] = importlib.import_module(FORMULA_MODULES[version]).FORMULA
+        return formula
+
+    @staticmethod
+    def versions() -> List[str]:
+        return list(FORMULA_MODULES)
+
+    # --------------------------------------------------------------------------
+    # 타격 1회 (핫 패스)
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def roll_hit(m: Matchup, roll: Roll = global_roll) -> bool:
+        window = m.hit_window
+        if window is None:
+            return True
+        r = roll("hit")
+        return window[0] <= r < window[1]
+
+    @staticmethod
+    def roll_damage(m: Matchup, roll: Roll = global_roll) -> Tuple[int, bool, int]:
+        """명중한 타격의 (피해, 치명타 여부, 반사 피해)."""
+        value = m.base
+        if m.variance is not None:
+            lo, hi = m.variance
+            value = value * (lo + (hi - lo) * roll("variance"))   # random.uniform과 같은 식
+        for factor in m.pre:
+            value *= factor
+        crit = m.crit_chance is not None and roll("crit") < m.crit_chance
+        if crit:
+            value *= m.crit_mult
+        for factor in m.post:
+            value *= factor
+        damage = int(max(1, value + m.flat))
+        reflect = int(damage * m.reflect_rate) if m.reflect_rate else 0
+        if m.post_mult != 1.0:
+            damage = int(damage * m.post_mult)
+        return damage, crit, reflect
+
+    @staticmethod
+    def strike(m: Matchup, roll: Roll = global_roll) -> Tuple[int, bool, int]:
+        """명중 판정 + 피해. 빗나가면 (0, False, 0)."""
+        if not FormulaEngine.roll_hit(m, roll):
+            return 0, False, 0
+        return FormulaEngine.roll_damage(m, roll)
+
+    @staticmethod
+    def expected(m: Matchup) -> dict:
+        """난수 없는 기대값 근사: 명중 확률, 명중 시 기대 피해/반사, 재생량 (빌드 사전 선별용)."""
+        value = m.base
+        if m.variance is not None:
+            value *= sum(m.variance) / 2
+        for factor in m.pre:
+            value *= factor
+        value = max(1.0, value)
+        if m.crit_chance is not None:
+            value *= 1.0 + m.crit_chance * (m.crit_mult - 1.0)
+        for factor in m.post:
+            value *= factor
+        value += m.flat
+        reflect = value * m.reflect_rate
+        return {"hit_prob": m.hit_chance, "dmg": value * m.post_mult, "reflect": reflect, "regen": m.regen}
+
+    @staticmethod
+    def damage_pmf(m: Matchup) -> Dict[int, float]:
+        """
+        타격 1회의 피해량 확률분포 (빗나감 = 0, 반사 제외).
+        균등 분산 구간을 정수 경계로 잘라 각 피해값의 확률을 정확히 계산합니다.
+        """
+        hit = m.hit_chance
+        pmf: Dict[int, float] = {0: 1.0 - hit} if hit < 1.0 else {}
+        scale = 1.0
+        for factor in m.pre + m.post:
+            scale *= factor
+        lo_var, hi_var = m.variance if m.variance is not None else (1.0, 1.0)
+        crit = 0.0 if m.crit_chance is None else max(0.0, min(1.0, m.crit_chance))
+
+        def add(damage: int, p: float):
+            if m.post_mult != 1.0:
+                damage = int(damage * m.post_mult)
+            pmf[damage] = pmf.get(damage, 0.0) + p
+
+        for mult, p in ((1.0, 1.0 - crit), (m.crit_mult, crit)):
+            if p <= 0:
+                continue
+            lo = m.base * lo_var * scale * mult + m.flat
+            hi = m.base * hi_var * scale * mult + m.flat
+            if hi - lo <= 0:
+                add(int(max(1, lo)), hit * p)
+                continue
+            for k in range(int(lo), int(hi) + 1):
+                width = min(hi, k + 1) - max(lo, k)
+                if width > 0:
+                    add(max(1, k), hit * p * width / (hi - lo))
+        return pmf
+
+    # --------------------------------------------------------------------------
+    # 1대1 결투 (버전 비교용 공통 루프)
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def duel(formula: FormulaSet, a, b, max_rounds: int = 100, roll_a: Roll = global_roll,
+             roll_b: Roll = global_roll) -> DuelResult:
+        """
+        A 선공으로 번갈아 공격합니다. 방어자가 쓰러지면 공격자 승리, 반사로 공격자만 쓰러지면 방어자 승리.
+        Matchup은 결투당 양방향 한 번씩만 만듭니다.
+        """
+        ab, ba = formula.matchup(a, b), formula.matchup(b, a)
+        hp = [formula.max_hp(a), formula.max_hp(b)]
+        result = DuelResult()
+        strike = FormulaEngine.strike
+        for rnd in range(1, max_rounds + 1):
+            result.rounds = rnd
+            for attacker, m, roll in ((0, ab, roll_a), (1, ba, roll_b)):
+                defender = 1 - attacker
+                damage, crit, reflect = strike(m, roll)
+                result.actions += 1
+                if attacker == 0:
+                    result.attempts += 1
+                    if damage:
+                        result.hits += 1
+                        result.crits += crit
+                        result.damages.append(damage)
+                        result.reflects.append(reflect)
+                hp[defender] -= damage
+                hp[attacker] -= reflect
+                if hp[defender] <= 0:
+                    result.win = attacker == 0
+                    return result
+                if hp[attacker] <= 0:
+                    result.win = attacker == 1
+                    return result
+                if damage and m.regen:
+                    hp[defender] += m.regen
+        return result
@@ -0,0 +1,109 @@
+# File: src/formulas/profile.py
+import json
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from src.formulas.book import FORMULAS, FormulaBook
+from src.formulas.engine import FormulaSet
+from src.formulas.v9 import V9Formula, FORMULA as V9_FORMULA
+from src.formulas.v61 import V61Formula, FORMULA as V61_FORMULA
+from src.formulas.v22 import V22Formula, FORMULA as V22_FORMULA
+
+# 덮어쓰기 묶음 이름 -> 대상 ("formulas"는 FormulaBook 상수: HP_PER_CON 등 GrowthSystem 공식 계수)
+GROUPS = ("v9", "v61", "v22", "formulas")
+
+@dataclass(frozen=True)
+class BalanceProfile:
+    """
+    한 벌의 밸런스 설정 (불변). 세 전투 코어의 공식 세트와 성장 공식(FormulaBook)을 함께 묶습니다.
+
+    전역 상수를 바꾸는 대신 프로필을 넘깁니다:
+        simulate_duel(..., profile=p) / simulate_battle(..., profile=p)      # v9 / v6.1 코어
+        EntityFactory.create_player(..., profile=p)                          # v2.2 성장/전투 (actor.profile)
+    프로필마다 공식 세트 인스턴스와 컴파일된 FormulaBook을 따로 가지므로, 데이터를 다시 읽지 않고
+    한 프로세스에서 여러 변형을 번갈아 평가할 수 있습니다. 기본 프로필(DEFAULT_PROFILE)은 모듈 전역
+    인스턴스(v9/v61/v22 FORMULA, FORMULAS)를 그대로 감싸므로 기존 결과와 비트 단위로 같습니다.
+    """
+    name: str
+    v9: V9Formula
+    v61: V61Formula
+    v22: V22Formula
+    formulas: FormulaBook
+
+    def __post_init__(self):
+        # v2.2 create()가 만드는 액터도 이 프로필의 성장 공식을 쓰도록 역참조
+        if getattr(self.v22, "profile", None) is None:
+            self.v22.profile = self
+
+    @staticmethod
+    def create(name: str, v9: Optional[Dict[str, object]] = None, v61: Optional[Dict[str, object]] = None,
+               v22: Optional[Dict[str, object]] = None, formulas: Optional[Dict[str, float]] = None) -> "BalanceProfile":
+        """
+        기본값에서 일부 상수만 바꾼 프로필. 각 인자는 {상수 이름: 값}.
+        formulas 상수를 바꾸면 이 프로필 전용 FormulaBook을 새로 컴파일합니다 (formulas.json 내용 위에 덮어씀).
+        """
+        if formulas:
+            unknown = sorted(set(formulas) - set(FORMULAS.constants))
+            if unknown:
+                raise KeyError(f"Unknown formula constants: {', '.join(unknown)}")
+            book = FormulaBook(constants=formulas)
+        else:
+            book = FORMULAS
+        return BalanceProfile(name, V9Formula(**(v9 or {})), V61Formula(**(v61 or {})),
+                              V22Formula(book, **(v22 or {})), book)
+
+    def derive(self, name: str, **groups: Dict[str, object]) -> "BalanceProfile":
+        """이 프로필의 덮어쓰기에 groups(v9=/v61=/v22=/formulas=)를 더한 새 프로필."""
+        merged = self.overrides
+        for group, values in groups.items():
+            if group not in GROUPS:
+                raise KeyError(f"Unknown profile group: {group}")
+            merged[group] = {**merged[group], **values}
+        return BalanceProfile.create(name, **merged)
+
+    @staticmethod
+    def parse(spec: str) -> Dict[str, Dict[str, object]]:
+        """
+        "v9.CRIT_CAP=0.4,formulas.HP_PER_CON=18" -> {"v9": {"CRIT_CAP": 0.4}, "formulas": {"HP_PER_CON": 18}} (CLI용).
+        값은 기본 상수의 타입을 따릅니다 (정수 상수에 정수 값이면 int, 그 외는 float - 튜너가 낸 소수 값도 허용).
+        """
+        defaults = {"v9": V9_FORMULA.values(), "v61": V61_FORMULA.values(), "v22": V22_FORMULA.values(),
+                    "formulas": FORMULAS.constants}
+        groups: Dict[str, Dict[str, object]] = {}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            target, value = item.split("=")
+            group, key = target.split(".")
+            if group not in GROUPS:
+                raise KeyError(f"Unknown profile group: {group}")
+            number = float(value)
+            if type(defaults[group].get(key)) is int and number.is_integer():
+                number = int(number)
+            groups.setdefault(group, {})[key] = number
+        return groups
+
+    # --------------------------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------------------------
+
+    @property
+    def overrides(self) -> Dict[str, Dict[str, object]]:
+        """기본값과 다른 상수만 묶음별로 (derive/fingerprint/출력용)."""
+        book = {k: v for k, v in self.formulas.constants.items() if FORMULAS.constants.get(k) != v}
+        return {"v9": dict(self.v9.overrides), "v61": dict(self.v61.overrides), "v22": dict(self.v22.overrides),
+                "formulas": book}
+
+    def formula(self, version: str) -> FormulaSet:
+        """FormulaEngine 버전 이름("v9"/"v6.1"/"v2.2")의 이 프로필 공식 세트."""
+        sets = {V9Formula.name: self.v9, V61Formula.name: self.v61, V22Formula.name: self.v22}
+        if version not in sets:
+            raise KeyError(f"Unknown formula version: {version}")
+        return sets[version]
+
+    def fingerprint(self) -> str:
+        """프로필의 실제 계산 규칙 지문 (SimCache 엔진 키용). 이름은 포함하지 않습니다."""
+        payload = {"v9": self.v9.values(), "v61": self.v61.values(), "v22": self.v22.values(),
+                   "formulas": self.formulas.fingerprint()}
+        return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+DEFAULT_PROFILE = BalanceProfile("default", V9_FORMULA, V61_FORMULA, V22_FORMULA, FORMULAS)
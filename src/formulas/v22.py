@@ -0,0 +1,101 @@
+# File: src/formulas/v22.py
+from typing import Dict, Optional, Tuple
+
+from src.formulas.book import FORMULAS, FormulaBook
+from src.formulas.engine import FormulaSet, Matchup
+from src.models.actor import Actor
+from src.systems.growth_system import GrowthSystem
+
+INF = float("inf")
+
+class V22Formula(FormulaSet):
+    """
+    v2.2 (실제 게임) 공식 세트 - GrowthSystem 파생 능력치 기반.
+    명중: 방어자 회피율 판정 (마법 필중) / 피해: (AP x 계수 + SP x 계수) x U(0.9, 1.1)
+    치명타: DEX 기반, 1.5배 / 경감: 물리·하이브리드만 CON 기반 % 감소 / 재생: 행동당 MP 2.
+    book: 파생 능력치/치명타/스킬 기본 피해 공식 (None이면 전역 FORMULAS).
+    """
+    name = "v2.2"
+    VARIANCE = (0.9, 1.1)
+    CRIT_MULT = 1.5
+    MP_REGEN = 2
+    MAX_CACHED = 50_000   # 실게임 Matchup 캐시가 이보다 커지면 비움
+
+    CONSTANTS = ("VARIANCE", "CRIT_MULT", "MP_REGEN")
+
+    def __init__(self, book: Optional[FormulaBook] = None, **overrides):
+        super().__init__(**overrides)
+        self.book = book if book is not None else FORMULAS
+        self.profile = None   # 이 세트를 가진 BalanceProfile (프로필이 만들 때 연결)
+        self._live: Dict[tuple, Matchup] = {}
+
+    def crit_chance(self, dex: int) -> float:
+        """치명타 확률: DEX 10 기준 5%, DEX 1포인트당 0.5% 추가 (formulas.json의 crit_chance)."""
+        return self.book.crit_chance(dex)
+
+    @staticmethod
+    def skill_key(skill: dict) -> Tuple[str, float, float]:
+        scaling = skill.get("scaling", {"ap": 1.0, "sp": 0.0})
+        return skill.get("type", "physical"), scaling.get("ap", 0.0), scaling.get("sp", 0.0)
+
+    def build(self, ap: int, sp: int, crit: float, evasion: float, defense: float, skill_type: str,
+              ap_coef: float, sp_coef: float) -> Matchup:
+        return Matchup(
+            hit_window=None if skill_type == "magic" else (evasion, INF),   # 난수 >= 회피율 이면 명중
+            base=self.book.skill_base(ap, sp, ap_coef, sp_coef),
+            variance=self.VARIANCE,
+            crit_chance=crit,
+            crit_mult=self.CRIT_MULT,
+            post=(1.0 - defense,) if skill_type in ("physical", "hybrid") else (),
+        )
+
+    # --------------------------------------------------------------------------
+    # FormulaSet
+    # --------------------------------------------------------------------------
+
+    def prepare(self, actor: Actor):
+        from src.systems.combat_profile import CombatProfile   # 순환 참조 방지를 위한 지역 임포트
+        return CombatProfile.from_actor(actor)
+
+    def create(self, actor_id: str, stats: Dict[str, int], level: int):
+        actor = Actor(actor_id, actor_id, "none", "none", level=level, profile=self.profile)
+        actor.base_stats.update(stats)
+        GrowthSystem.refresh_stats(actor)
+        return self.prepare(actor)
+
+    def matchup(self, attacker, defender, skill=None) -> Matchup:
+        """CombatProfile 두 개와 SkillProfile(None이면 평타)로 Matchup을 만듭니다."""
+        if skill is None:
+            return self.build(attacker.ap, attacker.sp, attacker.crit, defender.evasion, defender.defense,
+                                    "physical", 1.0, 0.0)
+        return self.build(attacker.ap, attacker.sp, attacker.crit, defender.evasion, defender.defense,
+                                skill.type, skill.ap_coef, skill.sp_coef)
+
+    # --------------------------------------------------------------------------
+    # 실게임 경로 (Actor + 스킬 데이터)
+    # --------------------------------------------------------------------------
+
+    def live_matchup(self, attacker: Actor, defender: Actor, skill: dict) -> Matchup:
+        """
+        Actor와 skills.json 항목으로 Matchup을 만듭니다.
+        양쪽의 능력치 재계산 버전과 레벨이 같으면 캐시된 Matchup을 그대로 씁니다.
+        """
+        a_dex = GrowthSystem.get_scaled_stat(attacker, "dexterity")   # dirty면 여기서 재계산 (버전 갱신)
+        GrowthSystem.get_scaled_stat(defender, "dexterity")
+        skill_key = V22Formula.skill_key(skill)
+        key = (attacker.id, attacker._stats_version, attacker.level,
+               defender.id, defender._stats_version, defender.level, skill_key)
+        m = self._live.get(key)
+        if m is None:
+            if len(self._live) >= V22Formula.MAX_CACHED:
+                self._live.clear()
+            m = self._live[key] = self.build(
+                GrowthSystem.get_attack_power(attacker), GrowthSystem.get_magic_power(attacker),
+                self.crit_chance(a_dex), GrowthSystem.get_evasion(defender), GrowthSystem.get_defense(defender),
+                *skill_key)
+        return m
+
+    def clear_cache(self):
+        self._live.clear()
+
+FORMULA = V22Formula()
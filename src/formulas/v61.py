@@ -0,0 +1,83 @@
+# File: src/formulas/v61.py
+import math
+from dataclasses import dataclass
+from typing import Dict
+
+from src.formulas.engine import FormulaSet, Matchup
+
+INF = float("inf")
+
+# 버전 공통 스탯 이름 -> v6.1 스탯 이름
+STAT_NAMES = {"strength": "STR", "dexterity": "DEX", "constitution": "CON", "intelligence": "INT"}
+
+@dataclass(frozen=True)
+class V61Combatant:
+    """전투 시작 시 한 번 계산하는 v6.1 스탯 스냅샷 (로그 스케일 적용 후)."""
+    id: str
+    STR: int
+    DEX: int
+    CON: int
+    attack_power: int
+    defense: int
+    accuracy: int
+    evasion: int
+    max_hp: int
+
+class V61Formula(FormulaSet):
+    """
+    v6.1 (Refined Equilibrium) 공식 세트 - 스트레스 테스트용 삼각 균형 모델.
+    명중: max(최소 명중, 명중 / (명중 + 회피 x 0.6)) / 피해: 공격력 x 방어 감쇄 x U(0.95, 1.05) x STR 압도
+    x CON 저항 -> 치명타 -> DEX 관통 -> CON 보복 피해 / 반사: 방어자 CON 비례 (상한 20%).
+    """
+    name = "v6.1"
+    BASE_CRIT_MULT = 1.5
+    MAX_CRIT_MULT = 2.2         # [v6.1] 암살자의 죽창력을 위해 상향
+    MAX_CRIT_CHANCE = 0.40      # [v6.1] 상향
+    CRIT_CHANCE_FACTOR = 0.015
+    EVA_FACTOR = 0.6            # [v6.1] 회피 효율 상향
+    REFLECT_CAP = 0.20          # [v6.1] 반사 상한 소폭 상향
+    MIN_HIT_CHANCE = 0.65       # [v6.1] 최소 명중률을 낮춰서 고DEX 캐릭터의 회피를 실질적으로 보장
+    VARIANCE = (0.95, 1.05)
+
+    CONSTANTS = ("BASE_CRIT_MULT", "MAX_CRIT_MULT", "MAX_CRIT_CHANCE", "CRIT_CHANCE_FACTOR", "EVA_FACTOR",
+                 "REFLECT_CAP", "MIN_HIT_CHANCE", "VARIANCE")
+
+    def prepare(self, actor) -> V61Combatant:
+        stats = actor.get_scaled_stats()
+        return V61Combatant(actor.id, stats["STR"], stats["DEX"], stats["CON"], actor.attack_power,
+                            actor.defense, actor.accuracy, actor.evasion, actor.max_hp)
+
+    def create(self, actor_id: str, stats: Dict[str, int], level: int) -> V61Combatant:
+        from src.simulation import StressTestActor   # 순환 참조 방지를 위한 지역 임포트
+        base = {v61: stats.get(name, 10) for name, v61 in STAT_NAMES.items()}
+        return self.prepare(StressTestActor(actor_id, actor_id, "test", "test", level=level, base_stats=base))
+
+    def matchup(self, attacker: V61Combatant, defender: V61Combatant, skill=None) -> Matchup:
+        # [Step 1] 명중: 난수 > 명중률 이면 빗나감 (명중률과 같은 난수는 명중)
+        acc, eva = attacker.accuracy, defender.evasion
+        hit_chance = max(self.MIN_HIT_CHANCE, acc / (acc + (eva * self.EVA_FACTOR)))
+
+        # [Step 2~4] 방어 감쇄 -> 분산 -> STR 압도 -> CON 고유 저항
+        atk = attacker.attack_power
+        mitigation = atk / (atk + defender.defense * 0.65)
+        overpower_mult = 1.0 + (attacker.STR / (attacker.STR + 80) * 0.25)
+        con_resilience = defender.CON / (defender.CON + 100)
+
+        # [Step 5] 치명타 / [Step 6] DEX 관통
+        crit_mult = self.BASE_CRIT_MULT + (attacker.DEX * 0.02)
+        pen_rate = attacker.DEX / (attacker.DEX + 40)
+
+        # [Step 7] CON 보복 피해 (CON > STR 인 공격자) / 반사 상한
+        return Matchup(
+            hit_window=(-INF, math.nextafter(hit_chance, INF)),
+            base=atk * mitigation,
+            variance=self.VARIANCE,
+            pre=(overpower_mult, 1.0 - con_resilience),
+            crit_chance=min(self.MAX_CRIT_CHANCE, attacker.DEX * self.CRIT_CHANCE_FACTOR),
+            crit_mult=min(self.MAX_CRIT_MULT, crit_mult),
+            post=(1.0 + pen_rate,),
+            flat=defender.CON * 0.5 if attacker.CON > attacker.STR else 0.0,
+            reflect_rate=min(self.REFLECT_CAP, con_resilience),
+        )
+
+FORMULA = V61Formula()
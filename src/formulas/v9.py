@@ -0,0 +1,236 @@
+# File: src/formulas/v9.py
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional
+
+try:
+    import numpy as np  # 스탯 격자 전체의 Matchup을 배열로 한 번에 계산 (선택 의존성)
+except ImportError:
+    np = None
+
+from src.config import GLOBAL_DAMAGE_SCALE
+from src.formulas.engine import FormulaSet, Matchup
+
+INF = float("inf")
+
+class MathEngine:
+    """
+    업로드된 문서(WoW Defense, PoE Pipelines)의 핵심 공식을 구현한 엔진.
+    """
+    @staticmethod
+    def calculate_defense_dr(armor: int, attacker_level: int) -> float:
+        """
+        WoW Hyperbolic Defense Formula: DR = Armor / (Armor + K)
+        K = 400 + 85 * Level (문서 기준 상수)
+        """
+        k_constant = 400 + (85 * attacker_level)
+        if armor <= 0: return 0.0
+        return armor / (armor + k_constant)
+
+    @staticmethod
+    def calculate_hit_chance(accuracy: int, evasion: int, min_chance: float = 0.05, max_chance: float = 1.0) -> float:
+        """
+        Standard Hit Formula: Acc / (Acc + Eva)^Entropy
+        여기서는 PoE 스타일의 엔트로피 대신 표준 명중 공식 사용.
+        """
+        if accuracy <= 0: return min_chance
+        chance = accuracy / (accuracy + (evasion * 0.5)) # 회피 효율 0.5 계수 적용
+        return max(min_chance, min(max_chance, chance))
+
+class StatBucket:
+    """
+    PoE Style Damage Pipeline:
+    Base -> Flat -> Increased(Sum) -> More(Product)
+    """
+    def __init__(self, base_value: float):
+        self.base = base_value
+        self.flat = 0.0
+        self.increased = 0.0 # 합연산 (예: 0.5 = 50% 증가)
+        self.more = []       # 곱연산 (예: 1.5 = 50% 증폭)
+
+    def add_flat(self, val: float): self.flat += val
+    def add_increased(self, val: float): self.increased += val
+    def add_more(self, val: float): self.more.append(val)
+
+    def calculate(self) -> float:
+        # Step 1 & 2: Base + Flat
+        val = self.base + self.flat
+        # Step 3: Increased (Additive)
+        val *= (1.0 + self.increased)
+        # Step 4: More (Multiplicative)
+        for m in self.more:
+            val *= m
+        return val
+
+@dataclass(frozen=True)
+class V9Combatant:
+    """전투 시작 시 한 번 계산하는 v9 스탯 스냅샷 (로그 스케일 적용 후)."""
+    id: str
+    level: int
+    strength: int
+    dex: int
+    con: int
+    max_hp: int
+    keystones: FrozenSet[str]
+
+class V9Formula(FormulaSet):
+    """
+    v9.0 (이론 모델) 공식 세트 - 쌍곡선 방어, PoE식 피해 버킷, 스탯 20 키스톤.
+    RESOLUTE_TECHNIQUE: 필중 / 치명타 불가 / More 30%
+    DEADLY_ARTS: 치명타 상한 80% / DEX 비례 More / 받는 피해 15% 증가
+    IRON_FORTRESS: 회피 불가 / 방어 50% More / 받피감 10% / 반사 25% / 피격 시 최대 HP 3% 재생
+    """
+    name = "v9"
+    BASE_CRIT_MULT = 1.5
+    CRIT_CHANCE_PER_DEX = 0.012
+    GLOBAL_DMG_SCALE = GLOBAL_DAMAGE_SCALE   # src/config.py
+    CRIT_MULT_PER_DEX = 0.01        # 치명타 배율 = 1.5 + DEX x 1%
+    CRIT_CAP = 0.35
+    DEADLY_CRIT_CAP = 0.80
+    MIN_HIT_CHANCE = 0.60
+    RESOLUTE_MORE = 1.30
+    FORTRESS_ARMOR_MORE = 1.5
+    FORTRESS_MITIGATION = 0.90
+    FORTRESS_REFLECT = 0.25
+    FORTRESS_REGEN = 0.03           # 피격 후 생존 시 최대 HP 비율
+    DEADLY_TAKEN = 1.15
+    KEYSTONE_THRESHOLD = 20         # 원본 스탯이 이 값 이상이면 해당 키스톤 활성화
+
+    # 스윕/튜닝/BalanceProfile에서 덮어쓸 수 있는 밸런스 상수 이름
+    CONSTANTS = ("BASE_CRIT_MULT", "CRIT_CHANCE_PER_DEX", "GLOBAL_DMG_SCALE", "CRIT_MULT_PER_DEX", "CRIT_CAP",
+                 "DEADLY_CRIT_CAP", "MIN_HIT_CHANCE", "RESOLUTE_MORE", "FORTRESS_ARMOR_MORE", "FORTRESS_MITIGATION",
+                 "FORTRESS_REFLECT", "FORTRESS_REGEN", "DEADLY_TAKEN")
+
+    @staticmethod
+    def constants(overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        values = {name: getattr(V9Formula, name) for name in V9Formula.CONSTANTS}
+        for name, value in (overrides or {}).items():
+            if name not in values:
+                raise KeyError(f"Unknown v9 constant: {name}")
+            values[name] = value
+        return values
+
+    def prepare(self, actor) -> V9Combatant:
+        return V9Combatant(actor.id, actor.level, actor.get_stat("strength"), actor.get_stat("dex"),
+                           actor.get_stat("con"), actor.get_max_hp(),
+                           frozenset(k for k, on in actor.keystones.items() if on))
+
+    def create(self, actor_id: str, stats: Dict[str, int], level: int) -> V9Combatant:
+        from src.combat_simulator import Actor   # 순환 참조 방지를 위한 지역 임포트
+        actor = Actor(actor_id, actor_id, level, strength=stats.get("strength", 10),
+                      dex=stats.get("dexterity", 10), con=stats.get("constitution", 10))
+        actor.update_keystones()
+        return self.prepare(actor)
+
+    def matchup(self, attacker: V9Combatant, defender: V9Combatant, skill=None) -> Matchup:
+        a_keys, d_keys = attacker.keystones, defender.keystones
+        resolute = "RESOLUTE_TECHNIQUE" in a_keys
+        deadly = "DEADLY_ARTS" in a_keys
+        fortress = "IRON_FORTRESS" in d_keys
+
+        # [Step 1] 명중: RESOLUTE 공격자 / IRON_FORTRESS 방어자는 필중
+        if resolute or fortress:
+            hit_window = None
+        else:
+            acc = attacker.dex * 4 + attacker.strength * 1   # STR도 명중 기여
+            eva = defender.dex * 4
+            hit_window = (-INF, MathEngine.calculate_hit_chance(acc, eva, min_chance=self.MIN_HIT_CHANCE))
+
+        # [Step 2] 공격력 (StatBucket): 무기(레벨 x 5) + STR x 2.5 + DEX
+        bucket = StatBucket(attacker.level * 5 + ((attacker.strength * 2.5) + (attacker.dex * 1.0)))
+        if resolute:
+            bucket.add_more(self.RESOLUTE_MORE)
+        if deadly:
+            bucket.add_more(1.0 + (attacker.dex / (attacker.dex + 100)))   # DEX 100 기준 약 50% 증폭
+        raw_dmg = bucket.calculate() * self.GLOBAL_DMG_SCALE
+
+        # [Step 3] 방어 (Hyperbolic): CON 위주 방어도
+        armor = (defender.con * 2.0) + (defender.strength * 0.5) + (defender.dex * 0.2)
+        if fortress:
+            armor *= self.FORTRESS_ARMOR_MORE
+        mitigation_mult = (1.0 - MathEngine.calculate_defense_dr(armor, attacker.level))
+        if fortress:
+            mitigation_mult *= self.FORTRESS_MITIGATION
+
+        # [Step 4] 치명타: 상한 35% (DEADLY_ARTS 80%), 배율 1.5 + DEX x 1%
+        crit_chance = None
+        if not resolute:
+            crit_chance = min(self.DEADLY_CRIT_CAP if deadly else self.CRIT_CAP,
+                              attacker.dex * self.CRIT_CHANCE_PER_DEX)
+
+        # [Step 5] 반사 / 받피증 / 재생
+        return Matchup(
+            hit_window=hit_window,
+            base=raw_dmg * mitigation_mult,
+            crit_chance=crit_chance,
+            crit_mult=self.BASE_CRIT_MULT + (attacker.dex * self.CRIT_MULT_PER_DEX),
+            reflect_rate=self.FORTRESS_REFLECT if fortress else 0.0,
+            post_mult=self.DEADLY_TAKEN if "DEADLY_ARTS" in d_keys else 1.0,
+            regen=int(defender.max_hp * self.FORTRESS_REGEN) if fortress else 0,
+        )
+
+    # --------------------------------------------------------------------------
+    # 배열 버전 (스탯 격자 스윕용)
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def matchup_arrays(att: Dict[str, "np.ndarray"], dfn: Dict[str, "np.ndarray"],
+                       constants: Optional[Dict[str, float]] = None) -> Dict[str, "np.ndarray"]:
+        """
+        matchup()과 FormulaEngine.roll_damage를 격자 전체에 대해 한 번에 계산합니다.
+        att/dfn: level, strength, dex, con (로그 스케일 적용 후), max_hp, 키스톤 불리언 배열 (브로드캐스트 가능).
+        v9에는 피해 분산이 없으므로 타격 결과는 (빗나감, 일반, 치명타) 세 가지뿐이고, 각 결과의 정수 피해/반사를
+        스칼라 경로와 같은 연산 순서로 미리 계산합니다 (같은 셀이면 matchup과 비트 단위로 같은 값).
+        반환: hit_p, crit_p, dmg, dmg_crit, reflect, reflect_crit, regen, exp_dmg, exp_reflect.
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for v9 matchup arrays")
+        c = V9Formula.constants(constants)
+        resolute, deadly = att["RESOLUTE_TECHNIQUE"], att["DEADLY_ARTS"]
+        fortress = dfn["IRON_FORTRESS"]
+        a_str, a_dex, a_lvl = att["strength"], att["dex"], att["level"]
+
+        # [Step 1] 명중 (calculate_hit_chance와 같은 식, 필중이면 1.0)
+        acc = a_dex * 4 + a_str * 1
+        eva = dfn["dex"] * 4
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chance = np.where(acc <= 0, c["MIN_HIT_CHANCE"],
+                              np.maximum(c["MIN_HIT_CHANCE"], np.minimum(1.0, acc / (acc + (eva * 0.5)))))
+        hit_p = np.where(resolute | fortress, 1.0, chance)
+
+        # [Step 2] StatBucket: (base + 0) x (1 + 0) x More... x 전역 배율
+        raw = (a_lvl * 5 + ((a_str * 2.5) + (a_dex * 1.0))).astype(float)
+        raw = np.where(resolute, raw * c["RESOLUTE_MORE"], raw)
+        raw = np.where(deadly, raw * (1.0 + (a_dex / (a_dex + 100))), raw)
+        raw = raw * c["GLOBAL_DMG_SCALE"]
+
+        # [Step 3] 쌍곡선 방어
+        armor = (dfn["con"] * 2.0) + (dfn["strength"] * 0.5) + (dfn["dex"] * 0.2)
+        armor = np.where(fortress, armor * c["FORTRESS_ARMOR_MORE"], armor)
+        k = 400 + (85 * a_lvl)
+        dr = np.where(armor <= 0, 0.0, armor / np.where(armor <= 0, 1.0, armor + k))
+        mitigation = 1.0 - dr
+        mitigation = np.where(fortress, mitigation * c["FORTRESS_MITIGATION"], mitigation)
+        base = raw * mitigation
+
+        # [Step 4] 치명타
+        cap = np.where(deadly, c["DEADLY_CRIT_CAP"], c["CRIT_CAP"])
+        crit_p = np.where(resolute, 0.0, np.minimum(cap, a_dex * c["CRIT_CHANCE_PER_DEX"]))
+        crit_mult = c["BASE_CRIT_MULT"] + (a_dex * c["CRIT_MULT_PER_DEX"])
+
+        # [Step 5] 정수화 -> 반사 -> 받피증 (roll_damage와 같은 순서)
+        reflect_rate = np.where(fortress, c["FORTRESS_REFLECT"], 0.0)
+        post_mult = np.where(dfn["DEADLY_ARTS"], c["DEADLY_TAKEN"], 1.0)
+        out = {"hit_p": hit_p, "crit_p": crit_p}
+        for key, value in (("", base), ("_crit", base * crit_mult)):
+            damage = np.trunc(np.maximum(1, value + 0.0))
+            out["reflect" + key] = np.trunc(damage * reflect_rate).astype(np.int64)
+            out["dmg" + key] = np.where(post_mult != 1.0, np.trunc(damage * post_mult), damage).astype(np.int64)
+        out["regen"] = np.where(fortress, np.trunc(dfn["max_hp"] * c["FORTRESS_REGEN"]), 0).astype(np.int64)
+
+        # FormulaEngine.expected와 같은 기대값 (정수화 전, estimate_duel용)
+        expected = np.maximum(1.0, base) * (1.0 + crit_p * (crit_mult - 1.0))
+        out["exp_reflect"] = expected * reflect_rate
+        out["exp_dmg"] = expected * post_mult
+        return out
+
+FORMULA = V9Formula()
@@ -1,5 +1,6 @@
 import sys
 import os
+import random
 
 # --- 경로 설정 ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -8,12 +9,40 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from src.core.engine import GameEngine
+from src.core.context import GameContext
+from src.core.replay import Replayer, record_session
 from src.states.title_state import TitleState
+from src.systems.math_engine import MathEngine
+from src.utils.rng import CounterRNG, RollBuffer
 
 # =================================================================================
 # 메인 실행 블록
 # =================================================================================
 if __name__ == "__main__":
+    # --seed N: 전투/탐험 판정을 카운터 기반 난수로 고정 (같은 입력이면 같은 게임)
+    if "--seed" in sys.argv:
+        GameContext.rng = CounterRNG(int(sys.argv[sys.argv.index("--seed") + 1]))
+    # --roll-buffer [N]: 전역 random 대신 미리 만든 난수 블록에서 판정 (N: 세션 시드, 생략 시 무작위)
+    elif "--roll-buffer" in sys.argv:
+        rest = sys.argv[sys.argv.index("--roll-buffer") + 1:]
+        MathEngine.use_rolls(RollBuffer(int(rest[0]) if rest and rest[0].isdigit() else None).roll)
+
+    # --replay PATH: 기록을 화면 출력/대기 없이 재생하며 스텝마다 상태 해시 검증 (불일치 시 종료 코드 1)
+    if "--replay" in sys.argv:
+        report = Replayer.load(sys.argv[sys.argv.index("--replay") + 1]).run()
+        print(f"[Replay] {report.steps}/{report.total} steps in {report.elapsed * 1e3:.1f}ms")
+        if not report.ok:
+            print(f"[Replay] Diverged at step {report.diverged_at}:")
+            for key, (expected, actual) in report.mismatches().items():
+                print(f"  {key}: recorded={expected!r} replayed={actual!r}")
+        sys.exit(0 if report.ok else 1)
+
+    # --record PATH: 시드와 입력, 상태 전이를 기록 (--seed가 없으면 무작위 시드를 골라 기록)
+    if "--record" in sys.argv:
+        seed = GameContext.rng.seed if GameContext.rng is not None else random.randrange(2 ** 32)
+        record_session(sys.argv[sys.argv.index("--record") + 1], seed)
+        sys.exit()
+
     # 게임 엔진을 초기화하고 타이틀 화면으로 시작합니다.
     app = GameEngine()
     app.state_machine.change(TitleState())
@@ -1,6 +1,7 @@
 # File: src/models/actor.py
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
+from src.models.inventory import Inventory
 
 @dataclass
 class Actor:
@@ -13,6 +14,7 @@ class Actor:
     name: str
     race_id: str
     class_id: str
+    template_id: str = ""  # 데이터 원본 ID (몬스터: monsters.json 키 - 드랍 테이블 조회용)
     
     # --- 성장 데이터 ---
     level: int = 1
@@ -39,6 +41,7 @@ class Actor:
     # 스탯 계산 부하를 줄이기 위해 캐싱을 사용합니다.
     _cached_stats: Dict[str, int] = field(default_factory=dict)
     _is_stats_dirty: bool = True  # True일 때 GrowthSystem이 재계산을 수행합니다.
+    _stats_version: int = 0       # 재계산마다 새로 발급 (전역 유일, 파생 능력치 기반 캐시의 무효화 기준)
     
     # --- 전투 및 기술 ---
     keystones: Dict[str, bool] = field(default_factory=dict) # 활성화된 특화(Mastery)
@@ -46,12 +49,16 @@ class Actor:
     status_effects: List[Dict] = field(default_factory=list) # 현재 걸린 버프/디버프
     
     # --- 아이템 및 장비 ---
-    inventory: List = field(default_factory=list)
+    inventory: Inventory = field(default_factory=Inventory)
     equipment: Dict[str, Optional[object]] = field(default_factory=lambda: {
         "main_hand": None,
         "body": None,
         "ring": None
     })
+
+    # --- 밸런스 프로필 ---
+    # BalanceProfile (None = 기본 프로필). GrowthSystem/MathEngine이 이 액터의 공식과 상수를 여기서 고릅니다.
+    profile: Optional[object] = None
     
     def mark_dirty(self):
         """
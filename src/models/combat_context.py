@@ -1,6 +1,6 @@
 # File: src/models/combat_context.py
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from src.models.actor import Actor
 
 @dataclass
@@ -23,11 +23,52 @@ class CombatContext:
     # 전투 중 발생한 이벤트 로그 (최근 5~10개 표시용)
     combat_logs: List[str] = field(default_factory=list)
 
+    # 난수원 (CounterRNG.battle(...)). None이면 전역 random. 판정은 slot() 이름으로 뽑음
+    rolls: Optional[object] = None
+
+    # --------------------------------------------------------------------------
+    # 스냅샷 (분기/되돌리기)
+    # --------------------------------------------------------------------------
+
+    def snapshot(self) -> tuple:
+        """
+        전투 진행 상태만 담은 불변 튜플: (턴 인덱스, 라운드, 종료 여부, 승자, 로그, 액터별 (HP, MP, 효과),
+        난수 위치). Actor 전체를 deepcopy하지 않으므로 분기마다 만들어도 저렴합니다. 효과 딕셔너리는 튜플로 얼려 둡니다.
+        난수 위치는 rolls의 라운드 내 스트림별 순번이라, 라운드 중간에 찍은 스냅샷도 같은 난수로 이어집니다.
+        """
+        actors = tuple((a.current_hp, a.current_mp,
+                        tuple(tuple(sorted(e.items())) for e in a.status_effects) if a.status_effects else ())
+                       for a in self.participants + self.enemies)
+        return (self.current_turn_index, self.round_count, self.is_finished, self.winner_side,
+                tuple(self.combat_logs), actors, self.rolls.position() if self.rolls is not None else None)
+
+    def restore(self, snap: tuple):
+        """snapshot()으로 저장한 시점으로 되돌립니다 (같은 참가자 구성이어야 함)."""
+        self.current_turn_index, self.round_count, self.is_finished, self.winner_side, logs, actors, rolls = snap
+        self.combat_logs = list(logs)
+        for actor, (hp, mp, effects) in zip(self.participants + self.enemies, actors):
+            actor.current_hp, actor.current_mp = hp, mp
+            actor.status_effects = [dict(e) for e in effects]
+        if self.rolls is not None and rolls is not None:
+            # 스트림별 순번까지 되돌려, 복원한 지점에서 다시 진행하면 같은 난수가 나오도록
+            self.rolls.seek(rolls)
+
     def add_log(self, message: str):
         self.combat_logs.append(message)
         if len(self.combat_logs) > 10:
             self.combat_logs.pop(0)
 
+    def slot(self, actor: Actor) -> str:
+        """
+        전투 내 자리 이름 ("p0", "e1"...). Actor.id는 생성마다 새 uuid라 프로세스가 바뀌면 달라지므로,
+        난수 키에는 이 이름을 씁니다.
+        """
+        for prefix, group in (("p", self.participants), ("e", self.enemies)):
+            for i, member in enumerate(group):
+                if member is actor:
+                    return f"{prefix}{i}"
+        return actor.id
+
     @property
     def current_actor(self) -> Optional[Actor]:
         if not self.turn_order:
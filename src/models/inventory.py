@@ -0,0 +1,148 @@
+# File: src/models/inventory.py
+from typing import Dict, Iterator, List, Optional
+
+from src.models.item import Item
+
+class Inventory:
+    """
+    인스턴스 ID로 색인되는 인벤토리 컨테이너.
+
+    - 아이템은 instance_id -> Item 사전에 보관되므로 추가/제거/조회가 모두 O(1)입니다.
+      (기존 list 구현은 `in`/`remove`마다 전체 목록을 dataclass 필드 비교로 훑었습니다.)
+    - 템플릿 ID(Item.id)별 보유 수량을 따로 유지하여 count()도 O(1)입니다.
+    - 소모품(STACKABLE_TYPES)은 같은 템플릿끼리 한 칸에 quantity로 쌓이며, 한 칸은 DEFAULT_MAX_STACK개까지입니다.
+    - capacity는 칸(엔트리) 수 제한이며, None이면 무제한입니다.
+    기존 호출부 호환을 위해 append/remove/in/len/반복을 그대로 지원합니다.
+    """
+
+    STACKABLE_TYPES = ("consumable",)
+    DEFAULT_MAX_STACK = 99
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity
+        self._items: Dict[str, object] = {}          # instance_id -> Item (삽입 순서 유지)
+        self._counts: Dict[str, int] = {}            # template id -> 총 수량
+        self._stacks: Dict[str, List[str]] = {}      # template id -> 쌓을 수 있는 칸의 instance_id 목록
+
+    # --------------------------------------------------------------------------
+    # list 호환 인터페이스
+    # --------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator:
+        return iter(list(self._items.values()))
+
+    def __contains__(self, item) -> bool:
+        stored = self._items.get(getattr(item, "instance_id", None))
+        return stored is not None and (stored is item or stored == item)
+
+    def __repr__(self) -> str:
+        return f"Inventory({len(self)}/{self.capacity if self.capacity is not None else '∞'} slots)"
+
+    def append(self, item):
+        """list.append 호환. 공간이 없으면 ValueError."""
+        if not self.add(item):
+            raise ValueError("Inventory is full")
+
+    def remove(self, item):
+        """list.remove 호환. 칸(스택 포함)을 통째로 제거하며, 없으면 ValueError."""
+        if item not in self:
+            raise ValueError("Item not in inventory")
+        self._discard(item)
+
+    # --------------------------------------------------------------------------
+    # 색인 기반 연산
+    # --------------------------------------------------------------------------
+
+    @property
+    def is_full(self) -> bool:
+        return self.capacity is not None and len(self._items) >= self.capacity
+
+    def get(self, instance_id: str):
+        return self._items.get(instance_id)
+
+    def count(self, template_id: str) -> int:
+        """템플릿 기준 총 보유 수량 (스택 수량 포함)."""
+        return self._counts.get(template_id, 0)
+
+    def _is_stackable(self, item) -> bool:
+        return getattr(item, "type", None) in Inventory.STACKABLE_TYPES
+
+    def add(self, item) -> bool:
+        """
+        아이템을 추가합니다. 공간이 부족하면 False를 반환하고 아무것도 바꾸지 않습니다.
+
+        소모품은 같은 템플릿의 기존 스택을 DEFAULT_MAX_STACK까지 먼저 채우고, 남은 수량은
+        최대 스택 단위의 새 칸으로 나눠 담습니다. 새 칸의 첫 칸은 item 자신(quantity가 줄어듦)이고,
+        나머지는 같은 템플릿/옵션의 새 인스턴스입니다. 전부 기존 스택에 합쳐지면 item 자체는 보관되지
+        않으므로 `item in inventory`는 False입니다 - 수량은 count()/take()처럼 템플릿 ID로 다루세요.
+        """
+        if item.instance_id in self._items:
+            return False
+        if not self._is_stackable(item):
+            if self.is_full:
+                return False
+            self._store(item, getattr(item, "quantity", 1))
+            return True
+
+        cap = Inventory.DEFAULT_MAX_STACK
+        stacks = [self._items[iid] for iid in self._stacks.get(item.id, [])]
+        left = item.quantity
+        overflow = max(0, left - sum(max(0, cap - stack.quantity) for stack in stacks))
+        if self.capacity is not None and len(self._items) + -(-overflow // cap) > self.capacity:
+            return False
+
+        for stack in stacks:
+            fill = min(left, max(0, cap - stack.quantity))
+            stack.quantity += fill
+            left -= fill
+        self._counts[item.id] = self._counts.get(item.id, 0) + (item.quantity - left)
+
+        entries = []
+        while left > 0:
+            entry = Item(item.template, item.affixes) if entries else item
+            entry.quantity = min(left, cap)
+            left -= entry.quantity
+            entries.append(entry)
+        for entry in entries:
+            self._store(entry, entry.quantity)
+            self._stacks.setdefault(item.id, []).append(entry.instance_id)
+        return True
+
+    def _store(self, item, quantity: int):
+        self._items[item.instance_id] = item
+        self._counts[item.id] = self._counts.get(item.id, 0) + quantity
+
+    def _discard(self, item):
+        stored = self._items.pop(item.instance_id)
+        template_id = stored.id
+        remaining = self._counts.get(template_id, 0) - getattr(stored, "quantity", 1)
+        if remaining > 0:
+            self._counts[template_id] = remaining
+        else:
+            self._counts.pop(template_id, None)
+        if template_id in self._stacks:
+            self._stacks[template_id].remove(stored.instance_id)
+            if not self._stacks[template_id]:
+                del self._stacks[template_id]
+
+    def take(self, template_id: str, quantity: int = 1) -> int:
+        """템플릿 단위로 수량을 소모합니다 (물약 사용 등). 실제로 소모한 수량을 반환합니다."""
+        taken = 0
+        for iid in list(self._stacks.get(template_id, [])):
+            if taken >= quantity:
+                break
+            stack = self._items[iid]
+            use = min(stack.quantity, quantity - taken)
+            taken += use
+            if use == stack.quantity:
+                self._discard(stack)
+            else:
+                stack.quantity -= use
+                self._counts[template_id] -= use
+        return taken
@@ -1,22 +1,162 @@
 # File: src/models/item.py
+import random
+import itertools
 from dataclasses import dataclass, field
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, List
 
-@dataclass
-class Item:
+try:
+    import numpy as np  # 대량 드랍 생성 시 벡터화된 옵션 굴림에 사용 (선택 의존성)
+except ImportError:
+    np = None
+
+# 인스턴스 ID 발급기 (정수 ID는 uuid 문자열보다 훨씬 작습니다)
+_instance_ids = itertools.count(1)
+
+@dataclass(frozen=True)
+class ItemTemplate:
     """
-    게임 내 존재하는 모든 아이템(장비, 소모품 등)의 데이터 모델.
+    items.json 한 항목에 해당하는 불변(immutable) 아이템 원형.
+    같은 종류의 모든 아이템 인스턴스가 하나의 템플릿을 공유합니다 (Flyweight).
+    필드는 모두 해시 가능한 값이라 템플릿을 사전 키/집합 원소로 쓸 수 있습니다.
+    옵션 조합(affixes 튜플)과 그 스탯 사전은 템플릿이 한 번만 만들어 모든 인스턴스가 공유합니다.
     """
+    MAX_VARIANTS = 4096   # 템플릿당 공유해 두는 옵션 조합 수 상한 (넘으면 새로 만들어 돌려줌)
+
     id: str
     name: str
-    type: str  # "weapon", "armor", "accessory"
+    type: str  # "weapon", "armor", "accessory", "consumable"
     slot: str  # "main_hand", "body", "ring"
-    
-    # 장착 시 오르는 스탯 (예: {"strength": 5, "max_hp": 50})
-    bonus_stats: Dict[str, int] = field(default_factory=dict)
-    
+
+    # 장착 시 오르는 스탯 ((스탯, 값), ...) (예: (("strength", 5), ("max_hp", 50))) - 사전 보기는 bonus_stats
+    bonus: Tuple[Tuple[str, int], ...] = ()
+
     # 아이템 설명
     description: str = ""
-    
+
     # 가격
-    price: int = 0
\ No newline at end of file
+    price: int = 0
+
+    # 무작위 옵션 풀: ((스탯, 최소, 최대), ...) - 인스턴스마다 값만 굴려서 보관
+    affix_pool: Tuple[Tuple[str, int, int], ...] = ()
+
+    # 옵션 조합 -> (공유 튜플, 읽기 전용 스탯 사전). 파생 캐시라 비교/해시에서 제외
+    _variants: Dict[Tuple[int, ...], Tuple[Tuple[int, ...], Mapping[str, int]]] = field(
+        default_factory=dict, init=False, compare=False, repr=False)
+
+    @staticmethod
+    def from_data(item_id: str, data: dict) -> "ItemTemplate":
+        """
+        JSON 데이터로부터 템플릿을 만듭니다. 옵션 풀은 선택 항목입니다.
+        예: "affixes": {"strength": [0, 3], "constitution": [1, 2]}
+        """
+        affixes = tuple((stat, int(lo), int(hi)) for stat, (lo, hi) in data.get("affixes", {}).items())
+        return ItemTemplate(
+            id=data.get("id", item_id),
+            name=data["name"],
+            type=data["type"],
+            slot=data.get("slot", ""),
+            bonus=tuple(data.get("bonus_stats", {}).items()),
+            description=data.get("description", ""),
+            price=data.get("price", 0),
+            affix_pool=affixes,
+        )
+
+    @property
+    def bonus_stats(self) -> Mapping[str, int]:
+        """기본 보너스의 읽기 전용 사전 (모든 인스턴스가 공유)."""
+        return self.variant(())[1]
+
+    def variant(self, affixes: Tuple[int, ...]) -> Tuple[Tuple[int, ...], Mapping[str, int]]:
+        """옵션 조합의 (공유 튜플, 기본 보너스 + 옵션 값 읽기 전용 사전)."""
+        cached = self._variants.get(affixes)
+        if cached is None:
+            merged = dict(self.bonus)
+            for (stat, _, _), value in zip(self.affix_pool, affixes):
+                merged[stat] = merged.get(stat, 0) + value
+            cached = (affixes, MappingProxyType(merged))
+            if len(self._variants) < ItemTemplate.MAX_VARIANTS:
+                self._variants[affixes] = cached
+        return cached
+
+    def roll_affixes(self, rng=random) -> Tuple[int, ...]:
+        """옵션 풀의 각 항목을 [최소, 최대] 정수 범위에서 굴립니다 (같은 조합은 하나의 튜플을 공유)."""
+        return self.variant(tuple(rng.randint(lo, hi) for _, lo, hi in self.affix_pool))[0]
+
+    def roll_affixes_batch(self, count: int, seed: Optional[int] = None) -> List[Tuple[int, ...]]:
+        """
+        count개 인스턴스의 옵션을 한 번에 굴립니다 (대량 루팅/상자 생성용).
+        NumPy가 있으면 옵션별로 한 번의 벡터 연산으로 생성하고, 없으면 random으로 대체합니다.
+        """
+        if not self.affix_pool:
+            return [()] * count
+        if np is not None:
+            gen = np.random.default_rng(seed)
+            columns = [gen.integers(lo, hi + 1, size=count) for _, lo, hi in self.affix_pool]
+            rolls = zip(*(col.tolist() for col in columns))
+        else:
+            rng = random.Random(seed) if seed is not None else random
+            rolls = (self.roll_affixes(rng) for _ in range(count))
+        # 같은 옵션 조합은 하나의 튜플을 공유 (범위가 좁아 조합 수가 적으므로 메모리 절약)
+        return [self.variant(tuple(r))[0] for r in rolls]
+
+class Item:
+    """
+    게임 내 존재하는 개별 아이템 인스턴스.
+    인스턴스는 ID, 템플릿 참조, 굴린 옵션 값, 수량만 보관하며
+    이름/슬롯/설명 등 나머지 속성은 모두 템플릿에서 읽어옵니다.
+    """
+    __slots__ = ("template", "instance_id", "affixes", "quantity")
+
+    def __init__(self, template: ItemTemplate, affixes: Tuple[int, ...] = (),
+                 instance_id: Optional[int] = None, quantity: int = 1):
+        self.template = template
+        self.affixes = affixes
+        self.instance_id = instance_id if instance_id is not None else next(_instance_ids)
+        self.quantity = quantity
+
+    @staticmethod
+    def from_fields(id: str, name: str, type: str, slot: str, bonus_stats: Optional[Dict[str, int]] = None,
+                    description: str = "", price: int = 0) -> "Item":
+        """템플릿 데이터 없이 즉석 아이템을 만듭니다 (훈련용 더미, 테스트 등)."""
+        template = ItemTemplate(id, name, type, slot, tuple((bonus_stats or {}).items()), description, price)
+        return Item(template)
+
+    # --- 템플릿 위임 속성 ---
+    @property
+    def id(self) -> str:
+        return self.template.id
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def type(self) -> str:
+        return self.template.type
+
+    @property
+    def slot(self) -> str:
+        return self.template.slot
+
+    @property
+    def description(self) -> str:
+        return self.template.description
+
+    @property
+    def price(self) -> int:
+        return self.template.price
+
+    @property
+    def bonus_stats(self) -> Mapping[str, int]:
+        """템플릿 기본 보너스 + 굴린 옵션 값 (읽기 전용, 같은 조합의 인스턴스끼리 공유하는 사전)."""
+        return self.template.variant(self.affixes)[1]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Item) and other.instance_id == self.instance_id
+
+    def __hash__(self) -> int:
+        return hash(self.instance_id)
+
+    def __repr__(self) -> str:
+        return f"Item({self.id!r}#{self.instance_id}, affixes={self.affixes}, qty={self.quantity})"
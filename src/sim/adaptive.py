@@ -0,0 +1,84 @@
+# File: src/sim/adaptive.py
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable, Dict, Tuple
+
+from src.utils.stats import RunningStats
+
+def z_score(confidence: float) -> float:
+    """양측 신뢰수준(예: 0.95)에 해당하는 표준정규 분위수."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+def wilson_interval(successes: int, n: int, z: float) -> Tuple[float, float]:
+    """
+    승률(비율)의 Wilson score 신뢰구간.
+    0%/100% 근처에서도 폭이 0으로 붕괴하지 않아 조기 종료 판정에 안전합니다.
+    """
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+@dataclass
+class AdaptiveResult:
+    """적응형 시뮬레이션 결과 및 달성 정밀도."""
+    battles: int = 0
+    wins: int = 0
+    ttk: RunningStats = field(default_factory=RunningStats)
+    win_ci: Tuple[float, float] = (0.0, 1.0)
+    ttk_ci_width: float = math.inf
+    converged: bool = False
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.battles if self.battles else 0.0
+
+    @property
+    def win_ci_width(self) -> float:
+        return self.win_ci[1] - self.win_ci[0]
+
+class AdaptiveSimulator:
+    """
+    신뢰구간 폭 기반 조기 종료 몬테카를로 드라이버.
+
+    전투를 batch_size 단위로 실행하면서 승률(Wilson)과 평균 TTK(정규 근사)의
+    신뢰구간 폭을 갱신하고, 두 목표 폭을 모두 만족하거나 max_battles에 도달하면 멈춥니다.
+    일방적인 매치업은 수십~수백 판 만에 끝나고, 접전만 상한까지 표본을 받습니다.
+    """
+
+    def __init__(self, win_ci_width: float = 0.10, ttk_ci_width: float = 0.5, confidence: float = 0.95,
+                 batch_size: int = 50, min_battles: int = 100, max_battles: int = 5000):
+        self.win_ci_width = win_ci_width
+        self.ttk_ci_width = ttk_ci_width
+        self.z = z_score(confidence)
+        self.batch_size = batch_size
+        self.min_battles = min_battles
+        self.max_battles = max_battles
+
+    def run(self, battle_fn: Callable[[], Dict]) -> AdaptiveResult:
+        """
+        battle_fn: 인자 없이 전투 1회를 수행하고 {"win": bool, "turns": int}를 반환하는 함수.
+        """
+        result = AdaptiveResult()
+        while result.battles < self.max_battles:
+            n = min(self.batch_size, self.max_battles - result.battles)
+            for _ in range(n):
+                duel = battle_fn()
+                result.battles += 1
+                if duel["win"]:
+                    result.wins += 1
+                result.ttk.push(duel["turns"])
+
+            result.win_ci = wilson_interval(result.wins, result.battles, self.z)
+            result.ttk_ci_width = 2 * self.z * result.ttk.stderr
+            if result.battles >= self.min_battles and self._is_precise(result):
+                result.converged = True
+                break
+        return result
+
+    def _is_precise(self, result: AdaptiveResult) -> bool:
+        return result.win_ci_width <= self.win_ci_width and result.ttk_ci_width <= self.ttk_ci_width
@@ -0,0 +1,327 @@
+# File: src/sim/balance_tuner.py
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.core.factory import EntityFactory
+from src.formulas.profile import BalanceProfile, DEFAULT_PROFILE, GROUPS
+from src.systems.growth_system import GrowthSystem
+from src.systems.skill_system import SkillSystem
+from src.utils.data_loader import DataLoader
+
+# --- 밸런스 감사 임계값 (sim_full_matrix.py 감사와 공유) ---
+MIN_CLASS_AP_GAP_PERCENT = 15.0  # 전사 vs 도적의 AP 차이는 최소 15% 이상이어야 함
+MAX_DOMINANCE_SCORE = 2         # 한 조합이 최고 기록(HP, MP, SP, DMG)을 3개 이상 차지하면 실패
+TARGET_TTK_MIN = 3              # 동급 전투 시 최소 턴 수 (너무 순삭 방지)
+TARGET_TTK_MAX = 8              # 동급 전투 시 최대 턴 수 (지루함 방지)
+
+MATRIX_LEVELS = (1, 25, 50)
+DOMINANCE_METRICS = ("hp", "mp", "sp", "dmg")
+
+# 기본 조정 대상 ("묶음.상수", BalanceProfile.parse와 같은 표기)
+TUNABLE = ("formulas.STAT_GROWTH", "formulas.HP_PER_CON", "formulas.HP_PER_LEVEL",
+           "formulas.POWER_PER_LEVEL", "formulas.POWER_MULT")
+
+@dataclass
+class MatrixAudit:
+    """종족 x 직업 x 레벨 매트릭스 한 번의 측정값과 감사 결과."""
+    rows: List[dict]
+    violations: List[str]
+    loss: float
+    ttk_by_level: Dict[int, float]
+    ap_gap: float
+
+    def growth(self, metric: str = "hp") -> float:
+        """최저 -> 최고 레벨 평균 metric 배율 (감사 대상은 아니지만 레벨 성장이 사라지는 해를 알아보는 용도)."""
+        levels = sorted({r["lv"] for r in self.rows})
+        mean = lambda lv: sum(r[metric] for r in self.rows if r["lv"] == lv) / max(1, sum(1 for r in self.rows if r["lv"] == lv))
+        return mean(levels[-1]) / mean(levels[0]) if levels and mean(levels[0]) else 0.0
+
+    @property
+    def passed(self) -> bool:
+        return not self.violations
+
+@dataclass
+class TuneResult:
+    values: Dict[str, float]
+    audit: MatrixAudit
+    profile: BalanceProfile
+    evaluations: int
+    elapsed: float
+
+    def spec(self) -> str:
+        """BalanceProfile.parse / sim_balance_profiles.py --set에 그대로 넣을 수 있는 문자열."""
+        return ",".join(f"{param}={value:g}" for param, value in self.values.items())
+
+@dataclass
+class Sensitivity:
+    """파라미터 하나의 탄력성(±step 중앙차분, d ln 지표 / d ln 파라미터)과 단독 허용 구간."""
+    param: str
+    value: float
+    elasticity: Dict[str, float] = field(default_factory=dict)
+    feasible: Optional[Tuple[float, float]] = None   # 다른 값 고정 시 감사를 통과하는 구간 (해가 통과할 때만)
+
+    @property
+    def inert(self) -> bool:
+        return all(abs(v) < 1e-9 for v in self.elasticity.values())
+
+def nelder_mead(f: Callable[[List[float]], float], x0: Sequence[float], step: float = 0.25,
+                max_evals: int = 400, tol: float = 1e-6,
+                bounds: Optional[Tuple[float, float]] = None) -> Tuple[List[float], float]:
+    """
+    경계 클리핑을 더한 표준 Nelder-Mead (미분 불필요). 정수화(int) 때문에 계단 모양인 감사 손실에도 쓸 수 있습니다.
+    반환: (최적점, 최솟값).
+    """
+    n = len(x0)
+    clip = (lambda x: [min(bounds[1], max(bounds[0], v)) for v in x]) if bounds else list
+    evals = [0]
+
+    def score(x):
+        evals[0] += 1
+        return f(x)
+
+    simplex = [clip(list(x0))]
+    for i in range(n):
+        point = list(x0)
+        point[i] += step
+        simplex.append(clip(point))
+    scores = [score(p) for p in simplex]
+
+    while evals[0] < max_evals:
+        order = sorted(range(n + 1), key=scores.__getitem__)
+        simplex, scores = [simplex[i] for i in order], [scores[i] for i in order]
+        if scores[-1] - scores[0] <= tol and max(abs(a - b) for p in simplex[1:] for a, b in zip(p, simplex[0])) <= tol:
+            break
+        centroid = [sum(p[i] for p in simplex[:-1]) / n for i in range(n)]
+        worst = simplex[-1]
+        move = lambda t: clip([c + t * (c - w) for c, w in zip(centroid, worst)])
+
+        reflected = move(1.0)
+        r_score = score(reflected)
+        if r_score < scores[0]:
+            expanded = move(2.0)
+            e_score = score(expanded)
+            simplex[-1], scores[-1] = (expanded, e_score) if e_score < r_score else (reflected, r_score)
+        elif r_score < scores[-2]:
+            simplex[-1], scores[-1] = reflected, r_score
+        else:
+            contracted = move(0.5 if r_score < scores[-1] else -0.5)
+            c_score = score(contracted)
+            if c_score < min(r_score, scores[-1]):
+                simplex[-1], scores[-1] = contracted, c_score
+            else:
+                # 축소: 최선점 쪽으로 절반
+                best = simplex[0]
+                simplex = [best] + [clip([b + 0.5 * (v - b) for b, v in zip(best, p)]) for p in simplex[1:]]
+                scores = [scores[0]] + [score(p) for p in simplex[1:]]
+
+    i = min(range(n + 1), key=scores.__getitem__)
+    return simplex[i], scores[i]
+
+class BalanceTuner:
+    """
+    sim_full_matrix.py의 감사 임계값(TTK 밴드, 전사/도적 AP 격차, 지배력)을 만족하는 밸런스 상수를 찾습니다.
+
+    - 매트릭스는 종족 x 직업마다 액터를 한 번만 만들고, 후보 상수마다 BalanceProfile만 바꿔 끼워
+      GrowthSystem.refresh_stats + SkillSystem 계산을 다시 합니다 (데이터 재로딩/난수 없음, 후보당 수 ms).
+    - TTK는 sim_full_matrix와 같은 정의(HP / 대표 스킬 피해)이며, 모든 셀(모든 레벨)이 밴드 안에 있어야 통과입니다.
+    - 파라미터는 기본값 대비 배율로 정규화해 Nelder-Mead로 손실(밴드/격차 위반량 + 기본값에서 멀어지는 작은 벌점)을
+      최소화하고, 결과는 유효숫자 3자리로 반올림한 뒤 손실을 늘리지 않는 파라미터는 기본값으로 되돌려 다시 감사합니다.
+    - sensitivity(): 파라미터별 탄력성과, 다른 값을 고정했을 때 감사를 통과하는 구간(이분법 경계 탐색).
+    """
+
+    MARGIN = 0.05          # 손실은 임계값보다 5% 안쪽을 목표로 (해가 경계에 붙지 않도록)
+    REGULARIZE = 1e-3      # 기본값에서 멀어지는 것에 대한 벌점 (동점일 때 변경 최소화)
+
+    def __init__(self, params: Sequence[str] = TUNABLE, levels: Sequence[int] = MATRIX_LEVELS,
+                 base: BalanceProfile = DEFAULT_PROFILE, bounds: Tuple[float, float] = (0.0, 4.0)):
+        for param in params:
+            group, _, name = param.partition(".")
+            if group not in GROUPS or not name:
+                raise KeyError(f"Unknown tuning parameter: {param} (expected group.NAME)")
+        self.params = list(params)
+        self.levels = list(levels)
+        self.base = base
+        self.bounds = bounds
+        self.defaults = {param: self._base_value(param) for param in self.params}
+        self.evaluations = 0
+        self._memo: Dict[Tuple[float, ...], MatrixAudit] = {}
+
+        races = DataLoader.load_json("races.json")
+        classes = DataLoader.load_json("classes.json")
+        self.cells = []
+        for r_id in races:
+            for c_id, class_info in classes.items():
+                sig_skill = class_info["initial_skills"][0] if class_info["initial_skills"] else "power_strike"
+                actor = EntityFactory.create_player(f"{r_id}_{c_id}", r_id, c_id)
+                self.cells.append((r_id, c_id, sig_skill, actor, (actor.current_hp, actor.current_mp)))
+
+    def _base_value(self, param: str) -> float:
+        group, _, name = param.partition(".")
+        if group == "formulas":
+            if name not in self.base.formulas.constants:
+                raise KeyError(f"Unknown formula constants: {name}")
+            return float(self.base.formulas.constants[name])
+        formula = getattr(self.base, group)
+        if name not in formula.CONSTANTS:
+            raise KeyError(f"Unknown {formula.name} constant: {name}")
+        return float(getattr(formula, name))
+
+    def profile(self, values: Dict[str, float], name: str = "tuned") -> BalanceProfile:
+        groups: Dict[str, Dict[str, float]] = {}
+        for param, value in values.items():
+            group, _, key = param.partition(".")
+            groups.setdefault(group, {})[key] = value
+        return self.base.derive(name, **groups)
+
+    # --------------------------------------------------------------------------
+    # 측정 + 감사
+    # --------------------------------------------------------------------------
+
+    def measure(self, profile: BalanceProfile) -> List[dict]:
+        """sim_full_matrix._measure_cell과 같은 값 (hp, mp, ap, sp, dmg, ttk)을 모든 셀에 대해."""
+        rows = []
+        for r_id, c_id, sig_skill, actor, fresh in self.cells:
+            actor.profile = profile
+            for level in self.levels:
+                # 갓 생성된 액터와 같은 현재 HP/MP에서 시작 (스킬 비용 판정이 같도록)
+                actor.current_hp, actor.current_mp = fresh
+                actor.level = level
+                GrowthSystem.refresh_stats(actor)
+                dmg = SkillSystem.calculate_skill_damage(actor, sig_skill).get("damage", 0)
+                hp = actor.max_hp
+                rows.append({
+                    "key": f"{r_id}_{c_id}", "race": r_id, "class": c_id, "lv": level,
+                    "hp": hp, "mp": actor.max_mp, "ap": GrowthSystem.get_attack_power(actor),
+                    "sp": GrowthSystem.get_magic_power(actor), "dmg": dmg, "ttk": hp / dmg if dmg > 0 else 99,
+                })
+        return rows
+
+    def audit(self, rows: List[dict]) -> MatrixAudit:
+        violations: List[str] = []
+        lo, hi = TARGET_TTK_MIN, TARGET_TTK_MAX
+        band_lo, band_hi = lo * (1 + self.MARGIN), hi * (1 - self.MARGIN)
+        band_loss = 0.0
+        for row in rows:
+            ttk = max(row["ttk"], 1e-6)   # HP 0 (계수 0 경계)에서도 손실이 정의되도록
+            if not lo <= ttk <= hi:
+                violations.append(f"TTK {row['key']} Lv.{row['lv']} = {ttk:.1f}")
+            # 로그 비율 위반량 (밴드 안쪽 5%까지 목표)
+            band_loss += max(0.0, math.log(band_lo / ttk)) ** 2 + max(0.0, math.log(ttk / band_hi)) ** 2
+        loss = band_loss / max(1, len(rows))
+
+        top_level = max(self.levels)
+        top_rows = [r for r in rows if r["lv"] == top_level]
+        dominance: Dict[str, int] = {}
+        for metric in DOMINANCE_METRICS if top_rows else ():
+            top = max(top_rows, key=lambda r: r[metric])
+            dominance[top["key"]] = dominance.get(top["key"], 0) + 1
+        for key, score in dominance.items():
+            if score > MAX_DOMINANCE_SCORE:
+                violations.append(f"DOMINANCE {key} = {score}")
+                loss += score - MAX_DOMINANCE_SCORE
+
+        warrior = [r["ap"] for r in top_rows if r["class"] == "warrior"]
+        rogue = [r["ap"] for r in top_rows if r["class"] == "rogue"]
+        ap_gap = 0.0
+        if warrior and rogue:
+            ap_gap = ((sum(warrior) / len(warrior)) / max(1e-9, sum(rogue) / len(rogue)) - 1) * 100
+            if ap_gap < MIN_CLASS_AP_GAP_PERCENT:
+                violations.append(f"AP GAP {ap_gap:.1f}% < {MIN_CLASS_AP_GAP_PERCENT}%")
+            target = MIN_CLASS_AP_GAP_PERCENT * (1 + self.MARGIN)
+            loss += (max(0.0, target - ap_gap) / target) ** 2
+
+        ttk_by_level = {}
+        for level in self.levels:
+            values = [r["ttk"] for r in rows if r["lv"] == level]
+            ttk_by_level[level] = sum(values) / len(values) if values else 0.0
+        return MatrixAudit(rows, violations, loss, ttk_by_level, ap_gap)
+
+    def evaluate(self, values: Dict[str, float]) -> MatrixAudit:
+        key = tuple(round(values[p], 9) for p in self.params)
+        result = self._memo.get(key)
+        if result is None:
+            self.evaluations += 1
+            result = self._memo[key] = self.audit(self.measure(self.profile(values)))
+        return result
+
+    # --------------------------------------------------------------------------
+    # 최적화
+    # --------------------------------------------------------------------------
+
+    def _values(self, x: Sequence[float]) -> Dict[str, float]:
+        """정규화 좌표(기본값 대비 배율) -> 상수 값."""
+        return {p: self.defaults[p] * v if self.defaults[p] else v for p, v in zip(self.params, x)}
+
+    def _objective(self, x: Sequence[float]) -> float:
+        reg = sum((v - 1.0) ** 2 for v in x) / len(x)
+        return self.evaluate(self._values(x)).loss + self.REGULARIZE * reg
+
+    @staticmethod
+    def _round(value: float, digits: int = 3) -> float:
+        if value == 0:
+            return 0.0
+        return round(value, digits - 1 - int(math.floor(math.log10(abs(value)))))
+
+    def solve(self, max_evals: int = 600, restarts: int = 2) -> TuneResult:
+        """손실 최소화 -> 유효숫자 3자리 반올림 -> 재감사. 재시작마다 이전 최선점에서 새 단체(simplex)로 다시 탐색."""
+        start = time.perf_counter()
+        x, best = [1.0] * len(self.params), math.inf
+        budget = max_evals // (restarts + 1)
+        for _ in range(restarts + 1):
+            x, score = nelder_mead(self._objective, x, max_evals=budget, bounds=self.bounds)
+            if score >= best - 1e-12:
+                break
+            best = score
+
+        values = {p: self._round(v) for p, v in self._values(x).items()}
+        # 기본값으로 되돌려도 감사 손실이 늘지 않는 파라미터는 되돌림 (무관한 상수가 떠다니지 않도록)
+        for param in self.params:
+            if values[param] != self.defaults[param]:
+                trial = {**values, param: self.defaults[param]}
+                if self.evaluate(trial).loss <= self.evaluate(values).loss:
+                    values = trial
+        return TuneResult(values, self.evaluate(values), self.profile(values), self.evaluations,
+                          time.perf_counter() - start)
+
+    # --------------------------------------------------------------------------
+    # 민감도 리포트
+    # --------------------------------------------------------------------------
+
+    def _metrics(self, audit: MatrixAudit) -> Dict[str, float]:
+        metrics = {f"ttk_lv{level}": ttk for level, ttk in audit.ttk_by_level.items()}
+        metrics["ap_gap"] = audit.ap_gap
+        return metrics
+
+    def _feasible_edge(self, values: Dict[str, float], param: str, limit: float, iterations: int) -> float:
+        """values(통과)에서 limit 쪽으로 감사를 통과하는 마지막 값 (이분법)."""
+        inside, outside = values[param], limit
+        if self.evaluate({**values, param: outside}).passed:
+            return outside
+        for _ in range(iterations):
+            mid = (inside + outside) / 2
+            if self.evaluate({**values, param: mid}).passed:
+                inside = mid
+            else:
+                outside = mid
+        return inside
+
+    def sensitivity(self, values: Dict[str, float], step: float = 0.05, iterations: int = 12) -> List[Sensitivity]:
+        base_audit = self.evaluate(values)
+        report = []
+        for param in self.params:
+            value = values[param]
+            delta = abs(value) * step or step
+            up = self._metrics(self.evaluate({**values, param: value + delta}))
+            down = self._metrics(self.evaluate({**values, param: value - delta}))
+            entry = Sensitivity(param, value)
+            for name, center in self._metrics(base_audit).items():
+                if center:
+                    entry.elasticity[name] = (up[name] - down[name]) / center * (value or 1.0) / (2 * delta)
+            if base_audit.passed:
+                scale = self.defaults[param] or 1.0
+                entry.feasible = (self._feasible_edge(values, param, self.bounds[0] * scale, iterations),
+                                  self._feasible_edge(values, param, self.bounds[1] * scale, iterations))
+            report.append(entry)
+        return report
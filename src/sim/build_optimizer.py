@@ -0,0 +1,179 @@
+# File: src/sim/build_optimizer.py
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src import combat_simulator
+from src.sim.paired import CommonRandomStreams
+from src.utils.data_loader import DataLoader
+
+V9_STATS = ("strength", "dex", "con")
+
+# items.json 스탯 이름 -> v9 시뮬레이터 스탯 이름
+ITEM_STAT_MAP = {"strength": "strength", "dexterity": "dex", "constitution": "con"}
+
+# 데이터 파일이 없을 때 사용하는 기본 장비 후보 (슬롯별, "none" = 빈 슬롯)
+DEFAULT_GEAR = {
+    "main_hand": {"none": {}, "greatsword": {"strength": 3}, "dagger": {"dex": 3}},
+    "body": {"none": {}, "plate": {"con": 3}, "leather": {"dex": 2, "con": 1}},
+    "ring": {"none": {}, "ring_of_might": {"strength": 2}, "ring_of_haste": {"dex": 2}, "ring_of_vigor": {"con": 2}},
+}
+
+def gear_catalog_from_items() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """items.json에서 슬롯별 장비 후보를 만듭니다 (v9에 없는 스탯은 무시). 데이터가 없으면 DEFAULT_GEAR."""
+    items = DataLoader.load_json("items.json")
+    if not items:
+        return DEFAULT_GEAR
+    catalog: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for item_id, data in items.items():
+        slot = data.get("slot")
+        if not slot:
+            continue
+        bonus = {ITEM_STAT_MAP[k.lower()]: v for k, v in data.get("bonus_stats", {}).items() if k.lower() in ITEM_STAT_MAP}
+        catalog.setdefault(slot, {"none": {}})[item_id] = bonus
+    return catalog
+
+@dataclass(frozen=True)
+class Candidate:
+    """스탯 배분 + 슬롯별 장비 선택으로 이루어진 빌드 후보."""
+    stats: Tuple[int, ...]          # V9_STATS 순서의 기본 스탯
+    gear: Tuple[Tuple[str, str], ...]  # ((slot, item_id), ...)
+
+    def label(self) -> str:
+        stats = "/".join(str(v) for v in self.stats)
+        gear = ", ".join(item for _, item in self.gear if item != "none") or "no gear"
+        return f"{stats} [{gear}]"
+
+@dataclass
+class Evaluation:
+    candidate: Candidate
+    effective: Tuple[int, ...]
+    est_win: float
+    est_ttk: float
+    win_rate: Optional[float] = None   # 시뮬레이션 결과 (선별 통과 후보만)
+    ttk: Optional[float] = None
+
+    @property
+    def simulated(self) -> bool:
+        return self.win_rate is not None
+
+def pareto_front(evals: List[Evaluation], simulated: bool = True) -> List[Evaluation]:
+    """승률 최대화 / TTK 최소화 기준의 비지배(Pareto) 집합 (승률 내림차순 정렬)."""
+    def key(ev: Evaluation) -> Tuple[float, float]:
+        return (ev.win_rate, ev.ttk) if simulated else (ev.est_win, ev.est_ttk)
+
+    ordered = sorted(evals, key=lambda ev: (-key(ev)[0], key(ev)[1]))
+    front = []
+    best_ttk = float("inf")
+    for ev in ordered:
+        win, ttk = key(ev)
+        if ttk < best_ttk:
+            front.append(ev)
+            best_ttk = ttk
+    return front
+
+class BuildOptimizer:
+    """
+    v9 전투 공식 기반 빌드 탐색기.
+
+    1. 스탯 포인트(총합 고정) x 슬롯별 장비의 모든 조합을 나열합니다.
+    2. 해석적 기대값(estimate_duel)으로 전 후보를 빠르게 평가하고, 상위 후보만 남깁니다.
+    3. 남은 후보를 공통 난수 스트림으로 시뮬레이션하여 (승률, TTK) Pareto front를 반환합니다.
+    평가는 '유효 스탯'(배분 + 장비) 기준으로 메모이즈되므로 같은 결과를 내는 조합은 한 번만 계산합니다.
+    """
+
+    def __init__(self, enemies: List[dict], level: int = 20, stat_total: int = 45, stat_min: int = 5,
+                 step: int = 1, gear_catalog: Optional[dict] = None, battles: int = 200,
+                 seed: int = 0, screen_keep: int = 48):
+        self.enemies = enemies
+        self.level = level
+        self.stat_total = stat_total
+        self.stat_min = stat_min
+        self.step = step
+        self.gear_catalog = gear_catalog if gear_catalog is not None else gear_catalog_from_items()
+        self.battles = battles
+        self.seed = seed
+        self.screen_keep = screen_keep
+
+        self._estimate_cache: Dict[Tuple[int, ...], Tuple[float, float]] = {}
+        self._sim_cache: Dict[Tuple[int, ...], Tuple[float, float]] = {}
+        self.sim_calls = 0
+        self.evaluated: List[Evaluation] = []
+
+    # --------------------------------------------------------------------------
+    # 후보 나열
+    # --------------------------------------------------------------------------
+
+    def _allocations(self):
+        lo, total, step = self.stat_min, self.stat_total, self.step
+        for s in range(lo, total - 2 * lo + 1, step):
+            for d in range(lo, total - s - lo + 1, step):
+                yield (s, d, total - s - d)
+
+    def candidates(self):
+        slots = sorted(self.gear_catalog)
+        gear_choices = [[(slot, item) for item in self.gear_catalog[slot]] for slot in slots]
+        for alloc in self._allocations():
+            for gear in itertools.product(*gear_choices):
+                yield Candidate(alloc, tuple(gear))
+
+    def effective_stats(self, candidate: Candidate) -> Tuple[int, ...]:
+        values = dict(zip(V9_STATS, candidate.stats))
+        for slot, item in candidate.gear:
+            for stat, bonus in self.gear_catalog[slot][item].items():
+                values[stat] = values.get(stat, 0) + bonus
+        return tuple(values[s] for s in V9_STATS)
+
+    # --------------------------------------------------------------------------
+    # 평가 (메모이즈)
+    # --------------------------------------------------------------------------
+
+    def estimate(self, effective: Tuple[int, ...]) -> Tuple[float, float]:
+        if effective not in self._estimate_cache:
+            stats = dict(zip(V9_STATS, effective))
+            wins = ttk = 0.0
+            for enemy in self.enemies:
+                est = combat_simulator.estimate_duel(stats, enemy, self.level)
+                wins += est["win"]
+                ttk += est["turns"]
+            n = len(self.enemies)
+            self._estimate_cache[effective] = (wins / n, ttk / n)
+        return self._estimate_cache[effective]
+
+    def simulate(self, effective: Tuple[int, ...]) -> Tuple[float, float]:
+        if effective not in self._sim_cache:
+            stats = dict(zip(V9_STATS, effective))
+            wins = turns = 0
+            for e_idx, enemy in enumerate(self.enemies):
+                for battle in range(self.battles):
+                    # 모든 후보가 같은 난수열을 공유 -> 후보 간 비교 잡음 최소화 (CRN)
+                    rolls = CommonRandomStreams(self.seed + e_idx, battle)
+                    duel = combat_simulator.simulate_duel(stats, enemy, self.level, rolls=rolls)
+                    wins += duel["win"]
+                    turns += duel["turns"]
+            self.sim_calls += 1
+            n = self.battles * len(self.enemies)
+            self._sim_cache[effective] = (wins / n, turns / n)
+        return self._sim_cache[effective]
+
+    def optimize(self) -> List[Evaluation]:
+        """전체 후보를 선별/시뮬레이션하여 Pareto front를 반환합니다."""
+        evals = []
+        for cand in self.candidates():
+            eff = self.effective_stats(cand)
+            est_win, est_ttk = self.estimate(eff)
+            evals.append(Evaluation(cand, eff, est_win, est_ttk))
+
+        # 선별: 추정 Pareto front + 추정 승률 상위 screen_keep (유효 스탯 기준 중복 제거)
+        shortlist: Dict[Tuple[int, ...], Evaluation] = {}
+        for ev in pareto_front(evals, simulated=False):
+            shortlist.setdefault(ev.effective, ev)
+        for ev in sorted(evals, key=lambda e: (-e.est_win, e.est_ttk)):
+            if len(shortlist) >= self.screen_keep:
+                break
+            shortlist.setdefault(ev.effective, ev)
+
+        for ev in shortlist.values():
+            ev.win_rate, ev.ttk = self.simulate(ev.effective)
+        self.evaluated = evals
+        return pareto_front(list(shortlist.values()), simulated=True)
@@ -0,0 +1,437 @@
+# File: src/sim/dungeon_run.py
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np  # 수천 개 런을 배열로 동시에 진행 (선택 의존성)
+except ImportError:
+    np = None
+
+from src.core.factory import EntityFactory
+from src.models.actor import Actor
+from src.states.dungeon_state import DungeonState
+from src.systems.ai_system import AISystem, DamageEntry
+from src.systems.growth_system import GrowthSystem
+from src.systems.combat_profile import CombatProfile, SkillProfile, damage_pmf
+from src.systems.table_system import TableSystem
+from src.systems.math_engine import MathEngine
+from src.formulas.engine import FormulaEngine, Matchup, rng_roll
+from src.formulas.v22 import FORMULA as V22_FORMULA
+
+MAX_COMBAT_ROUNDS = 200   # 이 라운드까지 결판이 안 나면 도주한 것으로 처리
+MAX_TICKS = 2000          # 런 하나가 취할 수 있는 최대 행동 수 (무한 휴식 방지)
+
+@dataclass(frozen=True)
+class MonsterSkill:
+    """몬스터 스킬 하나의 플레이어 상대 계산값 (AISystem 효용 계산용 피해 분포 + 타격용 Matchup)."""
+    skill_id: str
+    skill: SkillProfile
+    entry: DamageEntry
+    matchup: Matchup
+
+@dataclass
+class DungeonRunReport:
+    """층별 집계. 인덱스 f는 지하 f층 (0은 사용하지 않음)."""
+    runs: int
+    max_floor: int
+    entered: List[int] = field(default_factory=list)      # f층에 도달한 런 수
+    cleared: List[int] = field(default_factory=list)      # f층 계단을 내려간 런 수
+    deaths: List[int] = field(default_factory=list)       # f층에서 사망한 런 수
+    combat_deaths: List[int] = field(default_factory=list)
+    encounters: List[int] = field(default_factory=list)   # f층 전투 횟수 합계
+    exit_hp: List[float] = field(default_factory=list)    # f층을 떠날 때 HP 비율 합계
+
+    def __post_init__(self):
+        size = self.max_floor + 1
+        for name in ("entered", "cleared", "deaths", "combat_deaths", "encounters", "exit_hp"):
+            if not getattr(self, name):
+                setattr(self, name, [0] * size)
+
+    def survival(self, floor: int) -> float:
+        """f층을 무사히 통과한 런의 비율 (생존 곡선)."""
+        return self.cleared[floor] / self.runs if self.runs else 0.0
+
+    def encounters_per_floor(self, floor: int) -> float:
+        return self.encounters[floor] / self.entered[floor] if self.entered[floor] else 0.0
+
+    def mean_exit_hp(self, floor: int) -> float:
+        return self.exit_hp[floor] / self.cleared[floor] if self.cleared[floor] else 0.0
+
+    def deepest_median_floor(self) -> int:
+        """절반 이상의 런이 도달한 가장 깊은 층."""
+        deepest = 0
+        for f in range(1, self.max_floor + 1):
+            if self.entered[f] * 2 >= self.runs:
+                deepest = f
+        return deepest
+
+class DungeonRunSimulator:
+    """
+    헤드리스 던전 런 몬테카를로 시뮬레이터.
+
+    DungeonState의 탐험 규칙(이벤트 테이블, 목표 난이도 조우, 산딸기/가시덤불, 휴식 기습, 10걸음마다 하강)과
+    CombatSystem/MathEngine의 전투 공식(주도권, 명중, 분산, 치명타, 피해 감소, MP 회복)을 그대로 재현합니다.
+    플레이어 정책: HP가 rest_below 비율 미만이면 휴식, 아니면 전진. 전투에서는 MP가 되면 주력 스킬, 아니면 평타.
+    몬스터 정책: 실게임과 같이 AISystem 효용(플레이어 남은 HP, 자신의 MP 기준)으로 보유 스킬 중 하나를 고릅니다.
+
+    NumPy가 있으면 모든 런을 배열로 묶어 한 걸음씩 동시에 진행(전투도 라운드 단위로 일괄 처리)하고,
+    없으면 런마다 순수 Python으로 진행합니다. 두 경로 모두 V22_FORMULA.matchup이 만든 같은 Matchup으로
+    타격을 처리하므로(NumPy 경로는 필드를 배열로 펼침) formulas.json을 바꿔도 분포가 일치합니다.
+    """
+
+    def __init__(self, player: Actor, max_floor: int = 10, rest_below: float = 0.5,
+                 event_table: str = "dungeon_events", berry_heal: float = DungeonState.BERRY_HEAL,
+                 thorn_damage: float = DungeonState.THORN_DAMAGE, rest_heal: float = DungeonState.REST_HEAL,
+                 ambush_chance: float = DungeonState.AMBUSH_CHANCE):
+        GrowthSystem.refresh_stats(player)
+        self.player = CombatProfile.from_actor(player)
+        self.max_floor = max_floor
+        self.rest_below = rest_below
+        self.events = TableSystem.get(event_table)
+        self.berry_heal = berry_heal
+        self.thorn_damage = thorn_damage
+        self.rest_heal = rest_heal
+        self.ambush_chance = ambush_chance
+
+        # 층별 조우 테이블과 몬스터 프로필 (몬스터 ID -> 배열 인덱스)
+        self.encounters = {f: DungeonState.spawn_table(f, player) for f in range(1, max_floor + 1)}
+        self.monster_ids: List[str] = []
+        self.monsters: List[CombatProfile] = []
+        self.monster_skills: List[List[MonsterSkill]] = []   # 몬스터별 AI 후보 (AISystem.skill_ids 순서)
+        index: Dict[str, int] = {}
+        for table in self.encounters.values():
+            if table is None:
+                continue
+            for mid in table.alias.values:
+                if mid not in index:
+                    monster = EntityFactory.create_monster(mid)
+                    if monster is None:
+                        continue
+                    index[mid] = len(self.monsters)
+                    self.monster_ids.append(mid)
+                    profile = CombatProfile.from_actor(monster)
+                    self.monsters.append(profile)
+                    self.monster_skills.append(self._skill_options(monster, profile))
+        self._monster_index = index
+
+    def _skill_options(self, monster: Actor, profile: CombatProfile) -> List[MonsterSkill]:
+        options = []
+        for skill_id in AISystem.skill_ids(monster):
+            skill = AISystem._skill(skill_id)
+            if skill is not None:
+                options.append(MonsterSkill(skill_id, skill, DamageEntry(damage_pmf(profile, skill, self.player)),
+                                            V22_FORMULA.matchup(profile, self.player, skill)))
+        return options
+
+    # --------------------------------------------------------------------------
+    # 진입점
+    # --------------------------------------------------------------------------
+
+    def run(self, runs: int = 5000, seed: int = 0, vectorized: Optional[bool] = None) -> DungeonRunReport:
+        if vectorized is None:
+            vectorized = np is not None
+        if vectorized:
+            if np is None:
+                raise RuntimeError("NumPy is required for vectorized dungeon runs")
+            return self._run_vectorized(runs, seed)
+        report = DungeonRunReport(runs, self.max_floor)
+        rng = random.Random(seed)
+        for _ in range(runs):
+            self._run_single(rng, report)
+        return report
+
+    # --------------------------------------------------------------------------
+    # 순수 Python 경로 (런 1개씩)
+    # --------------------------------------------------------------------------
+
+    def _fight(self, hp: int, mp: int, monster_idx: int, rng) -> Tuple[int, int]:
+        p = self.player
+        monster = self.monsters[monster_idx]
+        player_first = p.dex * 1.5 + rng.randint(1, 20) >= monster.dex * 1.5 + rng.randint(1, 20)
+        m_hp, m_mp = monster.max_hp, monster.max_mp
+        # 명중/분산/치명타/피해 감소는 MathEngine과 같은 v2.2 공식 세트 (전투당 Matchup 한 번씩)
+        roll = rng_roll(rng)
+        basic = V22_FORMULA.matchup(p, monster)
+        special = V22_FORMULA.matchup(p, monster, p.skill) if p.skill else None
+        skills = {option.skill_id: option for option in self.monster_skills[monster_idx]}
+        options = [(option.skill_id, option.entry, option.skill.mp_cost) for option in skills.values()]
+        strike = FormulaEngine.strike
+        for _ in range(MAX_COMBAT_ROUNDS):
+            for player_turn in ((True, False) if player_first else (False, True)):
+                if player_turn:
+                    if special is not None and mp >= p.skill.mp_cost:
+                        mp -= p.skill.mp_cost
+                        m_hp -= strike(special, roll)[0]
+                    else:
+                        m_hp -= strike(basic, roll)[0]
+                    mp = min(p.max_mp, mp + MathEngine.MP_REGEN)
+                else:
+                    chosen = skills[AISystem.best(AISystem.rank(options, m_mp, monster.max_mp, hp))]
+                    m_mp = min(monster.max_mp, m_mp - chosen.skill.mp_cost + MathEngine.MP_REGEN)
+                    hp -= strike(chosen.matchup, roll)[0]
+                if hp <= 0 or m_hp <= 0:
+                    return hp, mp
+        return hp, mp
+
+    def _run_single(self, rng, report: DungeonRunReport):
+        p = self.player
+        hp, mp, floor, steps = p.max_hp, p.max_mp, 1, 0
+        report.entered[1] += 1
+        for _ in range(MAX_TICKS):
+            fight = False
+            if hp < p.max_hp * self.rest_below:
+                if rng.random() < self.ambush_chance:
+                    fight = True
+                else:
+                    hp = min(p.max_hp, hp + int(p.max_hp * self.rest_heal))
+            else:
+                steps += 1
+                if steps >= DungeonState.STEPS_PER_FLOOR:
+                    report.cleared[floor] += 1
+                    report.exit_hp[floor] += hp / p.max_hp
+                    if floor >= self.max_floor:
+                        return
+                    floor, steps = floor + 1, 0
+                    report.entered[floor] += 1
+                    continue
+                event = self.events.roll_one(rng)
+                if event == "combat":
+                    fight = True
+                elif event == "berries":
+                    hp = min(p.max_hp, hp + int(p.max_hp * self.berry_heal))
+                elif event == "thorns":
+                    hp -= int(p.max_hp * self.thorn_damage)
+
+            if fight and self.encounters.get(floor) is not None:
+                mid = self.encounters[floor].roll_one(rng)
+                if mid in self._monster_index:
+                    report.encounters[floor] += 1
+                    hp, mp = self._fight(hp, mp, self._monster_index[mid], rng)
+                    if hp <= 0:
+                        report.combat_deaths[floor] += 1
+            if hp <= 0:
+                report.deaths[floor] += 1
+                return
+
+    # --------------------------------------------------------------------------
+    # NumPy 경로 (모든 런을 배열로 동시에)
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def _matchup_arrays(rows: List[List[Matchup]]) -> Dict[str, "np.ndarray"]:
+        """
+        Matchup 표를 [행, 후보] 패딩 배열로 펼칩니다 (_strike_vectorized 입력).
+        필중(hit_window None)은 [-inf, inf), 분산 없음은 [1, 1], 치명타 불가는 확률 0으로 바꿉니다.
+        """
+        width = max(len(row) for row in rows)
+        depth = {name: max([len(getattr(m, name)) for row in rows for m in row] + [0]) for name in ("pre", "post")}
+        shape = (len(rows), width)
+        a = {name: np.zeros(shape) for name in ("hit_lo", "hit_hi", "base", "var_lo", "var_hi", "crit_chance",
+                                                 "crit_mult", "flat", "post_mult")}
+        for name in ("pre", "post"):
+            a[name] = np.ones(shape + (depth[name],))
+        for i, row in enumerate(rows):
+            for j, m in enumerate(row):
+                a["hit_lo"][i, j], a["hit_hi"][i, j] = m.hit_window if m.hit_window is not None else (-np.inf, np.inf)
+                a["var_lo"][i, j], a["var_hi"][i, j] = m.variance if m.variance is not None else (1.0, 1.0)
+                a["crit_chance"][i, j] = m.crit_chance if m.crit_chance is not None else 0.0
+                for name in ("base", "crit_mult", "flat", "post_mult"):
+                    a[name][i, j] = getattr(m, name)
+                for name in ("pre", "post"):
+                    factors = getattr(m, name)
+                    a[name][i, j, :len(factors)] = factors
+        return a
+
+    @staticmethod
+    def _strike_vectorized(gen, a, rows, cols):
+        """FormulaEngine.strike를 배열로: 타격마다 (행, 후보)의 Matchup으로 명중 판정 + 피해 (반사 제외)."""
+        k = len(rows)
+        r = gen.random(k)
+        hit = (a["hit_lo"][rows, cols] <= r) & (r < a["hit_hi"][rows, cols])
+        lo, hi = a["var_lo"][rows, cols], a["var_hi"][rows, cols]
+        value = a["base"][rows, cols] * (lo + (hi - lo) * gen.random(k))
+        for factor in np.moveaxis(a["pre"][rows, cols], -1, 0):
+            value = value * factor
+        crit = gen.random(k) < a["crit_chance"][rows, cols]
+        value = np.where(crit, value * a["crit_mult"][rows, cols], value)
+        for factor in np.moveaxis(a["post"][rows, cols], -1, 0):
+            value = value * factor
+        damage = np.maximum(1, value + a["flat"][rows, cols]).astype(np.int64)
+        post_mult = a["post_mult"][rows, cols]
+        damage = np.where(post_mult != 1.0, (damage * post_mult).astype(np.int64), damage)
+        return np.where(hit, damage, 0)
+
+    def _monster_arrays(self):
+        p = self.player
+        cols = {}
+        for name in ("max_hp", "max_mp", "dex"):
+            cols[name] = np.array([getattr(m, name) for m in self.monsters], dtype=np.float64)
+
+        # 타격: 플레이어 -> 몬스터 [몬스터, 0=평타/1=주력 스킬], 몬스터 -> 플레이어 [몬스터, AI 후보]
+        cols["player_hits"] = self._matchup_arrays(
+            [[V22_FORMULA.matchup(p, monster)] + ([V22_FORMULA.matchup(p, monster, p.skill)] if p.skill else [])
+             for monster in self.monsters])
+        cols["monster_hits"] = self._matchup_arrays([[o.matchup for o in options] for options in self.monster_skills])
+
+        # 스킬 후보 비용/효용 (후보 0 = 첫 스킬, 빈 칸은 고르지 않음)
+        width = max(len(options) for options in self.monster_skills)
+        cols["skill_mp_cost"] = np.zeros((len(self.monsters), width))
+        cols["skill_efficiency"] = np.zeros(len(self.monsters))
+        cols["skill_entries"] = []
+        for i, options in enumerate(self.monster_skills):
+            for j, option in enumerate(options):
+                cols["skill_mp_cost"][i, j] = option.skill.mp_cost
+            cols["skill_efficiency"][i] = AISystem.best_efficiency(
+                [(option.skill_id, option.entry, option.skill.mp_cost) for option in options])
+            cols["skill_entries"].append([(np.array(o.entry.values, dtype=np.float64), np.array(o.entry.prefix),
+                                           np.array(o.entry.tail), o.skill.mp_cost) for o in options])
+        return cols
+
+    @staticmethod
+    def _choose_vectorized(m, monster: int, hp, m_mp, max_mp: float):
+        """AISystem.rank + best를 배열로: 몬스터 하나의 전투들에서 각자 고른 후보 인덱스."""
+        h = np.maximum(1, hp).astype(np.float64)
+        scarcity = 1.0 - m_mp / max_mp if max_mp > 0 else np.ones(len(hp))
+        mp_value = m["skill_efficiency"][monster] * scarcity
+        best = np.full(len(hp), -np.inf)
+        choice = np.zeros(len(hp), dtype=np.int64)
+        for j, (values, prefix, tail, cost) in enumerate(m["skill_entries"][monster]):
+            i = np.searchsorted(values, h, side="left")
+            utility = (prefix[i] + h * tail[i]) * (1.0 + AISystem.KILL_BONUS * tail[i]) - mp_value * cost
+            utility = np.where(m_mp >= cost, utility, -np.inf)
+            better = utility > best   # 동점이면 앞쪽 후보 유지 (AISystem.best와 같은 규칙)
+            choice = np.where(better, j, choice)
+            best = np.where(better, utility, best)
+        return choice
+
+    def _fight_vectorized(self, gen, hp, mp, monster_idx, m):
+        """
+        여러 전투를 라운드 단위로 동시에 진행합니다.
+        hp/mp: 전투 참가 런들의 현재 값 (복사본), monster_idx: 각 전투의 몬스터 인덱스.
+        """
+        p = self.player
+        n = len(hp)
+        m_hp = m["max_hp"][monster_idx].copy()
+        m_mp_max = m["max_mp"][monster_idx]
+        m_mp = m_mp_max.copy()
+        player_first = p.dex * 1.5 + gen.integers(1, 21, n) >= m["dex"][monster_idx] * 1.5 + gen.integers(1, 21, n)
+        active = np.ones(n, dtype=bool)
+        skill = p.skill
+        strike = DungeonRunSimulator._strike_vectorized
+
+        def player_acts(mask):
+            k = int(mask.sum())
+            if not k:
+                return
+            cur_mp = mp[mask]
+            use = (cur_mp >= skill.mp_cost) if skill else np.zeros(k, dtype=bool)
+            m_hp[mask] -= strike(gen, m["player_hits"], monster_idx[mask], use.astype(np.int64))
+            cost = np.where(use, skill.mp_cost, 0) if skill else 0
+            mp[mask] = np.minimum(p.max_mp, cur_mp - cost + MathEngine.MP_REGEN)
+
+        def monster_acts(mask):
+            k = int(mask.sum())
+            if not k:
+                return
+            who = monster_idx[mask]
+            choice = np.zeros(k, dtype=np.int64)
+            for i in np.unique(who).tolist():
+                if len(self.monster_skills[i]) > 1:
+                    sel = who == i
+                    choice[sel] = self._choose_vectorized(m, i, hp[mask][sel], m_mp[mask][sel], self.monsters[i].max_mp)
+            hp[mask] -= strike(gen, m["monster_hits"], who, choice)
+            m_mp[mask] = np.minimum(m_mp_max[mask], m_mp[mask] - m["skill_mp_cost"][who, choice] + MathEngine.MP_REGEN)
+
+        for _ in range(MAX_COMBAT_ROUNDS):
+            for first in (True, False):
+                # first=True: 주도권을 쥔 쪽이 행동, False: 나머지 쪽이 행동
+                player_turn = active & (player_first == first)
+                monster_turn = active & (player_first != first)
+                player_acts(player_turn)
+                monster_acts(monster_turn)
+                active &= (hp > 0) & (m_hp > 0)
+            if not active.any():
+                break
+        return hp, mp
+
+    def _run_vectorized(self, runs: int, seed: int) -> DungeonRunReport:
+        p = self.player
+        gen = np.random.default_rng(seed)
+        report = DungeonRunReport(runs, self.max_floor)
+        m = self._monster_arrays() if self.monsters else None
+        event_values = self.events.alias.values
+
+        hp = np.full(runs, p.max_hp, dtype=np.int64)
+        mp = np.full(runs, p.max_mp, dtype=np.int64)
+        floor = np.ones(runs, dtype=np.int64)
+        steps = np.zeros(runs, dtype=np.int64)
+        running = np.ones(runs, dtype=bool)
+        report.entered[1] = runs
+
+        def count_by_floor(target: List, floors, weights=None):
+            counts = np.bincount(floors, weights=weights, minlength=self.max_floor + 1)
+            for f in range(1, self.max_floor + 1):
+                target[f] += counts[f].item()
+
+        for _ in range(MAX_TICKS):
+            idx = np.flatnonzero(running)
+            if not len(idx):
+                break
+            fight = np.zeros(runs, dtype=bool)
+
+            low = hp[idx] < p.max_hp * self.rest_below
+            resting, exploring = idx[low], idx[~low]
+
+            # 휴식 (HP가 기준 미만)
+            ambushed = gen.random(len(resting)) < self.ambush_chance
+            fight[resting[ambushed]] = True
+            healed = resting[~ambushed]
+            hp[healed] = np.minimum(p.max_hp, hp[healed] + int(p.max_hp * self.rest_heal))
+
+            # 전진: 계단에 도달한 런은 하강(또는 완주), 나머지는 이벤트 추첨
+            steps[exploring] += 1
+            at_stairs = steps[exploring] >= DungeonState.STEPS_PER_FLOOR
+            stairs, walking = exploring[at_stairs], exploring[~at_stairs]
+            count_by_floor(report.cleared, floor[stairs])
+            count_by_floor(report.exit_hp, floor[stairs], hp[stairs] / p.max_hp)
+            finished = stairs[floor[stairs] >= self.max_floor]
+            running[finished] = False
+            descending = stairs[floor[stairs] < self.max_floor]
+            floor[descending] += 1
+            steps[descending] = 0
+            count_by_floor(report.entered, floor[descending])
+
+            events = self.events.alias.sample_indices(gen, len(walking))
+            for e, value in enumerate(event_values):
+                hit = walking[events == e]
+                if value == "combat":
+                    fight[hit] = True
+                elif value == "berries":
+                    hp[hit] = np.minimum(p.max_hp, hp[hit] + int(p.max_hp * self.berry_heal))
+                elif value == "thorns":
+                    hp[hit] -= int(p.max_hp * self.thorn_damage)
+
+            # 전투: 층별로 조우 몬스터를 뽑은 뒤 모든 전투를 한꺼번에 진행
+            fighters = np.flatnonzero(fight)
+            if len(fighters) and m is not None:
+                monster_idx = np.full(len(fighters), -1, dtype=np.int64)
+                fighter_floors = floor[fighters]
+                for f in np.unique(fighter_floors).tolist():
+                    table = self.encounters.get(f)
+                    if table is None:
+                        continue
+                    sel = fighter_floors == f
+                    lookup = np.array([self._monster_index.get(mid, -1) for mid in table.alias.values], dtype=np.int64)
+                    monster_idx[sel] = lookup[table.alias.sample_indices(gen, int(sel.sum()))]
+                valid = monster_idx >= 0
+                fighters, monster_idx = fighters[valid], monster_idx[valid]
+                count_by_floor(report.encounters, floor[fighters])
+                f_hp, f_mp = self._fight_vectorized(gen, hp[fighters].copy(), mp[fighters].copy(), monster_idx, m)
+                hp[fighters], mp[fighters] = f_hp, f_mp
+                count_by_floor(report.combat_deaths, floor[fighters[f_hp <= 0]])
+
+            dead = idx[hp[idx] <= 0]
+            running[dead] = False
+            count_by_floor(report.deaths, floor[dead])
+        return report
@@ -0,0 +1,200 @@
+# File: src/sim/lookahead.py
+from typing import Dict, List, Optional, Tuple
+
+from src.models.actor import Actor
+from src.models.combat_context import CombatContext
+from src.systems.combat_profile import BASIC_SKILL, CombatProfile, SkillProfile, damage_pmf
+from src.systems.math_engine import MathEngine
+from src.utils.data_loader import DataLoader
+
+class CombatBoard:
+    """
+    탐색용 압축 전투 상태.
+
+    액터마다 HP/MP만 평평한 리스트로 들고, 모든 변경은 (리스트, 인덱스, 이전 값)으로 저널에 쌓입니다.
+    mark()는 저널 길이(= O(1) 스냅샷)이고 undo(mark)는 그 뒤의 변경만 역순으로 되돌리므로,
+    분기 하나의 비용은 실제로 바뀐 값의 개수에 비례합니다 (Actor/CombatContext deepcopy 불필요).
+    """
+    __slots__ = ("profiles", "sides", "hp", "mp", "clock", "order", "_journal")
+
+    def __init__(self, profiles: List[CombatProfile], sides: List[str], hp: List[int], mp: List[int],
+                 order: List[int], turn_index: int = 0, round_count: int = 1):
+        self.profiles = profiles
+        self.sides = sides                  # 액터별 "player" / "enemy"
+        self.hp = list(hp)
+        self.mp = list(mp)
+        self.clock = [turn_index, round_count]
+        self.order = order                  # 행동 순서 (액터 인덱스)
+        self._journal: List[Tuple[list, int, int]] = []
+
+    @staticmethod
+    def from_context(ctx: CombatContext) -> "CombatBoard":
+        actors = ctx.participants + ctx.enemies
+        index = {a.id: i for i, a in enumerate(actors)}
+        return CombatBoard([CombatProfile.from_actor(a) for a in actors],
+                           ["player"] * len(ctx.participants) + ["enemy"] * len(ctx.enemies),
+                           [a.current_hp for a in actors], [a.current_mp for a in actors],
+                           [index[aid] for aid in ctx.turn_order if aid in index] or list(range(len(actors))),
+                           ctx.current_turn_index, ctx.round_count)
+
+    # --------------------------------------------------------------------------
+    # 변경 / 되돌리기
+    # --------------------------------------------------------------------------
+
+    def mark(self) -> int:
+        return len(self._journal)
+
+    def undo(self, mark: int = 0):
+        journal = self._journal
+        while len(journal) > mark:
+            values, i, old = journal.pop()
+            values[i] = old
+
+    def _set(self, values: list, i: int, new):
+        self._journal.append((values, i, values[i]))
+        values[i] = new
+
+    def act(self, actor: int, target: int, mp_cost: int, damage: int):
+        """행동 1회: MP 소모 -> 피해 -> MP 회복 -> 다음 차례 (CombatSystem.process_action과 같은 순서)."""
+        mp = self.mp[actor] - mp_cost
+        self._set(self.mp, actor, min(self.profiles[actor].max_mp, mp + MathEngine.MP_REGEN))
+        if damage:
+            self._set(self.hp, target, max(0, self.hp[target] - damage))
+        self.end_turn()
+
+    def end_turn(self):
+        turn = self.clock[0] + 1
+        if turn >= len(self.order):
+            self._set(self.clock, 1, self.clock[1] + 1)
+            turn = 0
+        self._set(self.clock, 0, turn)
+
+    # --------------------------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------------------------
+
+    @property
+    def current(self) -> int:
+        return self.order[self.clock[0]]
+
+    def alive(self, side: str) -> List[int]:
+        return [i for i, s in enumerate(self.sides) if s == side and self.hp[i] > 0]
+
+    def winner(self) -> Optional[str]:
+        if not self.alive("enemy"):
+            return "player"
+        if not self.alive("player"):
+            return "enemy"
+        return None
+
+class Lookahead:
+    """
+    CombatBoard 위의 기대-미니맥스(Expectiminimax) 탐색.
+
+    자기 편 차례는 기대값 최대, 상대 편 차례는 최소, 피해는 확률 노드입니다.
+    피해 분포는 빗나감 + 확률이 같은 OUTCOMES개 구간의 조건부 평균으로 압축해 분기 수를 줄이고,
+    (공격자, 스킬, 방어자)별로 한 번만 계산합니다. 평가 함수는 양 편 HP 비율 합의 차이입니다.
+    """
+
+    OUTCOMES = 3
+    WIN_SCORE = 10.0
+
+    def __init__(self, board: CombatBoard, skills: List[List[Tuple[str, SkillProfile]]]):
+        self.board = board
+        self.skills = skills                # 액터별 [(스킬 ID, 프로필)...] (평타 포함)
+        self.nodes = 0                      # 탐색 중 시뮬레이션한 행동 수
+        self._outcomes: Dict[Tuple[int, int, int], List[Tuple[int, float]]] = {}
+
+    @staticmethod
+    def skills_of(actor: Actor) -> List[Tuple[str, SkillProfile]]:
+        skills = [("basic_attack", BASIC_SKILL)]
+        for skill_id in actor.skills:
+            data = DataLoader.load_skill(skill_id) if skill_id != "basic_attack" else None
+            if data:
+                skills.append((skill_id, SkillProfile.from_data(data)))
+        return skills
+
+    @staticmethod
+    def from_context(ctx: CombatContext) -> "Lookahead":
+        return Lookahead(CombatBoard.from_context(ctx),
+                         [Lookahead.skills_of(a) for a in ctx.participants + ctx.enemies])
+
+    def outcomes(self, actor: int, skill: int, target: int) -> List[Tuple[int, float]]:
+        key = (actor, skill, target)
+        cached = self._outcomes.get(key)
+        if cached is not None:
+            return cached
+        pmf = damage_pmf(self.board.profiles[actor], self.skills[actor][skill][1], self.board.profiles[target])
+        hits = sorted((d, p) for d, p in pmf.items() if d > 0)
+        result = [(0, pmf[0])] if pmf.get(0, 0.0) > 0 else []
+        total = sum(p for _, p in hits)
+        k, acc, mass, weighted = 1, 0.0, 0.0, 0.0
+        for d, p in hits:
+            acc += p
+            mass += p
+            weighted += d * p
+            if acc >= total * k / self.OUTCOMES - 1e-12 or d == hits[-1][0]:
+                result.append((round(weighted / mass), mass))
+                k, mass, weighted = k + 1, 0.0, 0.0
+        self._outcomes[key] = result
+        return result
+
+    def evaluate(self, side: str) -> float:
+        board = self.board
+        winner = board.winner()
+        if winner is not None:
+            return self.WIN_SCORE if winner == side else -self.WIN_SCORE
+        score = 0.0
+        for i, s in enumerate(board.sides):
+            ratio = board.hp[i] / max(1, board.profiles[i].max_hp)
+            score += ratio if s == side else -ratio
+        return score
+
+    def _value(self, depth: int, side: str) -> float:
+        board = self.board
+        if depth == 0 or board.winner() is not None:
+            return self.evaluate(side)
+        actor = board.current
+        if board.hp[actor] <= 0:
+            mark = board.mark()
+            board.end_turn()
+            value = self._value(depth, side)
+            board.undo(mark)
+            return value
+
+        target = board.alive("enemy" if board.sides[actor] == "player" else "player")[0]
+        maximize = board.sides[actor] == side
+        best = None
+        for s, (_, skill) in enumerate(self.skills[actor]):
+            if board.mp[actor] >= skill.mp_cost:
+                value = self._expect(actor, s, target, depth, side)
+                if best is None or (value > best if maximize else value < best):
+                    best = value
+        return best
+
+    def _expect(self, actor: int, s: int, target: int, depth: int, side: str) -> float:
+        """스킬 s를 쓴 뒤의 기대 평가값 (피해 구간마다 적용 -> 재귀 -> 되돌리기)."""
+        board = self.board
+        cost = self.skills[actor][s][1].mp_cost
+        value = 0.0
+        for damage, p in self.outcomes(actor, s, target):
+            mark = board.mark()
+            board.act(actor, target, cost, damage)
+            self.nodes += 1
+            value += p * self._value(depth - 1, side)
+            board.undo(mark)
+        return value
+
+    def best_skill(self, depth: int = 4) -> Tuple[str, float]:
+        """현재 차례 액터의 (최선 스킬 ID, 기대 평가값). depth는 내다볼 행동 수."""
+        board = self.board
+        actor = board.current
+        side = board.sides[actor]
+        target = board.alive("enemy" if side == "player" else "player")[0]
+        best_id, best = "basic_attack", None
+        for s, (skill_id, skill) in enumerate(self.skills[actor]):
+            if board.mp[actor] >= skill.mp_cost:
+                value = self._expect(actor, s, target, depth, side)
+                if best is None or value > best:
+                    best_id, best = skill_id, value
+        return best_id, best
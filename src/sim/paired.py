@@ -0,0 +1,107 @@
+# File: src/sim/paired.py
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Tuple
+
+from src.utils.stats import RunningStats
+from src.sim.adaptive import z_score
+
+class CommonRandomStreams:
+    """
+    공통 난수(Common Random Numbers) 스트림 묶음.
+
+    (seed, battle, actor, purpose)마다 독립된 난수열을 만들어, 빌드가 달라 판정 횟수가
+    바뀌더라도 "플레이어의 n번째 명중 판정"에는 항상 같은 난수가 쓰이게 합니다.
+    antithetic=True면 모든 난수를 1 - u로 뒤집은 대조(antithetic) 스트림을 제공합니다.
+    """
+
+    def __init__(self, seed: int, battle: int, antithetic: bool = False):
+        self.seed = seed
+        self.battle = battle
+        self.antithetic = antithetic
+        self._streams: Dict[Tuple[str, str], random.Random] = {}
+
+    def begin_round(self, round: int):
+        """BattleRolls와 같은 인터페이스 (공통 난수는 라운드와 무관하게 스트림 순번만 사용)."""
+
+    def draw(self, actor_id: str, purpose: str) -> float:
+        key = (actor_id, purpose)
+        stream = self._streams.get(key)
+        if stream is None:
+            # 문자열 시드는 sha512로 해시되므로 프로세스/실행과 무관하게 결정적입니다.
+            stream = self._streams[key] = random.Random(f"{self.seed}:{self.battle}:{actor_id}:{purpose}")
+        u = stream.random()
+        return 1.0 - u if self.antithetic else u
+
+@dataclass
+class PairedResult:
+    """
+    변형 B - 변형 A의 짝지은(paired) 차이 통계.
+    diff_*는 전투(또는 대조 쌍)별 차이의 누적기이며, 신뢰구간은 그 표준오차로 계산합니다.
+    """
+    z: float
+    pairs: int = 0
+    a_win: RunningStats = field(default_factory=RunningStats)
+    b_win: RunningStats = field(default_factory=RunningStats)
+    a_ttk: RunningStats = field(default_factory=RunningStats)
+    b_ttk: RunningStats = field(default_factory=RunningStats)
+    diff_win: RunningStats = field(default_factory=RunningStats)
+    diff_ttk: RunningStats = field(default_factory=RunningStats)
+
+    def ci(self, diff: RunningStats) -> Tuple[float, float]:
+        half = self.z * diff.stderr
+        return diff.mean - half, diff.mean + half
+
+    @property
+    def win_diff_ci(self) -> Tuple[float, float]:
+        return self.ci(self.diff_win)
+
+    @property
+    def ttk_diff_ci(self) -> Tuple[float, float]:
+        return self.ci(self.diff_ttk)
+
+    @staticmethod
+    def _variance_reduction(a: RunningStats, b: RunningStats, diff: RunningStats) -> float:
+        # 독립 표본이었다면 차이의 분산은 Var(A) + Var(B). 짝지은 분산 대비 배율 = 필요 전투 수 절감 배율.
+        independent = a.variance + b.variance
+        return independent / diff.variance if diff.variance > 0 else float("inf")
+
+    @property
+    def win_variance_reduction(self) -> float:
+        return PairedResult._variance_reduction(self.a_win, self.b_win, self.diff_win)
+
+    @property
+    def ttk_variance_reduction(self) -> float:
+        return PairedResult._variance_reduction(self.a_ttk, self.b_ttk, self.diff_ttk)
+
+def compare_paired(duel_a: Callable[[CommonRandomStreams], Dict], duel_b: Callable[[CommonRandomStreams], Dict],
+                   battles: int = 200, seed: int = 0, antithetic: bool = False,
+                   confidence: float = 0.95) -> PairedResult:
+    """
+    두 변형을 공통 난수로 짝지어 비교합니다.
+    duel_a/duel_b: 난수 스트림을 받아 전투 1회를 수행하고 {"win", "turns"}를 반환하는 함수.
+    antithetic=True면 전투 i마다 (u, 1-u) 두 판을 치러 평균을 한 관측치로 사용합니다.
+    """
+    result = PairedResult(z=z_score(confidence))
+    variants = (False, True) if antithetic else (False,)
+
+    for battle in range(battles):
+        win_a = win_b = ttk_a = ttk_b = 0.0
+        for anti in variants:
+            res_a = duel_a(CommonRandomStreams(seed, battle, anti))
+            res_b = duel_b(CommonRandomStreams(seed, battle, anti))
+            win_a += res_a["win"]
+            win_b += res_b["win"]
+            ttk_a += res_a["turns"]
+            ttk_b += res_b["turns"]
+        k = len(variants)
+        win_a, win_b, ttk_a, ttk_b = win_a / k, win_b / k, ttk_a / k, ttk_b / k
+
+        result.pairs += 1
+        result.a_win.push(win_a)
+        result.b_win.push(win_b)
+        result.a_ttk.push(ttk_a)
+        result.b_ttk.push(ttk_b)
+        result.diff_win.push(win_b - win_a)
+        result.diff_ttk.push(ttk_b - ttk_a)
+    return result
@@ -0,0 +1,383 @@
+# File: src/sim/rotation_planner.py
+import hashlib
+import json
+import math
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np  # 가치 반복을 배열 연산으로 (선택 의존성)
+except ImportError:
+    np = None
+
+from src.core.factory import EntityFactory
+from src.models.actor import Actor
+from src.systems.ai_system import AISystem
+from src.systems.combat_profile import BASIC_SKILL, CombatProfile, SkillProfile, damage_pmf
+from src.systems.growth_system import GrowthSystem
+from src.systems.math_engine import MathEngine
+from src.utils.data_loader import DataLoader
+
+PLANNER_VERSION = 1      # 모델/공식이 바뀌면 올려서 디스크 캐시를 무효화
+HP_BUCKETS = 20          # 자신/적 HP 구간 수 (최대 HP가 이보다 작으면 1 HP 단위로 정확히)
+MP_LEVELS = 40           # MP 단계 수 상한 (최대 MP가 이보다 크면 여러 MP를 한 단계로 묶음)
+DISCOUNT = 0.99          # 라운드당 할인율 - 같은 승률이면 빨리 끝내는 쪽을 선호
+TOLERANCE = 1e-6
+TIE_EPSILON = 1e-6       # 이만큼 이상 낫지 않으면 앞쪽(더 싼) 행동 - 수렴 오차 수준의 차이로 MP를 쓰지 않음
+MAX_ITERATIONS = 2000
+
+# ------------------------------------------------------------------------------
+# 정책 (압축 조회표)
+# ------------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class RotationPolicy:
+    """
+    (자신 HP 구간, MP 단계, 적 HP 구간) -> 스킬 조회표.
+    table은 상태마다 행동 인덱스 한 글자('0'~'9')를 이어붙인 문자열이라 JSON에 그대로 저장됩니다.
+    """
+    actions: Tuple[str, ...]
+    max_hp: int
+    max_mp: int
+    enemy_max_hp: int
+    hp_buckets: int
+    mp_quantum: int
+    mp_levels: int
+    enemy_buckets: int
+    table: str
+    win_chance: float          # 풀 HP/풀 MP에서 시작했을 때의 승률 (모델 기준)
+
+    @staticmethod
+    def _bucket(hp: int, max_hp: int, buckets: int) -> int:
+        return min(buckets - 1, max(0, math.ceil(hp / max_hp * buckets) - 1))
+
+    def index(self, hp: int, mp: int, enemy_hp: int) -> int:
+        h = RotationPolicy._bucket(hp, self.max_hp, self.hp_buckets)
+        m = min(self.mp_levels - 1, max(0, mp) // self.mp_quantum)
+        e = RotationPolicy._bucket(enemy_hp, self.enemy_max_hp, self.enemy_buckets)
+        return (h * self.mp_levels + m) * self.enemy_buckets + e
+
+    def action(self, hp: int, mp: int, enemy_hp: int) -> str:
+        return self.actions[int(self.table[self.index(hp, mp, enemy_hp)])]
+
+    def choose(self, actor: Actor, enemy: Actor) -> str:
+        return self.action(actor.current_hp, actor.current_mp, enemy.current_hp)
+
+    def usage(self) -> Dict[str, float]:
+        """전체 상태 중 각 스킬을 고르는 비율."""
+        return {skill_id: self.table.count(str(i)) / len(self.table) for i, skill_id in enumerate(self.actions)}
+
+    def to_dict(self) -> dict:
+        data = dict(self.__dict__)
+        data["actions"] = list(self.actions)
+        return data
+
+    @staticmethod
+    def from_dict(data: dict) -> "RotationPolicy":
+        data = dict(data)
+        data["actions"] = tuple(data["actions"])
+        return RotationPolicy(**data)
+
+# ------------------------------------------------------------------------------
+# 결투 MDP
+# ------------------------------------------------------------------------------
+
+def _hp_transition(pmf: Dict[int, float], max_hp: int, buckets: int) -> Tuple[List[List[Tuple[int, float]]], List[float]]:
+    """
+    구간 b 안의 HP를 균등분포로 보고 피해 분포를 적용한 전이.
+    반환: (trans[b] = [(다음 구간, 확률)...], dead[b] = 쓰러질 확률). 구간 크기가 1이면 정확한 전이입니다.
+    """
+    size = max_hp / buckets
+    trans, dead = [], []
+    for b in range(buckets):
+        lo, hi = b * size, (b + 1) * size
+        row: Dict[int, float] = {}
+        p_dead = 0.0
+        for d, pd in pmf.items():
+            a, z = lo - d, hi - d
+            if z <= 0:
+                p_dead += pd
+                continue
+            if a < 0:
+                p_dead += pd * (-a) / size
+                a = 0.0
+            k = int(a // size)
+            while k * size < z:
+                overlap = min(z, (k + 1) * size) - max(a, k * size)
+                if overlap > 0:
+                    row[k] = row.get(k, 0.0) + pd * overlap / size
+                k += 1
+        trans.append(sorted(row.items()))
+        dead.append(p_dead)
+    return trans, dead
+
+def _mp_transition(cost: int, quantum: int, levels: int, max_mp: int) -> List[Optional[List[Tuple[int, float]]]]:
+    """MP 단계 m에서 스킬을 쓴 뒤의 단계 분포 (쓸 수 없으면 None). 묶인 단계 사이는 확률로 나눕니다."""
+    rows: List[Optional[List[Tuple[int, float]]]] = []
+    for m in range(levels):
+        mp = m * quantum
+        if mp < cost:
+            rows.append(None)
+            continue
+        after = min(max_mp, mp - cost + MathEngine.MP_REGEN) / quantum
+        low = min(levels - 1, int(after))
+        frac = after - low if low < levels - 1 else 0.0
+        rows.append([(low, 1.0 - frac), (low + 1, frac)] if frac > 0 else [(low, 1.0)])
+    return rows
+
+class DuelModel:
+    """
+    1대1 전투를 (자신 HP 구간, MP 단계, 적 HP 구간) 상태의 MDP로 본 모델.
+    한 라운드 = 자신의 행동(스킬 선택) -> 적이 살아 있으면 적의 평타. 승리 보상 1, 패배 0, 라운드마다 DISCOUNT.
+    적은 평타만 쓴다고 가정하므로 스킬을 쓰는 몬스터(AISystem.has_active_skills)는 상대로 쓰지 않습니다.
+    """
+
+    def __init__(self, me: CombatProfile, skills: List[Tuple[str, SkillProfile]], foe: CombatProfile,
+                 hp_buckets: int = HP_BUCKETS, mp_levels: int = MP_LEVELS):
+        self.me, self.foe = me, foe
+        self.actions = [("basic_attack", BASIC_SKILL)] + [(sid, s) for sid, s in skills if sid != "basic_attack"]
+        self.max_hp, self.foe_hp = max(1, me.max_hp), max(1, foe.max_hp)
+        self.H = min(hp_buckets, self.max_hp)
+        self.E = min(hp_buckets, self.foe_hp)
+        self.quantum = max(1, math.ceil(me.max_mp / (mp_levels - 1)))
+        self.M = me.max_mp // self.quantum + 1
+
+        self.own_trans, self.own_dead = _hp_transition(damage_pmf(foe, BASIC_SKILL, me), self.max_hp, self.H)
+        self.foe_trans, self.kill, self.mp_trans = [], [], []
+        for _, skill in self.actions:
+            trans, dead = _hp_transition(damage_pmf(me, skill, foe), self.foe_hp, self.E)
+            self.foe_trans.append(trans)
+            self.kill.append(dead)
+            self.mp_trans.append(_mp_transition(skill.mp_cost, self.quantum, self.M, me.max_mp))
+
+    # --------------------------------------------------------------------------
+    # 가치 반복
+    # --------------------------------------------------------------------------
+
+    def solve(self, policy: Optional[Callable[[int, int, int], int]] = None, vectorized: Optional[bool] = None,
+              discount: float = DISCOUNT):
+        """
+        가치 반복으로 (가치표 V[h][m][e], 행동표)를 구합니다.
+        policy(h, m, e) -> 행동 인덱스를 주면 그 고정 정책의 가치만 평가합니다 (정책 평가).
+        discount=1.0으로 정책을 평가하면 가치가 곧 (할인 없는) 승률입니다.
+        """
+        use_numpy = np is not None if vectorized is None else (vectorized and np is not None)
+        return self._solve_numpy(policy, discount) if use_numpy else self._solve_python(policy, discount)
+
+    def _solve_python(self, policy, discount):
+        H, M, E, A = self.H, self.M, self.E, len(self.actions)
+        V = [[[0.0] * E for _ in range(M)] for _ in range(H)]
+        best = [[[0] * E for _ in range(M)] for _ in range(H)]
+        for _ in range(MAX_ITERATIONS):
+            # W[h][m][e'] = discount x E[V(적 공격 후 h', m, e')] (쓰러지면 0)
+            W = [[[discount * sum(p * V[k][m][e] for k, p in self.own_trans[h]) for e in range(E)]
+                  for m in range(M)] for h in range(H)]
+            delta = 0.0
+            new_V = [[[0.0] * E for _ in range(M)] for _ in range(H)]
+            for h in range(H):
+                for m in range(M):
+                    for e in range(E):
+                        allowed = [policy(h, m, e)] if policy else range(A)
+                        top, top_a = -1.0, None
+                        for a in allowed:
+                            mp_row = self.mp_trans[a][m]
+                            if mp_row is None:
+                                continue
+                            q = self.kill[a][e]
+                            for f, pf in self.foe_trans[a][e]:
+                                q += pf * sum(pm * W[h][n][f] for n, pm in mp_row)
+                            if top_a is None or q > top + TIE_EPSILON:
+                                top, top_a = q, a
+                        new_V[h][m][e], best[h][m][e] = top, top_a
+                        delta = max(delta, abs(top - V[h][m][e]))
+            V = new_V
+            if delta < TOLERANCE:
+                break
+        return V, best
+
+    def _dense(self):
+        """희소 전이를 밀집 행렬로 (NumPy 경로용)."""
+        own = np.zeros((self.H, self.H))
+        for h, row in enumerate(self.own_trans):
+            for k, p in row:
+                own[h, k] = p
+        foe, mp, allowed = [], [], []
+        for a in range(len(self.actions)):
+            f = np.zeros((self.E, self.E))
+            for e, row in enumerate(self.foe_trans[a]):
+                for k, p in row:
+                    f[e, k] = p
+            m = np.zeros((self.M, self.M))
+            ok = np.zeros(self.M, dtype=bool)
+            for i, row in enumerate(self.mp_trans[a]):
+                if row is not None:
+                    ok[i] = True
+                    for n, p in row:
+                        m[i, n] = p
+            foe.append(f)
+            mp.append(m)
+            allowed.append(ok)
+        return own, foe, mp, allowed
+
+    def _solve_numpy(self, policy, discount):
+        H, M, E, A = self.H, self.M, self.E, len(self.actions)
+        own, foe, mp, allowed = self._dense()
+        kill = [np.asarray(k) for k in self.kill]
+        fixed = None
+        if policy:
+            fixed = np.array([[[policy(h, m, e) for e in range(E)] for m in range(M)] for h in range(H)])
+
+        V = np.zeros((H, M, E))
+        Q = np.full((A, H, M, E), -1.0)
+        tie = TIE_EPSILON * np.arange(A)[:, None, None, None]
+        for _ in range(MAX_ITERATIONS):
+            W = discount * np.einsum("hk,kme->hme", own, V)
+            for a in range(A):
+                X = np.einsum("mn,hne->hme", mp[a], W)
+                Q[a] = kill[a][None, None, :] + np.einsum("ef,hmf->hme", foe[a], X)
+                Q[a][:, ~allowed[a], :] = -1.0
+            best = fixed if fixed is not None else (Q - tie).argmax(axis=0)
+            new_V = np.take_along_axis(Q, best[None], axis=0)[0]
+            delta = np.abs(new_V - V).max()
+            V = new_V
+            if delta < TOLERANCE:
+                break
+        return V.tolist(), best.tolist()
+
+    # --------------------------------------------------------------------------
+    # 결과
+    # --------------------------------------------------------------------------
+
+    def start_value(self, V) -> float:
+        return V[self.H - 1][self.M - 1][self.E - 1]
+
+    def policy(self, vectorized: Optional[bool] = None) -> RotationPolicy:
+        _, best = self.solve(vectorized=vectorized)
+        V, _ = self.solve(policy=lambda h, m, e: best[h][m][e], vectorized=vectorized, discount=1.0)
+        table = "".join(str(best[h][m][e]) for h in range(self.H) for m in range(self.M) for e in range(self.E))
+        return RotationPolicy(tuple(sid for sid, _ in self.actions), self.max_hp, self.me.max_mp, self.foe_hp,
+                              self.H, self.quantum, self.M, self.E, table, self.start_value(V))
+
+    def evaluate(self, choose: Callable[[int, float], str], vectorized: Optional[bool] = None) -> float:
+        """
+        고정 규칙의 승률 (할인 없음). choose(MP, 적 HP 비율) -> 스킬 ID (쓸 수 없는 스킬이면 평타로 대체).
+        """
+        ids = [sid for sid, _ in self.actions]
+
+        def rule(h, m, e):
+            a = ids.index(choose(m * self.quantum, (e + 1) / self.E))
+            return a if self.mp_trans[a][m] is not None else 0
+        V, _ = self.solve(policy=rule, vectorized=vectorized, discount=1.0)
+        return self.start_value(V)
+
+# ------------------------------------------------------------------------------
+# 직업별 정책 (디스크 캐시)
+# ------------------------------------------------------------------------------
+
+class RotationPlanner:
+    """
+    직업별 최적 스킬 순환 계획기.
+
+    (종족, 직업, 레벨, 상대 몬스터)마다 DuelModel을 가치 반복으로 풀어 RotationPolicy 조회표를 만듭니다.
+    결과는 데이터 파일(races/classes/skills/monsters) 내용 해시와 함께 디스크에 캐싱되어,
+    데이터가 그대로면 AI와 밸런스 시뮬레이션이 계산 없이 즉시 불러올 수 있습니다.
+    """
+
+    CACHE_FILE = "cache/rotation_policies.json"
+    DATA_FILES = ("races.json", "classes.json", "skills.json", "monsters.json", "formulas.json")
+
+    _policies: Optional[Dict[str, RotationPolicy]] = None
+    _source: Optional[str] = None
+
+    @staticmethod
+    def data_hash() -> str:
+        payload = {"v": PLANNER_VERSION,
+                   "model": [HP_BUCKETS, MP_LEVELS, MathEngine.MP_REGEN, DISCOUNT],
+                   "data": {name: DataLoader.load_json(name) for name in RotationPlanner.DATA_FILES}}
+        return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _load() -> Dict[str, RotationPolicy]:
+        source = RotationPlanner.data_hash()
+        if RotationPlanner._policies is not None and RotationPlanner._source == source:
+            return RotationPlanner._policies
+
+        policies = {}
+        try:
+            with open(DataLoader._get_data_path(RotationPlanner.CACHE_FILE), "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("source") == source:
+                policies = {key: RotationPolicy.from_dict(p) for key, p in cached["policies"].items()}
+        except (IOError, ValueError, KeyError, TypeError):
+            pass
+        RotationPlanner._policies, RotationPlanner._source = policies, source
+        return policies
+
+    @staticmethod
+    def _save():
+        path = DataLoader._get_data_path(RotationPlanner.CACHE_FILE)
+        data = {"source": RotationPlanner._source,
+                "policies": {key: p.to_dict() for key, p in RotationPlanner._policies.items()}}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, sort_keys=True)
+        except IOError:
+            pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 계산)
+
+    @staticmethod
+    def clear_cache():
+        """메모리 캐시를 버립니다. 디스크 캐시는 데이터 해시로 자동 무효화됩니다."""
+        RotationPlanner._policies = None
+        RotationPlanner._source = None
+
+    @staticmethod
+    def supports(monster: Actor) -> bool:
+        """평타만 쓰는 몬스터인지 (DuelModel의 적 행동 가정이 실제 AI와 같은 경우)."""
+        return not AISystem.has_active_skills(monster)
+
+    @staticmethod
+    def default_opponent(player: Actor) -> Optional[str]:
+        """전투력이 플레이어와 가장 비슷한, 평타만 쓰는 몬스터 (난이도 1.0 = 대등한 결투)."""
+        from src.systems.difficulty_system import DifficultySystem
+        power = DifficultySystem.player_power(player)
+        for _, monster_id in sorted(DifficultySystem.ratings(), key=lambda r: abs(r[0] - power)):
+            monster = EntityFactory.create_monster(monster_id)
+            if monster is not None and RotationPlanner.supports(monster):
+                return monster_id
+        return None
+
+    @staticmethod
+    def model_for(player: Actor, monster: Actor) -> DuelModel:
+        """스킬을 쓰는 몬스터는 모델이 맞지 않으므로 ValueError."""
+        if not RotationPlanner.supports(monster):
+            raise ValueError(f"Rotation planner models basic-attack-only foes: {monster.template_id}")
+        GrowthSystem.refresh_stats(player)
+        skills = []
+        for skill_id in player.skills:
+            data = DataLoader.load_skill(skill_id)
+            if data and skill_id != "basic_attack" and len(skills) < 9:   # 조회표 한 글자 = 행동 10개까지
+                skills.append((skill_id, SkillProfile.from_data(data)))
+        return DuelModel(CombatProfile.from_actor(player), skills, CombatProfile.from_actor(monster))
+
+    @staticmethod
+    def class_policy(class_id: str, race_id: str = "human", level: int = 10,
+                     opponent: Optional[str] = None) -> Optional[RotationPolicy]:
+        """직업별 최적 정책 (상대가 스킬을 쓰면 None). 캐시에 있으면 즉시 반환하고, 없으면 풀어서 디스크에 저장합니다."""
+        player = EntityFactory.create_player("Planner", race_id, class_id)
+        if player is None:
+            return None
+        player.level = level
+        GrowthSystem.refresh_stats(player)
+        opponent = opponent or RotationPlanner.default_opponent(player)
+        monster = EntityFactory.create_monster(opponent) if opponent else None
+        if monster is None or not RotationPlanner.supports(monster):
+            return None
+
+        policies = RotationPlanner._load()
+        key = f"{race_id}/{class_id}/{level}/{opponent}"
+        if key not in policies:
+            policies[key] = RotationPlanner.model_for(player, monster).policy()
+            RotationPlanner._save()
+        return policies[key]
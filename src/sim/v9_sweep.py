@@ -0,0 +1,222 @@
+# File: src/sim/v9_sweep.py
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # 격자 전체를 배열로 처리 (필수: 이 모듈은 NumPy 전용)
+except ImportError:
+    np = None
+
+from src.formulas.v9 import V9Formula
+
+AXES = ("strength", "dex", "con", "level")
+KEYSTONES = (("RESOLUTE_TECHNIQUE", "strength"), ("DEADLY_ARTS", "dex"), ("IRON_FORTRESS", "con"))
+
+# Matchup 배열 중 결투 결과를 결정하는 값 (이 값들이 그대로면 셀 결과도 그대로)
+PARAM_KEYS = ("hit_p", "crit_p", "dmg", "dmg_crit", "reflect", "reflect_crit", "regen")
+EXPECTED_KEYS = ("exp_dmg", "exp_reflect")   # 해석적 근사 전용 (시뮬레이션 결과에는 영향 없음)
+
+def _combatant(strength, dex, con, level) -> Dict[str, "np.ndarray"]:
+    """combat_simulator.Actor의 get_stat/get_max_hp/update_keystones를 배열로 (로그 항은 math.log로 같은 값)."""
+    level = np.asarray(level)
+    log_term = np.vectorize(lambda lv: math.log(lv + 1), otypes=[float])(level)
+    out = {"level": level, "max_hp": np.trunc(100 + (con * 25) + level * 8.0 * log_term).astype(np.int64)}
+    for name, raw in (("strength", strength), ("dex", dex), ("con", con)):
+        out[name] = np.trunc(raw + raw * 0.5 * log_term).astype(np.int64)
+    threshold = V9Formula.KEYSTONE_THRESHOLD
+    for keystone, stat in KEYSTONES:
+        out[keystone] = np.asarray({"strength": strength, "dex": dex, "con": con}[stat]) >= threshold
+    return out
+
+class V9Sweep:
+    """
+    v9 결투(combat_simulator.simulate_duel)를 STR x DEX x CON x 레벨 격자 전체에 대해 한 번에 평가합니다.
+
+    1. 셀마다 양방향 Matchup(명중/치명타 확률, 일반/치명타 피해와 반사, 재생)을 V9Formula.matchup_arrays로 계산.
+    2. 몬테카를로: 모든 셀이 같은 난수 표(턴 x 용도 x 표본)를 공유하는 공통 난수 방식으로 (셀 x 표본) 배열을
+       턴 단위로 진행합니다. 셀 결과는 그 셀의 Matchup과 난수 표만으로 정해지므로 일부 셀만 다시 계산해도
+       전체를 다시 계산한 것과 같습니다.
+    3. set_constants(): 상수를 바꾸면 Matchup 배열(값싼 원소별 연산)만 전부 다시 계산하고,
+       값이 실제로 달라진 셀만 다시 시뮬레이션합니다 (예: FORTRESS_REFLECT는 IRON_FORTRESS가 관여하는 셀만).
+    estimate_duel과 같은 해석적 근사(est_win/est_ttk)도 함께 제공합니다.
+    """
+
+    def __init__(self, strength: Sequence[int], dex: Sequence[int], con: Sequence[int], levels: Sequence[int],
+                 enemy: Optional[Dict[str, int]] = None, samples: int = 500, max_turns: int = 100, seed: int = 0,
+                 constants: Optional[Dict[str, float]] = None):
+        if np is None:
+            raise RuntimeError("NumPy is required for V9Sweep")
+        from src.combat_simulator import ENEMY_STATS   # 순환 참조 방지를 위한 지역 임포트
+        self.axes = {"strength": np.asarray(strength), "dex": np.asarray(dex), "con": np.asarray(con),
+                     "level": np.asarray(levels)}
+        self.shape = tuple(len(self.axes[a]) for a in AXES)
+        self.enemy = dict(enemy or ENEMY_STATS)
+        self.samples = samples
+        self.max_turns = max_turns
+        self.constants = V9Formula.constants(constants)
+
+        grid = np.meshgrid(*(self.axes[a] for a in AXES), indexing="ij")
+        self._player = _combatant(*grid)
+        e = self.enemy
+        self._enemy = _combatant(np.full(self.shape, e["strength"]), np.full(self.shape, e["dex"]),
+                                 np.full(self.shape, e["con"]), grid[3])
+
+        # 공통 난수 표: [턴, (플레이어 명중, 플레이어 치명타, 적 명중, 적 치명타), 표본]
+        self._rolls = np.random.default_rng(seed).random((max_turns, 4, samples))
+
+        size = int(np.prod(self.shape))
+        self.win = np.zeros(size)
+        self.ttk = np.zeros(size)
+        self.simulated_cells = 0          # 누적 시뮬레이션 셀 수 (증분 재계산 확인용)
+        self._params = self._matchups()
+        self._simulate(np.arange(size))
+
+    # --------------------------------------------------------------------------
+    # Matchup 배열
+    # --------------------------------------------------------------------------
+
+    def _matchups(self) -> Dict[str, "np.ndarray"]:
+        pe = V9Formula.matchup_arrays(self._player, self._enemy, self.constants)
+        ep = V9Formula.matchup_arrays(self._enemy, self._player, self.constants)
+        params = {f"p_{k}": pe[k].ravel() for k in PARAM_KEYS + EXPECTED_KEYS}
+        params.update({f"e_{k}": ep[k].ravel() for k in PARAM_KEYS + EXPECTED_KEYS})
+        params["p_hp"] = self._player["max_hp"].ravel()
+        params["e_hp"] = self._enemy["max_hp"].ravel()
+        return params
+
+    def set_constants(self, **overrides) -> int:
+        """상수를 바꾸고 영향받는 셀만 다시 시뮬레이션합니다. 반환: 다시 계산한 셀 수."""
+        self.constants = V9Formula.constants({**self.constants, **overrides})
+        params = self._matchups()
+        changed = np.zeros(self.win.size, dtype=bool)
+        for key, values in params.items():
+            if key[2:] not in EXPECTED_KEYS:
+                changed |= values != self._params[key]
+        self._params = params
+        cells = np.flatnonzero(changed)
+        if cells.size:
+            self._simulate(cells)
+        return int(cells.size)
+
+    # --------------------------------------------------------------------------
+    # 몬테카를로 (셀 x 표본 배열을 턴 단위로 진행)
+    # --------------------------------------------------------------------------
+
+    def _simulate(self, cells: "np.ndarray", chunk: int = 512):
+        for start in range(0, cells.size, chunk):
+            idx = cells[start:start + chunk]
+            wins, turns = self._duel(idx)
+            self.win[idx] = wins / self.samples
+            self.ttk[idx] = turns / self.samples
+        self.simulated_cells += int(cells.size)
+
+    def _duel(self, idx: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        셀 idx의 결투 (셀 x 표본)개를 평평한 배열로 진행하고 (셀별 승리 수, 셀별 턴 수 합)을 반환합니다.
+        simulate_duel과 같은 순서: 플레이어 타격 -> 적 사망이면 승리 -> 플레이어 사망이면 패배 -> 적 타격
+        (적 타격 뒤에는 다음 턴 시작 시 루프 조건으로 종료). 끝난 결투는 매 턴 배열에서 빼냅니다.
+        """
+        n = self.samples
+        row = np.repeat(np.arange(idx.size), n)          # 결투 -> 셀 (idx 안의 위치)
+        sample = np.tile(np.arange(n), idx.size)          # 결투 -> 난수 표 열
+        p_hp = self._params["p_hp"][idx][row]
+        e_hp = self._params["e_hp"][idx][row]
+        wins = np.zeros(idx.size, dtype=np.int64)
+        turns = np.zeros(idx.size, dtype=np.int64)
+
+        # 셀별 결과표: [빗나감, 일반, 치명타] 피해/반사를 (셀 x 3) 평평한 배열로 -> 결투당 한 번의 색인으로 조회
+        tables = {}
+        for side in ("p", "e"):
+            get = lambda key: self._params[f"{side}_{key}"][idx]
+            zero = np.zeros(idx.size, dtype=np.int64)
+            tables[side] = (get("hit_p"), get("crit_p"),
+                            np.column_stack([zero, get("dmg"), get("dmg_crit")]).ravel(),
+                            np.column_stack([zero, get("reflect"), get("reflect_crit")]).ravel(), get("regen"))
+
+        def strike(side, r_hit, r_crit, hp, other):
+            hit_p, crit_p, damage, reflect, regen = tables[side]
+            hit = r_hit < hit_p[row]
+            outcome = row * 3 + hit + (hit & (r_crit < crit_p[row]))
+            hp -= damage[outcome]
+            other -= reflect[outcome]
+            hp += np.where(hit & (hp > 0), regen[row], 0)
+
+        for t in range(self.max_turns):
+            rolls = self._rolls[t][:, sample]
+            strike("p", rolls[0], rolls[1], e_hp, p_hp)
+            won = e_hp <= 0
+            done = won | (p_hp <= 0)
+            strike("e", rolls[2], rolls[3], p_hp, e_hp)   # 끝난 결투의 적 타격은 아래에서 버려짐
+            done |= (p_hp <= 0) | (e_hp <= 0)
+            if t + 1 == self.max_turns:
+                done[:] = True
+            if done.any():
+                np.add.at(wins, row[won], 1)
+                np.add.at(turns, row[done], t + 1)
+                keep = ~done
+                row, sample, p_hp, e_hp = row[keep], sample[keep], p_hp[keep], e_hp[keep]
+                if row.size == 0:
+                    break
+        return wins, turns
+
+    # --------------------------------------------------------------------------
+    # 해석적 근사 (estimate_duel 배열 버전)
+    # --------------------------------------------------------------------------
+
+    def estimate(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """(추정 승률, 추정 전투 길이) 격자. estimate_duel과 같은 식."""
+        P = self._params
+
+        def expected(side):
+            return P[f"{side}_hit_p"], P[f"{side}_exp_dmg"], P[f"{side}_exp_reflect"], P[f"{side}_regen"]
+
+        ph, pd, pr, preg = expected("p")
+        eh, ed, er, ereg = expected("e")
+        to_enemy = ph * (pd - preg) + eh * er
+        to_player = eh * (ed - ereg) + ph * pr
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_enemy = np.where(to_enemy > 0, np.ceil(P["e_hp"] / to_enemy), self.max_turns)
+            t_player = np.where(to_player > 0, np.ceil(P["p_hp"] / to_player), self.max_turns)
+        t_enemy = np.minimum(t_enemy, self.max_turns)
+        t_player = np.minimum(t_player, self.max_turns)
+        margin = (t_player - t_enemy + 0.5) / np.maximum(1.0, 0.15 * np.minimum(t_enemy, t_player))
+        win = 1.0 / (1.0 + np.exp(-margin))
+        return win.reshape(self.shape), np.minimum(t_enemy, t_player).reshape(self.shape)
+
+    # --------------------------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------------------------
+
+    @property
+    def win_rate(self) -> "np.ndarray":
+        return self.win.reshape(self.shape)
+
+    @property
+    def mean_ttk(self) -> "np.ndarray":
+        return self.ttk.reshape(self.shape)
+
+    def cell(self, strength: int, dex: int, con: int, level: int) -> Tuple[int, int, int, int]:
+        return tuple(int(np.flatnonzero(self.axes[a] == v)[0]) for a, v in zip(AXES, (strength, dex, con, level)))
+
+    def heatmap(self, metric: str = "win", x: str = "strength", y: str = "dex",
+                fixed: Optional[Dict[str, int]] = None) -> "np.ndarray":
+        """
+        2차원 단면 [y, x]. 나머지 축은 fixed의 값 (없으면 그 축의 가운데 값).
+        metric: "win" / "ttk" / "est_win" / "est_ttk".
+        """
+        if metric in ("est_win", "est_ttk"):
+            est_win, est_ttk = self.estimate()
+            data = est_win if metric == "est_win" else est_ttk
+        else:
+            data = self.win_rate if metric == "win" else self.mean_ttk
+        fixed = fixed or {}
+        index: List[object] = []
+        for axis in AXES:
+            if axis in (x, y):
+                index.append(slice(None))
+            elif axis in fixed:
+                index.append(int(np.flatnonzero(self.axes[axis] == fixed[axis])[0]))
+            else:
+                index.append(len(self.axes[axis]) // 2)
+        plane = data[tuple(index)]
+        return plane.T if AXES.index(x) < AXES.index(y) else plane
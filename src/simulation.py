@@ -1,9 +1,9 @@
 import sys
 import os
-import statistics
 import random
 import math
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 # --- 경로 설정 수정 ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,7 +12,13 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from src.models.actor import Actor
-from src.models.combat_context import CombatContext
+from src.utils.result_store import ResultStore
+from src.utils.stats import MetricSet
+from src.sim.adaptive import AdaptiveSimulator, AdaptiveResult
+from src.formulas.engine import FormulaEngine, global_roll
+from src.formulas.v61 import V61Formula, FORMULA as V61_FORMULA
+from src.formulas.profile import BalanceProfile, DEFAULT_PROFILE
+from src.utils.rng import CounterRNG
 
 # --- 🚀 Phase 4: Role-Based Actor ---
 class StressTestActor(Actor):
@@ -27,6 +33,11 @@ class StressTestActor(Actor):
         level_bonus = self.level * 2.1 * math.log(self.level + 1)
         return int(20 + (self.base_stats["CON"] * 10) + level_bonus)
 
+    @max_hp.setter
+    def max_hp(self, value: int):
+        # Actor.__init__이 max_hp 필드에 기본값을 대입하므로 무시합니다 (레벨/CON에서 파생되는 값).
+        pass
+
     def get_scaled_stats(self) -> Dict[str, int]:
         """Base + Log Scaling"""
         scaled = {}
@@ -56,19 +67,43 @@ class StressTestActor(Actor):
         stats = self.get_scaled_stats()
         return stats["DEX"] * 2
 
+# --- 1:1 전투 컨텍스트 ---
+@dataclass
+class DuelContext:
+    """
+    스트레스 테스트용 1:1 전투 컨텍스트.
+    (CombatContext는 다대다 턴 순서 모델이므로 교대 공격만 하는 듀얼 전용으로 분리)
+    """
+    player: StressTestActor
+    enemy: StressTestActor
+    turn_count: int = 0
+    is_finished: bool = False
+    winner: Optional[StressTestActor] = None
+    profile: Optional[BalanceProfile] = None   # None = 기본 프로필
+
+    def get_current_attacker(self) -> StressTestActor:
+        return self.player if self.turn_count % 2 == 0 else self.enemy
+
+    def get_current_defender(self) -> StressTestActor:
+        return self.enemy if self.turn_count % 2 == 0 else self.player
+
 # --- 🚀 Final Combat Core: Tri-Equilibrium (v6.1 - The Refined Equilibrium) ---
 class FinalCombatSystem:
-    # 밸런싱 상수
-    BASE_CRIT_MULT = 1.5
-    MAX_CRIT_MULT = 2.2         # [v6.1] 암살자의 죽창력을 위해 상향
-    MAX_CRIT_CHANCE = 0.40      # [v6.1] 상향
-    CRIT_CHANCE_FACTOR = 0.015
-    EVA_FACTOR = 0.6            # [v6.1] 회피 효율 상향
-    REFLECT_CAP = 0.20          # [v6.1] 반사 상한 소폭 상향
-    MIN_HIT_CHANCE = 0.65       # [v6.1] 핵심! 최소 명중률을 낮춰서 고DEX 캐릭터의 회피를 실질적으로 보장
+    # 기본 프로필의 밸런싱 상수 (V61Formula가 원본, 변형은 DuelContext.profile로 전달)
+    BASE_CRIT_MULT = V61Formula.BASE_CRIT_MULT
+    MAX_CRIT_MULT = V61Formula.MAX_CRIT_MULT
+    MAX_CRIT_CHANCE = V61Formula.MAX_CRIT_CHANCE
+    CRIT_CHANCE_FACTOR = V61Formula.CRIT_CHANCE_FACTOR
+    EVA_FACTOR = V61Formula.EVA_FACTOR
+    REFLECT_CAP = V61Formula.REFLECT_CAP
+    MIN_HIT_CHANCE = V61Formula.MIN_HIT_CHANCE
 
     @staticmethod
-    def process_turn(context: CombatContext, action: str = "attack") -> dict:
+    def process_turn(context: DuelContext, action: str = "attack") -> dict:
+        """
+        현재 공격자의 공격 1회. 명중/감쇄/압도/저항/치명타/관통/보복/반사 공식은
+        V61Formula.matchup이, 난수 판정은 FormulaEngine이 처리합니다.
+        """
         attacker = context.get_current_attacker()
         defender = context.get_current_defender()
         
@@ -81,58 +116,15 @@ class FinalCombatSystem:
             "is_dead": False
         }
 
-        # 보정 스탯 캐싱
-        a_stats = attacker.get_scaled_stats() if hasattr(attacker, 'get_scaled_stats') else attacker.base_stats
-        d_stats = defender.get_scaled_stats() if hasattr(defender, 'get_scaled_stats') else defender.base_stats
-
-        # --- [Step 1: 명중/회피] ---
-        acc = attacker.accuracy
-        eva = defender.evasion
-        # [v6.1] 최소 명중률(MIN_HIT_CHANCE)이 낮아져서 이제 DEX 빌드가 진짜로 '피합니다'
-        hit_chance = max(FinalCombatSystem.MIN_HIT_CHANCE, acc / (acc + (eva * FinalCombatSystem.EVA_FACTOR)))
-
-        if random.random() > hit_chance:
-            result["is_hit"] = False
+        formula = (context.profile or DEFAULT_PROFILE).v61
+        m = formula.matchup(formula.prepare(attacker), formula.prepare(defender))
+        if not FormulaEngine.roll_hit(m):
             context.turn_count += 1
             return result
 
         result["is_hit"] = True
+        final_damage, result["is_crit"], reflected_dmg = FormulaEngine.roll_damage(m)
 
-        # --- [Step 2: STR 기반 압도 (Overpower)] ---
-        overpower_mult = 1.0 + (a_stats["STR"] / (a_stats["STR"] + 80) * 0.25)
-
-        # --- [Step 3: 데미지 계산 (기본 방어 감쇄)] ---
-        atk = attacker.attack_power
-        defense_val = defender.defense
-        mitigation = atk / (atk + defense_val * 0.65) # 방어 효율 소폭 완화
-        raw_damage = atk * mitigation * random.uniform(0.95, 1.05) * overpower_mult
-
-        # --- [Step 4: CON 기반 고유 저항] ---
-        con_resilience = d_stats["CON"] / (d_stats["CON"] + 100)
-        raw_damage *= (1.0 - con_resilience)
-
-        # --- [Step 5: 크리티컬 (DEX 죽창력 상향)] ---
-        crit_prob = min(FinalCombatSystem.MAX_CRIT_CHANCE, a_stats["DEX"] * FinalCombatSystem.CRIT_CHANCE_FACTOR)
-        if random.random() < crit_prob:
-            crit_mult = FinalCombatSystem.BASE_CRIT_MULT + (a_stats["DEX"] * 0.02)
-            raw_damage *= min(FinalCombatSystem.MAX_CRIT_MULT, crit_mult)
-            result["is_crit"] = True
-
-        # --- [Step 6: DEX 기반 약점 찌르기 (Penetration Buff)] ---
-        # [v6.1] 이제 관통이 CON 저항을 일부 무시하도록 설계
-        pen_rate = a_stats["DEX"] / (a_stats["DEX"] + 40)
-        raw_damage *= (1.0 + pen_rate)
-
-        # --- [Step 7: 최종 데미지 확정 및 반사 (Weight of Steel)] ---
-        # [v6.1] CON 탱커의 결정타 부족 해결: 자신의 방어력의 일부를 공격력에 추가 (보복 데미지)
-        vengence_dmg = d_stats["CON"] * 0.5
-        final_damage = int(max(1, raw_damage + (vengence_dmg if a_stats["CON"] > a_stats["STR"] else 0)))
-        
-        # 반사 상한 적용
-        raw_reflect = d_stats["CON"] / (d_stats["CON"] + 100)
-        reflect_rate = min(FinalCombatSystem.REFLECT_CAP, raw_reflect)
-        reflected_dmg = int(final_damage * reflect_rate)
-        
         # 결과 적용
         result["damage"] = final_damage
         result["reflected"] = reflected_dmg
@@ -156,50 +148,122 @@ class FinalCombatSystem:
 
 # --- 🚀 Professional Simulation Engine ---
 
-def run_simulation(p_stats: dict, e_stats: dict, level: int = 1, battles: int = 100):
+def simulate_battle(p_stats: dict, e_stats: dict, level: int = 1, profile: Optional[BalanceProfile] = None,
+                    rolls=None) -> dict:
+    """
+    1:1 전투를 한 번 수행합니다.
+    반환: win, turns, 플레이어 피해량/치명타 수, 양측 명중 피해 목록(hit_damages)
+    profile: 밸런스 프로필 (None이면 기본 프로필).
+    rolls: CounterRNG.battle(...) 등 draw/begin_round 난수원 (None이면 전역 random). 라운드 = 양측 1회씩 공격.
+    """
+    p = StressTestActor("p_unit", "Hero", "test", "test", level=level, base_stats=dict(p_stats))
+    e = StressTestActor("e_unit", "Mob", "test", "test", level=level, base_stats=dict(e_stats))
+    # 스탯은 전투 중 변하지 않으므로 양방향 Matchup을 한 번만 만들고 HP만 갱신 (process_turn과 같은 규칙)
+    formula = (profile or DEFAULT_PROFILE).v61
+    fp, fe = formula.prepare(p), formula.prepare(e)
+    matchups = (formula.matchup(fp, fe), formula.matchup(fe, fp))
+    hp = [fp.max_hp, fe.max_hp]
+    strike = FormulaEngine.strike
+    rollers = (global_roll, global_roll) if rolls is None else (rolls.roller(p.id), rolls.roller(e.id))
+    battle = {"win": False, "turns": 0, "damage": 0, "crits": 0, "hit_damages": []}
+
+    turn_count, winner = 0, None
+    while winner is None:
+        attacker = turn_count % 2
+        defender = 1 - attacker
+        if rolls is not None:
+            rolls.begin_round(turn_count // 2 + 1)
+        damage, crit, reflected = strike(matchups[attacker], rollers[attacker])
+        if damage:
+            battle["hit_damages"].append(damage)
+            if attacker == 0:
+                battle["damage"] += damage
+                if crit: battle["crits"] += 1
+            hp[defender] = max(0, hp[defender] - damage)
+            hp[attacker] = max(0, hp[attacker] - reflected)
+            if hp[defender] <= 0:
+                winner = attacker
+                break
+            if hp[attacker] <= 0:
+                winner = defender
+                break
+        turn_count += 1
+
+    battle["win"] = winner == 0
+    battle["turns"] = turn_count
+    return battle
+
+def run_simulation(p_stats: dict, e_stats: dict, level: int = 1, battles: int = 100,
+                   sink: Optional[ResultStore] = None, build: str = "", seed: Optional[int] = None,
+                   profile: Optional[BalanceProfile] = None, rng: Optional[CounterRNG] = None):
+    """
+    sink: 전투별 결과를 스트리밍 기록할 ResultStore (build 이름으로 구분).
+    seed: 지정 시 전투 i는 seed + i로 시드를 고정합니다.
+    profile: 밸런스 프로필 (None이면 기본 프로필).
+    rng: 지정 시 전역 random 대신 전투 i에 rng.battle("build:i")를 사용 (seed 열에는 i를 기록).
+    """
     wins = 0
-    turn_counts = []
-    damages = []
+    # 모든 값을 리스트로 보관하지 않고 스트리밍 누적 (O(1) 메모리, 병합 가능)
+    metrics = MetricSet("turns", "damage")
     
-    for _ in range(battles):
-        p = StressTestActor("p_unit", "Hero", level=level, base_stats=p_stats)
-        e = StressTestActor("e_unit", "Mob", level=level, base_stats=e_stats)
-        p.current_hp = p.max_hp
-        e.current_hp = e.max_hp
-        
-        ctx = CombatContext(player=p, enemy=e)
-        
-        while not ctx.is_finished:
-            res = FinalCombatSystem.process_turn(ctx)
-            if res["is_hit"]:
-                damages.append(res["damage"])
-            
-        if ctx.winner and ctx.winner.id == "p_unit":
+    for i in range(battles):
+        battle_seed = -1
+        rolls = None
+        if rng is not None:
+            battle_seed = i
+            rolls = rng.battle(f"{build}:{i}")
+        elif seed is not None:
+            battle_seed = seed + i
+            random.seed(battle_seed)
+
+        battle = simulate_battle(p_stats, e_stats, level, profile, rolls)
+        for dmg in battle["hit_damages"]:
+            metrics.push("damage", dmg)
+        if battle["win"]:
             wins += 1
-        turn_counts.append(ctx.turn_count)
+        metrics.push("turns", battle["turns"])
 
-    avg_dmg = statistics.mean(damages) if damages else 0
-    std_dmg = statistics.stdev(damages) if len(damages) > 1 else 0
+        if sink is not None:
+            sink.append(build=build, level=level, win=battle["win"], turns=battle["turns"],
+                        damage=battle["damage"], crit=battle["crits"], seed=battle_seed)
+
+    avg_dmg = metrics["damage"].mean
+    std_dmg = metrics["damage"].stdev
+    ttk = metrics.summary("turns")
+    dmg = metrics.summary("damage")
 
     return {
         "win_rate": (wins / battles) * 100,
-        "avg_turns": statistics.mean(turn_counts),
+        "avg_turns": metrics["turns"].mean,
         "avg_damage": avg_dmg,
-        "dmg_cv": (std_dmg / avg_dmg) if avg_dmg > 0 else 0
+        "dmg_cv": (std_dmg / avg_dmg) if avg_dmg > 0 else 0,
+        "ttk_p50": ttk["p50"], "ttk_p95": ttk["p95"], "ttk_p99": ttk["p99"],
+        "dmg_p50": dmg["p50"], "dmg_p95": dmg["p95"], "dmg_p99": dmg["p99"],
+        "metrics": metrics
     }
 
-def perform_stress_tests():
+def run_adaptive(p_stats: dict, e_stats: dict, level: int, simulator: AdaptiveSimulator,
+                 profile: Optional[BalanceProfile] = None) -> AdaptiveResult:
+    """고정 전투 수 대신 신뢰구간 목표 달성 시까지 전투를 수행합니다."""
+    return simulator.run(lambda: simulate_battle(p_stats, e_stats, level, profile))
+
+def perform_stress_tests(adaptive: bool = False):
+    """adaptive=True면 각 케이스를 AdaptiveSimulator로 조기 종료하며 달성 정밀도를 출력합니다."""
+    if adaptive:
+        _perform_adaptive_stress_tests(AdaptiveSimulator(max_battles=1000))
+        return
+
     print("=== 🧪 DYNAMIC STRESS TEST: LEVEL SCALING (v6.1) ===")
-    print("-" * 65)
-    print(f"{'LV':<4} | {'Win%':<6} | {'TTK(Avg)':<8} | {'AvgDmg':<8} | {'DmgCV':<6}")
-    print("-" * 65)
+    print("-" * 80)
+    print(f"{'LV':<4} | {'Win%':<6} | {'TTK(Avg)':<8} | {'TTK p95':<7} | {'AvgDmg':<8} | {'Dmg p99':<7} | {'DmgCV':<6}")
+    print("-" * 80)
     
     p_stats = {"STR": 16, "DEX": 13, "CON": 15, "INT": 10} 
     e_stats = {"STR": 13, "DEX": 8, "CON": 15, "INT": 5}
 
     for lv in [1, 10, 20, 30, 40, 50]:
         res = run_simulation(p_stats, e_stats, level=lv, battles=500)
-        print(f"{lv:<4} | {res['win_rate']:>5.1f}% | {res['avg_turns']:>8.1f} | {res['avg_damage']:>8.1f} | {res['dmg_cv']:>6.2f}")
+        print(f"{lv:<4} | {res['win_rate']:>5.1f}% | {res['avg_turns']:>8.1f} | {res['ttk_p95']:>7.0f} | {res['avg_damage']:>8.1f} | {res['dmg_p99']:>7.0f} | {res['dmg_cv']:>6.2f}")
 
     print("\n=== 🧪 EXTREME BUILD TEST: THE REFINED EQUILIBRIUM (LV 20) ===")
     print("목표: DEX(회피 보장) vs CON(보복 데미지) 빌드의 생존력 확인")
@@ -218,5 +282,33 @@ def perform_stress_tests():
         res = run_simulation(stats, e_stats_standard, level=20, battles=1000)
         print(f"[{name}] Win: {res['win_rate']:>5.1f}% | TTK: {res['avg_turns']:>4.1f} | DmgCV: {res['dmg_cv']:>4.2f}")
 
+def _perform_adaptive_stress_tests(simulator: AdaptiveSimulator):
+    print("=== 🧪 ADAPTIVE STRESS TEST (v6.1) - CI early stopping ===")
+    print("-" * 80)
+    print(f"{'Case':<24} | {'Win%':<6} | {'Win CI':<13} | {'TTK':<5} | {'TTK CI':<6} | {'Battles':<7}")
+    print("-" * 80)
+
+    p_stats = {"STR": 16, "DEX": 13, "CON": 15, "INT": 10}
+    e_stats = {"STR": 13, "DEX": 8, "CON": 15, "INT": 5}
+    cases = [(f"Lv.{lv} Standard", p_stats, e_stats, lv) for lv in [1, 10, 20, 30, 40, 50]]
+
+    e_stats_standard = {"STR": 18, "DEX": 12, "CON": 18, "INT": 10}
+    cases += [
+        ("Lv.20 STR Berserker", {"STR": 25, "DEX": 8, "CON": 10, "INT": 5}, e_stats_standard, 20),
+        ("Lv.20 DEX Assassin", {"STR": 10, "DEX": 25, "CON": 8, "INT": 5}, e_stats_standard, 20),
+        ("Lv.20 CON Tanker", {"STR": 10, "DEX": 8, "CON": 25, "INT": 5}, e_stats_standard, 20),
+    ]
+
+    total = 0
+    for name, ps, es, lv in cases:
+        res = run_adaptive(ps, es, lv, simulator)
+        total += res.battles
+        lo, hi = res.win_ci
+        cap = "" if res.converged else " (cap)"
+        print(f"{name:<24} | {res.win_rate * 100:>5.1f}% | {lo * 100:>5.1f}~{hi * 100:>5.1f}% | {res.ttk.mean:>5.1f} | "
+              f"±{res.ttk_ci_width / 2:>5.2f} | {res.battles:>7}{cap}")
+    print("-" * 80)
+    print(f"Total battles: {total} (fixed mode: {6 * 500 + 3 * 1000})")
+
 if __name__ == "__main__":
-    perform_stress_tests()
\ No newline at end of file
+    perform_stress_tests(adaptive="--adaptive" in sys.argv)
\ No newline at end of file
@@ -1,11 +1,15 @@
-import time
+import random
 from src.core.state_machine import State
 from src.systems.combat_system import CombatSystem
+from src.systems.drop_system import DropSystem
+from src.systems.auto_resolve_system import AutoResolveSystem
+from src.systems.ai_system import AISystem
 from src.core.context import GameContext
 
 class CombatState(State):
     def __init__(self, enemies: list):
         self.enemies = enemies
+        self.auto_resolved = False
 
     def on_enter(self, prev_state=None):
         player = GameContext.get_player()
@@ -13,7 +17,26 @@ class CombatState(State):
         print("      전 투  시 작 !      ")
         print("⚔️"*25)
         
-        self.ctx = CombatSystem.initialize_combat([player], self.enemies)
+        self.ctx = CombatSystem.initialize_combat([player], self.enemies, GameContext.next_battle_rolls())
+
+        # 자동 전투: 1:1이고 사망 위험이 임계값 이하면 결과 분포에서 즉시 결판
+        if GameContext.auto_battle and len(self.enemies) == 1 and not self.ctx.is_finished:
+            enemy = self.enemies[0]
+            if AutoResolveSystem.try_resolve(player, enemy, self.ctx, rng=self._rng("auto_resolve")):
+                self.auto_resolved = True
+                print(f"  {self.ctx.combat_logs[-1]}")
+            else:
+                risk = AutoResolveSystem.death_risk(player, enemy)
+                if risk is None:
+                    print(f" ⚠️ {enemy.name}은(는) 스킬을 사용합니다 - 직접 전투합니다!")
+                else:
+                    print(f" ⚠️ 위험도 {risk * 100:.1f}% - 직접 전투합니다!")
+
+    def _rng(self, purpose: str):
+        """전투 외 판정(자동 전투, 드랍)용 rng: 재현 모드면 이 전투의 카운터 스트림, 아니면 전역 random."""
+        if self.ctx.rolls is None:
+            return random
+        return self.ctx.rolls.stream("p0", purpose)
 
     def _draw_hp_bar(self, current, max_hp, length=15):
         if max_hp <= 0: max_hp = 1
@@ -26,10 +49,16 @@ class CombatState(State):
         if self.ctx.is_finished:
             if self.ctx.winner_side == "player":
                 print(f"\n🏆 승리! 적들을 모두 처치했습니다.")
+                gained, lost = DropSystem.grant_drops(GameContext.get_player(), self.enemies, rng=self._rng("drops"))
+                for item in gained:
+                    print(f" 🎁 전리품 획득: {item.name}")
+                for item in lost:
+                    print(f" 🎒 가방이 가득 차 {item.name}을(를) 두고 왔습니다.")
             else:
                 print(f"\n💀 패배... 도망칩니다.")
             
-            input(" (엔터키를 눌러 복귀) ")
+            if not self.auto_resolved:
+                GameContext.console.read(" (엔터키를 눌러 복귀) ")
             self.manager.pop()
             return
 
@@ -85,7 +114,12 @@ class CombatState(State):
         print()
         for log in self.ctx.combat_logs[-2:]:
             print(f"  {log}")
-            time.sleep(0.3)
+            GameContext.console.pause(0.3)
+
+        if all(e.current_hp <= 0 for e in self.enemies):
+            self.ctx.is_finished = True
+            self.ctx.winner_side = "player"
+            return
         
         self._next_turn()
         self._process_ai_turns()
@@ -106,11 +140,11 @@ class CombatState(State):
             enemy = next((e for e in self.ctx.enemies if e.id == current_id), None)
             if enemy:
                 print(f"\n🤖 {enemy.name}의 턴...")
-                time.sleep(0.5)
-                skill = enemy.skills[0] if enemy.skills else "basic_attack"
+                GameContext.console.pause(0.5)
+                skill = AISystem.choose_skill(enemy, player)
                 CombatSystem.process_action(enemy, player, skill, self.ctx)
                 print(f"  🔥 {self.ctx.combat_logs[-1]}")
-                time.sleep(0.5)
+                GameContext.console.pause(0.5)
 
             if player.current_hp <= 0:
                 self.ctx.is_finished = True
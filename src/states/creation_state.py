@@ -1,4 +1,3 @@
-import time
 from src.core.state_machine import State
 from src.core.factory import EntityFactory
 from src.core.context import GameContext
@@ -131,7 +130,7 @@ class CharacterCreationState(State):
             GameContext.set_player(player)
             
             print("✅ 캐릭터 생성 완료!")
-            time.sleep(1)
+            GameContext.console.pause(1)
             
             from src.states.town_state import TownState
             self.manager.change(TownState())
@@ -1,38 +1,87 @@
-import time
 import random
 from src.core.state_machine import State
 from src.core.factory import EntityFactory
 from src.core.context import GameContext
 from src.utils.data_loader import DataLoader
+from src.systems.table_system import TableSystem
+from src.systems.difficulty_system import DifficultySystem
 from src.states.combat_state import CombatState
 
 class DungeonState(State):
+    # --- 탐험 밸런스 수치 (헤드리스 시뮬레이터 src/sim/dungeon_run.py와 공유) ---
+    STEPS_PER_FLOOR = 10     # 이 걸음 수에 도달하면 계단 발견
+    BERRY_HEAL = 0.10        # 산딸기: 최대 HP 대비 회복
+    THORN_DAMAGE = 0.05      # 가시덤불: 최대 HP 대비 피해
+    REST_HEAL = 0.20         # 휴식 성공 시 회복
+    AMBUSH_CHANCE = 0.3      # 휴식 중 기습 확률
+
     def __init__(self, floor=1):
         self.floor = floor
         self.steps = 0
         self.monster_pool = []
+        self.encounters = None
+        self.designed_encounters = False
         self._load_monsters()
 
-    def _load_monsters(self):
+    @staticmethod
+    def monster_pool_for(floor: int) -> list:
+        """해당 층에 등장 가능한 몬스터 ID 목록 (레벨 <= 층 * 1.5, 없으면 전체)."""
         all_monsters = DataLoader.load_json("monsters.json")
         if not all_monsters:
-            self.monster_pool = []
-            return
+            return []
 
-        max_cr = max(1, self.floor * 1.5)
+        max_cr = max(1, floor * 1.5)
         valid_mobs = []
         for mid, data in all_monsters.items():
             lvl = data.get("level", 0)
             if lvl <= max_cr:
                 valid_mobs.append(mid)
         
-        self.monster_pool = valid_mobs if valid_mobs else list(all_monsters.keys())
+        return valid_mobs if valid_mobs else list(all_monsters.keys())
+
+    @staticmethod
+    def encounter_table(floor: int):
+        """
+        층별 조우 테이블: tables.json에 정의가 있으면 사용, 없으면 몬스터별 spawn_weight(기본 1)로 생성.
+        등장 가능한 몬스터가 없으면 None.
+        """
+        table_id = f"encounters_floor_{floor}"
+        table = TableSystem.get(table_id)
+        if table is None:
+            pool = DungeonState.monster_pool_for(floor)
+            if not pool:
+                return None
+            all_monsters = DataLoader.load_json("monsters.json")
+            table = TableSystem.from_weights(table_id, {mid: all_monsters[mid].get("spawn_weight", 1) for mid in pool})
+        return table
+
+    @staticmethod
+    def has_designed_encounters(floor: int) -> bool:
+        """tables.json에 해당 층 조우 테이블이 직접 정의되어 있으면 난이도 기반 선택보다 우선합니다."""
+        return f"encounters_floor_{floor}" in DataLoader.load_json("tables.json")
+
+    @staticmethod
+    def spawn_table(floor: int, player):
+        """
+        플레이어 기준 실제 조우 분포 (시뮬레이터용).
+        직접 정의된 테이블이 없으면 목표 난이도 구간의 몬스터를 균등하게 뽑는 테이블입니다.
+        """
+        if player is not None and not DungeonState.has_designed_encounters(floor):
+            ids = DifficultySystem.band_monster_ids(player, floor)
+            if ids:
+                return TableSystem.compile_weights(f"difficulty_floor_{floor}", {mid: 1 for mid in ids})
+        return DungeonState.encounter_table(floor)
+
+    def _load_monsters(self):
+        self.monster_pool = DungeonState.monster_pool_for(self.floor)
+        self.encounters = DungeonState.encounter_table(self.floor)
+        self.designed_encounters = DungeonState.has_designed_encounters(self.floor)
 
     def update(self):
         player = GameContext.get_player()
         if player.current_hp <= 0:
             print("\n💀 당신은 던전에서 쓰러졌습니다...")
-            input(" (엔터키를 눌러 마을로 귀환) ")
+            GameContext.console.read(" (엔터키를 눌러 마을로 귀환) ")
             player.current_hp = 1
             from src.states.town_state import TownState
             self.manager.change(TownState())
@@ -40,7 +89,7 @@ class DungeonState(State):
 
         print("\n" + "="*50)
         print(f" 💀 [ 깊은 숲 - 지하 {self.floor}층 ]")
-        print(f" 👣 진행도: {self.steps}/10  |  ❤️ HP: {player.current_hp}")
+        print(f" 👣 진행도: {self.steps}/{DungeonState.STEPS_PER_FLOOR}  |  ❤️ HP: {player.current_hp}")
         print("="*50)
         print(" 1. 🔦 앞으로 나아간다 (탐험)")
         print(" 2. ⛺ 잠시 휴식 (Risk: 기습)")
@@ -57,56 +106,75 @@ class DungeonState(State):
             from src.states.town_state import TownState
             self.manager.change(TownState())
 
+    def _rng(self, purpose: str):
+        """
+        탐험 판정 난수원. GameContext.rng가 있으면 (시드, 세션 전체 탐험 행동 번호, 용도)로 정해지는 스트림,
+        없으면 전역 random. 행동 번호는 GameContext에 있어 같은 층을 다시 방문해도 새 판정이 나옵니다.
+        """
+        if GameContext.rng is None:
+            return random
+        rolls = GameContext.rng.battle("dungeon")
+        rolls.begin_round(GameContext.dungeon_actions)
+        return rolls.stream("player", purpose)
+
     def _explore(self):
         self.steps += 1
+        GameContext.dungeon_actions += 1
         print("\n👣 뚜벅... 뚜벅...")
-        time.sleep(0.5)
+        GameContext.console.pause(0.5)
 
-        if self.steps >= 10:
+        if self.steps >= DungeonState.STEPS_PER_FLOOR:
             print("\n✨ 아래층으로 내려가는 계단을 발견했습니다!")
-            sel = input(" [1: 내려간다] [2: 머무른다] >> ")
+            sel = GameContext.console.read(" [1: 내려간다] [2: 머무른다] >> ")
             if sel == '1':
                 self.manager.change(DungeonState(self.floor + 1))
             return
 
-        roll = random.randint(1, 100)
-        if roll <= 50: 
+        event = TableSystem.roll("dungeon_events", self._rng("event"))
+        if event == "combat":
             self._trigger_combat()
-        elif roll <= 70:
-            msg = random.choice(["바람 소리가 들립니다.", "멀리서 늑대 울음소리가...", "길이 조용합니다."])
+        elif event == "ambient":
+            msg = TableSystem.roll("dungeon_ambient", self._rng("ambient"))
             print(f" ...{msg}")
-        elif roll <= 85: 
+        elif event == "berries":
             player = GameContext.get_player()
-            heal = int(player.max_hp * 0.1)
+            heal = int(player.max_hp * DungeonState.BERRY_HEAL)
             player.current_hp = min(player.max_hp, player.current_hp + heal)
             print(f" 🍓 산딸기를 발견했습니다! 체력이 {heal} 회복됩니다.")
-        else: 
+        elif event == "thorns":
             player = GameContext.get_player()
-            dmg = int(player.max_hp * 0.05)
+            dmg = int(player.max_hp * DungeonState.THORN_DAMAGE)
             player.current_hp -= dmg
             print(f" 💢 가시덤불에 긁혔습니다! {dmg} 피해.")
 
     def _trigger_combat(self):
-        if not self.monster_pool:
+        # 직접 설계된 층이 아니면 현재 플레이어 능력치 대비 목표 난이도 구간에서 선택
+        mid = None
+        if not self.designed_encounters:
+            mid = DifficultySystem.pick_monster_id(GameContext.get_player(), self.floor, self._rng("difficulty"))
+        if mid is None and self.encounters:
+            mid = self.encounters.roll_one(self._rng("encounter"))
+        if mid is None:
             print(" (몬스터가 없는 층입니다)")
             return
 
-        mid = random.choice(self.monster_pool)
         monster = EntityFactory.create_monster(mid)
         
         if monster:
             print(f"\n🔥 야생의 [{monster.name}] (Lv.{monster.level}) 등장!")
-            time.sleep(1)
+            if not GameContext.auto_battle:
+                GameContext.console.pause(1)
             self.manager.push(CombatState(enemies=[monster]))
 
     def _rest(self):
         player = GameContext.get_player()
         print("\n⛺ 쪽잠을 잡니다...")
-        time.sleep(1)
-        if random.random() < 0.3:
+        GameContext.console.pause(1)
+        GameContext.dungeon_actions += 1
+        if self._rng("ambush").random() < DungeonState.AMBUSH_CHANCE:
             print(" ⚡ 으악! 자는 도중 몬스터가 습격했습니다!")
             self._trigger_combat()
         else:
-            heal = int(player.max_hp * 0.2)
+            heal = int(player.max_hp * DungeonState.REST_HEAL)
             player.current_hp = min(player.max_hp, player.current_hp + heal)
             print(f" ✨ 개운합니다. 체력이 {heal} 회복되었습니다.")
\ No newline at end of file
@@ -1,8 +1,9 @@
-import time
 from src.core.state_machine import State
 from src.core.context import GameContext
 from src.core.factory import EntityFactory
 from src.systems.growth_system import GrowthSystem
+from src.systems.loadout_system import LoadoutSystem
+from src.systems.auto_resolve_system import AutoResolveSystem
 from src.states.combat_state import CombatState
 from src.states.dungeon_state import DungeonState
 
@@ -34,6 +35,7 @@ class TownState(State):
         print(" 3. 📦 인벤토리 & 장비 확인")
         print(" 4. 💤 여관에서 휴식 (HP/MP 회복)")
         print(" 5. 🔙 타이틀로")
+        print(f" 6. ⚡ 자동 전투: {'ON' if GameContext.auto_battle else 'OFF'} (위험도 {AutoResolveSystem.RISK_THRESHOLD * 100:.0f}% 이하)")
         print("-"*50)
 
     def handle_input(self, user_input: str):
@@ -52,10 +54,12 @@ class TownState(State):
             print("\n💤 따뜻한 침대에서 푹 쉽니다... (HP/MP 완전 회복)")
             player.current_hp = player.max_hp
             player.current_mp = player.max_mp
-            time.sleep(1)
+            GameContext.console.pause(1)
         elif user_input == '5':
             from src.states.title_state import TitleState
             self.manager.change(TitleState())
+        elif user_input == '6':
+            GameContext.auto_battle = not GameContext.auto_battle
 
     def _show_inventory(self):
         player = GameContext.get_player()
@@ -65,6 +69,9 @@ class TownState(State):
         print(f" 🗡️  무기: {eq['main_hand'].name if eq['main_hand'] else '(없음)'}")
         print(f" 🛡️  갑옷: {eq['body'].name if eq['body'] else '(없음)'}")
         print(f" 💍  반지: {eq['ring'].name if eq['ring'] else '(없음)'}")
+        bag = player.inventory
+        cap = bag.capacity if bag.capacity is not None else "∞"
+        print(f" 🎒  가방: {len(bag)}/{cap} 칸")
         
         atk = GrowthSystem.get_attack_power(player)
         defense = int(GrowthSystem.get_defense(player) * 100)
@@ -73,5 +80,17 @@ class TownState(State):
         print(f" 💪 공격력: {atk}")
         print(f" 🛡️ 피해감소: {defense}%")
         print(f" 💨 회피율: {evasion}%")
+
+        # 가방 속 장비로 만들 수 있는 최적 조합 추천 (실제 장착 없이 계산)
+        recommendations = []
+        for objective, label in (("ap", "공격력"), ("ehp", "유효 체력")):
+            loadout = LoadoutSystem.best_loadout(player, objective)
+            if loadout.gain > 0:
+                recommendations.append(loadout)
+                names = ", ".join(item.name for item in loadout.items.values() if item) or "(맨몸)"
+                print(f" ⭐ [{len(recommendations)}] {label} 최적: {names} ({int(loadout.current_value)} → {int(loadout.value)})")
         print("="*30)
-        input(" (엔터를 누르면 돌아갑니다) ")
\ No newline at end of file
+        choice = GameContext.console.read(" (추천 번호를 입력하면 장착, 엔터를 누르면 돌아갑니다) ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(recommendations):
+            LoadoutSystem.apply(player, recommendations[int(choice) - 1])
+            print(" ✅ 추천 장비로 교체했습니다.")
\ No newline at end of file
@@ -0,0 +1,172 @@
+# File: src/systems/ai_system.py
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from src.models.actor import Actor
+from src.systems.combat_profile import BASIC_SKILL, CombatProfile, SkillProfile, damage_pmf
+from src.systems.growth_system import GrowthSystem
+from src.utils.data_loader import DataLoader
+
+class DamageEntry:
+    """
+    (공격자, 방어자, 스킬) 조합의 피해 분포 요약.
+    values는 오름차순 피해값, prefix[i]는 values[:i]의 기대 기여분 합, tail[i]는 P(피해 >= values[i]).
+    """
+    __slots__ = ("mean", "values", "prefix", "tail")
+
+    def __init__(self, pmf: Dict[int, float]):
+        items = sorted(pmf.items())
+        self.values = [v for v, _ in items]
+        self.mean = sum(v * p for v, p in items)
+        self.prefix = [0.0]
+        for v, p in items:
+            self.prefix.append(self.prefix[-1] + v * p)
+        self.tail = [0.0] * (len(items) + 1)
+        for i in range(len(items) - 1, -1, -1):
+            self.tail[i] = self.tail[i + 1] + items[i][1]
+
+    def kill_chance(self, hp: int) -> float:
+        """이번 행동 한 번으로 hp 이상의 피해를 줄 확률."""
+        return self.tail[bisect_left(self.values, hp)]
+
+    def capped_mean(self, hp: int) -> float:
+        """E[min(피해, hp)] - 남은 HP를 넘는 초과 피해는 가치가 없음."""
+        i = bisect_left(self.values, hp)
+        return self.prefix[i] + hp * self.tail[i]
+
+class AISystem:
+    """
+    효용(Utility) 기반 몬스터 AI.
+
+    사용 가능한 스킬마다
+        효용 = E[min(피해, 대상 남은 HP)] x (1 + KILL_BONUS x 처치 확률) - MP 가치 x MP 비용
+    을 계산해 가장 높은 스킬을 고릅니다. MP 가치는 '평타 대비 추가 피해 / MP'가 가장 좋은 스킬의 효율에
+    MP 부족 정도(1 - 현재/최대)를 곱한 값이라, MP가 넉넉하면 과감히 쓰고 부족하면 효율 좋은 스킬만 씁니다.
+
+    피해 분포는 (공격자, 방어자, 스킬)별로 캐싱되며, 양쪽의 능력치 재계산 버전(_stats_version)이
+    바뀔 때만 다시 계산합니다. 캐시 적중 시 결정 비용은 스킬 수 x (사전 조회 + bisect)입니다.
+    """
+
+    KILL_BONUS = 1.0
+    MAX_ENTRIES = 100_000   # 캐시가 이보다 커지면 비움 (전투가 끝난 액터 정리)
+
+    _entries: Dict[Tuple[str, str, str], Tuple[int, int, DamageEntry]] = {}
+    _skills: Dict[str, Optional[SkillProfile]] = {}
+    _policies: Dict[str, object] = {}   # 액터 ID -> 오프라인으로 풀어 둔 정책 (choose(actor, enemy) -> 스킬 ID)
+
+    @staticmethod
+    def _skill(skill_id: str) -> Optional[SkillProfile]:
+        if skill_id not in AISystem._skills:
+            data = DataLoader.load_skill(skill_id)
+            if data:
+                AISystem._skills[skill_id] = SkillProfile.from_data(data)
+            else:
+                AISystem._skills[skill_id] = BASIC_SKILL if skill_id == "basic_attack" else None
+        return AISystem._skills[skill_id]
+
+    @staticmethod
+    def _version(actor: Actor) -> int:
+        if actor._is_stats_dirty:
+            GrowthSystem._recalc_stats(actor)
+        return actor._stats_version
+
+    @staticmethod
+    def damage_entry(attacker: Actor, defender: Actor, skill_id: str) -> Optional[DamageEntry]:
+        """캐시된 피해 분포. 어느 한쪽의 파생 능력치가 바뀌었으면 다시 계산합니다."""
+        skill = AISystem._skill(skill_id)
+        if skill is None:
+            return None
+        key = (attacker.id, defender.id, skill_id)
+        a_ver, d_ver = AISystem._version(attacker), AISystem._version(defender)
+        cached = AISystem._entries.get(key)
+        if cached is not None and cached[0] == a_ver and cached[1] == d_ver:
+            return cached[2]
+
+        if len(AISystem._entries) >= AISystem.MAX_ENTRIES:
+            AISystem._entries.clear()
+        entry = DamageEntry(damage_pmf(CombatProfile.from_actor(attacker), skill, CombatProfile.from_actor(defender)))
+        AISystem._entries[key] = (a_ver, d_ver, entry)
+        return entry
+
+    @staticmethod
+    def skill_ids(actor: Actor) -> List[str]:
+        """AI가 고려하는 스킬 목록 (평타가 없으면 맨 뒤에 추가)."""
+        skill_ids = actor.skills or ["basic_attack"]
+        if "basic_attack" not in skill_ids:
+            skill_ids = list(skill_ids) + ["basic_attack"]
+        return skill_ids
+
+    @staticmethod
+    def has_active_skills(actor: Actor) -> bool:
+        """평타 외에 (최대 MP로) 쓸 수 있는 스킬이 하나라도 있는지 - 평타만 가정하는 계산의 적용 가능 여부."""
+        for skill_id in actor.skills:
+            skill = AISystem._skill(skill_id) if skill_id != "basic_attack" else None
+            if skill is not None and skill.mp_cost <= actor.max_mp:
+                return True
+        return False
+
+    @staticmethod
+    def best_efficiency(options: List[Tuple[str, DamageEntry, int]]) -> float:
+        """MP 1당 평타 대비 추가 기대 피해가 가장 큰 스킬의 효율 (MP 가치의 기준, MP 보유량과 무관)."""
+        basic = next(entry for skill_id, entry, _ in options if skill_id == "basic_attack")
+        best = 0.0
+        for _, entry, cost in options:
+            if cost > 0:
+                best = max(best, (entry.mean - basic.mean) / cost)
+        return best
+
+    @staticmethod
+    def rank(options: List[Tuple[str, DamageEntry, int]], mp: int, max_mp: int, hp: int) -> List[Tuple[float, str]]:
+        """
+        (스킬 ID, 피해 분포, MP 비용) 목록의 효용 (MP 부족 스킬 제외). 목록에는 basic_attack이 있어야 합니다.
+        실제 액터 없이 프로필만으로 같은 정책을 재현할 때(DungeonRunSimulator 등)도 이 함수를 씁니다.
+        """
+        scarcity = 1.0 - mp / max_mp if max_mp > 0 else 1.0
+        mp_value = AISystem.best_efficiency(options) * scarcity
+        hp = max(1, hp)
+        scored = []
+        for skill_id, entry, cost in options:
+            if mp >= cost:
+                utility = entry.capped_mean(hp) * (1.0 + AISystem.KILL_BONUS * entry.kill_chance(hp)) - mp_value * cost
+                scored.append((utility, skill_id))
+        return scored
+
+    @staticmethod
+    def score_skills(attacker: Actor, defender: Actor) -> List[Tuple[float, str]]:
+        """사용 가능한 스킬별 (효용, 스킬 ID) 목록 (MP 부족 스킬 제외)."""
+        options = []
+        for skill_id in AISystem.skill_ids(attacker):
+            entry = AISystem.damage_entry(attacker, defender, skill_id)
+            if entry is not None:
+                options.append((skill_id, entry, AISystem._skill(skill_id).mp_cost))
+        return AISystem.rank(options, attacker.current_mp, attacker.max_mp, defender.current_hp)
+
+    @staticmethod
+    def set_policy(actor: Actor, policy=None):
+        """액터에 고정 정책(예: RotationPlanner의 RotationPolicy)을 지정합니다. None이면 효용 기반으로 되돌림."""
+        if policy is None:
+            AISystem._policies.pop(actor.id, None)
+        else:
+            AISystem._policies[actor.id] = policy
+
+    @staticmethod
+    def choose_skill(attacker: Actor, defender: Actor) -> str:
+        """효용이 가장 높은 스킬 ID (동점이면 목록 앞쪽). 쓸 수 있는 스킬이 없으면 평타."""
+        policy = AISystem._policies.get(attacker.id)
+        if policy is not None:
+            return policy.choose(attacker, defender)
+        return AISystem.best(AISystem.score_skills(attacker, defender))
+
+    @staticmethod
+    def best(scored: List[Tuple[float, str]]) -> str:
+        """효용 목록에서 최고 스킬 (동점이면 목록 앞쪽, 비어 있으면 평타)."""
+        best_id, best_utility = "basic_attack", None
+        for utility, skill_id in scored:
+            if best_utility is None or utility > best_utility:
+                best_id, best_utility = skill_id, utility
+        return best_id
+
+    @staticmethod
+    def clear_cache():
+        AISystem._entries.clear()
+        AISystem._skills.clear()
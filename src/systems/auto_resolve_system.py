@@ -0,0 +1,182 @@
+# File: src/systems/auto_resolve_system.py
+import random
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from src.models.actor import Actor
+from src.models.combat_context import CombatContext
+from src.systems.ai_system import AISystem
+from src.systems.combat_profile import BASIC_SKILL, CombatProfile, damage_pmf
+
+MAX_TURNS = 100          # 이 턴 안에 처치하지 못할 확률은 위험으로 간주
+NEGLIGIBLE = 1e-9        # 남은 확률 질량이 이보다 작으면 계산 중단
+
+def initiative_chance(player: CombatProfile, monster: CombatProfile) -> float:
+    """플레이어가 먼저 행동할 확률: (DEX * 1.5) + 1d20 비교, 동점은 플레이어 우선 (CombatSystem 정렬 규칙)."""
+    wins = sum(1 for a in range(1, 21) for b in range(1, 21)
+               if player.dex * 1.5 + a >= monster.dex * 1.5 + b)
+    return wins / 400.0
+
+@dataclass
+class OutcomeTable:
+    """
+    자동 전투(평타만 사용) 결과 분포.
+    turns[n]: 플레이어의 n번째 공격에 적이 쓰러질 확률.
+    taken_cdf[n][d]: n턴 전투에서 받은 누적 피해가 d 이하일 확률 (d == cap은 cap 이상 포함).
+    """
+    cap: int
+    turns: List[float]
+    turns_cdf: List[float]
+    taken_cdf: List[List[float]]
+    taken_tail: List[float]        # taken_tail[h] = P(받은 피해 >= h) (전체 전투 기준)
+    unresolved: float              # MAX_TURNS 안에 끝나지 않을 확률
+
+    def death_risk(self, hp: int) -> float:
+        """현재 HP로 이 전투에서 쓰러질 확률 (+ 결판이 나지 않을 확률)."""
+        if hp <= 0:
+            return 1.0
+        return min(1.0, self.taken_tail[min(hp, self.cap)] + self.unresolved)
+
+    def expected_turns(self) -> float:
+        return sum(n * p for n, p in enumerate(self.turns))
+
+    def sample(self, rng=random) -> Tuple[int, int]:
+        """(턴 수, 받은 피해)를 결합분포에서 뽑습니다."""
+        n = bisect_left(self.turns_cdf, rng.random() * self.turns_cdf[-1])
+        n = min(max(n, 1), len(self.turns) - 1)
+        cdf = self.taken_cdf[n]
+        taken = bisect_left(cdf, rng.random() * cdf[-1])
+        return n, min(taken, self.cap)
+
+class AutoResolveSystem:
+    """
+    일방적인 전투의 자동 처리.
+
+    (플레이어 능력치 스냅샷, 몬스터 원형, 레벨)별로 결과 분포를 해석적으로 계산해 메모이즈합니다.
+    1. 평타 피해 분포로 '몇 번째 공격에 처치하는지'(N)의 분포를 몬스터 HP에 대한 DP로 구하고,
+    2. 주도권 확률에 따라 몬스터가 N-1 또는 N번 공격할 때 받는 피해 분포를 합성곱으로 구합니다.
+    사망 위험이 임계값 이하이면 분포에서 (턴, 피해)를 뽑아 즉시 전투를 끝내고, 넘으면 직접 전투로 넘깁니다.
+
+    몬스터가 평타 외 스킬을 쓸 수 있으면 적용하지 않습니다: AISystem은 플레이어 남은 HP와 자신의 MP를 보고
+    스킬을 고르므로 '평타 k회' 합성곱으로는 받는 피해를 크게 과소평가합니다 (항상 직접 전투).
+    """
+
+    RISK_THRESHOLD = 0.01
+    _tables: Dict[tuple, OutcomeTable] = {}
+
+    @staticmethod
+    def _key(player: CombatProfile, monster: Actor, monster_profile: CombatProfile) -> tuple:
+        return (player, monster.template_id or monster_profile, monster.level)
+
+    @staticmethod
+    def outcome_table(player: Actor, monster: Actor) -> OutcomeTable:
+        p = CombatProfile.from_actor(player)
+        m = CombatProfile.from_actor(monster)
+        key = AutoResolveSystem._key(p, monster, m)
+        table = AutoResolveSystem._tables.get(key)
+        if table is None:
+            table = AutoResolveSystem._tables[key] = AutoResolveSystem._compute(p, m)
+        return table
+
+    @staticmethod
+    def clear_cache():
+        """메모이즈한 결과 분포를 비웁니다 (공식이 바뀌면 분포도 달라지므로)."""
+        AutoResolveSystem._tables.clear()
+
+    @staticmethod
+    def _compute(p: CombatProfile, m: CombatProfile) -> OutcomeTable:
+        cap = max(1, p.max_hp)
+        deal = sorted(damage_pmf(p, BASIC_SKILL, m).items())
+        take = sorted(damage_pmf(m, BASIC_SKILL, p).items())
+        q = initiative_chance(p, m)
+
+        # 1. 처치 턴 분포: remaining[h] = 적 HP가 h 남았을 확률
+        remaining = {max(1, m.max_hp): 1.0}
+        turns = [0.0]
+        for _ in range(MAX_TURNS):
+            nxt: Dict[int, float] = {}
+            killed = 0.0
+            for h, ph in remaining.items():
+                for d, pd in deal:
+                    if d >= h:
+                        killed += ph * pd
+                    else:
+                        nxt[h - d] = nxt.get(h - d, 0.0) + ph * pd
+            turns.append(killed)
+            remaining = nxt
+            if sum(remaining.values()) < NEGLIGIBLE:
+                break
+        unresolved = sum(remaining.values())
+
+        # 2. 몬스터 공격 k회 누적 피해 분포 (cap 이상은 cap에 흡수)
+        taken_k = [[1.0] + [0.0] * cap]
+        for _ in range(len(turns) - 1):
+            prev, cur = taken_k[-1], [0.0] * (cap + 1)
+            for t, pt in enumerate(prev):
+                if pt == 0.0:
+                    continue
+                if t == cap:
+                    cur[cap] += pt
+                    continue
+                for d, pd in take:
+                    cur[min(cap, t + d)] += pt * pd
+            taken_k.append(cur)
+
+        taken_cdf: List[List[float]] = [[1.0] * (cap + 1)]
+        marginal = [0.0] * (cap + 1)
+        for n in range(1, len(turns)):
+            # 플레이어 선공이면 적은 n-1번, 후공이면 n번 공격
+            mix = [q * a + (1.0 - q) * b for a, b in zip(taken_k[n - 1], taken_k[n])]
+            taken_cdf.append(list(accumulate(mix)))
+            for t, pt in enumerate(mix):
+                marginal[t] += turns[n] * pt
+
+        tail = [0.0] * (cap + 2)
+        for t in range(cap, -1, -1):
+            tail[t] = tail[t + 1] + marginal[t]
+        return OutcomeTable(cap, turns, list(accumulate(turns)), taken_cdf, tail[:cap + 1], unresolved)
+
+    @staticmethod
+    def supports(monster: Actor) -> bool:
+        """평타만 쓰는 몬스터인지 (이 모델이 실제 전투 분포와 같은 경우)."""
+        return not AISystem.has_active_skills(monster)
+
+    @staticmethod
+    def death_risk(player: Actor, monster: Actor) -> Optional[float]:
+        """사망 위험 추정. 몬스터가 스킬을 써서 모델이 맞지 않으면 None."""
+        if not AutoResolveSystem.supports(monster):
+            return None
+        return AutoResolveSystem.outcome_table(player, monster).death_risk(player.current_hp)
+
+    @staticmethod
+    def try_resolve(player: Actor, monster: Actor, ctx: CombatContext,
+                    threshold: Optional[float] = None, rng=random) -> bool:
+        """
+        위험도가 임계값 이하이면 전투를 즉시 끝내고 True를 반환합니다.
+        뽑힌 피해가 남은 HP 이상이면 (임계값 이하의 확률로) 패배 처리합니다.
+        """
+        threshold = AutoResolveSystem.RISK_THRESHOLD if threshold is None else threshold
+        if not AutoResolveSystem.supports(monster):
+            return False
+        table = AutoResolveSystem.outcome_table(player, monster)
+        if table.death_risk(player.current_hp) > threshold:
+            return False
+
+        turns, taken = table.sample(rng)
+        ctx.round_count = turns
+        ctx.is_finished = True
+        if taken >= player.current_hp:
+            player.current_hp = 0
+            ctx.winner_side = "enemy"
+            ctx.add_log(f"💀 {player.name}이(가) {turns}턴 만에 쓰러졌습니다... (자동 전투)")
+            return True
+
+        player.current_hp -= taken
+        # 평타 1회마다 MP 2 회복 (CombatSystem.process_action과 동일)
+        player.current_mp = min(player.max_mp, player.current_mp + 2 * turns)
+        monster.current_hp = 0
+        ctx.winner_side = "player"
+        ctx.add_log(f"⚡ 자동 전투: {turns}턴 만에 {monster.name} 처치! (받은 피해 {taken})")
+        return True
@@ -0,0 +1,76 @@
+# File: src/systems/combat_profile.py
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from src.models.actor import Actor
+from src.systems.growth_system import GrowthSystem
+from src.systems.loadout_system import BASIC_ATTACK
+from src.systems.math_engine import MathEngine
+from src.formulas.engine import FormulaEngine
+from src.formulas.v22 import FORMULA as V22_FORMULA
+from src.utils.data_loader import DataLoader
+
+@dataclass(frozen=True)
+class SkillProfile:
+    """스킬 데이터 중 전투 계산에 필요한 값만 추린 불변 요약."""
+    ap_coef: float
+    sp_coef: float
+    type: str
+    mp_cost: int
+
+    @staticmethod
+    def from_data(skill: dict) -> "SkillProfile":
+        scaling = skill.get("scaling", {"ap": 1.0, "sp": 0.0})
+        return SkillProfile(scaling.get("ap", 0.0), scaling.get("sp", 0.0), skill.get("type", "physical"),
+                            skill.get("cost", {}).get("mp", 0))
+
+    @property
+    def is_magic(self) -> bool:
+        return self.type == "magic"
+
+    @property
+    def reduced_by_armor(self) -> bool:
+        return self.type in ("physical", "hybrid")
+
+BASIC_SKILL = SkillProfile.from_data(BASIC_ATTACK)
+
+@dataclass(frozen=True)
+class CombatProfile:
+    """전투에 필요한 파생 능력치 스냅샷 (런 동안 레벨/장비가 바뀌지 않으므로 한 번만 계산)."""
+    max_hp: int
+    max_mp: int
+    ap: int
+    sp: int
+    evasion: float
+    defense: float
+    crit: float
+    dex: int
+    skill: Optional[SkillProfile] = None   # MP가 충분하면 사용하는 주력 스킬 (없으면 평타만)
+
+    @staticmethod
+    def from_actor(actor: Actor) -> "CombatProfile":
+        """현재 스탯으로 스냅샷을 만듭니다 (max_hp/max_mp는 refresh_stats가 갱신한 값을 사용)."""
+        dex = GrowthSystem.get_scaled_stat(actor, "dexterity")
+        ap, sp = GrowthSystem.get_attack_power(actor), GrowthSystem.get_magic_power(actor)
+
+        # 보유 스킬 중 기본 피해가 가장 큰 액티브 스킬을 주력으로 사용 (CombatState의 [2] 선택)
+        best, best_dmg = None, 0.0
+        for skill_id in actor.skills:
+            if skill_id == "basic_attack":
+                continue
+            data = DataLoader.load_skill(skill_id)
+            if not data:
+                continue
+            skill = SkillProfile.from_data(data)
+            dmg = ap * skill.ap_coef + sp * skill.sp_coef
+            if dmg > best_dmg:
+                best, best_dmg = skill, dmg
+        return CombatProfile(actor.max_hp, actor.max_mp, ap, sp, GrowthSystem.get_evasion(actor),
+                             GrowthSystem.get_defense(actor), MathEngine.crit_chance(dex, actor.profile), dex, best)
+
+def damage_pmf(attacker: CombatProfile, skill: SkillProfile, defender: CombatProfile) -> Dict[int, float]:
+    """
+    행동 1회의 피해량 확률분포 (빗나감 = 0).
+    MathEngine과 같은 규칙(v2.2 공식 세트)의 Matchup을 FormulaEngine.damage_pmf로 해석적으로 풉니다.
+    """
+    return FormulaEngine.damage_pmf(V22_FORMULA.matchup(attacker, defender, skill))
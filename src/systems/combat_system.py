@@ -16,12 +16,13 @@ class CombatSystem:
     """
 
     @staticmethod
-    def initialize_combat(players: list, enemies: list) -> CombatContext:
+    def initialize_combat(players: list, enemies: list, rolls=None) -> CombatContext:
         """
         전투 컨텍스트를 생성하고 주도권(Initiative)을 결정합니다.
         공식: (DEX * 1.5) + 1d20
+        rolls: CounterRNG.battle(...)을 넘기면 주도권과 이후 모든 판정이 (시드, 전투, 라운드, 자리, 용도)로 정해집니다.
         """
-        ctx = CombatContext(players, enemies)
+        ctx = CombatContext(players, enemies, rolls=rolls)
         
         # 주도권 계산을 위해 모든 참여자 취합
         all_participants = players + enemies
@@ -30,10 +31,13 @@ class CombatSystem:
         # 순환 참조 방지를 위한 지역 임포트
         from src.systems.growth_system import GrowthSystem 
         
+        if rolls is not None:
+            rolls.begin_round(0)   # 라운드 0 = 전투 시작 판정
         for actor in all_participants:
             dex = GrowthSystem.get_scaled_stat(actor, "dexterity")
             # 주사위 눈금(1~20)을 더해 난수성 부여
-            score = (dex * 1.5) + random.randint(1, 20)
+            d20 = random.randint(1, 20) if rolls is None else rolls.randint(1, 20, ctx.slot(actor), "initiative")
+            score = (dex * 1.5) + d20
             initiatives.append((score, actor.id))
             
         # 점수가 높은 순서대로 정렬하여 턴 순서 확정
@@ -68,12 +72,16 @@ class CombatSystem:
         attacker.current_mp -= mp_cost
 
         # 3. 명중 판정 (MathEngine 위임)
-        if not MathEngine.roll_hit(attacker, defender, skill):
+        roll = None  # MathEngine.rolls (전역 random 또는 세션 RollBuffer)
+        if ctx.rolls is not None:
+            ctx.rolls.begin_round(ctx.round_count)
+            roll = ctx.rolls.roller(ctx.slot(attacker))
+        if not MathEngine.roll_hit(attacker, defender, skill, roll):
             ctx.add_log(f"💨 {attacker.name}의 [{skill_name}]! ...하지만 {defender.name}이(가) 피했습니다.")
         else:
             # 4. 데미지 계산 및 적용
             # MathEngine.calculate_skill_damage는 (damage, is_crit) 튜플을 반환함
-            result = MathEngine.calculate_skill_damage(attacker, defender, skill)
+            result = MathEngine.calculate_skill_damage(attacker, defender, skill, roll)
             
             # 호환성 처리 (튜플이 아닐 경우 대비)
             if isinstance(result, tuple):
@@ -97,7 +105,7 @@ class CombatSystem:
 
         # 6. [전략적 포인트] 턴 종료 시 마나 자연 회복
         # 시뮬레이션에서 검증된 '매 턴 2 회복'을 적용하여 스킬 빈도를 높임
-        attacker.current_mp = min(attacker.max_mp, attacker.current_mp + 2)
+        attacker.current_mp = min(attacker.max_mp, attacker.current_mp + MathEngine.formula(attacker).MP_REGEN)
 
         # 7. 사망 판정
         if defender.current_hp <= 0:
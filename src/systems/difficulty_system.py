@@ -0,0 +1,171 @@
+# File: src/systems/difficulty_system.py
+import hashlib
+import json
+import os
+import random
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from src.core.factory import EntityFactory
+from src.formulas.book import FORMULAS
+from src.models.actor import Actor
+from src.systems.combat_profile import CombatProfile
+from src.systems.growth_system import GrowthSystem
+from src.utils.data_loader import DataLoader
+
+RATING_VERSION = 1   # 공식이 바뀌면 올려서 디스크 캐시를 무효화
+
+# 기대 DPS 계산에 쓰는 기준 방어자 (평범 / 회피형 / 중장갑) - 평균을 사용
+REFERENCE_BUILDS = {
+    "balanced": {"dexterity": 10, "constitution": 10},
+    "agile": {"dexterity": 25, "constitution": 10},
+    "armored": {"dexterity": 10, "constitution": 25},
+}
+
+class DifficultySystem:
+    """
+    몬스터 전투력(Power Rating) 산정과 목표 난이도 기반 조우 선택.
+
+    전투력 = 유효 체력(EHP) x 기준 빌드 상대 기대 DPS.
+    플레이어가 적을 잡는 시간은 EHP_적 / DPS_나, 적이 나를 잡는 시간은 EHP_나 / DPS_적이므로
+    두 시간의 비 = 전투력_적 / 전투력_나 입니다. 이 비율(난이도)은 '전투에서 잃는 HP 비율'의 근사이며,
+    1.0이면 대략 동전 던지기입니다.
+
+    몬스터 전투력은 monsters.json 내용과 공식 지문의 해시와 함께 디스크에 캐싱되고,
+    메모리에서는 전투력 순으로 정렬된 배열로 보관되어 난이도 구간 검색이 bisect로 O(log n)입니다.
+    """
+
+    CACHE_FILE = "cache/power_ratings.json"
+    # 던전 런 시뮬레이션으로 맞춘 값: 레벨과 무관하게 절반 정도가 9층 근처까지 도달
+    BASE_DIFFICULTY = 0.10      # 1층 목표 난이도 (구간 중심)
+    DIFFICULTY_PER_FLOOR = 0.015
+    MAX_DIFFICULTY = 0.9
+    BAND_WIDTH = 0.05           # 중심 ± 폭
+
+    _ratings: Optional[List[Tuple[float, str]]] = None
+    _keys: List[float] = []
+
+    # --------------------------------------------------------------------------
+    # 전투력 공식
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def _reference_factors() -> List[float]:
+        """기준 방어자별 (1 - 회피) x (1 - 피해감소)."""
+        return [(1.0 - GrowthSystem.calc_evasion(ref["dexterity"])) * (1.0 - GrowthSystem.calc_defense(ref["constitution"]))
+                for ref in REFERENCE_BUILDS.values()]
+
+    @staticmethod
+    def power(profile: CombatProfile) -> float:
+        ehp = profile.max_hp / ((1.0 - profile.defense) * (1.0 - profile.evasion))
+        hit = profile.ap * (1.0 + 0.5 * min(1.0, profile.crit))   # 평타 기준 기대 피해
+        factors = DifficultySystem._reference_factors()
+        dps = hit * sum(factors) / len(factors)
+        return ehp * dps
+
+    @staticmethod
+    def player_power(player: Actor) -> float:
+        return DifficultySystem.power(CombatProfile.from_actor(player))
+
+    # --------------------------------------------------------------------------
+    # 몬스터 색인 (디스크 캐시)
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def _source_hash(monsters: dict) -> str:
+        # 공식 지문 포함: FormulaBook.reload()로 성장/판정 식이 바뀌면 디스크 캐시도 무효
+        payload = json.dumps({"v": RATING_VERSION, "refs": REFERENCE_BUILDS, "monsters": monsters,
+                              "formulas": FORMULAS.fingerprint()}, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _compute_ratings(monsters: dict) -> Dict[str, float]:
+        ratings = {}
+        for mid in monsters:
+            monster = EntityFactory.create_monster(mid)
+            if monster is not None:
+                ratings[mid] = DifficultySystem.power(CombatProfile.from_actor(monster))
+        return ratings
+
+    @staticmethod
+    def ratings() -> List[Tuple[float, str]]:
+        """(전투력, 몬스터 ID) 오름차순 목록. 데이터가 바뀌지 않았으면 디스크 캐시를 재사용합니다."""
+        if DifficultySystem._ratings is not None:
+            return DifficultySystem._ratings
+
+        monsters = DataLoader.load_json("monsters.json")
+        source = DifficultySystem._source_hash(monsters)
+        path = DataLoader._get_data_path(DifficultySystem.CACHE_FILE)
+        ratings = None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("source") == source:
+                ratings = cached["ratings"]
+        except (IOError, ValueError, KeyError):
+            pass
+
+        if ratings is None:
+            ratings = DifficultySystem._compute_ratings(monsters)
+            if ratings:
+                try:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "w", encoding="utf-8") as f:
+                        json.dump({"source": source, "ratings": ratings}, f, indent=2, sort_keys=True)
+                except IOError:
+                    pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 계산)
+
+        DifficultySystem._ratings = sorted((rating, mid) for mid, rating in ratings.items())
+        DifficultySystem._keys = [rating for rating, _ in DifficultySystem._ratings]
+        return DifficultySystem._ratings
+
+    @staticmethod
+    def clear_cache():
+        """메모리 색인을 버립니다 (데이터를 다시 읽은 뒤 호출). 디스크 캐시는 해시로 자동 무효화됩니다."""
+        DifficultySystem._ratings = None
+        DifficultySystem._keys = []
+
+    # --------------------------------------------------------------------------
+    # 목표 난이도 조우
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def target_band(floor: int) -> Tuple[float, float]:
+        """층별 목표 난이도 구간 (적 전투력 / 플레이어 전투력)."""
+        center = min(DifficultySystem.MAX_DIFFICULTY,
+                     DifficultySystem.BASE_DIFFICULTY + DifficultySystem.DIFFICULTY_PER_FLOOR * (floor - 1))
+        return max(0.0, center - DifficultySystem.BAND_WIDTH), center + DifficultySystem.BAND_WIDTH
+
+    @staticmethod
+    def band_slice(player_power: float, band: Tuple[float, float]) -> Tuple[int, int]:
+        """난이도 구간에 드는 몬스터의 [i, j) 인덱스 범위. 구간이 비면 중심에 가장 가까운 1마리."""
+        ratings = DifficultySystem.ratings()
+        keys = DifficultySystem._keys
+        if not ratings:
+            return 0, 0
+        i = bisect_left(keys, band[0] * player_power)
+        j = bisect_right(keys, band[1] * player_power)
+        if i < j:
+            return i, j
+        target = (band[0] + band[1]) / 2 * player_power
+        k = bisect_left(keys, target)
+        if k == len(keys) or (k > 0 and target - keys[k - 1] < keys[k] - target):
+            k -= 1
+        return k, k + 1
+
+    @staticmethod
+    def difficulty(player: Actor, monster: Actor) -> float:
+        return DifficultySystem.power(CombatProfile.from_actor(monster)) / DifficultySystem.player_power(player)
+
+    @staticmethod
+    def band_monster_ids(player: Actor, floor: int) -> List[str]:
+        i, j = DifficultySystem.band_slice(DifficultySystem.player_power(player), DifficultySystem.target_band(floor))
+        return [mid for _, mid in DifficultySystem.ratings()[i:j]]
+
+    @staticmethod
+    def pick_monster_id(player: Actor, floor: int, rng=random) -> Optional[str]:
+        """목표 난이도 구간에서 몬스터 하나를 고릅니다 (색인 검색 O(log n) + 구간 내 균등 추첨)."""
+        i, j = DifficultySystem.band_slice(DifficultySystem.player_power(player), DifficultySystem.target_band(floor))
+        if i >= j:
+            return None
+        return DifficultySystem.ratings()[rng.randrange(i, j)][1]
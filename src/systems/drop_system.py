@@ -0,0 +1,58 @@
+# File: src/systems/drop_system.py
+import random
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from src.core.factory import EntityFactory
+from src.models.actor import Actor
+from src.models.item import Item
+from src.systems.inventory_system import InventorySystem
+from src.systems.table_system import TableSystem
+from src.utils.data_loader import DataLoader
+
+class DropSystem:
+    """
+    몬스터 처치 보상(전리품) 시스템.
+    monsters.json의 "loot_table" 항목(없으면 loot_default)을 TableSystem으로 굴려 아이템을 생성합니다.
+    """
+
+    DEFAULT_TABLE = "loot_default"
+
+    @staticmethod
+    def loot_table_for(monster: Actor) -> str:
+        data = DataLoader.load_monster(monster.template_id) if monster.template_id else None
+        return (data or {}).get("loot_table", DropSystem.DEFAULT_TABLE)
+
+    @staticmethod
+    def roll_drops(monster: Actor, rng=random) -> List[Item]:
+        """몬스터 1마리의 드랍을 굴립니다 (옵션 굴림도 rng 사용). 꽝(null)이나 존재하지 않는 아이템 ID는 건너뜁니다."""
+        table = TableSystem.get(DropSystem.loot_table_for(monster))
+        if table is None:
+            return []
+        drops = []
+        for item_id in table.roll(rng):
+            item = EntityFactory.create_item(item_id, rng) if item_id else None
+            if item:
+                drops.append(item)
+        return drops
+
+    @staticmethod
+    def grant_drops(player: Actor, monsters: List[Actor], rng=random) -> Tuple[List[Item], List[Item]]:
+        """처치한 몬스터들의 드랍을 가방에 넣습니다. (획득, 가방이 가득 차 버린 아이템)을 반환합니다."""
+        gained, lost = [], []
+        for monster in monsters:
+            for item in DropSystem.roll_drops(monster, rng):
+                (gained if InventorySystem.add_item(player, item) else lost).append(item)
+        return gained, lost
+
+    @staticmethod
+    def simulate_drops(table_id: str, kills: int, seed: Optional[int] = None) -> Counter:
+        """
+        kills마리 처치 시의 아이템 ID별 드랍 수 (밸런스 검증용, 아이템 객체는 만들지 않음).
+        모든 추첨을 한 번에 일괄 샘플링합니다.
+        """
+        table = TableSystem.get(table_id)
+        if table is None:
+            return Counter()
+        rolls = table.roll_many(kills * table.rolls, seed=seed)
+        return Counter(item_id for item_id in rolls if item_id)
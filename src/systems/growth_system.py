@@ -1,6 +1,12 @@
+import itertools
 import math
 import random
 from src.models.actor import Actor
+from src.formulas.book import FORMULAS, FormulaBook
+
+# 능력치 재계산 버전 발급기 (프로세스 전역). 액터별로 1씩 올리면 id가 같은 서로 다른 액터
+# (복제본, 저장 파일에서 불러온 액터)의 버전이 겹쳐 (id, 버전) 키 캐시가 엉뚱한 값을 돌려줍니다.
+_STATS_VERSIONS = itertools.count(1)
 
 class GrowthSystem:
     """
@@ -15,16 +21,20 @@ class GrowthSystem:
     
     PRIMARY_STATS = ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]
 
+    @staticmethod
+    def _book(profile) -> FormulaBook:
+        return FORMULAS if profile is None else profile.formulas
+
+    @staticmethod
+    def formulas(actor: Actor) -> FormulaBook:
+        """액터의 밸런스 프로필 공식 (프로필이 없으면 전역 FORMULAS)."""
+        return FORMULAS if actor.profile is None else actor.profile.formulas
+
     @staticmethod
     def _recalc_stats(actor: Actor):
         """기본 스탯에 레벨 보정과 장비 보너스를 합산하여 캐시를 생성합니다."""
-        new_cache = {}
-        
-        for stat_key in GrowthSystem.PRIMARY_STATS:
-            base = actor.base_stats.get(stat_key, 10)
-            # 레벨당 기본 스탯 성장 (기존 1.5 유지)
-            growth_bonus = (actor.level - 1) * 1.5 
-            new_cache[stat_key] = int(base + growth_bonus)
+        # 레벨당 기본 스탯 성장 (기존 1.5 유지)
+        new_cache = GrowthSystem.base_stats_at_level(actor)
 
         # 착용 중인 모든 장비의 보너스 스탯 합산
         for item in actor.equipment.values():
@@ -38,6 +48,7 @@ class GrowthSystem:
 
         actor._cached_stats = new_cache
         actor._is_stats_dirty = False
+        actor._stats_version = next(_STATS_VERSIONS)
 
     @staticmethod
     def get_scaled_stat(actor: Actor, stat_name: str) -> int:
@@ -48,6 +59,7 @@ class GrowthSystem:
 
     # --------------------------------------------------------------------------
     # [Final Balancing] 전투 수식 - 시뮬레이션 기반 최종값
+    # 식과 계수는 formulas.json (없으면 src/formulas/book.py 기본값)에서 컴파일된 FORMULAS를 사용
     # --------------------------------------------------------------------------
 
     @staticmethod
@@ -57,7 +69,7 @@ class GrowthSystem:
         - 묵직한 체력을 제공하여 전투가 6~12턴 정도 긴장감 있게 유지되도록 함.
         """
         con = GrowthSystem.get_scaled_stat(actor, "constitution")
-        return int((con * 15) + (actor.level * 30))
+        return GrowthSystem.formulas(actor).max_hp(con, actor.level)
 
     @staticmethod
     def get_attack_power(actor: Actor) -> int:
@@ -67,8 +79,7 @@ class GrowthSystem:
         - 힘 스탯과 레벨의 가치를 동시에 높임.
         """
         strength = GrowthSystem.get_scaled_stat(actor, "strength")
-        base_atk = strength + (actor.level * 3)
-        return int(base_atk * 1.2)
+        return GrowthSystem.formulas(actor).attack_power(strength, actor.level)
 
     @staticmethod
     def get_magic_power(actor: Actor) -> int:
@@ -77,8 +88,7 @@ class GrowthSystem:
         - 마법형 캐릭터가 지능 스탯에 투자할 확실한 이유를 제공함.
         """
         intelligence = GrowthSystem.get_scaled_stat(actor, "intelligence")
-        base_matk = intelligence + (actor.level * 3)
-        return int(base_matk * 1.2)
+        return GrowthSystem.formulas(actor).magic_power(intelligence, actor.level)
     
     @staticmethod
     def get_evasion(actor: Actor) -> float:
@@ -87,8 +97,7 @@ class GrowthSystem:
         - DEX 10 기준 0%, DEX 30 기준 20%.
         """
         dex = GrowthSystem.get_scaled_stat(actor, "dexterity")
-        evasion_chance = max(0, (dex - 10) * 0.01)
-        return min(0.5, evasion_chance)
+        return GrowthSystem.formulas(actor).evasion(dex)
 
     @staticmethod
     def get_defense(actor: Actor) -> float:
@@ -98,8 +107,37 @@ class GrowthSystem:
         - 갑옷 시스템이 추가되면 이 수치에 합산될 예정.
         """
         con = GrowthSystem.get_scaled_stat(actor, "constitution")
-        dr = max(0, (con - 10) * 0.01)
-        return min(0.6, dr)
+        return GrowthSystem.formulas(actor).defense(con)
+
+    # --------------------------------------------------------------------------
+    # 순수 공식 (Actor 없이 스탯 값만으로 계산 - 장비 비교/최적화에서 재사용)
+    # profile: BalanceProfile (None이면 전역 FORMULAS)
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def base_stats_at_level(actor: Actor) -> dict:
+        """장비를 제외한, 레벨 보정만 적용된 기본 스탯 (_recalc_stats와 같은 반올림 규칙)."""
+        return GrowthSystem.formulas(actor).stats_at_level(actor.base_stats, GrowthSystem.PRIMARY_STATS, 10, actor.level)
+
+    @staticmethod
+    def calc_max_hp(con: int, level: int, profile=None) -> int:
+        return GrowthSystem._book(profile).max_hp(con, level)
+
+    @staticmethod
+    def calc_attack_power(strength: int, level: int, profile=None) -> int:
+        return GrowthSystem._book(profile).attack_power(strength, level)
+
+    @staticmethod
+    def calc_magic_power(intelligence: int, level: int, profile=None) -> int:
+        return GrowthSystem._book(profile).magic_power(intelligence, level)
+
+    @staticmethod
+    def calc_evasion(dex: int, profile=None) -> float:
+        return GrowthSystem._book(profile).evasion(dex)
+
+    @staticmethod
+    def calc_defense(con: int, profile=None) -> float:
+        return GrowthSystem._book(profile).defense(con)
 
     @staticmethod
     def refresh_stats(actor: Actor):
@@ -108,8 +146,7 @@ class GrowthSystem:
         actor.max_hp = GrowthSystem.get_max_hp(actor)
         
         # MP 공식 상향: 기본 20 + 지혜 보정 + 레벨당 5씩 증가
-        wisdom_bonus = GrowthSystem.get_scaled_stat(actor, "wisdom") // 2
-        actor.max_mp = 20 + wisdom_bonus + (actor.level * 5)
+        actor.max_mp = GrowthSystem.formulas(actor).max_mp(GrowthSystem.get_scaled_stat(actor, "wisdom"), actor.level)
         
         # 사망 상태가 아니면 현재 체력이 최대치를 넘지 않도록 보정
         if actor.current_hp <= 0 or actor.current_hp > actor.max_hp: 
@@ -8,18 +8,20 @@ class InventorySystem:
     """
     아이템 획득, 장착, 해제 등을 관리하는 시스템.
     장비 변경 시 Actor의 Dirty Flag를 켜서 스탯 재계산을 유도합니다.
+    인벤토리 조회/제거는 Inventory 컨테이너의 인스턴스 ID 색인으로 O(1)입니다.
     """
 
     @staticmethod
-    def add_item(actor: Actor, item: Item):
-        """인벤토리에 아이템을 추가합니다."""
-        actor.inventory.append(item)
+    def add_item(actor: Actor, item: Item) -> bool:
+        """인벤토리에 아이템을 추가합니다. 가방이 가득 차면 False."""
         # 획득만으로는 스탯이 변하지 않으므로 dirty 처리 안 함
+        return actor.inventory.add(item)
 
     @staticmethod
     def equip_item(actor: Actor, item: Item) -> bool:
         """
         아이템을 장착하고 스탯을 갱신합니다.
+        기존 장비를 가방에 돌려놓지 못하면 교체를 취소하고 False를 반환합니다 (장비가 사라지지 않음).
         """
         if item not in actor.inventory:
             return False
@@ -28,13 +30,15 @@ class InventorySystem:
         if not slot:
             return False
             
-        # 기존 장착 해제
-        if actor.equipment.get(slot):
-            InventorySystem.unequip_item(actor, slot)
+        # 먼저 가방에서 꺼내 칸을 비운 뒤 기존 장비를 돌려놓음 (가득 찬 가방에서도 교체 가능)
+        actor.inventory.remove(item)
+        previous = actor.equipment.get(slot)
+        if previous and not actor.inventory.add(previous):
+            actor.inventory.add(item)   # 방금 비운 칸이므로 항상 들어감
+            return False
             
         # 장착
         actor.equipment[slot] = item
-        actor.inventory.remove(item)
         
         # [최적화] 장비 변경 발생 -> Dirty Flag On
         actor.mark_dirty()
@@ -46,17 +50,18 @@ class InventorySystem:
     @staticmethod
     def unequip_item(actor: Actor, slot: str) -> bool:
         """
-        아이템을 해제하고 인벤토리로 되돌립니다.
+        아이템을 해제하고 인벤토리로 되돌립니다. 가방에 빈 칸이 없으면 해제하지 않습니다.
         """
         item = actor.equipment.get(slot)
         if not item:
             return False
-            
+
+        if not actor.inventory.add(item):
+            return False
         actor.equipment[slot] = None
-        actor.inventory.append(item)
         
         # [최적화] 장비 해제 발생 -> Dirty Flag On
         actor.mark_dirty()
         
         GrowthSystem.refresh_stats(actor)
-        return True
\ No newline at end of file
+        return True
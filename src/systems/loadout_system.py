@@ -0,0 +1,203 @@
+# File: src/systems/loadout_system.py
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.models.actor import Actor
+from src.models.item import Item
+from src.systems.growth_system import GrowthSystem
+from src.systems.math_engine import MathEngine
+from src.systems.inventory_system import InventorySystem
+
+# 평타 기준 (스킬 데이터를 지정하지 않은 DPS 계산용)
+BASIC_ATTACK = {"name": "Basic Attack", "type": "physical", "scaling": {"ap": 1.0, "sp": 0.0}}
+
+@dataclass
+class Loadout:
+    """최적화 결과: 슬롯별 선택 장비와 목표 수치."""
+    objective: str
+    value: float
+    current_value: float
+    items: Dict[str, Optional[Item]] = field(default_factory=dict)
+    stats: Dict[str, int] = field(default_factory=dict)
+    combinations: int = 0   # 실제로 평가한 조합 수
+
+    @property
+    def gain(self) -> float:
+        return self.value - self.current_value
+
+class LoadoutSystem:
+    """
+    최적 장비(Best-in-Slot) 계산기.
+
+    장비를 실제로 바꿔 끼우며 refresh_stats를 돌리는 대신,
+    1. 장비 없는 레벨 보정 스탯을 한 번 계산하고,
+    2. 아이템마다 목표에 영향을 주는 스탯의 변화량(delta)만 뽑아,
+    3. 슬롯별로 다른 후보에 완전히 밀리는(지배되는) 아이템을 제거한 뒤
+    4. 남은 후보 조합만 순수 공식(GrowthSystem.calc_*)으로 평가합니다.
+    모든 목표는 관련 스탯에 대해 단조 증가이므로 지배 제거는 최적해를 잃지 않습니다.
+    """
+
+    SLOTS = ("main_hand", "body", "ring")
+    OBJECTIVES = ("ap", "sp", "ehp", "dps")
+    MAX_COMBINATIONS = 200_000   # 지배 제거 후에도 조합이 이보다 많으면 슬롯별 상위 후보만 남김
+
+    # --------------------------------------------------------------------------
+    # 목표 함수
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def _objective(objective: str, level: int, target: Optional[Actor] = None,
+                   skill: Optional[dict] = None) -> Tuple[Tuple[str, ...], Callable[[Dict[str, int]], float]]:
+        """(관련 스탯, stats -> 점수) 쌍을 반환합니다."""
+        if objective == "ap":
+            return ("strength",), lambda s: GrowthSystem.calc_attack_power(s["strength"], level)
+        if objective == "sp":
+            return ("intelligence",), lambda s: GrowthSystem.calc_magic_power(s["intelligence"], level)
+        if objective == "ehp":
+            # 유효 체력: 최대 HP를 물리 피해 감소율과 회피율로 나눈 값
+            def ehp(s):
+                hp = GrowthSystem.calc_max_hp(s["constitution"], level)
+                taken = (1.0 - GrowthSystem.calc_defense(s["constitution"])) * (1.0 - GrowthSystem.calc_evasion(s["dexterity"]))
+                return hp / taken
+            return ("constitution", "dexterity"), ehp
+        if objective == "dps":
+            skill = skill or BASIC_ATTACK
+            scaling = skill.get("scaling", {"ap": 1.0, "sp": 0.0})
+            ap_coef, sp_coef = scaling.get("ap", 0.0), scaling.get("sp", 0.0)
+            skill_type = skill.get("type", "physical")
+            # 대상의 회피/방어는 장비 선택과 무관하므로 한 번만 계산
+            evasion = GrowthSystem.get_evasion(target) if target is not None and skill_type != "magic" else 0.0
+            defense = GrowthSystem.get_defense(target) if target is not None and skill_type in ("physical", "hybrid") else 0.0
+            factor = (1.0 - evasion) * (1.0 - defense)
+
+            def dps(s):
+                base = (GrowthSystem.calc_attack_power(s["strength"], level) * ap_coef
+                        + GrowthSystem.calc_magic_power(s["intelligence"], level) * sp_coef)
+                crit = min(1.0, MathEngine.crit_chance(s["dexterity"]))
+                return base * (1.0 + 0.5 * crit) * factor
+
+            relevant = tuple(k for k, coef in (("strength", ap_coef), ("intelligence", sp_coef)) if coef) + ("dexterity",)
+            return relevant, dps
+        raise ValueError(f"Unknown objective: {objective}")
+
+    @staticmethod
+    def evaluate(actor: Actor, objective: str, target: Optional[Actor] = None, skill: Optional[dict] = None) -> float:
+        """현재 장착 상태의 목표 수치."""
+        _, score = LoadoutSystem._objective(objective, actor.level, target, skill)
+        stats = {k: GrowthSystem.get_scaled_stat(actor, k) for k in GrowthSystem.PRIMARY_STATS}
+        return score(stats)
+
+    # --------------------------------------------------------------------------
+    # 후보 정리
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def _delta(item: Optional[Item], relevant: Tuple[str, ...]) -> Tuple[int, ...]:
+        if item is None:
+            return (0,) * len(relevant)
+        bonus = {}
+        for stat, value in item.bonus_stats.items():
+            key = stat.lower()
+            bonus[key] = bonus.get(key, 0) + value
+        return tuple(bonus.get(k, 0) for k in relevant)
+
+    @staticmethod
+    def _non_dominated(entries: List[Tuple[Tuple[int, ...], Optional[Item]]]) -> List[Tuple[Tuple[int, ...], Optional[Item]]]:
+        """
+        변화량 벡터 기준 비지배 후보만 남깁니다 (같은 벡터는 하나만).
+        내림차순 정렬 후 앞선 후보들과만 비교하므로, 대부분 한두 개로 줄어드는 실제 데이터에서는 거의 선형입니다.
+        """
+        unique: Dict[Tuple[int, ...], Optional[Item]] = {}
+        for delta, item in entries:
+            # 같은 변화량이면 이미 장착 중이거나 먼저 나온 아이템 유지
+            unique.setdefault(delta, item)
+        front: List[Tuple[Tuple[int, ...], Optional[Item]]] = []
+        for delta in sorted(unique, reverse=True):
+            if not any(all(f >= d for f, d in zip(kept, delta)) for kept, _ in front):
+                front.append((delta, unique[delta]))
+        return front
+
+    @staticmethod
+    def candidates(actor: Actor, relevant: Tuple[str, ...]) -> Dict[str, List[Tuple[Tuple[int, ...], Optional[Item]]]]:
+        """슬롯별 후보 (현재 장비 + 가방 속 장비 + 빈 슬롯)의 비지배 집합."""
+        per_slot: Dict[str, List[Tuple[Tuple[int, ...], Optional[Item]]]] = {}
+        for slot in LoadoutSystem.SLOTS:
+            equipped = actor.equipment.get(slot)
+            per_slot[slot] = [(LoadoutSystem._delta(equipped, relevant), equipped)]
+        for item in actor.inventory:
+            if item.slot in per_slot:
+                per_slot[item.slot].append((LoadoutSystem._delta(item, relevant), item))
+        for slot, entries in per_slot.items():
+            entries.append(((0,) * len(relevant), None))
+            per_slot[slot] = LoadoutSystem._non_dominated(entries)
+        return per_slot
+
+    # --------------------------------------------------------------------------
+    # 최적화
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def best_loadout(actor: Actor, objective: str = "ap", target: Optional[Actor] = None,
+                     skill: Optional[dict] = None) -> Loadout:
+        """
+        목표(ap / sp / ehp / dps)를 최대화하는 슬롯별 장비 조합을 찾습니다.
+        dps는 target(몬스터)을 상대로 한 행동당 기대 피해량이며, skill을 생략하면 평타 기준입니다.
+        """
+        relevant, score = LoadoutSystem._objective(objective, actor.level, target, skill)
+        base = GrowthSystem.base_stats_at_level(actor)
+        # 목표와 무관한 스탯/장비 외 보정은 점수에 영향이 없으므로 기본값만 유지
+        base_vec = tuple(base.get(k, 0) for k in relevant)
+        per_slot = LoadoutSystem.candidates(actor, relevant)
+
+        slots = list(per_slot)
+        sizes = [len(per_slot[s]) for s in slots]
+        total = 1
+        for n in sizes:
+            total *= n
+        if total > LoadoutSystem.MAX_COMBINATIONS:
+            # 후보가 너무 많으면 슬롯 단독 기여도 상위만 남김 (근사)
+            keep = max(1, int(LoadoutSystem.MAX_COMBINATIONS ** (1.0 / len(slots))))
+            for s in slots:
+                ranked = sorted(per_slot[s], key=lambda e: score(LoadoutSystem._stats(base, relevant, base_vec, e[0])), reverse=True)
+                per_slot[s] = ranked[:keep]
+
+        best_value, best_choice, combinations = None, None, 0
+        for choice in itertools.product(*(per_slot[s] for s in slots)):
+            delta = tuple(map(sum, zip(*(d for d, _ in choice))))
+            value = score(LoadoutSystem._stats(base, relevant, base_vec, delta))
+            combinations += 1
+            if best_value is None or value > best_value:
+                best_value, best_choice = value, choice
+
+        current_delta = tuple(map(sum, zip(*(LoadoutSystem._delta(actor.equipment.get(s), relevant) for s in slots))))
+        best_delta = tuple(map(sum, zip(*(d for d, _ in best_choice))))
+        return Loadout(
+            objective=objective,
+            value=best_value,
+            current_value=score(LoadoutSystem._stats(base, relevant, base_vec, current_delta)),
+            items={s: item for s, (_, item) in zip(slots, best_choice)},
+            stats=dict(zip(relevant, (b + d for b, d in zip(base_vec, best_delta)))),
+            combinations=combinations,
+        )
+
+    @staticmethod
+    def _stats(base: Dict[str, int], relevant: Tuple[str, ...], base_vec: Tuple[int, ...], delta: Tuple[int, ...]) -> Dict[str, int]:
+        stats = dict(base)
+        for key, b, d in zip(relevant, base_vec, delta):
+            stats[key] = b + d
+        return stats
+
+    @staticmethod
+    def apply(actor: Actor, loadout: Loadout) -> bool:
+        """계산된 조합대로 장비를 교체합니다. 바뀐 슬롯만 장착/해제합니다."""
+        changed = False
+        for slot, item in loadout.items.items():
+            current = actor.equipment.get(slot)
+            if item is current:
+                continue
+            if item is None:
+                changed |= InventorySystem.unequip_item(actor, slot)
+            else:
+                changed |= InventorySystem.equip_item(actor, item)
+        return changed
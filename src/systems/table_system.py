@@ -0,0 +1,132 @@
+# File: src/systems/table_system.py
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.alias_table import AliasTable
+from src.utils.data_loader import DataLoader
+
+# tables.json이 없거나 해당 항목이 없을 때 쓰는 기본 테이블 (기존 하드코딩 확률과 동일)
+DEFAULT_TABLES = {
+    "dungeon_events": {"entries": [
+        {"value": "combat", "weight": 50},
+        {"value": "ambient", "weight": 20},
+        {"value": "berries", "weight": 15},
+        {"value": "thorns", "weight": 15},
+    ]},
+    "dungeon_ambient": {"entries": [
+        {"value": "바람 소리가 들립니다.", "weight": 1},
+        {"value": "멀리서 늑대 울음소리가...", "weight": 1},
+        {"value": "길이 조용합니다.", "weight": 1},
+    ]},
+    "loot_default": {"rolls": 1, "entries": [
+        {"value": None, "weight": 80},
+        {"value": "rusty_greatsword", "weight": 20},
+    ]},
+}
+
+@dataclass(frozen=True)
+class WeightedTable:
+    """컴파일된 가중치 테이블. rolls는 한 번 굴릴 때 뽑는 횟수입니다 (예: 몬스터 1마리당 드랍 2회)."""
+    table_id: str
+    alias: AliasTable
+    rolls: int = 1
+
+    def roll(self, rng=random) -> List[Any]:
+        return [self.alias.sample(rng) for _ in range(self.rolls)]
+
+    def roll_one(self, rng=random) -> Any:
+        return self.alias.sample(rng)
+
+    def roll_many(self, count: int, rng=random, seed: Optional[int] = None) -> List[Any]:
+        """count번의 독립 추첨 (rolls와 무관)."""
+        return self.alias.sample_many(count, rng, seed)
+
+class TableSystem:
+    """
+    데이터 기반 가중치 테이블(이벤트/조우/전리품) 관리자.
+
+    tables.json 형식:
+        "table_id": {"rolls": 1, "entries": [
+            {"value": "health_potion", "weight": 30},   # 일반 항목 (null = 꽝)
+            {"table": "loot_rare", "weight": 5}         # 중첩 테이블
+        ]}
+    간단히 {"값": 가중치, ...} 형태로 적어도 됩니다.
+    중첩 테이블은 컴파일 시 하위 항목의 확률을 곱해 하나의 별칭 테이블로 펼치므로
+    깊이와 무관하게 추첨 1회 = 난수 1개입니다. 컴파일 결과는 테이블 ID별로 캐싱됩니다.
+    """
+
+    _compiled: Dict[str, WeightedTable] = {}
+
+    @staticmethod
+    def _definition(table_id: str) -> Optional[dict]:
+        data = DataLoader.load_json("tables.json")
+        return data.get(table_id) or DEFAULT_TABLES.get(table_id)
+
+    @staticmethod
+    def _entries(definition) -> List[dict]:
+        if isinstance(definition, dict) and "entries" in definition:
+            return definition["entries"]
+        return [{"value": value, "weight": weight} for value, weight in definition.items()]
+
+    @staticmethod
+    def _flatten(table_id: str, scale: float, path: Tuple[str, ...]) -> List[Tuple[Any, float]]:
+        """중첩 테이블을 (값, 절대 가중치) 목록으로 펼칩니다."""
+        if table_id in path:
+            raise ValueError(f"Circular table reference: {' -> '.join(path + (table_id,))}")
+        definition = TableSystem._definition(table_id)
+        if definition is None:
+            raise KeyError(f"Unknown table: {table_id}")
+
+        entries = TableSystem._entries(definition)
+        total = float(sum(e.get("weight", 1) for e in entries))
+        if total <= 0:
+            return []
+        flat = []
+        for entry in entries:
+            share = scale * entry.get("weight", 1) / total
+            if "table" in entry:
+                flat.extend(TableSystem._flatten(entry["table"], share, path + (table_id,)))
+            else:
+                flat.append((entry.get("value"), share))
+        return flat
+
+    @staticmethod
+    def get(table_id: str) -> Optional[WeightedTable]:
+        table = TableSystem._compiled.get(table_id)
+        if table is None:
+            definition = TableSystem._definition(table_id)
+            if definition is None:
+                return None
+            rolls = definition.get("rolls", 1) if "entries" in definition else 1
+            table = WeightedTable(table_id, AliasTable(TableSystem._flatten(table_id, 1.0, ())), rolls)
+            TableSystem._compiled[table_id] = table
+        return table
+
+    @staticmethod
+    def compile_weights(table_id: str, weights: Dict[Any, float]) -> WeightedTable:
+        """코드에서 만든 가중치 사전을 등록하지 않고 컴파일만 합니다 (일회성 테이블)."""
+        return WeightedTable(table_id, AliasTable(list(weights.items())))
+
+    @staticmethod
+    def from_weights(table_id: str, weights: Dict[Any, float]) -> WeightedTable:
+        """코드에서 만든 가중치 사전을 컴파일하여 등록합니다 (예: 층별 조우 테이블)."""
+        table = TableSystem.compile_weights(table_id, weights)
+        TableSystem._compiled[table_id] = table
+        return table
+
+    @staticmethod
+    def roll(table_id: str, rng=random) -> Any:
+        """테이블에서 값 하나를 뽑습니다. 테이블이 없으면 None."""
+        table = TableSystem.get(table_id)
+        return table.roll_one(rng) if table else None
+
+    @staticmethod
+    def roll_many(table_id: str, count: int, rng=random, seed: Optional[int] = None) -> List[Any]:
+        table = TableSystem.get(table_id)
+        return table.roll_many(count, rng, seed) if table else []
+
+    @staticmethod
+    def clear_cache():
+        """데이터를 다시 읽은 뒤 호출하여 컴파일된 테이블을 버립니다."""
+        TableSystem._compiled.clear()
@@ -0,0 +1,540 @@
+# File: src/tests/bench_hot_paths.py
+import sys
+import os
+import io
+import gc
+import json
+import math
+import time
+import random
+import platform
+import argparse
+import tempfile
+import statistics
+import contextlib
+
+# 프로젝트 루트 경로 추가
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.factory import EntityFactory
+from src.core.state_machine import StateMachine, State
+from src.core.console import NullRenderer
+from src.core.replay import Replayer, record_session
+from src.systems.growth_system import GrowthSystem
+from src.systems.inventory_system import InventorySystem
+from src.systems.loadout_system import LoadoutSystem
+from src.systems.ai_system import AISystem
+from src.systems.difficulty_system import DifficultySystem
+from src.sim.lookahead import Lookahead
+from src.systems.table_system import TableSystem
+from src.systems.combat_system import CombatSystem
+from src.systems.math_engine import MathEngine
+from src.models.item import Item
+from src.utils.data_loader import DataLoader
+from src.utils.serializer import Serializer
+from src import combat_simulator
+from src import simulation
+from src.formulas.engine import FormulaEngine
+from src.formulas.book import FormulaBook
+from src.formulas.profile import DEFAULT_PROFILE
+from src.sim.v9_sweep import V9Sweep
+from src.sim.balance_tuner import BalanceTuner
+from src.sim.rotation_planner import RotationPlanner
+from src.utils.rng import CounterRNG, RollBuffer
+from src.utils.sim_cache import SimCache
+
+# --- 벤치마크 설정 ---
+SEED = 20240601                 # 모든 측정은 고정 시드에서 시작 (재현성)
+WARMUP_RUNS = 3                 # 측정 전 예열 횟수 (캐시/인터프리터 워밍업)
+REPEATS = 15                    # 표본(샘플) 수
+REGRESSION_THRESHOLD = 0.10     # 중앙값 기준 10% 이상 느려지면 회귀 후보
+SIGNIFICANCE_Z = 2.33           # 단측 유의수준 ~1% (Mann-Whitney 정규 근사)
+BASELINE_PATH = os.path.join(script_dir, "benchmarks", "baseline.json")
+
+# 데이터 파일(src/data/*.json)이 없는 환경에서도 동일한 부하를 재현하기 위한 최소 픽스처.
+FIXTURE_DATA = {
+    "races.json": {
+        "human": {"name": "Human", "base_stats": {"strength": 1, "dexterity": 1, "constitution": 1}},
+        "orc": {"name": "Orc", "base_stats": {"strength": 3, "constitution": 2, "intelligence": -2}},
+    },
+    "classes.json": {
+        "warrior": {"name": "Warrior", "hit_dice": "d10", "base_stats": {"strength": 3, "constitution": 2},
+                    "initial_skills": ["basic_attack", "power_strike"], "keystones": []},
+    },
+    "skills.json": {
+        "basic_attack": {"name": "Basic Attack", "type": "physical", "cost": {"mp": 0}, "scaling": {"ap": 1.0, "sp": 0.0}},
+        "power_strike": {"name": "Power Strike", "type": "physical", "cost": {"mp": 5}, "scaling": {"ap": 1.6, "sp": 0.0}},
+    },
+    "items.json": {
+        "rusty_greatsword": {"name": "Rusty Greatsword", "type": "weapon", "slot": "main_hand",
+                             "bonus_stats": {"strength": 2}, "price": 10},
+    },
+    "monsters.json": {
+        "brown_bear": {"name": "Brown Bear", "level": 3,
+                       "base_stats": {"strength": 16, "dexterity": 10, "constitution": 14,
+                                      "intelligence": 2, "wisdom": 12, "charisma": 7}},
+    },
+}
+
+def _ensure_fixture_data():
+    """실제 데이터 파일이 없으면 픽스처를 캐시에 주입합니다 (파일은 만들지 않음)."""
+    for filename, data in FIXTURE_DATA.items():
+        if not DataLoader.load_json(filename):
+            DataLoader._cache[filename] = json.loads(json.dumps(data))
+
+def _isolate_caches():
+    """파생 결과 디스크 캐시(전투력/순환 정책/시뮬 결과)를 임시 폴더로 돌립니다 (소스 트리에 쓰지 않음)."""
+    cache_dir = tempfile.mkdtemp(prefix="textdd_bench_cache_")
+    DifficultySystem.CACHE_FILE = os.path.join(cache_dir, "power_ratings.json")
+    RotationPlanner.CACHE_FILE = os.path.join(cache_dir, "rotation_policies.json")
+    SimCache.CACHE_DIR = os.path.join(cache_dir, "sims")
+
+# =================================================================
+# 1. Benchmark Registry
+# =================================================================
+
+BENCHMARKS = {}
+
+def benchmark(name: str, number: int):
+    """
+    벤치마크 등록 데코레이터.
+    등록 함수는 준비 작업을 수행한 뒤 '한 번의 작업'을 수행하는 callable을 반환합니다.
+    number: 한 샘플 안에서 callable을 반복 호출하는 횟수.
+    """
+    def wrapper(setup):
+        BENCHMARKS[name] = (setup, number)
+        return setup
+    return wrapper
+
+@benchmark("duel_v9_single", number=200)
+def bench_duel_v9():
+    p_stats = {"strength": 10, "dex": 25, "con": 8}
+    e_stats = {"strength": 18, "dex": 15, "con": 18}
+    return lambda: combat_simulator.simulate_duel(p_stats, e_stats, 20)
+
+@benchmark("duel_v9_batch", number=2)
+def bench_duel_v9_batch():
+    builds = [
+        {"strength": 25, "dex": 8, "con": 10},
+        {"strength": 10, "dex": 25, "con": 8},
+        {"strength": 10, "dex": 8, "con": 25},
+        {"strength": 15, "dex": 15, "con": 15},
+    ]
+    e_stats = {"strength": 18, "dex": 15, "con": 18}
+    def run():
+        for stats in builds:
+            for _ in range(100):
+                combat_simulator.simulate_duel(stats, e_stats, 20)
+    return run
+
+@benchmark("duel_v9_profile_variants", number=2)
+def bench_duel_v9_profiles():
+    # 프로필 8개를 번갈아 평가 (전역 상수 교체/데이터 재로딩 없이)
+    profiles = [DEFAULT_PROFILE.derive(f"cap_{i}", v9={"CRIT_CAP": 0.25 + 0.02 * i}) for i in range(8)]
+    p_stats = {"strength": 10, "dex": 25, "con": 8}
+    e_stats = {"strength": 18, "dex": 15, "con": 18}
+    def run():
+        for profile in profiles:
+            for _ in range(50):
+                combat_simulator.simulate_duel(p_stats, e_stats, 20, profile=profile)
+    return run
+
+@benchmark("duel_v9_counter_rng", number=200)
+def bench_duel_v9_counter_rng():
+    # 전역 random 대신 (전투, 라운드, 행위자, 용도) 키 난수 - draw당 해시 비용 확인용
+    rng = CounterRNG(7)
+    p_stats = {"strength": 10, "dex": 25, "con": 8}
+    e_stats = {"strength": 18, "dex": 15, "con": 18}
+    state = {"i": 0}
+    def run():
+        state["i"] += 1
+        combat_simulator.simulate_duel(p_stats, e_stats, 20, rolls=rng.battle(state["i"]))
+    return run
+
+@benchmark("rng_counter_draw", number=20000)
+def bench_rng_counter_draw():
+    rolls = CounterRNG(7).battle(0)
+    def run():
+        rolls.begin_round(1)
+        rolls.draw("P", "hit")
+    return run
+
+@benchmark("duel_v61_single", number=200)
+def bench_duel_v61():
+    p_stats = {"STR": 10, "DEX": 8, "CON": 25, "INT": 5}
+    e_stats = {"STR": 18, "DEX": 12, "CON": 18, "INT": 10}
+    return lambda: simulation.simulate_battle(p_stats, e_stats, 20)
+
+@benchmark("duel_formula_versions", number=20)
+def bench_duel_formula_versions():
+    stats = {"strength": 15, "dexterity": 15, "constitution": 15, "intelligence": 10}
+    rival = {"strength": 18, "dexterity": 12, "constitution": 18, "intelligence": 10}
+    pairs = []
+    for version in FormulaEngine.versions():
+        formula = FormulaEngine.get(version)
+        pairs.append((formula, formula.create("A", stats, 20), formula.create("B", rival, 20)))
+    def run():
+        for formula, a, b in pairs:
+            for _ in range(10):
+                FormulaEngine.duel(formula, a, b)
+    return run
+
+@benchmark("duel_live_process_action", number=50)
+def bench_duel_live():
+    def run():
+        player = EntityFactory.create_player("Bench", "human", "warrior")
+        monster = EntityFactory.create_monster("brown_bear")
+        ctx = CombatSystem.initialize_combat([player], [monster])
+        for _ in range(100):
+            CombatSystem.process_action(player, monster, "power_strike", ctx)
+            if monster.current_hp <= 0: break
+            CombatSystem.process_action(monster, player, "basic_attack", ctx)
+            if player.current_hp <= 0: break
+    return run
+
+@benchmark("duel_live_roll_buffer", number=50)
+def bench_duel_live_roll_buffer():
+    # duel_live_process_action과 같은 전투, 판정 난수만 세션 RollBuffer에서
+    buffer = RollBuffer(seed=0)
+    live = bench_duel_live()
+    def run():
+        previous = MathEngine.use_rolls(buffer.roll)
+        try:
+            live()
+        finally:
+            MathEngine.use_rolls(previous)
+    return run
+
+@benchmark("roll_buffer_draw", number=20000)
+def bench_roll_buffer_draw():
+    roll = RollBuffer(seed=0).roll
+    def run():
+        roll("hit")
+    return run
+
+@benchmark("factory_spawn", number=500)
+def bench_factory_spawn():
+    def run():
+        EntityFactory.create_player("Bench", "orc", "warrior")
+        EntityFactory.create_monster("brown_bear")
+    return run
+
+@benchmark("growth_refresh_stats", number=2000)
+def bench_refresh_stats():
+    actor = EntityFactory.create_player("Bench", "human", "warrior")
+    actor.equipment["main_hand"] = Item.from_fields("w", "Sword", "weapon", "main_hand", {"strength": 5})
+    actor.equipment["body"] = Item.from_fields("b", "Mail", "armor", "body", {"constitution": 4})
+    return lambda: GrowthSystem.refresh_stats(actor)
+
+@benchmark("formula_book_compile", number=20)
+def bench_formula_book_compile():
+    # formulas.json 재로딩 1회 = 전체 공식 파싱 + 상수 접기 + 컴파일
+    return lambda: FormulaBook()
+
+@benchmark("v9_sweep_grid", number=3)
+def bench_v9_sweep_grid():
+    # 8x8x8x2 = 1024셀 x 100회 결투 전체 (Matchup 배열 + 몬테카를로)
+    values = list(range(6, 38, 4))
+    return lambda: V9Sweep(values, values, values, [10, 30], samples=100)
+
+@benchmark("v9_sweep_set_constant", number=5)
+def bench_v9_sweep_set_constant():
+    values = list(range(6, 38, 4))
+    sweep = V9Sweep(values, values, values, [10, 30], samples=100)
+    state = {"i": 0}
+    def run():
+        # IRON_FORTRESS 셀만 다시 시뮬레이션되는 증분 재계산
+        state["i"] ^= 1
+        sweep.set_constants(FORTRESS_REFLECT=0.25 + 0.05 * state["i"])
+    return run
+
+@benchmark("balance_tuner_evaluate", number=20)
+def bench_balance_tuner_evaluate():
+    tuner = BalanceTuner()
+    state = {"i": 0}
+    def run():
+        # 후보 1개 = 프로필 파생(FormulaBook 컴파일) + 매트릭스 전체 재측정 + 감사 (메모 우회용으로 매번 다른 값)
+        state["i"] += 1
+        tuner.evaluate({**tuner.defaults, "formulas.HP_PER_CON": 15 + state["i"] * 1e-6})
+    return run
+
+@benchmark("inventory_equip_item", number=200)
+def bench_equip_item():
+    actor = EntityFactory.create_player("Bench", "human", "warrior")
+    for i in range(300):
+        InventorySystem.add_item(actor, Item.from_fields(f"junk_{i}", f"Junk {i}", "weapon", "main_hand", {"strength": i % 5}))
+    swords = [Item.from_fields(f"sword_{i}", "Sword", "weapon", "main_hand", {"strength": 3}) for i in range(2)]
+    for sword in swords:
+        InventorySystem.add_item(actor, sword)
+    state = {"i": 0}
+    def run():
+        # 두 자루를 번갈아 장착 -> 매번 해제/장착/재계산이 모두 발생
+        state["i"] ^= 1
+        InventorySystem.equip_item(actor, swords[state["i"]])
+    return run
+
+@benchmark("loadout_best_in_slot", number=5)
+def bench_best_in_slot():
+    actor = EntityFactory.create_player("Bench", "human", "warrior")
+    rng = random.Random(SEED)
+    stats = ["strength", "dexterity", "constitution", "intelligence"]
+    for i in range(3000):
+        bonus = {s: rng.randint(-2, 8) for s in rng.sample(stats, 2)}
+        InventorySystem.add_item(actor, Item.from_fields(f"gear_{i}", f"Gear {i}", "weapon", rng.choice(LoadoutSystem.SLOTS), bonus))
+    def run():
+        for objective in LoadoutSystem.OBJECTIVES:
+            LoadoutSystem.best_loadout(actor, objective, target=actor)
+    return run
+
+@benchmark("ai_choose_skill", number=20)
+def bench_ai_choose_skill():
+    player = EntityFactory.create_player("Bench", "human", "warrior")
+    monsters = [EntityFactory.create_monster("brown_bear") for _ in range(300)]
+    for monster in monsters:
+        monster.skills = ["basic_attack", "power_strike"]
+    def run():
+        for monster in monsters:
+            AISystem.choose_skill(monster, player)
+    return run
+
+@benchmark("combat_snapshot_restore", number=5000)
+def bench_combat_snapshot():
+    player = EntityFactory.create_player("Bench", "human", "warrior")
+    ctx = CombatSystem.initialize_combat([player], [EntityFactory.create_monster("brown_bear")])
+    def run():
+        ctx.restore(ctx.snapshot())
+    return run
+
+@benchmark("lookahead_expectimax", number=3)
+def bench_lookahead():
+    player = EntityFactory.create_player("Bench", "human", "warrior")
+    ctx = CombatSystem.initialize_combat([player], [EntityFactory.create_monster("brown_bear")])
+    def run():
+        Lookahead.from_context(ctx).best_skill(depth=6)
+    return run
+
+@benchmark("table_roll_batch", number=20)
+def bench_table_roll():
+    rng = random.Random(SEED)
+    def run():
+        # 이벤트 테이블 1만 회 일괄 추첨 (별칭 테이블)
+        TableSystem.roll_many("dungeon_events", 10000, rng)
+    return run
+
+@benchmark("dataloader_cold", number=50)
+def bench_dataloader_cold():
+    filenames = [f for f in FIXTURE_DATA if os.path.exists(DataLoader._get_data_path(f))]
+    if not filenames:
+        return None # 실제 데이터 파일이 없으면 측정 불가
+    def run():
+        for f in filenames:
+            DataLoader._cache.pop(f, None)
+            DataLoader.load_json(f)
+    return run
+
+@benchmark("dataloader_warm", number=20000)
+def bench_dataloader_warm():
+    return lambda: (DataLoader.load_skill("basic_attack"), DataLoader.load_monster("brown_bear"))
+
+@benchmark("serializer_roundtrip", number=50)
+def bench_serializer():
+    tmp_dir = tempfile.mkdtemp(prefix="textdd_bench_")
+    path = os.path.join(tmp_dir, "bench_save.json")
+    actor = EntityFactory.create_player("Bench", "human", "warrior")
+    payload = {
+        "player": {k: v for k, v in vars(actor).items() if not k.startswith("_") and k not in ("equipment", "inventory")},
+        "stack": Serializer.encode_state_stack([_BenchState(), _BenchState()]),
+    }
+    state_map = {"_BenchState": _BenchState}
+    def run():
+        # Serializer는 진행 상황을 print 하므로 출력은 버립니다.
+        with contextlib.redirect_stdout(io.StringIO()):
+            Serializer.save_to_file(path, payload)
+            data = Serializer.load_from_file(path)
+        Serializer.decode_state_stack(data["stack"], state_map)
+    return run
+
+class _BenchState(State):
+    def __init__(self):
+        super().__init__()
+        self.context = {"floor": 1, "steps": 3}
+
+@benchmark("replay_session", number=2)
+def bench_replay_session():
+    # 300입력 세션(생성 -> 자동 전투 -> 탐험/전투 반복)을 기록해 두고, 해시 검증 포함 헤드리스 재생
+    path = os.path.join(tempfile.mkdtemp(), "bench.replay.gz")
+    script = iter(["1", "Bench", "1", "1", "y", "6"] + ["1"] * 300)
+    record_session(path, 7, lambda prompt: next(script, "quit"), renderer=NullRenderer(), realtime=False)
+    replayer = Replayer.load(path)
+    def run():
+        replayer.run()
+    return run
+
+@benchmark("state_machine_transition", number=5000)
+def bench_state_machine():
+    machine = StateMachine(_BenchState())
+    a, b = _BenchState(), _BenchState()
+    def run():
+        machine.push(a)
+        machine.change(b)
+        machine.pop()
+    return run
+
+# =================================================================
+# 2. Measurement & Statistics
+# =================================================================
+
+def measure(name: str, repeats: int = REPEATS, warmup: int = WARMUP_RUNS):
+    """
+    고정 시드 -> 예열 -> repeats개의 표본을 측정합니다.
+    각 표본은 'number'회 호출의 평균(작업 1회당 초)입니다.
+    """
+    setup, number = BENCHMARKS[name]
+    random.seed(SEED)
+    op = setup()
+    if op is None:
+        return None
+
+    for _ in range(warmup):
+        op()
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable() # GC 일시정지로 인한 튀는 값 방지
+    try:
+        for _ in range(repeats):
+            random.seed(SEED)
+            start = time.perf_counter()
+            for _ in range(number):
+                op()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+def mann_whitney_z(baseline: list, current: list) -> float:
+    """
+    Mann-Whitney U 검정의 정규 근사 z 값 (양수면 current가 더 느림).
+    분포 가정 없이 표본 두 묶음의 순위만으로 비교하므로 타이밍 잡음에 강합니다.
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 == 0 or n2 == 0:
+        return 0.0
+    merged = sorted([(v, 0) for v in baseline] + [(v, 1) for v in current])
+    ranks = [0.0] * len(merged)
+    i = 0
+    while i < len(merged):
+        j = i
+        while j + 1 < len(merged) and merged[j + 1][0] == merged[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = avg_rank
+        i = j + 1
+    rank_sum_current = sum(r for r, (_, grp) in zip(ranks, merged) if grp == 1)
+    u = rank_sum_current - n2 * (n2 + 1) / 2
+    mean_u = n1 * n2 / 2
+    sd_u = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    return (u - mean_u) / sd_u if sd_u > 0 else 0.0
+
+def compare(baseline: dict, current: dict, threshold: float = REGRESSION_THRESHOLD) -> dict:
+    """중앙값 비율과 유의성 검정을 함께 만족해야 회귀로 판정합니다."""
+    base_med = statistics.median(baseline["samples"])
+    cur_med = statistics.median(current["samples"])
+    ratio = cur_med / base_med if base_med > 0 else 1.0
+    z = mann_whitney_z(baseline["samples"], current["samples"])
+    if ratio > 1.0 + threshold and z > SIGNIFICANCE_Z:
+        verdict = "REGRESSION"
+    elif ratio < 1.0 - threshold and z < -SIGNIFICANCE_Z:
+        verdict = "IMPROVED"
+    else:
+        verdict = "OK"
+    return {"ratio": ratio, "z": z, "verdict": verdict}
+
+def _summarize(samples: list) -> dict:
+    return {
+        "samples": samples,
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+def _fmt_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.2f}us"
+    return f"{seconds * 1e3:8.2f}ms"
+
+# =================================================================
+# 3. Runner
+# =================================================================
+
+def run_benchmarks(names: list, save: bool, threshold: float, repeats: int) -> bool:
+    _ensure_fixture_data()
+    _isolate_caches()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("benchmarks", {})
+
+    print("=" * 90)
+    print(f"{'⏱️  Hot Path Benchmark Suite':^90}")
+    print("=" * 90)
+    print(f"{'Benchmark':<28} | {'Median':>10} | {'Stdev':>10} | {'vs Base':>8} | {'z':>6} | Verdict")
+    print("-" * 90)
+
+    results = {}
+    has_regression = False
+    for name in names:
+        samples = measure(name, repeats=repeats)
+        if samples is None:
+            print(f"{name:<28} | {'(skipped: no data files)':>40}")
+            continue
+        results[name] = _summarize(samples)
+
+        if name in baseline and not save:
+            cmp = compare(baseline[name], results[name], threshold)
+            if cmp["verdict"] == "REGRESSION":
+                has_regression = True
+            print(f"{name:<28} | {_fmt_time(results[name]['median']):>10} | {_fmt_time(results[name]['stdev']):>10} | "
+                  f"{cmp['ratio']:>7.2f}x | {cmp['z']:>6.2f} | {cmp['verdict']}")
+        else:
+            print(f"{name:<28} | {_fmt_time(results[name]['median']):>10} | {_fmt_time(results[name]['stdev']):>10} | "
+                  f"{'-':>8} | {'-':>6} | {'(no baseline)' if not save else 'SAVED'}")
+
+    if save:
+        baseline.update(results)
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({
+                "meta": {
+                    "seed": SEED, "repeats": repeats, "warmup": WARMUP_RUNS,
+                    "python": platform.python_version(), "machine": platform.platform(),
+                },
+                "benchmarks": baseline,
+            }, f, indent=2)
+        print(f"\n[System] Baseline saved to {BASELINE_PATH}")
+
+    print("-" * 90)
+    if has_regression:
+        print(f"❌ FAILURE: median slowdown > {threshold * 100:.0f}% with statistical significance.")
+    else:
+        print("✅ No significant regressions.")
+    print("=" * 90)
+    return not has_regression
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="핫 패스 벤치마크 (기준선 비교)")
+    parser.add_argument("--save", "--save-baseline", dest="save", action="store_true",
+                        help="현재 측정값을 기준선(benchmarks/baseline.json)으로 저장")
+    parser.add_argument("--filter", default="", help="이름에 포함된 벤치마크만 실행")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="회귀 판정 비율 (기본 0.10)")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="표본 수")
+    args = parser.parse_args()
+
+    selected = [n for n in BENCHMARKS if args.filter in n]
+    ok = run_benchmarks(selected, save=args.save, threshold=args.threshold, repeats=args.repeats)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,107 @@
+# File: src/tests/sim_balance_profiles.py
+import sys
+import os
+import time
+import random
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.combat_simulator import simulate_duel, BUILDS, ENEMY_STATS, SIM_LEVEL
+from src.core.factory import EntityFactory
+from src.formulas.profile import BalanceProfile, DEFAULT_PROFILE
+from src.simulation import simulate_battle
+from src.systems.growth_system import GrowthSystem
+
+# 비교용 변형 (--set을 주면 그 하나만 기본 프로필과 비교)
+VARIANTS = [
+    ("crit_nerf", {"v9": {"CRIT_CAP": 0.25, "DEADLY_CRIT_CAP": 0.6}, "v61": {"MAX_CRIT_CHANCE": 0.3}}),
+    ("fortress_nerf", {"v9": {"FORTRESS_REFLECT": 0.15, "FORTRESS_REGEN": 0.01}, "v61": {"REFLECT_CAP": 0.1}}),
+    ("tanky", {"formulas": {"HP_PER_CON": 20, "HP_PER_LEVEL": 40}}),
+]
+
+# v6.1 빌드 (STR/DEX/CON/INT)
+V61_PLAYER = {"STR": 15, "DEX": 15, "CON": 15, "INT": 10}
+V61_ENEMY = {"STR": 18, "DEX": 12, "CON": 18, "INT": 10}
+
+GROWTH_CASES = [("human", "warrior"), ("orc", "warrior"), ("elf", "mage")]
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def _v9_row(profile: BalanceProfile, battles: int, seed: int) -> list:
+    """빌드별 (승률, 평균 TTK). 같은 시드이므로 차이는 프로필에서만 나옵니다."""
+    row = []
+    for _, stats in BUILDS:
+        random.seed(seed)
+        wins = turns = 0
+        for _ in range(battles):
+            duel = simulate_duel(stats, ENEMY_STATS, SIM_LEVEL, profile=profile)
+            wins += duel["win"]
+            turns += duel["turns"]
+        row.append((wins / battles, turns / battles))
+    return row
+
+def _v61_win(profile: BalanceProfile, battles: int, seed: int, level: int = 20) -> float:
+    random.seed(seed)
+    return sum(simulate_battle(V61_PLAYER, V61_ENEMY, level, profile)["win"] for _ in range(battles)) / battles
+
+def _growth(profile: BalanceProfile) -> list:
+    """v2.2 실게임 성장: Lv.50 HP/MP (프로필은 액터에 실려 GrowthSystem이 따라감)."""
+    row = []
+    for race_id, cls_id in GROWTH_CASES:
+        actor = EntityFactory.create_player(f"{race_id}_{cls_id}", race_id, cls_id, profile=profile)
+        actor.level = 50
+        GrowthSystem.refresh_stats(actor)
+        row.append((actor.max_hp, actor.max_mp))
+    return row
+
+def run_balance_profiles(battles: int = 300, seed: int = 0, spec: str = ""):
+    print("=" * 100)
+    print(f"{'🎛️  [Profile] Balance Variants Side by Side (one process, no reload)':^100}")
+    print("=" * 100)
+
+    variants = [("custom", BalanceProfile.parse(spec))] if spec else VARIANTS
+    start = time.perf_counter()
+    profiles = [DEFAULT_PROFILE] + [DEFAULT_PROFILE.derive(name, **groups) for name, groups in variants]
+    print(f" 프로필 {len(profiles)}개 생성: {(time.perf_counter() - start) * 1e3:.1f}ms | "
+          f"v9 Lv.{SIM_LEVEL} 빌드당 {battles}회 (시드 {seed})")
+
+    # 프로필 없이 돌린 결과(모듈 전역)와 기본 프로필 결과가 같아야 함
+    random.seed(seed)
+    baseline = simulate_duel(BUILDS[0][1], ENEMY_STATS, SIM_LEVEL)
+    random.seed(seed)
+    same = simulate_duel(BUILDS[0][1], ENEMY_STATS, SIM_LEVEL, profile=DEFAULT_PROFILE) == baseline
+    print(f" 기본 프로필 == 전역 상수 결과: {'✅' if same else '❌'}")
+
+    names = [name.split("(")[0].strip() for name, _ in BUILDS]
+    print("-" * 100)
+    print(f"{'Profile':<14} | " + " | ".join(f"{n:>14}" for n in names) + f" | {'v6.1 Win%':>9}")
+    for profile in profiles:
+        start = time.perf_counter()
+        row = _v9_row(profile, battles, seed)
+        v61 = _v61_win(profile, battles, seed)
+        cells = " | ".join(f"{win * 100:>5.1f}% {ttk:>5.1f}T" for win, ttk in row)
+        print(f"{profile.name:<14} | {cells} | {v61 * 100:>8.1f}%  ({time.perf_counter() - start:.2f}s)")
+
+    print("-" * 100)
+    print(f"{'Profile':<14} | " + " | ".join(f"{r}/{c} Lv.50 HP/MP".rjust(22) for r, c in GROWTH_CASES))
+    for profile in profiles:
+        print(f"{profile.name:<14} | " + " | ".join(f"{hp:>13} / {mp:<6}" for hp, mp in _growth(profile)))
+
+    print("-" * 100)
+    for profile in profiles[1:]:
+        changed = {group: values for group, values in profile.overrides.items() if values}
+        print(f" {profile.name:<14} {profile.fingerprint()[:10]}  {changed}")
+    print("=" * 100)
+    return profiles
+
+if __name__ == "__main__":
+    run_balance_profiles(
+        battles=_arg("--battles", 300),
+        seed=_arg("--seed", 0),
+        spec=_arg("--set", ""),
+    )
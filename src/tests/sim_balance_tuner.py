@@ -0,0 +1,89 @@
+# File: src/tests/sim_balance_tuner.py
+import sys
+import os
+import json
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.sim.balance_tuner import (BalanceTuner, TUNABLE, TARGET_TTK_MIN, TARGET_TTK_MAX,
+                                   MIN_CLASS_AP_GAP_PERCENT)
+from src.utils.data_loader import DataLoader
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def _print_audit(label: str, audit, limit: int = 6):
+    levels = " / ".join(f"Lv.{lv} {ttk:.1f}" for lv, ttk in audit.ttk_by_level.items())
+    verdict = "✅ PASS" if audit.passed else f"❌ FAIL ({len(audit.violations)}건)"
+    print(f" [{label:<7}] 평균 TTK {levels} | AP 격차 {audit.ap_gap:.1f}% | 성장 HP x{audit.growth('hp'):.1f} "
+          f"AP x{audit.growth('ap'):.1f} | 손실 {audit.loss:.4f} | {verdict}")
+    for violation in audit.violations[:limit]:
+        print(f"           - {violation}")
+    if len(audit.violations) > limit:
+        print(f"           - ... 외 {len(audit.violations) - limit}건")
+
+def run_balance_tuner(params: str = "", evals: int = 600, out: str = "", bounds: str = "0,4"):
+    """bounds: 기본값 대비 배율 하한,상한 (예: "0.5,3"이면 레벨 성장 계수를 절반 아래로 내리지 않음)."""
+    print("=" * 110)
+    print(f"{'🎯 [Tuner] Solve Balance Constants for Audit Thresholds (Nelder-Mead + Bisection)':^110}")
+    print("=" * 110)
+    if not DataLoader.load_json("races.json") or not DataLoader.load_json("classes.json"):
+        print("❌ 종족/직업 데이터가 비어있습니다!")
+        return None
+
+    lo, hi = (float(v) for v in bounds.split(","))
+    tuner = BalanceTuner([p for p in params.split(",") if p] or TUNABLE, bounds=(lo, hi))
+    print(f" 목표: 모든 셀 TTK {TARGET_TTK_MIN}~{TARGET_TTK_MAX}턴, 전사/도적 AP 격차 >= {MIN_CLASS_AP_GAP_PERCENT}% | "
+          f"셀 {len(tuner.cells)}개 x Lv.{'/'.join(str(lv) for lv in tuner.levels)} | 배율 범위 x{lo:g}~x{hi:g}")
+
+    before = tuner.evaluate(tuner.defaults)
+    result = tuner.solve(max_evals=evals)
+    print(f" 탐색: {result.evaluations}회 평가, {result.elapsed:.2f}s "
+          f"({result.elapsed / max(1, result.evaluations) * 1e3:.2f}ms/평가)")
+    print("-" * 110)
+    _print_audit("before", before)
+    _print_audit("after", result.audit)
+
+    print("-" * 110)
+    print(f"{'Parameter':<26} | {'Default':>9} | {'Tuned':>9} | {'Change':>7}")
+    for param in tuner.params:
+        default, value = tuner.defaults[param], result.values[param]
+        change = f"{(value / default - 1) * 100:+6.1f}%" if default else "    n/a"
+        print(f"{param:<26} | {default:>9g} | {value:>9g} | {change:>7}")
+
+    print("-" * 110)
+    report = tuner.sensitivity(result.values)
+    metrics = list(report[0].elasticity) if report else []
+    print(f" [민감도] 탄력성 = 파라미터 1% 변화당 지표 변화율(%) | 허용 구간 = 다른 값 고정 시 감사 통과 범위")
+    print(f"{'Parameter':<26} | " + " | ".join(f"{m:>9}" for m in metrics) + f" | {'Feasible range':>20}")
+    for entry in report:
+        cells = " | ".join(f"{entry.elasticity.get(m, 0.0):>+9.3f}" for m in metrics)
+        if entry.inert:
+            span = "inert (감사와 무관)"
+        elif entry.feasible:
+            span = f"{entry.feasible[0]:.3g} ~ {entry.feasible[1]:.3g}"
+        else:
+            span = "n/a (미통과)"
+        print(f"{entry.param:<26} | {cells} | {span:>20}")
+
+    print("-" * 110)
+    print(f" --set 용: {result.spec()}")
+    if out:
+        constants = {p.split(".", 1)[1]: v for p, v in result.values.items() if p.startswith("formulas.")}
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump({"constants": constants}, f, ensure_ascii=False, indent=2)
+        print(f" formulas.json 형식으로 저장: {out} (v9/v61/v22 상수는 --set 문자열 참고)")
+    print("=" * 110)
+    return result
+
+if __name__ == "__main__":
+    run_balance_tuner(
+        params=_arg("--params", ""),
+        evals=_arg("--evals", 600),
+        out=_arg("--out", ""),
+        bounds=_arg("--bounds", "0,4"),
+    )
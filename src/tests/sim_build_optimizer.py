@@ -0,0 +1,42 @@
+# File: src/tests/sim_build_optimizer.py
+import sys
+import os
+import time
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.combat_simulator import ENEMY_STATS, SIM_LEVEL
+from src.sim.build_optimizer import BuildOptimizer
+
+def run_build_optimizer():
+    print("=" * 90)
+    print(f"{'🧬 [Optimizer] Pareto-Optimal Builds (v9 Formulas)':^90}")
+    print("=" * 90)
+
+    # 목표 적 집합: 밸런스형 엘리트 + 탱커형 + 회피형
+    enemies = [
+        ENEMY_STATS,
+        {"strength": 14, "dex": 8, "con": 26},
+        {"strength": 12, "dex": 24, "con": 12},
+    ]
+
+    start = time.perf_counter()
+    optimizer = BuildOptimizer(enemies, level=SIM_LEVEL, stat_total=45, stat_min=5, battles=200)
+    front = optimizer.optimize()
+    elapsed = time.perf_counter() - start
+
+    print(f" 후보 {len(optimizer.evaluated)}개 해석적 평가 -> {optimizer.sim_calls}개 시뮬레이션 ({elapsed:.1f}s)")
+    print("-" * 90)
+    print(f"{'Build (STR/DEX/CON [gear])':<46} | {'Eff. Stats':<10} | {'Win%':>6} | {'TTK':>5} | {'Est.Win':>7}")
+    print("-" * 90)
+    for ev in front:
+        eff = "/".join(str(v) for v in ev.effective)
+        print(f"{ev.candidate.label():<46} | {eff:<10} | {ev.win_rate * 100:>5.1f}% | {ev.ttk:>5.1f} | {ev.est_win * 100:>6.1f}%")
+    print("=" * 90)
+
+if __name__ == "__main__":
+    run_build_optimizer()
@@ -13,9 +13,28 @@ for path in [project_root, cwd]:
         sys.path.insert(0, path)
 
 from src.core.factory import EntityFactory
+from src.formulas.book import FORMULAS
 from src.systems.growth_system import GrowthSystem
+from src.utils.data_loader import DataLoader
+from src.utils.sim_cache import SimCache
 
-def run_tdd_simulation():
+GROWTH_VERSION = 1  # _measure_growth 계산 방식을 바꾸면 올림 (캐시 무효화)
+
+def _measure_growth(race_id: str, cls_id: str) -> dict:
+    player = EntityFactory.create_player(f"{race_id}_{cls_id}", race_id, cls_id)
+    # Lv.1 초기 상태 기록
+    result = {"init_hp": player.max_hp, "init_mp": player.max_mp}
+
+    # Lv.50 만레벨 시뮬레이션 (성장 곡선의 끝단 확인)
+    player.level = 50
+    GrowthSystem.refresh_stats(player)
+    result.update(final_hp=player.max_hp, final_mp=player.max_mp,
+                  final_str=GrowthSystem.get_scaled_stat(player, "strength"),
+                  final_int=GrowthSystem.get_scaled_stat(player, "intelligence"))
+    return result
+
+def run_tdd_simulation(use_cache: bool = True):
+    cache = SimCache("class_growth", GROWTH_VERSION, FORMULAS.fingerprint(), enabled=use_cache)
     print("=" * 70)
     print("🧪 [TDD Simulation] Race & Class Synergy Matrix")
     print("=" * 70)
@@ -36,25 +55,17 @@ def run_tdd_simulation():
         print("-" * 45)
         
         try:
-            player = EntityFactory.create_player(f"{race_id}_{cls_id}", race_id, cls_id)
+            growth = cache.fetch(lambda: _measure_growth(race_id, cls_id),
+                                 race=DataLoader.load_race(race_id), cls=DataLoader.load_class(cls_id))
         except Exception as e:
             print(f"❌ 생성 실패: {race_id}/{cls_id} - {e}")
             import traceback
             traceback.print_exc()
             continue
             
-        # Lv.1 초기 상태 기록
-        init_hp = player.max_hp
-        init_mp = player.max_mp
-        
-        # Lv.50 만레벨 시뮬레이션 (성장 곡선의 끝단 확인)
-        player.level = 50
-        GrowthSystem.refresh_stats(player)
-        
-        final_hp = player.max_hp
-        final_mp = player.max_mp
-        final_str = GrowthSystem.get_scaled_stat(player, "strength")
-        final_int = GrowthSystem.get_scaled_stat(player, "intelligence")
+        init_hp, init_mp = growth["init_hp"], growth["init_mp"]
+        final_hp, final_mp = growth["final_hp"], growth["final_mp"]
+        final_str, final_int = growth["final_str"], growth["final_int"]
         
         print(f" [Lv.1  -> Lv.50] Result")
         print(f"  - HP: {init_hp} -> {final_hp} (Growth: x{final_hp/init_hp:.2f})")
@@ -81,9 +92,10 @@ def run_tdd_simulation():
             else:
                 print(" ❌ FAIL: Orc Mage Mana is too high for their low intelligence.")
 
-    print("\n" + "=" * 70)
+    print("\n" + cache.summary())
+    print("=" * 70)
     print("🏆 SIMULATION COMPLETE: Race/Class Matrix Analysis Finished.")
     print("=" * 70)
 
 if __name__ == "__main__":
-    run_tdd_simulation()
\ No newline at end of file
+    run_tdd_simulation(use_cache="--no-cache" not in sys.argv)
\ No newline at end of file
@@ -0,0 +1,124 @@
+# File: src/tests/sim_counter_rng.py
+import sys
+import os
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.combat_simulator import simulate_duel, BUILDS, ENEMY_STATS, SIM_LEVEL
+from src.core.factory import EntityFactory
+from src.simulation import simulate_battle
+from src.systems.ai_system import AISystem
+from src.systems.combat_system import CombatSystem
+from src.utils.rng import CounterRNG, np
+
+V61_PLAYER = {"STR": 15, "DEX": 15, "CON": 15, "INT": 10}
+V61_ENEMY = {"STR": 18, "DEX": 12, "CON": 18, "INT": 10}
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def _v9(seed: int, battle: int) -> tuple:
+    """v9 전투 하나 (빌드는 전투 번호로 순환). 결과 전체를 튜플로 비교."""
+    _, stats = BUILDS[battle % len(BUILDS)]
+    duel = simulate_duel(stats, ENEMY_STATS, SIM_LEVEL, rolls=CounterRNG(seed).battle(battle))
+    return duel["win"], duel["turns"], tuple(duel["damages"]), tuple(duel["reflects"])
+
+def _v61(seed: int, battle: int) -> tuple:
+    res = simulate_battle(V61_PLAYER, V61_ENEMY, 20, rolls=CounterRNG(seed).battle(battle))
+    return res["win"], res["turns"], tuple(res["hit_damages"])
+
+def _live(seed: int, battle: int, monster_id: str = "brown_bear") -> tuple:
+    """v2.2 실게임 전투 (CombatSystem.process_action + AISystem). 판정 키는 uuid가 아닌 자리 이름."""
+    player = EntityFactory.create_player("Hero", "human", "warrior")
+    monster = EntityFactory.create_monster(monster_id)
+    if monster is None:
+        return ()
+    ctx = CombatSystem.initialize_combat([player], [monster], CounterRNG(seed).battle(battle))
+    actors = {player.id: (player, monster), monster.id: (monster, player)}
+    for _ in range(200):
+        attacker, defender = actors[ctx.turn_order[ctx.current_turn_index]]
+        CombatSystem.process_action(attacker, defender, AISystem.choose_skill(attacker, defender), ctx)
+        if defender.current_hp <= 0:
+            break
+        ctx.current_turn_index = (ctx.current_turn_index + 1) % len(ctx.turn_order)
+        if ctx.current_turn_index == 0:
+            ctx.round_count += 1
+    return ctx.round_count, player.current_hp, monster.current_hp, tuple(ctx.combat_logs)
+
+CORES = {"v9": _v9, "v6.1": _v61, "v2.2 live": _live}
+
+def _shard(args) -> dict:
+    core, seed, battles = args
+    return {b: CORES[core](seed, b) for b in battles}
+
+def run_counter_rng(seed: int = 7, battles: int = 400, workers: int = 2):
+    print("=" * 100)
+    print(f"{'🎲 [RNG] Counter-Based Rolls: Serial vs Shuffled vs Sharded vs Isolated Replay':^100}")
+    print("=" * 100)
+    print(f" 시드 {seed} | 코어별 {battles}전투 | 샤드 {workers}개 (프로세스)")
+    print(f"{'Core':<10} | {'Serial':>8} | {'Shuffled':>8} | {'Sharded':>8} | {'Replay':>8}")
+    print("-" * 100)
+
+    all_ok = True
+    for core, fight in CORES.items():
+        ids = list(range(battles))
+        start = time.perf_counter()
+        serial = {b: fight(seed, b) for b in ids}
+        elapsed = time.perf_counter() - start
+        if not any(serial.values()):
+            print(f"{core:<10} | (데이터 없음 - 건너뜀)")
+            continue
+
+        # 1. 순서를 섞어도 (다른 전투가 전역 random을 마구 써도) 같은 결과
+        shuffled_ids = ids[:]
+        random.Random(seed).shuffle(shuffled_ids)
+        shuffled = {}
+        for b in shuffled_ids:
+            random.random()
+            shuffled[b] = fight(seed, b)
+
+        # 2. 프로세스 샤딩 (전투 번호 i % workers)
+        sharded = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_shard, [(core, seed, ids[w::workers]) for w in range(workers)]):
+                sharded.update(part)
+
+        # 3. 임의의 전투 하나만 단독 재생
+        probe = shuffled_ids[:5]
+        replay_ok = all(fight(seed, b) == serial[b] for b in probe)
+        ok = shuffled == serial and sharded == serial and replay_ok
+        all_ok &= ok
+        mark = lambda same: "✅ same" if same else "❌ diff"
+        print(f"{core:<10} | {elapsed:>7.2f}s | {mark(shuffled == serial):>8} | {mark(sharded == serial):>8} | "
+              f"{mark(replay_ok):>8}")
+
+    print("-" * 100)
+    if np is not None:
+        rng = CounterRNG(seed)
+        b_ids, rounds = np.arange(2000)[:, None], np.arange(1, 101)[None, :]
+        start = time.perf_counter()
+        grid = rng.batch(b_ids, rounds, "P", "hit")
+        t_batch = time.perf_counter() - start
+        start = time.perf_counter()
+        sample = [[rng.random(b, r, "P", "hit") for r in range(1, 101)] for b in range(200)]
+        t_scalar = (time.perf_counter() - start) * 10
+        same = bool((grid[:200] == np.array(sample)).all())
+        print(f" [batch] 2000전투 x 100라운드 명중 난수: NumPy {t_batch * 1e3:.1f}ms vs 스칼라 {t_scalar * 1e3:.0f}ms(추정) | "
+              f"스칼라와 비트 일치: {'✅' if same else '❌'} | 평균 {grid.mean():.4f}")
+    print(f" {'✅ 모든 코어가 실행 순서/프로세스와 무관하게 재현됩니다.' if all_ok else '❌ 재현 실패'}")
+    print("=" * 100)
+    return all_ok
+
+if __name__ == "__main__":
+    run_counter_rng(
+        seed=_arg("--seed", 7),
+        battles=_arg("--battles", 400),
+        workers=_arg("--workers", 2),
+    )
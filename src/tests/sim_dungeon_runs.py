@@ -0,0 +1,64 @@
+# File: src/tests/sim_dungeon_runs.py
+import sys
+import os
+import time
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.factory import EntityFactory
+from src.utils.data_loader import DataLoader
+from src.sim.dungeon_run import DungeonRunSimulator, np
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def run_dungeon_simulation(race: str = "human", job: str = "warrior", level: int = 5, runs: int = 5000,
+                           max_floor: int = 10, rest_below: float = 0.5, seed: int = 0, vectorized=None):
+    print("=" * 90)
+    print(f"{'🌲 [Dungeon] Whole-Run Monte Carlo (DungeonState + CombatSystem v2.2)':^90}")
+    print("=" * 90)
+
+    if not DataLoader.load_json("monsters.json"):
+        print("❌ 몬스터 데이터(monsters.json)가 비어있습니다!")
+        return None
+
+    player = EntityFactory.create_player("Runner", race, job)
+    player.level = level
+    sim = DungeonRunSimulator(player, max_floor=max_floor, rest_below=rest_below)
+
+    start = time.perf_counter()
+    report = sim.run(runs, seed=seed, vectorized=vectorized)
+    elapsed = time.perf_counter() - start
+
+    mode = "NumPy 벡터화" if (vectorized if vectorized is not None else np is not None) else "순수 Python"
+    print(f" {race.title()} {job.title()} Lv.{level} | HP {sim.player.max_hp} AP {sim.player.ap} | "
+          f"{runs}회 ({mode}, {elapsed:.2f}s) | 휴식 기준 HP {rest_below * 100:.0f}%")
+    print("-" * 90)
+    print(f"{'Floor':>5} | {'Reached':>8} | {'Survived':>8} | {'Enc/Floor':>9} | {'Exit HP':>7} | {'Deaths':>6} | {'(Combat)':>8}")
+    print("-" * 90)
+    for f in range(1, max_floor + 1):
+        if not report.entered[f]:
+            break
+        print(f"{f:>5} | {report.entered[f] / runs * 100:>7.1f}% | {report.survival(f) * 100:>7.1f}% | "
+              f"{report.encounters_per_floor(f):>9.2f} | {report.mean_exit_hp(f) * 100:>6.1f}% | "
+              f"{report.deaths[f]:>6} | {report.combat_deaths[f]:>8}")
+    print("-" * 90)
+    print(f" 절반 이상이 도달한 최심층: 지하 {report.deepest_median_floor()}층")
+    print("=" * 90)
+    return report
+
+if __name__ == "__main__":
+    run_dungeon_simulation(
+        race=_arg("--race", "human"),
+        job=_arg("--class", "warrior"),
+        level=_arg("--level", 5),
+        runs=_arg("--runs", 5000),
+        max_floor=_arg("--floors", 10),
+        rest_below=_arg("--rest-below", 0.5),
+        seed=_arg("--seed", 0),
+        vectorized=False if "--python" in sys.argv else None,
+    )
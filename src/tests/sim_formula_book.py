@@ -0,0 +1,77 @@
+# File: src/tests/sim_formula_book.py
+import sys
+import os
+import time
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.config import MAX_LEVEL
+from src.formulas.book import FORMULAS, DEFAULT_FORMULAS, FormulaBook
+from src.formulas.dsl import FormulaError, np
+from src.utils.data_loader import DataLoader
+
+LEVELS = [1, 5, 10, 20, 30, 40, 50]
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def run_formula_book(base_stat: int = 14, calls: int = 200_000):
+    print("=" * 100)
+    print(f"{'📐 [Formula] Data-Driven Balance Formulas (formulas.json -> compiled)':^100}")
+    print("=" * 100)
+
+    data = DataLoader.load_json(FormulaBook.DATA_FILE)
+    try:
+        FORMULAS.reload()
+    except FormulaError as e:
+        print(f"❌ {FormulaBook.DATA_FILE} 오류: {e}")
+        return None
+
+    overridden = set(data.get("formulas", {})) if data else set()
+    print(f" 데이터 파일: {FormulaBook.DATA_FILE} ({'있음' if data else '없음 - 기본값 사용'}) | "
+          f"상수 {len(FORMULAS.constants)}개 | 공식 {len(FORMULAS.compiled)}개")
+    print("-" * 100)
+    print(f"{'Formula':<14} | {'Src':<7} | Compiled (상수 접기 후)")
+    print("-" * 100)
+    for name, formula in FORMULAS.compiled.items():
+        origin = "data" if name in overridden else "default" if name in DEFAULT_FORMULAS else "custom"
+        print(f"{name:<14} | {origin:<7} | ({', '.join(formula.params)}) -> {formula.source}")
+
+    # 레벨 곡선: 기본 스탯 base_stat인 캐릭터의 레벨별 파생 능력치
+    print("-" * 100)
+    print(f" 기본 스탯 {base_stat} 캐릭터 레벨 곡선")
+    print(f"{'LV':>4} | {'Stat':>5} | {'HP':>6} | {'MP':>5} | {'AP':>5} | {'Evasion':>7} | {'Defense':>7} | {'Crit':>6}")
+    for level in LEVELS:
+        stat = FORMULAS.stat_at_level(base_stat, level)
+        print(f"{level:>4} | {stat:>5} | {FORMULAS.max_hp(stat, level):>6} | {FORMULAS.max_mp(stat, level):>5} | "
+              f"{FORMULAS.attack_power(stat, level):>5} | {FORMULAS.evasion(stat) * 100:>6.1f}% | "
+              f"{FORMULAS.defense(stat) * 100:>6.1f}% | {FORMULAS.crit_chance(stat) * 100:>5.1f}%")
+
+    # 호출 비용: 스칼라 컴파일 함수 vs 전 레벨 x 전 스탯 격자를 배열로 한 번에
+    print("-" * 100)
+    max_hp = FORMULAS.max_hp
+    start = time.perf_counter()
+    for i in range(calls):
+        max_hp(i & 63, 20)
+    scalar = (time.perf_counter() - start) / calls
+    line = f" max_hp 스칼라 호출: {scalar * 1e9:.0f}ns"
+    if np is not None:
+        stats, levels = np.meshgrid(np.arange(1, 101), np.arange(1, MAX_LEVEL + 1))
+        vec = FORMULAS.vectorized("max_hp")
+        start = time.perf_counter()
+        grid = vec(stats, levels)
+        elapsed = time.perf_counter() - start
+        line += f" | NumPy 격자 {grid.size}칸: {elapsed * 1e6:.0f}µs ({elapsed / grid.size * 1e9:.1f}ns/칸)"
+    print(line)
+    print("=" * 100)
+    return FORMULAS.compiled
+
+if __name__ == "__main__":
+    run_formula_book(
+        base_stat=_arg("--stat", 14),
+        calls=_arg("--calls", 200_000),
+    )
@@ -0,0 +1,79 @@
+# File: src/tests/sim_formula_versions.py
+import sys
+import os
+import time
+import random
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.formulas.engine import FormulaEngine, rng_roll
+
+# 비교할 빌드 (버전 공통 스탯 이름)
+BUILDS = [
+    ("Berserker (STR 25)", {"strength": 25, "dexterity": 8, "constitution": 10, "intelligence": 5}),
+    ("Assassin  (DEX 25)", {"strength": 10, "dexterity": 25, "constitution": 8, "intelligence": 5}),
+    ("Tanker    (CON 25)", {"strength": 10, "dexterity": 8, "constitution": 25, "intelligence": 5}),
+    ("Balanced  (15/15/15)", {"strength": 15, "dexterity": 15, "constitution": 15, "intelligence": 10}),
+]
+
+# 엘리트 몹 상정
+RIVAL = {"strength": 18, "dexterity": 12, "constitution": 18, "intelligence": 10}
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def run_formula_versions(level: int = 20, battles: int = 2000, seed: int = 0, versions: str = ""):
+    print("=" * 100)
+    print(f"{'⚖️  [Formula] Same Builds, Different Formula Sets (FormulaEngine)':^100}")
+    print("=" * 100)
+    selected = [v for v in versions.split(",") if v] or FormulaEngine.versions()
+    print(f" Lv.{level} | 상대 STR {RIVAL['strength']} DEX {RIVAL['dexterity']} CON {RIVAL['constitution']} | "
+          f"빌드당 {battles}회 (시드 {seed})")
+
+    results = {}
+    for version in selected:
+        formula = FormulaEngine.get(version)
+        print("-" * 100)
+        print(f"[{version}] {type(formula).__name__}")
+        print(f"{'Build':<22} | {'Win%':>6} | {'Rounds':>6} | {'Hit%':>6} | {'Crit%':>6} | {'AvgDmg':>7} | "
+              f"{'Reflect':>7} | {'µs/duel':>7}")
+        for name, stats in BUILDS:
+            a = formula.create("A", stats, level)
+            b = formula.create("B", RIVAL, level)
+            roll = rng_roll(random.Random(seed))
+            wins = rounds = attempts = hits = crits = damage = reflect = 0
+
+            start = time.perf_counter()
+            for _ in range(battles):
+                res = FormulaEngine.duel(formula, a, b, roll_a=roll, roll_b=roll)
+                wins += res.win
+                rounds += res.rounds
+                attempts += res.attempts
+                hits += res.hits
+                crits += res.crits
+                damage += sum(res.damages)
+                reflect += sum(res.reflects)
+            elapsed = time.perf_counter() - start
+
+            results[(version, name.strip())] = wins / battles
+            print(f"{name:<22} | {wins / battles * 100:>5.1f}% | {rounds / battles:>6.1f} | "
+                  f"{hits / max(1, attempts) * 100:>5.1f}% | {crits / max(1, hits) * 100:>5.1f}% | "
+                  f"{damage / max(1, hits):>7.1f} | {reflect / max(1, hits):>7.1f} | "
+                  f"{elapsed / battles * 1e6:>7.1f}")
+
+    print("-" * 100)
+    print(" 모든 버전이 같은 결투 루프(A 선공, 반사 사망 판정, 피격 재생)를 쓰므로 차이는 공식 세트에서만 나옵니다.")
+    print("=" * 100)
+    return results
+
+if __name__ == "__main__":
+    run_formula_versions(
+        level=_arg("--level", 20),
+        battles=_arg("--battles", 2000),
+        seed=_arg("--seed", 0),
+        versions=_arg("--versions", ""),
+    )
@@ -10,22 +10,46 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from src.core.factory import EntityFactory
+from src.formulas.book import FORMULAS
+from src.sim.balance_tuner import MIN_CLASS_AP_GAP_PERCENT, MAX_DOMINANCE_SCORE, TARGET_TTK_MIN, TARGET_TTK_MAX
 from src.systems.growth_system import GrowthSystem
 from src.systems.skill_system import SkillSystem
 from src.utils.data_loader import DataLoader
+from src.utils.result_store import ResultStore
+from src.utils.sim_cache import SimCache
 
 # --- 밸런스 실패 임계값 (Thresholds) ---
-MIN_CLASS_AP_GAP_PERCENT = 15.0  # 전사 vs 도적의 AP 차이는 최소 15% 이상이어야 함
-MAX_DOMINANCE_SCORE = 2         # 한 조합이 최고 기록(HP, MP, SP, DMG)을 3개 이상 차지하면 실패
-TARGET_TTK_MIN = 3              # 동급 전투 시 최소 턴 수 (너무 순삭 방지)
-TARGET_TTK_MAX = 8              # 동급 전투 시 최대 턴 수 (지루함 방지)
+# AP 격차/지배력/TTK 밴드(MIN_CLASS_AP_GAP_PERCENT 등)는 자동 조정기와 공유하므로 src/sim/balance_tuner.py에 있음
 GEAR_SCALING_FACTOR = 1.5       # 장비 장착 시 스탯 인플레이션 가중치
 
-def run_full_matrix_simulation():
+# --store 지정 시 매트릭스 행을 컬럼 저장소에 기록 (재실행 없이 사후 분석용)
+MATRIX_SCHEMA = {
+    "race": "cat", "class": "cat", "level": "h",
+    "hp": "i", "mp": "i", "ap": "i", "sp": "i", "dmg": "i", "ttk": "d", "gear_ap": "d",
+}
+
+MATRIX_VERSION = 1              # _measure_cell 계산 방식을 바꾸면 올림 (캐시 무효화)
+
+def _measure_cell(r_id: str, c_id: str, level: int, sig_skill: str) -> dict:
+    player = EntityFactory.create_player(f"{r_id}_{c_id}", r_id, c_id)
+    player.level = level
+    GrowthSystem.refresh_stats(player)
+    skill_res = SkillSystem.calculate_skill_damage(player, sig_skill)
+    return {
+        "hp": player.max_hp, "mp": player.max_mp,
+        "ap": GrowthSystem.get_attack_power(player), "sp": GrowthSystem.get_magic_power(player),
+        "dmg": skill_res.get("damage", 0),
+    }
+
+def run_full_matrix_simulation(store_path: str = None, use_cache: bool = True):
     """
     모든 조합을 조사하고, 자동화된 밸런스 감사(Audit)를 수행하는 마스터 시뮬레이션 (v13.0).
     추가 기능: 장비 스케일링 영향력 테스트, 레벨별 곡선 체크.
+    store_path: 지정 시 모든 행을 ResultStore(컬럼 파일)로도 기록합니다.
+    use_cache: 셀 결과를 SimCache로 재사용 (해당 종족/직업/스킬 데이터나 공식이 바뀐 셀만 다시 계산).
     """
+    store = ResultStore(store_path, MATRIX_SCHEMA) if store_path else None
+    cache = SimCache("full_matrix", MATRIX_VERSION, FORMULAS.fingerprint(), enabled=use_cache)
     print("=" * 125)
     print(f"{'🧪 [TDD] Race x Class Deep Balance Audit (v13.0)':^125}")
     print("=" * 125)
@@ -51,20 +75,15 @@ def run_full_matrix_simulation():
 
             # 레벨별 곡선 체크를 위해 Lv.1, 25, 50 샘플링
             for level in [1, 25, 50]:
-                player = EntityFactory.create_player(f"{r_id}_{c_id}", r_id, c_id)
-                player.level = level
-                GrowthSystem.refresh_stats(player)
-
-                hp = player.max_hp
-                mp = player.max_mp
-                ap = GrowthSystem.get_attack_power(player)
-                sp = GrowthSystem.get_magic_power(player)
+                # 셀 키 = 이 셀이 읽는 데이터 항목 내용 + 레벨 (다른 종족/직업을 고쳐도 재사용)
+                cell = cache.fetch(lambda: _measure_cell(r_id, c_id, level, sig_skill),
+                                   race=r_data[r_id], cls=class_info, skill=DataLoader.load_skill(sig_skill),
+                                   level=level)
+                hp, mp, ap, sp, dmg = cell["hp"], cell["mp"], cell["ap"], cell["sp"], cell["dmg"]
                 
                 # [Next Step] 장비 스케일링 시뮬레이션: 후반부 아이템이 붙었을 때 AP 격차
                 gear_ap = ap * (1.2 if level == 50 else 1.0) # 가상의 장비 보너스
                 
-                skill_res = SkillSystem.calculate_skill_damage(player, sig_skill)
-                dmg = skill_res.get("damage", 0)
                 ttk = hp / dmg if dmg > 0 else 99
 
                 res_entry = {
@@ -73,11 +92,18 @@ def run_full_matrix_simulation():
                     "gear_ap": gear_ap
                 }
                 matrix_results.append(res_entry)
+                if store is not None:
+                    store.append(**{k: res_entry[k] for k in MATRIX_SCHEMA if k != "level"}, level=level)
 
                 if level == 50:
                     comb_str = f"{r_id.capitalize()} {c_id.capitalize()}"
                     print(f"{comb_str:<18} | {level:<3} | {hp:6d} | {mp:6d} | {ap:5d} | {sp:5d} | {ttk:5.1f} | {gear_ap:7.0f} | {dmg:4d}")
 
+    print(cache.summary())
+    if store is not None:
+        store.close()
+        print(f"[System] Matrix rows stored to {store_path} ({store.rows} rows)")
+
     # --- 밸런스 감사 리포트 (Audit Report) ---
     print("\n" + "=" * 125)
     print(f"{'📊 AUTOMATED BALANCE AUDIT REPORT (Deep Analysis Mode)':^125}")
@@ -132,4 +158,10 @@ def run_full_matrix_simulation():
     print("=" * 125)
 
 if __name__ == "__main__":
-    run_full_matrix_simulation()
\ No newline at end of file
+    store_arg = None
+    if "--store" in sys.argv:
+        at = sys.argv.index("--store") + 1
+        if at >= len(sys.argv) or sys.argv[at].startswith("--"):
+            sys.exit("usage: sim_full_matrix.py [--store <PATH>] [--no-cache]")
+        store_arg = sys.argv[at]
+    run_full_matrix_simulation(store_arg, use_cache="--no-cache" not in sys.argv)
\ No newline at end of file
@@ -0,0 +1,118 @@
+# File: src/tests/sim_replay.py
+import sys
+import os
+import gzip
+import json
+import time
+import random
+import tempfile
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.console import NullRenderer
+from src.core.context import GameContext
+from src.core.replay import Replayer, apply_delta, record_session
+from src.states.dungeon_state import DungeonState
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+class Bot:
+    """상태 스택 맨 위를 보고 입력을 고르는 자동 플레이어 (게임 난수와 별도의 rng 사용)."""
+
+    def __init__(self, steps: int, seed: int):
+        self.steps = steps
+        self.rng = random.Random(seed)
+        self.count = 0
+
+    def __call__(self, prompt: str) -> str:
+        self.count += 1
+        if self.count > self.steps:
+            return "quit"
+        if prompt.strip() != ">>":
+            return "1" if "내려간다" in prompt else ""   # 계단 선택 / 엔터 대기
+        state = GameContext.console.machine.stack[-1]
+        name = type(state).__name__
+        player = GameContext.get_player()
+        if name == "TitleState":
+            return "1"
+        if name == "CharacterCreationState":
+            return ["Bot", "1", "1", "y"][state.step]
+        hp = player.current_hp / max(1, player.max_hp)
+        if name == "TownState":
+            if not GameContext.auto_battle and self.rng.random() < 0.5:
+                return "6"
+            return "4" if hp < 0.6 else "1"
+        if name == "DungeonState":
+            if hp < 0.3:
+                return "3"
+            return "2" if self.rng.random() < 0.2 else "1"
+        if name == "CombatState":
+            return self.rng.choice("1112")
+        return ""
+
+def run_replay(steps: int = 3000, seed: int = 42, bot_seed: int = 0):
+    print("=" * 100)
+    print(f"{'📼 [Replay] Record a Bot Session, Replay It Headless With State-Hash Checks':^100}")
+    print("=" * 100)
+    path = os.path.join(tempfile.mkdtemp(), "session.replay.gz")
+
+    # 1. 기록 (봇 입력, 화면 출력/대기 없음)
+    start = time.perf_counter()
+    recorder = record_session(path, seed, Bot(steps, bot_seed), renderer=NullRenderer(), realtime=False)
+    t_record = time.perf_counter() - start
+    size = os.path.getsize(path)
+    with gzip.open(path, "rb") as f:
+        raw = len(f.read())
+    transitions = sum(1 for step in recorder.steps if len(step) > 2 and "stack" in step[2])
+    print(f" 기록: 입력 {len(recorder.steps)}개, 상태 전이 {transitions}회, 전투 {GameContext.battle_count}회 | "
+          f"{t_record * 1e3:.0f}ms | 시드 {seed}")
+
+    # 변경분 인코딩 효과: 매 스텝 전체 스냅샷을 넣었을 때와 비교
+    data = Replayer.load(path).data
+    full, snap = [], {}
+    for step in data["steps"]:
+        if len(step) > 2:
+            snap = apply_delta(snap, step[2])
+        full.append([step[0], step[1], snap])
+    full_size = len(json.dumps({"steps": full}, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    print(f" 파일: {size:,}B gzip ({size / max(1, len(recorder.steps)):.1f}B/스텝) | JSON {raw:,}B "
+          f"(전체 스냅샷 방식이면 {full_size:,}B)")
+
+    # 2. 재생 (같은 시드) - 모든 스텝 해시 일치해야 함
+    print("-" * 100)
+    report = Replayer.load(path).run()
+    print(f" 재생: {report.steps}/{report.total} 스텝 {report.elapsed * 1e3:.0f}ms "
+          f"({report.steps / max(report.elapsed, 1e-9):,.0f} 스텝/s) | {'✅ 모든 해시 일치' if report.ok else '❌ 불일치'}")
+
+    # 3. 분기 탐지: 시드를 바꾸거나 밸런스 수치를 바꾸면 처음 달라진 스텝과 필드를 보고
+    for label, tamper in [("시드 +1", lambda: Replayer.load(path).run(seed=seed + 1)),
+                          ("휴식 중 기습 30% -> 50%", None)]:
+        if tamper is None:
+            original = DungeonState.AMBUSH_CHANCE
+            DungeonState.AMBUSH_CHANCE = 0.5
+            try:
+                bad = Replayer.load(path).run()
+            finally:
+                DungeonState.AMBUSH_CHANCE = original
+        else:
+            bad = tamper()
+        if bad.ok:
+            print(f" [{label}] 분기 없음 (세션에 해당 판정이 없었음)")
+            continue
+        diff = ", ".join(f"{k}: {e!r} -> {a!r}" for k, (e, a) in list(bad.mismatches().items())[:4])
+        print(f" [{label}] 스텝 {bad.diverged_at}에서 분기 ({bad.elapsed * 1e3:.0f}ms) | {diff}")
+    print("=" * 100)
+    os.remove(path)
+    return report
+
+if __name__ == "__main__":
+    run_replay(
+        steps=_arg("--steps", 3000),
+        seed=_arg("--seed", 42),
+        bot_seed=_arg("--bot-seed", 0),
+    )
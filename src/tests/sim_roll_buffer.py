@@ -0,0 +1,102 @@
+# File: src/tests/sim_roll_buffer.py
+import sys
+import os
+import time
+import random
+import timeit
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.factory import EntityFactory
+from src.formulas.engine import global_roll
+from src.systems.ai_system import AISystem
+from src.systems.combat_system import CombatSystem
+from src.systems.math_engine import MathEngine
+from src.utils.rng import RollBuffer
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def _battles(count: int, monster_id: str) -> dict:
+    """실게임 전투 count회 (CombatSystem + AISystem). 판정 통계와 로그 전체를 돌려줍니다."""
+    stats = {"wins": 0, "rounds": 0, "hits": 0, "misses": 0, "crits": 0, "logs": []}
+    for _ in range(count):
+        player = EntityFactory.create_player("Hero", "human", "warrior")
+        monster = EntityFactory.create_monster(monster_id)
+        ctx = CombatSystem.initialize_combat([player], [monster])
+        actors = {player.id: (player, monster), monster.id: (monster, player)}
+        for _ in range(200):
+            attacker, defender = actors[ctx.turn_order[ctx.current_turn_index]]
+            CombatSystem.process_action(attacker, defender, AISystem.choose_skill(attacker, defender), ctx)
+            if defender.current_hp <= 0:
+                break
+            ctx.current_turn_index = (ctx.current_turn_index + 1) % len(ctx.turn_order)
+            if ctx.current_turn_index == 0:
+                ctx.round_count += 1
+        stats["wins"] += monster.current_hp <= 0
+        stats["rounds"] += ctx.round_count
+        for line in ctx.combat_logs:
+            stats["misses"] += "피했습니다" in line
+            stats["hits"] += "피해." in line
+            stats["crits"] += "치명타" in line
+        stats["logs"].append(tuple(ctx.combat_logs))
+    return stats
+
+def _with_rolls(provider, seed: int, count: int, monster_id: str) -> tuple:
+    """provider를 MathEngine 기본 난수원으로 꽂고 전투 (이니셔티브 등 나머지는 random.seed(seed))."""
+    previous = MathEngine.use_rolls(provider)
+    try:
+        random.seed(seed)
+        start = time.perf_counter()
+        stats = _battles(count, monster_id)
+        return stats, time.perf_counter() - start
+    finally:
+        MathEngine.use_rolls(previous)
+
+def run_roll_buffer(battles: int = 2000, seed: int = 3, block: int = 1 << 16, monster_id: str = "brown_bear"):
+    print("=" * 100)
+    print(f"{'🧊 [RNG] Pre-Generated Roll Buffer vs Global random (MathEngine provider)':^100}")
+    print("=" * 100)
+    if EntityFactory.create_monster(monster_id) is None:
+        print(f" 몬스터 데이터 없음 ({monster_id}) - 종료")
+        return None
+
+    # 1. 같은 분포: 승률/명중률/치명타율이 통계적 오차 안에서 일치
+    base, t_base = _with_rolls(global_roll, seed, battles, monster_id)
+    buffer = RollBuffer(seed=seed, block=block)
+    buff, t_buff = _with_rolls(buffer.roll, seed, battles, monster_id)
+    print(f" 실게임 전투 {battles}회 (human/warrior vs {monster_id}) | 블록 {block}개, 재충전 {buffer.refills}회")
+    print(f"{'Provider':<14} | {'Win%':>6} | {'Rounds':>6} | {'Hit%':>6} | {'Crit%':>6} | {'Time':>8}")
+    print("-" * 100)
+    for name, st, t in [("global random", base, t_base), ("RollBuffer", buff, t_buff)]:
+        swings = max(1, st["hits"] + st["misses"])
+        print(f"{name:<14} | {st['wins'] / battles * 100:>5.1f}% | {st['rounds'] / battles:>6.2f} | "
+              f"{st['hits'] / swings * 100:>5.1f}% | {st['crits'] / max(1, st['hits']) * 100:>5.1f}% | {t:>7.2f}s")
+
+    # 2. 세션 시드: 같은 시드의 새 버퍼는 같은 게임을 재생
+    again, _ = _with_rolls(RollBuffer(seed=seed, block=block).roll, seed, battles, monster_id)
+    other, _ = _with_rolls(RollBuffer(seed=seed + 1, block=block).roll, seed, battles, monster_id)
+    print("-" * 100)
+    print(f" 세션 시드 {seed} 재생: {'✅ 동일' if again['logs'] == buff['logs'] else '❌ 불일치'} | "
+          f"시드 {seed + 1}: {'다른 전투 ✅' if other['logs'] != buff['logs'] else '❌ 같음'}")
+
+    # 3. 난수 1개 비용 (판정 함수가 부르는 Roll 그대로)
+    roll = RollBuffer(seed=seed, block=block).roll
+    n = 1_000_000
+    per = {name: min(timeit.repeat(lambda: fn("hit"), number=n, repeat=3)) / n * 1e9
+           for name, fn in [("global_roll", global_roll), ("RollBuffer.roll", roll)]}
+    print(" 난수 1개: " + " | ".join(f"{name} {ns:.0f}ns" for name, ns in per.items()) + " (람다 호출 포함)")
+    print("=" * 100)
+    return buffer
+
+if __name__ == "__main__":
+    run_roll_buffer(
+        battles=_arg("--battles", 2000),
+        seed=_arg("--seed", 3),
+        block=_arg("--block", 1 << 16),
+        monster_id=_arg("--monster", "brown_bear"),
+    )
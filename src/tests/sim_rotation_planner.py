@@ -0,0 +1,131 @@
+# File: src/tests/sim_rotation_planner.py
+import sys
+import os
+import time
+import random
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.factory import EntityFactory
+from src.systems.ai_system import AISystem
+from src.systems.combat_system import CombatSystem
+from src.systems.growth_system import GrowthSystem
+from src.utils.data_loader import DataLoader
+from src.sim.rotation_planner import RotationPlanner, np
+
+MAX_ROUNDS = 200
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def _fixed_order(model):
+    """sim_skill_execution식 고정 순서: MP가 되면 가장 센 스킬, 아니면 평타."""
+    strongest = model.me.skill
+    ids = {skill: sid for sid, skill in model.actions}
+    def choose(mp, enemy_ratio):
+        if strongest is not None and mp >= strongest.mp_cost:
+            return ids[strongest]
+        return "basic_attack"
+    return choose
+
+def _duel(ctx, start, rng_seed, fixed_skill=None) -> bool:
+    """실제 CombatSystem으로 1대1 결투 (플레이어 선공). fixed_skill이 있으면 MP가 될 때 그 스킬."""
+    random.seed(rng_seed)
+    ctx.restore(start)
+    player, monster = ctx.participants[0], ctx.enemies[0]
+    for _ in range(MAX_ROUNDS):
+        if fixed_skill is not None:
+            cost = DataLoader.load_skill(fixed_skill).get("cost", {}).get("mp", 0)
+            skill_id = fixed_skill if player.current_mp >= cost else "basic_attack"
+        else:
+            skill_id = AISystem.choose_skill(player, monster)
+        CombatSystem.process_action(player, monster, skill_id, ctx)
+        if monster.current_hp <= 0:
+            return True
+        CombatSystem.process_action(monster, player, "basic_attack", ctx)
+        if player.current_hp <= 0:
+            return False
+    return False
+
+def run_rotation_planner(race: str = "human", level: int = 10, battles: int = 2000, only_class: str = None,
+                         opponent: str = None):
+    print("=" * 100)
+    print(f"{'🧠 [Planner] Optimal Skill Rotation via MDP Value Iteration':^100}")
+    print("=" * 100)
+
+    classes = DataLoader.load_json("classes.json")
+    if not classes or not DataLoader.load_json("monsters.json"):
+        print("❌ 직업/몬스터 데이터가 비어있습니다!")
+        return None
+
+    backend = "NumPy" if np is not None else "순수 Python"
+    print(f" {race.title()} Lv.{level} | 상대: {opponent or '전투력이 가장 비슷한 몬스터'} | 실전 검증 {battles}회 | 백엔드 {backend}")
+    print("-" * 100)
+    print(f"{'Class':<12} | {'Opponent':<14} | {'Solve':>7} | {'Load':>7} | {'Basic':>6} | {'Fixed':>6} | "
+          f"{'Optimal':>7} | {'Real Fixed':>10} | {'Real Opt':>8}")
+    print("-" * 100)
+
+    results = {}
+    for class_id in classes:
+        if only_class and class_id != only_class:
+            continue
+        player = EntityFactory.create_player("Planner", race, class_id)
+        player.level = level
+        GrowthSystem.refresh_stats(player)
+        rival = opponent or RotationPlanner.default_opponent(player)
+        if rival is None:
+            continue
+
+        monster = EntityFactory.create_monster(rival)
+        if monster is None or not RotationPlanner.supports(monster):
+            print(f"{class_id:<12} | {rival:<14} | (없는 몬스터이거나 스킬을 쓰는 몬스터 - 건너뜀)")
+            continue
+        model = RotationPlanner.model_for(player, monster)
+        start = time.perf_counter()
+        model.policy()
+        solve_time = time.perf_counter() - start
+
+        # 캐시 적중 비용: 디스크 캐시에서 직업 정책 불러오기
+        RotationPlanner.class_policy(class_id, race, level, rival)
+        RotationPlanner.clear_cache()
+        start = time.perf_counter()
+        policy = RotationPlanner.class_policy(class_id, race, level, rival)
+        load_time = time.perf_counter() - start
+
+        basic = model.evaluate(lambda mp, enemy_ratio: "basic_attack")
+        fixed = model.evaluate(_fixed_order(model))
+
+        # 실전 검증: 같은 시드로 고정 순서 vs 최적 정책 (전투마다 시작 스냅샷으로 복원)
+        strongest = next((sid for sid, s in model.actions if s == model.me.skill), None)
+        player.current_hp, player.current_mp = player.max_hp, player.max_mp
+        ctx = CombatSystem.initialize_combat([player], [monster])
+        start = ctx.snapshot()
+        AISystem.set_policy(player, policy)
+        real_opt = sum(_duel(ctx, start, seed) for seed in range(battles)) / battles
+        AISystem.set_policy(player, None)
+        real_fixed = sum(_duel(ctx, start, seed, strongest or "basic_attack") for seed in range(battles)) / battles
+
+        results[class_id] = policy
+        print(f"{class_id:<12} | {rival:<14} | {solve_time * 1000:>5.0f}ms | {load_time * 1000:>5.1f}ms | "
+              f"{basic * 100:>5.1f}% | {fixed * 100:>5.1f}% | {policy.win_chance * 100:>6.1f}% | "
+              f"{real_fixed * 100:>9.1f}% | {real_opt * 100:>7.1f}%")
+        usage = ", ".join(f"{sid} {share * 100:.0f}%" for sid, share in policy.usage().items())
+        print(f"{'':<12} └ 상태별 선택 비율: {usage}")
+
+    print("-" * 100)
+    print(" Basic/Fixed/Optimal: 모델(구간 근사) 승률 | Real: CombatSystem 실전 승률")
+    print("=" * 100)
+    return results
+
+if __name__ == "__main__":
+    run_rotation_planner(
+        race=_arg("--race", "human"),
+        level=_arg("--level", 10),
+        battles=_arg("--battles", 2000),
+        only_class=_arg("--class", ""),
+        opponent=_arg("--opponent", ""),
+    )
@@ -0,0 +1,86 @@
+# File: src/tests/sim_v9_sweep.py
+import sys
+import os
+import time
+
+# 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, "../../"))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.combat_simulator import ENEMY_STATS
+from src.formulas.v9 import V9Formula
+from src.sim.v9_sweep import V9Sweep, np
+
+def _arg(name: str, default):
+    return type(default)(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+def _print_heatmap(sweep: V9Sweep, metric: str, x: str, y: str, fixed: dict):
+    plane = sweep.heatmap(metric, x, y, fixed)
+    xs, ys = sweep.axes[x], sweep.axes[y]
+    scale, fmt = (100, "{:>4.0f}") if metric in ("win", "est_win") else (1, "{:>4.1f}")
+    print(f"{y.upper():>5} \\ {x.upper():<5}" + "".join(f"{v:>5}" for v in xs))
+    for j, yv in enumerate(ys):
+        print(f"{yv:>11} " + "".join(" " + fmt.format(plane[j, i] * scale) for i in range(len(xs))))
+
+def run_v9_sweep(lo: int = 5, hi: int = 35, step: int = 2, levels: str = "20", samples: int = 400,
+                 x: str = "strength", y: str = "dex", fixed: str = "", tweak: str = ""):
+    print("=" * 100)
+    print(f"{'🗺️  [Sweep] v9 Keystone Formulas over STR x DEX x CON x Level (NumPy)':^100}")
+    print("=" * 100)
+    if np is None:
+        print("❌ NumPy가 필요합니다.")
+        return None
+
+    values = list(range(lo, hi + 1, step))
+    level_list = [int(v) for v in levels.split(",")]
+    start = time.perf_counter()
+    sweep = V9Sweep(values, values, values, level_list, samples=samples)
+    elapsed = time.perf_counter() - start
+    cells = sweep.win.size
+    print(f" 격자 {'x'.join(str(n) for n in sweep.shape)} = {cells}셀 x {samples}회 = {cells * samples:,}전투 | "
+          f"{elapsed:.2f}s ({elapsed / (cells * samples) * 1e6:.2f}µs/전투) | 적 {ENEMY_STATS}")
+
+    fixed_axes = {}
+    for item in filter(None, fixed.split(",")):
+        axis, value = item.split("=")
+        fixed_axes[axis] = int(value)
+    shown = ", ".join(f"{a}={fixed_axes.get(a, sweep.axes[a][len(sweep.axes[a]) // 2])}"
+                      for a in ("strength", "dex", "con", "level") if a not in (x, y))
+
+    print("-" * 100)
+    print(f" 승률(%) [{shown}]")
+    _print_heatmap(sweep, "win", x, y, fixed_axes)
+    print("-" * 100)
+    print(f" 평균 TTK(턴) [{shown}]")
+    _print_heatmap(sweep, "ttk", x, y, fixed_axes)
+
+    # 상수 하나를 바꾸면 Matchup이 달라진 셀만 다시 시뮬레이션
+    if tweak:
+        name, value = tweak.split("=")
+        before = sweep.win_rate.copy()
+        start = time.perf_counter()
+        recomputed = sweep.set_constants(**{name: float(value)})
+        elapsed = time.perf_counter() - start
+        print("-" * 100)
+        print(f" {name}: {getattr(V9Formula, name)} -> {value} | 재계산 {recomputed}/{cells}셀 ({elapsed:.2f}s) | "
+              f"승률 변화 최대 {np.abs(sweep.win_rate - before).max() * 100:.1f}%p")
+        print(f" 승률(%) 변경 후 [{shown}]")
+        _print_heatmap(sweep, "win", x, y, fixed_axes)
+
+    print("=" * 100)
+    return sweep
+
+if __name__ == "__main__":
+    run_v9_sweep(
+        lo=_arg("--min", 5),
+        hi=_arg("--max", 35),
+        step=_arg("--step", 2),
+        levels=_arg("--levels", "20"),
+        samples=_arg("--samples", 400),
+        x=_arg("--x", "strength"),
+        y=_arg("--y", "dex"),
+        fixed=_arg("--fixed", ""),
+        tweak=_arg("--set", ""),
+    )
@@ -12,7 +12,10 @@ from src.core.factory import EntityFactory
 from src.systems.growth_system import GrowthSystem
 from src.systems.combat_system import CombatSystem
 from src.systems.math_engine import MathEngine
+from src.systems.ai_system import AISystem
 from src.utils.data_loader import DataLoader
+from src.utils.sim_cache import SimCache
+from src.formulas.book import FORMULAS
 
 def print_header(text):
     print("\n" + "="*85)
@@ -36,7 +39,9 @@ def print_actor_stats(actor, label="Actor"):
     print(f"   📜 Skills: {actor.skills}")
 
 def assign_monster_skills(monster):
-    """시뮬레이션용: 몬스터 ID에 따라 스킬 세팅"""
+    """시뮬레이션용: monsters.json에 스킬 목록이 없는 몬스터만 이름 기준으로 스킬 세팅"""
+    if any(s != "basic_attack" for s in monster.skills):
+        return
     mid = monster.name.lower() # 몬스터 이름 기준 (불곰, 매머드 등)
     if "불곰" in mid or "bear" in mid:
         monster.skills = ["basic_attack", "wild_bite"]
@@ -47,33 +52,10 @@ def assign_monster_skills(monster):
     else:
         monster.skills = ["basic_attack"]
 
-def run_duel(player, monster_id, monster_level_override=None, lethality_boost=1.5):
-    """
-    고도화된 스킬 기반 전투 시뮬레이션
-    """
-    monster = EntityFactory.create_monster(monster_id)
-    if not monster:
-        print(f"❌ 몬스터 데이터 없음: {monster_id}")
-        return
-
-    if monster_level_override:
-        monster.level = monster_level_override
-        GrowthSystem.refresh_stats(monster)
-
-    # 몬스터 스킬 할당
-    assign_monster_skills(monster)
-
-    player.current_hp, player.current_mp = player.max_hp, player.max_mp
-    monster.current_hp, monster.current_mp = monster.max_hp, monster.max_mp
-
-    print("-" * 85)
-    print(f"⚔️  SKILL-BASED BATTLE: {player.name} VS {monster.name} (Boost: x{lethality_boost})")
-    print("-" * 85)
-    
-    print_actor_stats(player, "PLAYER")
-    print_actor_stats(monster, "ENEMY")
-    print("-" * 85)
+DUEL_VERSION = 1  # _fight 진행 방식을 바꾸면 올림 (캐시 무효화)
 
+def _fight(player, monster, lethality_boost):
+    """전투를 끝까지 진행하고 로그/통계를 JSON으로 저장 가능한 dict로 반환합니다 (SimCache 재사용 단위)."""
     ctx = CombatSystem.initialize_combat([player], [monster])
     
     turn = 1
@@ -81,6 +63,8 @@ def run_duel(player, monster_id, monster_level_override=None, lethality_boost=1.
     m_total_dmg = 0
     p_skills_used = {}
     m_skills_used = {}
+    logs = []
+    winner = None
 
     while not ctx.is_finished and turn <= 100:
         current_id = ctx.turn_order[ctx.current_turn_index]
@@ -88,19 +72,8 @@ def run_duel(player, monster_id, monster_level_override=None, lethality_boost=1.
         defender = monster if current_id == player.id else player
         
         # --- [AI 로직] ---
-        # 1. 사용 가능한 액티브 스킬 목록 추출
-        active_skills = [s for s in attacker.skills if s != "basic_attack"]
-        skill_id = "basic_attack"
-        
-        for s_id in active_skills:
-            s_data = DataLoader.load_skill(s_id)
-            if not s_data: continue
-            cost = s_data.get("cost", {}).get("mp", 0)
-            if attacker.current_mp >= cost:
-                # 40% 확률로 스킬 사용 (너무 남발하지 않게)
-                if random.random() < 0.4:
-                    skill_id = s_id
-                    break
+        # 기대 피해 / 처치 확률 / MP 효율 기반 효용이 가장 높은 스킬 선택
+        skill_id = AISystem.choose_skill(attacker, defender)
         
         # 데미지 기록용
         pre_hp = defender.current_hp
@@ -127,20 +100,78 @@ def run_duel(player, monster_id, monster_level_override=None, lethality_boost=1.
         attacker.current_mp = min(attacker.max_mp, attacker.current_mp + 2)
 
         if ctx.combat_logs:
-            print(f"   [T{turn}] {attacker.name:12} -> {skill_id:15} : {ctx.combat_logs[-1]}")
+            logs.append([turn, attacker.name, skill_id, ctx.combat_logs[-1]])
 
         if defender.current_hp <= 0:
-            print(f"\n🏆 승리자: {attacker.name} (종료 턴: {turn})")
+            winner = attacker.name
             break
 
         ctx.current_turn_index = (ctx.current_turn_index + 1) % len(ctx.turn_order)
         if ctx.current_turn_index == 0: turn += 1
 
+    return {"turn": turn, "winner": winner, "logs": logs,
+            "p_total_dmg": p_total_dmg, "m_total_dmg": m_total_dmg,
+            "p_skills_used": p_skills_used, "m_skills_used": m_skills_used}
+
+def run_duel(player, monster_id, monster_level_override=None, lethality_boost=1.5,
+             seed=None, cache: SimCache = None):
+    """
+    고도화된 스킬 기반 전투 시뮬레이션
+    seed: 지정 시 전투 전 전역 난수를 고정하고, 같은 입력의 결과를 cache에서 재사용합니다
+          (시드가 없으면 결과가 매번 달라 캐시하지 않음).
+    """
+    monster = EntityFactory.create_monster(monster_id)
+    if not monster:
+        print(f"❌ 몬스터 데이터 없음: {monster_id}")
+        return
+
+    if monster_level_override:
+        monster.level = monster_level_override
+        GrowthSystem.refresh_stats(monster)
+
+    # 몬스터 스킬 할당
+    assign_monster_skills(monster)
+
+    player.current_hp, player.current_mp = player.max_hp, player.max_mp
+    monster.current_hp, monster.current_mp = monster.max_hp, monster.max_mp
+
+    print("-" * 85)
+    print(f"⚔️  SKILL-BASED BATTLE: {player.name} VS {monster.name} (Boost: x{lethality_boost})")
+    print("-" * 85)
+    
+    print_actor_stats(player, "PLAYER")
+    print_actor_stats(monster, "ENEMY")
+    print("-" * 85)
+
+    def fight():
+        if seed is not None:
+            random.seed(seed)
+        return _fight(player, monster, lethality_boost)
+
+    if seed is None or cache is None:
+        result = fight()
+    else:
+        # 키 = 양측 빌드(데이터 항목 내용 포함) + 상대 + 시드
+        result = cache.fetch(
+            fight, seed=seed, boost=lethality_boost,
+            player={"name": player.name, "race": DataLoader.load_race(player.race_id),
+                    "cls": DataLoader.load_class(player.class_id), "level": player.level, "skills": player.skills},
+            monster={"id": monster_id, "data": DataLoader.load_monster(monster_id),
+                     "level": monster.level, "skills": monster.skills},
+            skills={sid: DataLoader.load_skill(sid) for sid in set(player.skills) | set(monster.skills)})
+
+    turn = result["turn"]
+    for log_turn, name, skill_id, log in result["logs"]:
+        print(f"   [T{log_turn}] {name:12} -> {skill_id:15} : {log}")
+    if result["winner"] is not None:
+        print(f"\n🏆 승리자: {result['winner']} (종료 턴: {turn})")
+
     # === 리포트 출력 ===
+    p_total_dmg, m_total_dmg = result["p_total_dmg"], result["m_total_dmg"]
     print("\n📝 [전투 분석 결과]")
     print(f"   - 총 누적 데미지: 플레이어({p_total_dmg}) / 몬스터({m_total_dmg})")
-    print(f"   - 플레이어 스킬 기록: {p_skills_used}")
-    print(f"   - 몬스터 스킬 기록: {m_skills_used}")
+    print(f"   - 플레이어 스킬 기록: {result['p_skills_used']}")
+    print(f"   - 몬스터 스킬 기록: {result['m_skills_used']}")
     
     p_ttk = player.max_hp / (m_total_dmg / turn if turn > 0 else 1)
     m_ttk = monster.max_hp / (p_total_dmg / turn if turn > 0 else 1)
@@ -153,20 +184,26 @@ def run_duel(player, monster_id, monster_level_override=None, lethality_boost=1.
     print(f"   - 최종 평점: {verdict}")
     print("=" * 85)
 
-def run_simulation():
+def run_simulation(seed=None, use_cache=True):
+    """seed: 지정 시 케이스 i는 seed + i로 고정되고 결과가 SimCache로 재사용됩니다."""
     print_header("D&D ABYSS WALKER - INTELLIGENT COMBAT SIMULATOR")
+    cache = SimCache("dnd_mechanics", DUEL_VERSION, FORMULAS.fingerprint(), enabled=use_cache)
+    case_seed = lambda i: None if seed is None else seed + i
     
     # [Case 1] 1레벨 초보자 vs 불곰 (짐승의 습격)
     p1 = EntityFactory.create_player("Novice", "human", "fighter")
     p1.skills = ["basic_attack", "power_strike"]
-    run_duel(p1, "brown_bear", monster_level_override=1, lethality_boost=1.5)
+    run_duel(p1, "brown_bear", monster_level_override=1, lethality_boost=1.5, seed=case_seed(0), cache=cache)
 
     # [Case 2] 10레벨 영웅 vs 매머드 (거대수의 포효)
     p2 = EntityFactory.create_player("Legend", "dragonborn", "paladin")
     p2.skills = ["basic_attack", "holy_strike"]
     p2.level = 10
     GrowthSystem.refresh_stats(p2)
-    run_duel(p2, "mammoth", monster_level_override=10, lethality_boost=1.5)
+    run_duel(p2, "mammoth", monster_level_override=10, lethality_boost=1.5, seed=case_seed(1), cache=cache)
+    if seed is not None:
+        print(cache.summary())
 
 if __name__ == "__main__":
-    run_simulation()
\ No newline at end of file
+    seed_arg = int(sys.argv[sys.argv.index("--seed") + 1]) if "--seed" in sys.argv else None
+    run_simulation(seed_arg, use_cache="--no-cache" not in sys.argv)
\ No newline at end of file
@@ -0,0 +1,92 @@
+# File: src/utils/alias_table.py
+import random
+from typing import Generic, List, Optional, Sequence, Tuple, TypeVar
+
+try:
+    import numpy as np  # 대량 일괄 샘플링 시 벡터화 (선택 의존성)
+except ImportError:
+    np = None
+
+T = TypeVar("T")
+
+class AliasTable(Generic[T]):
+    """
+    Walker/Vose 별칭(alias) 방식의 가중치 추첨표.
+
+    - 생성: O(n). 각 칸 i에 (유지 확률 prob[i], 대체 인덱스 alias[i])를 미리 계산합니다.
+    - 추첨: O(1). 난수 하나로 칸과 칸 내부 위치를 함께 결정합니다
+      (u * n의 정수부 = 칸, 소수부 < prob[칸]이면 그 칸, 아니면 alias).
+    randint 사다리(if roll <= 50 ... elif roll <= 70 ...)와 달리 항목 수와 무관하게 일정한 비용입니다.
+    """
+
+    __slots__ = ("values", "weights", "prob", "alias", "total")
+
+    def __init__(self, entries: Sequence[Tuple[T, float]]):
+        entries = [(value, float(weight)) for value, weight in entries if weight > 0]
+        if not entries:
+            raise ValueError("AliasTable requires at least one entry with positive weight")
+
+        self.values: List[T] = [value for value, _ in entries]
+        self.weights: List[float] = [weight for _, weight in entries]
+        self.total = sum(self.weights)
+
+        n = len(entries)
+        scaled = [w * n / self.total for w in self.weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # 남은 칸은 부동소수점 오차로 1.0 근처인 칸 -> 항상 자기 자신
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def probability(self, value: T) -> float:
+        """항목의 실제 추첨 확률 (같은 값이 여러 번 등록되면 합산)."""
+        return sum(w for v, w in zip(self.values, self.weights) if v == value) / self.total
+
+    def sample_index(self, rng=random) -> int:
+        x = rng.random() * len(self.prob)
+        i = int(x)
+        return i if x - i < self.prob[i] else self.alias[i]
+
+    def sample(self, rng=random) -> T:
+        return self.values[self.sample_index(rng)]
+
+    def sample_many(self, count: int, rng=random, seed: Optional[int] = None) -> List[T]:
+        """
+        count개를 일괄 추첨합니다.
+        seed가 주어지고 NumPy가 있으면 벡터 연산으로, 아니면 rng.random() 루프로 생성합니다.
+        """
+        values, prob, alias, n = self.values, self.prob, self.alias, len(self.prob)
+        if seed is not None and np is not None:
+            chosen = self.sample_indices(np.random.default_rng(seed), count)
+            return [values[i] for i in chosen.tolist()]
+        if seed is not None:
+            rng = random.Random(seed)
+        draw = rng.random
+        out = []
+        for _ in range(count):
+            x = draw() * n
+            i = int(x)
+            out.append(values[i] if x - i < prob[i] else values[alias[i]])
+        return out
+
+    def sample_indices(self, gen, count: int):
+        """NumPy Generator로 count개의 인덱스 배열을 뽑습니다 (NumPy 필요, 벡터화 시뮬레이터용)."""
+        x = gen.random(count) * len(self.prob)
+        idx = x.astype(np.int64)
+        keep = (x - idx) < np.asarray(self.prob)[idx]
+        return np.where(keep, idx, np.asarray(self.alias)[idx])
+
+    def __repr__(self) -> str:
+        return f"AliasTable({len(self)} entries, total={self.total:g})"
@@ -46,7 +46,8 @@ class DataLoader:
     def load_item(item_id: str) -> Optional[Dict[str, Any]]:
         data = DataLoader.load_json("items.json")
         if data and item_id in data:
-            item = data[item_id]
+            # 캐시된 원본을 변형하지 않도록 사본에 id를 기록
+            item = dict(data[item_id])
             item["id"] = item_id
             return item
         return None
@@ -0,0 +1,236 @@
+# File: src/utils/result_store.py
+import os
+import json
+import mmap
+import array
+from typing import Dict, List, Optional, Any, Iterator
+
+from src.utils.stats import RunningStats
+
+class ResultStore:
+    """
+    시뮬레이션 결과를 컬럼 단위 바이너리 파일로 스트리밍 저장하는 싱크(Sink).
+
+    [구조]
+    - 디렉터리 하나가 하나의 테이블입니다. 컬럼마다 `<name>.bin` 파일(고정 폭 배열)과
+      스키마/행 수/범주 사전을 담은 `meta.json`을 가집니다.
+    - 행은 메모리 버퍼(array)에 쌓였다가 CHUNK_ROWS 단위로 파일 끝에 덧붙여집니다.
+      따라서 1억 행 스윕도 버퍼 크기만큼의 메모리만 사용합니다.
+    - 문자열 컬럼("cat")은 사전 인코딩(정수 코드)으로 저장됩니다.
+    """
+
+    CHUNK_ROWS = 65536
+
+    # 기본 스키마: 빌드, 레벨, 승리 여부, 턴 수, 총 피해량, 치명타 횟수, 시드
+    DEFAULT_SCHEMA = {
+        "build": "cat",
+        "level": "h",
+        "win": "B",
+        "turns": "H",
+        "damage": "d",
+        "crit": "I",
+        "seed": "q",
+    }
+
+    def __init__(self, path: str, schema: Optional[Dict[str, str]] = None):
+        self.path = path
+        self.schema = dict(schema or ResultStore.DEFAULT_SCHEMA)
+        self.rows = 0
+        self.categories: Dict[str, List[str]] = {}
+        self._cat_index: Dict[str, Dict[str, int]] = {}
+
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            # 기존 테이블에 이어 쓰기
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if schema and meta["schema"] != self.schema:
+                raise ValueError(f"Schema mismatch for existing store at {path}")
+            self.schema = meta["schema"]
+            self.rows = meta["rows"]
+            self.categories = meta.get("categories", {})
+
+        for col, code in self.schema.items():
+            if code == "cat":
+                self.categories.setdefault(col, [])
+                self._cat_index[col] = {v: i for i, v in enumerate(self.categories[col])}
+
+        self._buffers = {col: array.array(ResultStore._storage_code(code)) for col, code in self.schema.items()}
+        self._buffered = 0
+
+    @staticmethod
+    def _storage_code(code: str) -> str:
+        return "i" if code == "cat" else code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, **row):
+        """한 행을 버퍼에 추가합니다. 누락된 컬럼은 0으로 채웁니다."""
+        for col, code in self.schema.items():
+            value = row.get(col, 0)
+            if code == "cat":
+                value = self._encode(col, str(value))
+            self._buffers[col].append(value)
+        self._buffered += 1
+        if self._buffered >= ResultStore.CHUNK_ROWS:
+            self.flush()
+
+    def _encode(self, col: str, value: str) -> int:
+        index = self._cat_index[col]
+        code = index.get(value)
+        if code is None:
+            code = len(self.categories[col])
+            self.categories[col].append(value)
+            index[value] = code
+        return code
+
+    def flush(self):
+        """버퍼에 쌓인 행을 각 컬럼 파일 끝에 덧붙이고 메타데이터를 갱신합니다."""
+        if self._buffered:
+            for col, buf in self._buffers.items():
+                with open(os.path.join(self.path, f"{col}.bin"), "ab") as f:
+                    buf.tofile(f)
+                del buf[:]
+            self.rows += self._buffered
+            self._buffered = 0
+        self._write_meta()
+
+    def _write_meta(self):
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"schema": self.schema, "rows": self.rows, "categories": self.categories}, f, ensure_ascii=False)
+
+    def close(self):
+        self.flush()
+
+    @staticmethod
+    def open(path: str) -> "ResultTable":
+        return ResultTable(path)
+
+class ResultTable:
+    """
+    ResultStore가 기록한 테이블을 메모리 맵으로 읽는 읽기 전용 뷰.
+    컬럼 데이터는 복사하지 않고 mmap 위의 memoryview로 노출됩니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.schema: Dict[str, str] = meta["schema"]
+        self.rows: int = meta["rows"]
+        self.categories: Dict[str, List[str]] = meta.get("categories", {})
+        self._maps: Dict[str, Any] = {}
+        self._views: Dict[str, memoryview] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.rows
+
+    def close(self):
+        for view in self._views.values():
+            view.release()
+        for mm, fh in self._maps.values():
+            mm.close()
+            fh.close()
+        self._views.clear()
+        self._maps.clear()
+
+    def column(self, name: str) -> memoryview:
+        """컬럼 전체를 가리키는 memoryview (행 수만큼 잘린, 0-copy)."""
+        if name not in self._views:
+            code = ResultStore._storage_code(self.schema[name])
+            if self.rows == 0:
+                self._views[name] = memoryview(array.array(code))
+            else:
+                fh = open(os.path.join(self.path, f"{name}.bin"), "rb")
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[name] = (mm, fh)
+                self._views[name] = memoryview(mm).cast(code)[:self.rows]
+        return self._views[name]
+
+    def decode(self, name: str, code: int) -> Any:
+        """범주형 컬럼의 정수 코드를 원래 문자열로 되돌립니다."""
+        if self.schema[name] == "cat":
+            return self.categories[name][code]
+        return code
+
+    def iter_chunks(self, columns: List[str], chunk_rows: int = ResultStore.CHUNK_ROWS) -> Iterator[Dict[str, List]]:
+        """지정한 컬럼들을 chunk_rows 단위로 잘라 순회합니다 (메모리 사용량 고정)."""
+        views = {c: self.column(c) for c in columns}
+        for start in range(0, self.rows, chunk_rows):
+            end = min(self.rows, start + chunk_rows)
+            yield {c: v[start:end].tolist() for c, v in views.items()}
+
+    # --------------------------------------------------------------------------
+    # Query API
+    # --------------------------------------------------------------------------
+
+    AGGREGATES = ("count", "sum", "mean", "min", "max", "std")
+
+    def group_by(self, keys: List[str], aggs: Dict[str, tuple],
+                 where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        스트리밍 group-by 집계.
+        keys : 그룹 키 컬럼 목록 (예: ["build", "level"])
+        aggs : {출력명: (컬럼, 함수)}  함수는 count/sum/mean/min/max/std
+        where: {컬럼: 값} 동치 필터 (범주형은 문자열로 지정)
+        반환: 그룹별 결과 dict 리스트 (키 순 정렬)
+        """
+        for out, (col, fn) in aggs.items():
+            if fn not in ResultTable.AGGREGATES:
+                raise ValueError(f"Unknown aggregate '{fn}' for {out}")
+
+        filters = {}
+        for col, value in (where or {}).items():
+            if self.schema[col] == "cat":
+                if value not in self.categories[col]:
+                    return []
+                value = self.categories[col].index(value)
+            filters[col] = value
+
+        value_cols = sorted({col for col, _ in aggs.values()})
+        columns = list(dict.fromkeys(keys + value_cols + list(filters)))
+
+        # 그룹마다 컬럼별 RunningStats 누적 (Welford: 큰 합계에서도 수치적으로 안정)
+        groups: Dict[tuple, Dict[str, RunningStats]] = {}
+        for chunk in self.iter_chunks(columns):
+            n = len(chunk[columns[0]]) if columns else 0
+            key_cols = [chunk[k] for k in keys]
+            val_cols = [(c, chunk[c]) for c in value_cols]
+            filter_cols = [(chunk[c], v) for c, v in filters.items()]
+            for i in range(n):
+                if filter_cols and any(col[i] != v for col, v in filter_cols):
+                    continue
+                key = tuple(col[i] for col in key_cols)
+                acc = groups.get(key)
+                if acc is None:
+                    acc = groups[key] = {c: RunningStats() for c in value_cols}
+                for c, col in val_cols:
+                    acc[c].push(col[i])
+
+        results = []
+        for key in sorted(groups):
+            row = {k: self.decode(k, v) for k, v in zip(keys, key)}
+            for out, (col, fn) in aggs.items():
+                row[out] = ResultTable._finalize(groups[key][col], fn)
+            results.append(row)
+        return results
+
+    @staticmethod
+    def _finalize(acc: RunningStats, fn: str) -> float:
+        if fn == "count": return acc.count
+        if fn == "sum": return acc.total
+        if fn == "min": return acc.min
+        if fn == "max": return acc.max
+        if fn == "mean": return acc.mean
+        return acc.stdev
@@ -0,0 +1,217 @@
+# File: src/utils/rng.py
+import hashlib
+import random
+from functools import partial
+from itertools import chain
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import numpy as np  # batch() / RollBuffer 블록 생성 (선택 의존성)
+except ImportError:
+    np = None
+
+Label = Union[int, str]
+
+MASK64 = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15      # SplitMix64 증분
+MIX1 = 0xBF58476D1CE4E5B9
+MIX2 = 0x94D049BB133111EB
+TO_UNIT = 2.0 ** -53             # 상위 53비트 -> [0, 1) (random.random()과 같은 정밀도)
+
+_labels: Dict[str, int] = {}
+
+def mix64(x: int) -> int:
+    """SplitMix64 최종 혼합 함수 (64비트 -> 64비트 전단사)."""
+    z = (x + GOLDEN) & MASK64
+    z = ((z ^ (z >> 30)) * MIX1) & MASK64
+    z = ((z ^ (z >> 27)) * MIX2) & MASK64
+    return z ^ (z >> 31)
+
+def label64(label: Label) -> int:
+    """
+    키 구성요소 -> 64비트. 정수는 그대로(2의 보수), 문자열은 blake2b 앞 8바이트.
+    내장 hash()는 프로세스마다 달라지므로 쓰지 않습니다.
+    """
+    if isinstance(label, int):
+        return label & MASK64
+    code = _labels.get(label)
+    if code is None:
+        code = _labels[label] = int.from_bytes(hashlib.blake2b(label.encode("utf-8"), digest_size=8).digest(), "little")
+    return code
+
+class CounterRNG:
+    """
+    카운터 기반 난수 서비스: 난수 하나가 (마스터 시드, 전투, 라운드, 행위자, 용도, n)의 순수 함수입니다.
+
+        key   = mix(mix(mix(mix(seed) ^ battle) ^ actor) ^ purpose)     # 스트림 키 (한 번 계산해 재사용)
+        value = mix(key ^ mix(round << 32 | n))                          # 카운터 = (라운드, 라운드 내 순번)
+        u     = (value >> 11) * 2^-53
+
+    내부 상태가 없으므로 어떤 전투든 단독으로 재생하거나, 순서를 섞거나, 프로세스로 나눠 돌려도 같은 값이 나오고,
+    batch()로 같은 함수를 NumPy 배열로 계산해도 비트 단위로 같습니다.
+    n은 같은 라운드에 같은 (행위자, 용도)를 여러 번 뽑을 때의 순번입니다 (BattleRolls가 관리).
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self._root = mix64(label64(seed))
+
+    def key(self, battle: Label, actor: Label, purpose: Label) -> int:
+        k = mix64(self._root ^ label64(battle))
+        k = mix64(k ^ label64(actor))
+        return mix64(k ^ label64(purpose))
+
+    @staticmethod
+    def counter(round: int, n: int = 0) -> int:
+        return ((round & 0xFFFFFFFF) << 32) | (n & 0xFFFFFFFF)
+
+    @staticmethod
+    def unit(key: int, counter: int) -> float:
+        return (mix64(key ^ mix64(counter)) >> 11) * TO_UNIT
+
+    def random(self, battle: Label, round: int, actor: Label, purpose: Label, n: int = 0) -> float:
+        return CounterRNG.unit(self.key(battle, actor, purpose), CounterRNG.counter(round, n))
+
+    def randint(self, lo: int, hi: int, battle: Label, round: int, actor: Label, purpose: Label, n: int = 0) -> int:
+        """lo <= x <= hi 정수 (1d20 = randint(1, 20, ...))."""
+        return lo + int(self.random(battle, round, actor, purpose, n) * (hi - lo + 1))
+
+    def battle(self, battle: Label, antithetic: bool = False) -> "BattleRolls":
+        return BattleRolls(self, battle, antithetic)
+
+    # --------------------------------------------------------------------------
+    # 일괄 생성 (NumPy, 스칼라 경로와 비트 단위로 동일)
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def _mix_array(x: "np.ndarray") -> "np.ndarray":
+        # uint64 배열 연산은 2^64로 자연스럽게 감깁니다 (& MASK64와 같음)
+        z = x + np.uint64(GOLDEN)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(MIX1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(MIX2)
+        return z ^ (z >> np.uint64(31))
+
+    def batch(self, battles, rounds, actor: Label, purpose: Label, n=0) -> "np.ndarray":
+        """
+        random(battle, round, actor, purpose, n)을 battles x rounds x n (브로드캐스트)에 대해 한 번에.
+        battles는 정수 ID만 지원합니다 (문자열 전투 ID는 스칼라 경로 사용).
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for CounterRNG.batch")
+        battles = np.asarray(battles, dtype=np.int64).astype(np.uint64)
+        rounds = np.asarray(rounds, dtype=np.int64).astype(np.uint64) & np.uint64(0xFFFFFFFF)
+        n = np.asarray(n, dtype=np.int64).astype(np.uint64) & np.uint64(0xFFFFFFFF)
+        with np.errstate(over="ignore"):
+            k = CounterRNG._mix_array(np.uint64(self._root) ^ battles)
+            k = CounterRNG._mix_array(k ^ np.uint64(label64(actor)))
+            k = CounterRNG._mix_array(k ^ np.uint64(label64(purpose)))
+            counter = (rounds << np.uint64(32)) | n
+            value = CounterRNG._mix_array(k ^ CounterRNG._mix_array(counter))
+        return (value >> np.uint64(11)).astype(np.float64) * TO_UNIT
+
+class _Stream:
+    """random 모듈 인터페이스 어댑터 (TableSystem/AliasTable/DifficultySystem 등의 rng 인자용)."""
+    __slots__ = ("random",)
+
+    def __init__(self, draw: Callable[[], float]):
+        self.random = draw
+
+    def randrange(self, start: int, stop: Optional[int] = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        return start + int(self.random() * (stop - start))
+
+    def randint(self, lo: int, hi: int) -> int:
+        return self.randrange(lo, hi + 1)
+
+class BattleRolls:
+    """
+    한 전투에 묶인 CounterRNG 보기. draw(actor, purpose)는 CommonRandomStreams와 같은 인터페이스라
+    simulate_duel(rolls=...) 등에 그대로 넘길 수 있습니다.
+
+    현재 라운드는 전투 루프가 begin_round()로 알려 주고, 같은 라운드에서 같은 (행위자, 용도)를 여러 번 뽑으면
+    n이 0, 1, 2...로 늘어납니다. 라운드가 바뀌면 순번은 0부터 다시 시작하므로 각 난수는
+    (시드, 전투, 라운드, 행위자, 용도, 라운드 내 순번)만으로 정해집니다.
+    """
+
+    def __init__(self, rng: CounterRNG, battle: Label, antithetic: bool = False):
+        self.rng = rng
+        self.battle = battle
+        self.antithetic = antithetic
+        self.round = 0
+        self._counts: Dict[Tuple[Label, Label], int] = {}
+        self._keys: Dict[Tuple[Label, Label], int] = {}
+
+    def begin_round(self, round: int):
+        """라운드 지정. 라운드가 바뀌면 순번을 0부터 다시 셉니다."""
+        if round != self.round:
+            self.round = round
+            self._counts.clear()
+
+    def position(self) -> tuple:
+        """현재 (라운드, 스트림별 순번) - seek()로 되돌릴 수 있는 불변 값 (전투 스냅샷용)."""
+        return self.round, tuple(self._counts.items())
+
+    def seek(self, position: tuple):
+        """position() 시점으로 되돌립니다. 이후 뽑는 난수는 그 시점에서 뽑았을 값과 같습니다."""
+        self.round, counts = position
+        self._counts = dict(counts)
+
+    def draw(self, actor: Label, purpose: Label) -> float:
+        stream = (actor, purpose)
+        key = self._keys.get(stream)
+        if key is None:
+            key = self._keys[stream] = self.rng.key(self.battle, actor, purpose)
+        n = self._counts.get(stream, 0)
+        self._counts[stream] = n + 1
+        u = CounterRNG.unit(key, CounterRNG.counter(self.round, n))
+        return 1.0 - u if self.antithetic else u
+
+    def randint(self, lo: int, hi: int, actor: Label, purpose: Label) -> int:
+        return lo + int(self.draw(actor, purpose) * (hi - lo + 1))
+
+    def roller(self, actor: Label) -> Callable[[str], float]:
+        """FormulaEngine Roll (용도 -> 난수)."""
+        return lambda purpose: self.draw(actor, purpose)
+
+    def stream(self, actor: Label, purpose: Label) -> _Stream:
+        """rng.random()을 부르는 기존 API(TableSystem.roll 등)에 넘길 객체."""
+        return _Stream(lambda: self.draw(actor, purpose))
+
+class RollBuffer:
+    """
+    미리 만들어 둔 난수 블록에서 하나씩 꺼내 주는 난수원 (MathEngine.use_rolls()로 꽂는 세션 단위 공급자).
+
+    block개의 U[0, 1)을 NumPy Generator(PCG64)로 한 번에 만들어 파이썬 float 리스트로 바꿔 두고,
+    소진되면 다음 블록을 통째로 다시 채웁니다. 분포는 random.random()과 같고(53비트 균등),
+    variance/crit/hit 모두 같은 U[0, 1)을 쓰므로 기존 판정 식이 그대로 유지됩니다.
+    NumPy가 없으면 random.Random(seed)로 블록을 채웁니다 (값 열은 달라도 분포는 동일).
+
+    roll은 partial(next, 블록 체인)입니다: 체인이 끝나지 않으므로 roll("hit")의 용도 인자는
+    next()의 기본값 자리에 들어갔다가 쓰이지 않고, 호출 전체가 C 수준에서 끝납니다
+    (파이썬 함수 프레임이 없어 global_roll보다 빠름). roll()처럼 인자 없이 부르면 random.random() 대용입니다.
+    """
+
+    def __init__(self, seed: Optional[int] = None, block: int = 1 << 16):
+        self.block = block
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None):
+        """세션 시드 재설정. 남은 블록은 버리고 새 체인을 만듭니다 (이전에 꺼내 둔 roll은 옛 체인을 계속 씀)."""
+        self.seed = seed
+        self.refills = 0
+        self._gen = np.random.default_rng(seed) if np is not None else random.Random(seed)
+        self.roll: Callable[..., float] = partial(next, chain.from_iterable(self._blocks()))
+        self.random = self.roll   # TableSystem.roll(rng=...) 등 random.random() 인터페이스
+
+    def _blocks(self) -> Iterator[list]:
+        while True:
+            self.refills += 1
+            if np is not None:
+                yield self._gen.random(self.block).tolist()
+            else:
+                yield [self._gen.random() for _ in range(self.block)]
+
+    def uniform(self, a: float, b: float) -> float:
+        """random.uniform과 같은 식 (a + (b - a) * U)."""
+        return a + (b - a) * self.roll()
@@ -0,0 +1,94 @@
+# File: src/utils/sim_cache.py
+import os
+import json
+import shutil
+import hashlib
+from typing import Any, Callable, Optional
+
+from src.utils.data_loader import DataLoader
+
+class SimCache:
+    """
+    시뮬레이션 결과의 내용 주소(content-addressed) 디스크 캐시.
+
+    [키]
+    결과를 결정하는 입력 전체 - 셀이 실제로 읽는 데이터 항목(종족/직업/스킬/몬스터 JSON 내용),
+    공식 지문(FormulaBook.fingerprint), 스크립트 로직 버전, 빌드/상대/시드/표본 수 - 를 정렬된 JSON으로 직렬화한
+    SHA-1입니다. 파일 전체가 아니라 셀이 읽는 항목만 키에 넣으므로, 종족 하나를 고치면 그 종족의 셀만 다시 계산됩니다.
+
+    [저장]
+    src/data/cache/sims/<namespace>/<키 앞 2자리>/<키>.json 에 결과 하나씩 저장합니다 (git 객체 저장소와 같은 배치).
+    키가 내용에서 나오므로 무효화가 따로 필요 없고, 브랜치를 오가도 양쪽 결과가 모두 재사용됩니다.
+    결과는 JSON으로 직렬화할 수 있어야 합니다 (튜플은 리스트로 돌아옴).
+    """
+
+    CACHE_DIR = "cache/sims"
+
+    def __init__(self, namespace: str, version: int, engine: str = "", enabled: bool = True):
+        """
+        version: 스크립트의 계산 로직을 바꾸면 올립니다 (공식/데이터 변경은 자동 반영).
+        engine: 공식 엔진 지문 (보통 FORMULAS.fingerprint()).
+        enabled: False면 항상 계산하고 저장도 하지 않습니다 (--no-cache).
+        """
+        self.namespace = namespace
+        self.version = version
+        self.engine = engine
+        self.enabled = enabled
+        self.path = DataLoader._get_data_path(os.path.join(SimCache.CACHE_DIR, namespace))
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(payload: Any) -> str:
+        text = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def key(self, **inputs) -> str:
+        return SimCache.digest({"ns": self.namespace, "v": self.version, "engine": self.engine, "inputs": inputs})
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        try:
+            with open(self._file(key), "r", encoding="utf-8") as f:
+                return json.load(f)["result"]
+        except (IOError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, result: Any):
+        if not self.enabled:
+            return
+        path = self._file(key)
+        tmp = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"result": result}, f, ensure_ascii=False)
+            os.replace(tmp, path)   # 중단되어도 반쯤 쓴 파일이 키 이름으로 남지 않음
+        except IOError:
+            pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 계산)
+
+    def fetch(self, compute: Callable[[], Any], **inputs) -> Any:
+        """입력의 키로 저장된 결과가 있으면 그대로, 없으면 compute()를 실행해 저장한 뒤 반환합니다."""
+        key = self.key(**inputs)
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = compute()
+        self.put(key, result)
+        return result
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        if not self.enabled:
+            return f"[Cache] disabled - {total} cells computed"
+        return f"[Cache] {self.namespace}: {self.hits}/{total} cells reused, {self.misses} recomputed"
+
+    def clear(self):
+        """이 네임스페이스의 저장 결과를 모두 지웁니다."""
+        shutil.rmtree(self.path, ignore_errors=True)
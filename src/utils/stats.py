@@ -0,0 +1,237 @@
+# File: src/utils/stats.py
+import math
+from typing import Dict, List, Optional
+
+class RunningStats:
+    """
+    Welford 알고리즘 기반의 스트리밍 평균/분산 누적기.
+    값 목록을 저장하지 않으므로 지표당 메모리는 O(1)이며,
+    merge()로 워커 프로세스별 결과를 정확하게 합칠 수 있습니다 (Chan et al.).
+    합계는 평균 x 개수로 되돌리지 않고 따로 누적하므로 정수 값(골드, 피해량)의 합은 정확한 정수입니다.
+    """
+    __slots__ = ("count", "mean", "_m2", "_sum", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._sum = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self._sum += x
+        if x < self.min: self.min = x
+        if x > self.max: self.max = x
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """다른 누적기를 제자리에서 합칩니다."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self._m2, self._sum = other.count, other.mean, other._m2, other._sum
+            self.min, self.max = other.min, other.max
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self._sum += other._sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def total(self) -> float:
+        return self._sum
+
+    @property
+    def variance(self) -> float:
+        """표본 분산 (statistics.variance와 동일한 n-1 분모)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        """평균의 표준 오차."""
+        return self.stdev / math.sqrt(self.count) if self.count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"count": self.count, "mean": self.mean, "m2": self._m2, "sum": self._sum, "min": self.min, "max": self.max}
+
+    @staticmethod
+    def from_dict(data: Dict[str, float]) -> "RunningStats":
+        rs = RunningStats()
+        rs.count, rs.mean, rs._m2 = data["count"], data["mean"], data["m2"]
+        rs._sum = data.get("sum", rs.mean * rs.count)   # 합계가 없던 이전 형식
+        rs.min, rs.max = data["min"], data["max"]
+        return rs
+
+class Histogram:
+    """
+    고정 구간(균등 분할) 히스토그램.
+    구간 정의가 같은 히스토그램끼리는 카운트 합산만으로 병합됩니다.
+    범위를 벗어난 값은 underflow/overflow 카운터에 기록됩니다.
+    """
+    __slots__ = ("lo", "hi", "counts", "underflow", "overflow", "_width")
+
+    def __init__(self, lo: float, hi: float, bins: int = 50):
+        if hi <= lo or bins <= 0:
+            raise ValueError("Histogram requires hi > lo and bins > 0")
+        self.lo = lo
+        self.hi = hi
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+        self._width = (hi - lo) / bins
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts) + self.underflow + self.overflow
+
+    def push(self, x: float):
+        if x < self.lo:
+            self.underflow += 1
+        elif x >= self.hi:
+            self.overflow += 1
+        else:
+            self.counts[int((x - self.lo) / self._width)] += 1
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        if (self.lo, self.hi, len(self.counts)) != (other.lo, other.hi, len(other.counts)):
+            raise ValueError("Cannot merge histograms with different bin edges")
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def edges(self) -> List[float]:
+        return [self.lo + i * self._width for i in range(len(self.counts) + 1)]
+
+    def quantile(self, q: float) -> float:
+        """구간 내부 선형 보간으로 근사한 분위수."""
+        n = self.count
+        if n == 0:
+            return 0.0
+        target = q * n
+        seen = self.underflow
+        if target <= seen:
+            return self.lo
+        for i, c in enumerate(self.counts):
+            if seen + c >= target and c > 0:
+                return self.lo + (i + (target - seen) / c) * self._width
+            seen += c
+        return self.hi
+
+class QuantileSketch:
+    """
+    상대 오차 보장 분위수 스케치 (DDSketch 방식).
+    값 x를 log_gamma(x) 버킷에 카운트하므로 모든 분위수가 상대 오차 alpha 이내로 보장됩니다.
+    버킷 수는 max_bins로 제한되며(초과 시 가장 작은 버킷들을 합침),
+    같은 alpha를 쓰는 스케치끼리는 버킷 카운트 합산으로 병합됩니다.
+    TTK, 피해량처럼 0 이상의 값을 대상으로 합니다 (음수는 0으로 취급).
+    """
+    __slots__ = ("alpha", "max_bins", "_gamma", "_log_gamma", "_bins", "zero_count", "count")
+
+    def __init__(self, alpha: float = 0.01, max_bins: int = 2048):
+        self.alpha = alpha
+        self.max_bins = max_bins
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def push(self, x: float):
+        self.count += 1
+        if x <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(x) / self._log_gamma)
+        self._bins[key] = self._bins.get(key, 0) + 1
+        if len(self._bins) > self.max_bins:
+            self._collapse()
+
+    def _collapse(self):
+        keys = sorted(self._bins)
+        excess = len(keys) - self.max_bins
+        merged = sum(self._bins.pop(k) for k in keys[:excess + 1])
+        self._bins[keys[excess]] = merged
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if self.alpha != other.alpha:
+            raise ValueError("Cannot merge sketches with different alpha")
+        for k, c in other._bins.items():
+            self._bins[k] = self._bins.get(k, 0) + c
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self._bins) > self.max_bins:
+            self._collapse()
+        return self
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if seen > rank:
+                # 버킷 (gamma^(k-1), gamma^k]의 대표값
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._bins) / (self._gamma + 1)
+
+    def percentiles(self, qs: Optional[List[float]] = None) -> Dict[str, float]:
+        """{"p50": .., "p95": .., "p99": ..} 형태로 반환합니다."""
+        qs = qs or [0.50, 0.95, 0.99]
+        return {f"p{round(q * 100):g}": self.quantile(q) for q in qs}
+
+class MetricSet:
+    """
+    지표 이름별로 RunningStats + QuantileSketch를 묶어 관리하는 헬퍼.
+    sim 리포트에서 '평균/표준편차/백분위수'를 한 번에 뽑을 때 사용합니다.
+    """
+
+    def __init__(self, *names: str, alpha: float = 0.01):
+        self.alpha = alpha
+        self.stats: Dict[str, RunningStats] = {}
+        self.sketches: Dict[str, QuantileSketch] = {}
+        for name in names:
+            self._ensure(name)
+
+    def _ensure(self, name: str):
+        if name not in self.stats:
+            self.stats[name] = RunningStats()
+            self.sketches[name] = QuantileSketch(self.alpha)
+
+    def push(self, name: str, x: float):
+        self._ensure(name)
+        self.stats[name].push(x)
+        self.sketches[name].push(x)
+
+    def merge(self, other: "MetricSet") -> "MetricSet":
+        for name in other.stats:
+            self._ensure(name)
+            self.stats[name].merge(other.stats[name])
+            self.sketches[name].merge(other.sketches[name])
+        return self
+
+    def __getitem__(self, name: str) -> RunningStats:
+        return self.stats[name]
+
+    def summary(self, name: str) -> Dict[str, float]:
+        rs = self.stats[name]
+        out = {"count": rs.count, "mean": rs.mean, "stdev": rs.stdev}
+        out.update(self.sketches[name].percentiles())
+        return out